@@ -8,5 +8,21 @@ class Settings:
     PORT = int(os.getenv("PORT", "8080"))
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+    # CPU-bound parsers (openpyxl, python-pptx, ebooklib, ...) run in child
+    # processes — see services/extraction_pool.py
+    EXTRACT_POOL_WORKERS = int(os.getenv("EXTRACT_POOL_WORKERS", "2"))            # Concurrent parser processes
+    EXTRACT_JOB_MEMORY_MB = int(os.getenv("EXTRACT_JOB_MEMORY_MB", "2048"))       # RLIMIT_AS per job
+    EXTRACT_JOB_TIMEOUT_S = float(os.getenv("EXTRACT_JOB_TIMEOUT_S", "300"))      # Wall clock per job, then kill
+
+    # Scanned PDF pipeline — pages render in a pool child while VLM calls run
+    PDF_VLM_CONCURRENCY = int(os.getenv("PDF_VLM_CONCURRENCY", "4"))              # VLM calls in flight per PDF
+    PDF_RENDER_DPI = int(os.getenv("PDF_RENDER_DPI", "200"))
+    PDF_DEDUP_ENABLED = os.getenv("PDF_DEDUP_ENABLED", "true").lower() == "true"  # Reuse VLM text of identical pages
+
+    # Archives — members are decompressed lazily, one budget check at a time
+    ARCHIVE_EXTRACT_CONCURRENCY = int(os.getenv("ARCHIVE_EXTRACT_CONCURRENCY", "4"))  # Members extracted in parallel
+    ARCHIVE_SPILL_BYTES = int(os.getenv("ARCHIVE_SPILL_BYTES", str(4 * 1024 * 1024)))  # Larger members → temp file
+    ARCHIVE_SPILL_DIR = os.getenv("ARCHIVE_SPILL_DIR", "")                            # Empty = system temp dir
+
 
 settings = Settings()
@@ -1,6 +1,7 @@
 """gRPC server for service-document-extraction.
 
-Exposes DocumentExtractionService.Extract as a unary RPC over h2c. The
+Exposes DocumentExtractionService.Extract as a unary RPC over h2c (plus
+ExtractStream, which streams pages as they are parsed). The
 FastAPI routes are retired in the same slice; callers (Kotlin server
 DocumentExtractionClient, orchestrator chat handler_context) dial this
 gRPC server instead.
@@ -15,6 +16,7 @@ from typing import TYPE_CHECKING
 import grpc
 from grpc_reflection.v1alpha import reflection
 
+from app.services.extractor import PageContent
 from jervis.document_extraction import extract_pb2, extract_pb2_grpc
 from jervis_contracts.interceptors import ServerContextInterceptor
 
@@ -71,6 +73,46 @@ class DocumentExtractionServicer(extract_pb2_grpc.DocumentExtractionServiceServi
             pages=pages,
         )
 
+    async def ExtractStream(
+        self,
+        request: extract_pb2.ExtractStreamRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        if not request.content:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "content required")
+
+        filename = request.filename or "unknown"
+        mime = request.mime_type or ""
+        tier = request.max_tier or "NONE"
+
+        logger.info(
+            "EXTRACT_STREAM_GRPC: file=%s mime=%s size=%d tier=%s",
+            filename, mime, len(request.content), tier,
+        )
+
+        page_count = 0
+        try:
+            async for unit in self._extractor.extract_stream(
+                bytes(request.content), filename, mime, tier,
+            ):
+                if isinstance(unit, PageContent):
+                    page_count += 1
+                    yield extract_pb2.ExtractStreamResponse(
+                        page=extract_pb2.ExtractedPage(
+                            page_number=int(unit.page_number), text=str(unit.text or ""),
+                        ),
+                    )
+                else:
+                    metadata = {str(k): str(v) for k, v in (unit.metadata or {}).items() if v is not None}
+                    yield extract_pb2.ExtractStreamResponse(
+                        done=extract_pb2.ExtractDone(
+                            method=str(unit.method or ""), metadata=metadata, page_count=page_count,
+                        ),
+                    )
+        except Exception as e:
+            logger.exception("EXTRACT_STREAM_GRPC_FAILED: file=%s pages_sent=%d", filename, page_count)
+            await context.abort(grpc.StatusCode.INTERNAL, f"Extraction failed: {e}")
+
     async def Health(
         self,
         request: extract_pb2.HealthRequest,
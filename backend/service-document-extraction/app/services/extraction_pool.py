@@ -0,0 +1,129 @@
+"""Bounded process pool for CPU-bound document parsers.
+
+openpyxl, python-pptx, ebooklib, odfpy & co. are pure-Python parsers that hold
+the GIL for seconds on large inputs — run on the event loop they freeze every
+other gRPC call on the pod. Each job runs in its own child process:
+
+- at most EXTRACT_POOL_WORKERS jobs run at once (asyncio semaphore; further
+  jobs wait for a slot),
+- the child caps its address space (RLIMIT_AS) so a zip-bomb XLSX raises
+  MemoryError instead of getting the pod OOM-killed,
+- the parent kills the child when the wall-clock budget runs out.
+
+A process per job (instead of a long-lived ProcessPoolExecutor) is what makes
+the kill possible — a hung worker inside an executor can't be terminated
+without breaking the whole pool. Children come from a forkserver that has the
+extractor modules preloaded, so a job costs a fork, not an interpreter start,
+and the parent's gRPC threads are never forked.
+
+Jobs are generator functions: every item they yield is sent back over a
+queue immediately, so callers can stream pages while the rest still parses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from typing import Any, AsyncIterator, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_POLL_S = 0.5
+
+
+class ExtractionJobError(RuntimeError):
+    """Job failed in the child, ran out of time, or the child died."""
+
+
+def _limit_memory(memory_mb: int) -> None:
+    if memory_mb <= 0:
+        return
+    try:
+        import resource
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning("EXTRACT_POOL: cannot set memory limit: %s", e)
+
+
+def _job_main(fn: Callable[..., Iterator[Any]], args: tuple, out, memory_mb: int) -> None:
+    """Child entry point — must stay module-level (picklable)."""
+    _limit_memory(memory_mb)
+    try:
+        for item in fn(*args):
+            out.put(("item", item))
+        out.put(("done", None))
+    except MemoryError:
+        out.put(("error", f"memory limit of {memory_mb} MB exceeded"))
+    except BaseException as e:
+        out.put(("error", f"{type(e).__name__}: {e}"))
+
+
+class ExtractionPool:
+    """Runs generator jobs in memory- and time-limited child processes."""
+
+    def __init__(self, workers: int, memory_mb: int, timeout_s: float):
+        self._ctx = multiprocessing.get_context("forkserver")
+        self._ctx.set_forkserver_preload(["app.services.extractor"])
+        self._slots = asyncio.Semaphore(max(1, workers))
+        self._memory_mb = memory_mb
+        self._timeout_s = timeout_s
+
+    async def stream(
+        self, fn: Callable[..., Iterator[Any]], *args: Any, maxsize: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Run fn(*args) in a child process, yielding its items as they arrive.
+
+        With maxsize > 0 the child blocks once that many items wait unread,
+        so a slow consumer back-pressures the job; time the consumer holds
+        an item does not count against the job's wall-clock budget.
+        Raises ExtractionJobError on failure/timeout. Leaving the iteration
+        early (consumer error, cancelled RPC) kills the child.
+        """
+        async with self._slots:
+            out = self._ctx.Queue(maxsize)
+            proc = self._ctx.Process(
+                target=_job_main, args=(fn, args, out, self._memory_mb), daemon=True,
+            )
+            started = time.monotonic()
+            deadline = started + self._timeout_s
+            await asyncio.to_thread(proc.start)
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ExtractionJobError(
+                            f"{fn.__name__} exceeded {self._timeout_s:.0f}s, killed",
+                        )
+                    try:
+                        kind, payload = await asyncio.to_thread(out.get, True, min(remaining, _POLL_S))
+                    except queue.Empty:
+                        if proc.is_alive():
+                            continue
+                        # Flushed before exit? One last non-blocking look.
+                        try:
+                            kind, payload = out.get_nowait()
+                        except queue.Empty:
+                            raise ExtractionJobError(
+                                f"{fn.__name__} worker died (exit code {proc.exitcode})",
+                            ) from None
+
+                    if kind == "item":
+                        held = time.monotonic()
+                        yield payload
+                        deadline += time.monotonic() - held
+                    elif kind == "done":
+                        logger.debug("EXTRACT_POOL: %s done in %.2fs",
+                                     fn.__name__, time.monotonic() - started)
+                        return
+                    else:
+                        raise ExtractionJobError(payload)
+            finally:
+                if proc.is_alive():
+                    proc.kill()
+                await asyncio.to_thread(proc.join, 5.0)
+                out.close()
+                out.cancel_join_thread()
@@ -20,21 +20,33 @@ Supported formats:
 - ZIP/RAR/7z/tar.gz → recursive extraction of contained files
 
 VLM calls go through Ollama router (HTTP) for GPU/cloud routing.
+
+Everything except plain text, PDF, images and archives is parsed in a child
+process (see extraction_pool.py). Paged formats — XLSX/XLS sheets, PPTX
+slides, EPUB chapters, PDF pages — are produced one page at a time, so
+extract_stream() can hand early pages to the caller while later ones parse.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 import logging
 import os
+import tempfile
+import time
 import zipfile
 import tarfile
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import PurePosixPath
+from typing import AsyncIterator, BinaryIO, Callable, Iterator, Union
 
 import httpx
 
+from app.services.extraction_pool import ExtractionPool
+
 logger = logging.getLogger(__name__)
 
 # Max recursion depth for nested archives
@@ -45,6 +57,8 @@ _MAX_ARCHIVE_TOTAL_BYTES = 100 * 1024 * 1024
 _MAX_ARCHIVE_FILES = 200
 # Skip files larger than this inside archives (20MB)
 _MAX_SINGLE_FILE_BYTES = 20 * 1024 * 1024
+# Rendered PDF pages the pool child may queue ahead of the VLM window
+_PDF_READ_AHEAD = 2
 
 
 @dataclass
@@ -69,6 +83,23 @@ class ExtractedDocument:
     metadata: dict = field(default_factory=dict)
 
 
+@dataclass
+class _PdfPageScan:
+    """One PDF page as walked by the pool child (_scan_pdf_pages)."""
+    page_number: int
+    text: str
+    image: bytes | None = None          # PNG — only for pages that need the VLM
+    dhash: int = 0                      # 64-bit difference hash of the page image
+    thumb: bytes = b""                  # 72-dpi grayscale, confirms dHash matches
+    thumb_width: int = 0
+    render_s: float = 0.0
+
+
+# Streaming unit: a page as soon as it is parsed, then one ExtractedDocument
+# (no text/pages) carrying method + metadata.
+ExtractionUnit = Union[PageContent, ExtractedDocument]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MIME type routing
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -209,6 +240,13 @@ def _detect_type(mime_type: str, filename: str) -> str:
     return "text"
 
 
+# Types parsed by a synchronous (CPU-bound) extractor → run in the process pool
+_POOLED_TYPES = {
+    "csv", "html", "docx", "doc", "xlsx", "xls", "pptx",
+    "odt", "ods", "odp", "rtf", "msg", "eml", "epub", "vsdx",
+}
+
+
 # Binary file extensions — listed in archive output but content not extracted
 _BINARY_EXTENSIONS = {
     # Executables / system
@@ -258,6 +296,187 @@ def _human_size(size_bytes: int) -> str:
         return f"{size_bytes / (1024 * 1024):.1f} MB"
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Lazy archive walking
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_COPY_BLOCK = 1024 * 1024
+
+
+class _MemberTooLarge(Exception):
+    pass
+
+
+@dataclass
+class _ArchiveMember:
+    """Archive entry, not yet decompressed. size is the declared uncompressed
+    size (-1 when the format doesn't say, e.g. bare .gz)."""
+    name: str
+    size: int
+    opener: Callable[[], BinaryIO]
+
+    def read(self, spill_dir: str, spill_bytes: int, cap: int) -> bytes | str:
+        """Decompress (at most cap bytes) → bytes, or the path of a temp file
+        when the member is larger than spill_bytes."""
+        with self.opener() as src:
+            if 0 <= self.size <= spill_bytes:
+                data = src.read(cap + 1)
+                if len(data) > cap:
+                    raise _MemberTooLarge(f"{self.name} exceeds {_human_size(cap)}")
+                return data
+            fd, path = tempfile.mkstemp(dir=spill_dir, suffix=PurePosixPath(self.name).suffix[-16:])
+            written = 0
+            try:
+                with os.fdopen(fd, "wb") as dst:
+                    while block := src.read(_COPY_BLOCK):
+                        written += len(block)
+                        if written > cap:
+                            raise _MemberTooLarge(f"{self.name} exceeds {_human_size(cap)}")
+                        dst.write(block)
+            except BaseException:
+                _remove_quietly(path)
+                raise
+            return path
+
+
+class _ArchiveBudget:
+    """File/byte budgets of one archive level, charged from declared sizes
+    in archive order. Decisions depend only on the (name, size) sequence, so
+    the 7z walker can plan its single decompression pass by a dry run."""
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.bytes = 0
+
+    def admit(self, member: _ArchiveMember) -> str | None:
+        """None (skip silently), "stop" (budget exhausted — stop walking),
+        "binary" / "too_large" (list only) or "extract"."""
+        base = PurePosixPath(member.name).name.lower()
+        # Skip OS metadata and empty files
+        if base in ("thumbs.db", "desktop.ini", ".ds_store") or member.size == 0:
+            return None
+        if self.files >= _MAX_ARCHIVE_FILES:
+            return "stop"
+        # Binary files — list but don't extract content
+        if _is_binary_extension(base):
+            self.files += 1
+            return "binary"
+        # Too large for extraction — list with size, never decompressed
+        if member.size > _MAX_SINGLE_FILE_BYTES:
+            self.files += 1
+            return "too_large"
+        # Budget is taken from the declared size before decompressing
+        reserve = member.size if member.size > 0 else _MAX_SINGLE_FILE_BYTES
+        if self.bytes + reserve > _MAX_ARCHIVE_TOTAL_BYTES:
+            return "stop"
+        self.files += 1
+        self.bytes += reserve
+        return "extract"
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _payload_size(payload: bytes | str) -> int:
+    return len(payload) if isinstance(payload, bytes) else os.path.getsize(payload)
+
+
+def _walk_archive(source: bytes | str, filename: str, archive_type: str) -> Iterator[_ArchiveMember]:
+    """Yield members lazily; the archive stays open while the consumer reads
+    each member before advancing (tar/rar are read sequentially)."""
+    fileobj = source if isinstance(source, str) else io.BytesIO(source)
+
+    if archive_type == "zip":
+        with zipfile.ZipFile(fileobj) as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    yield _ArchiveMember(info.filename, info.file_size, lambda info=info: zf.open(info))
+
+    elif archive_type == "tar":
+        try:
+            tf = (tarfile.open(name=source, mode="r:*") if isinstance(source, str)
+                  else tarfile.open(fileobj=fileobj, mode="r:*"))  # auto-detect compression
+        except tarfile.TarError:
+            # Plain gzip single file
+            import gzip
+            if not isinstance(source, str):
+                fileobj.seek(0)
+            inner_name = filename.replace(".gz", "")
+            yield _ArchiveMember(inner_name, -1, lambda: gzip.open(fileobj if not isinstance(source, str) else source))
+            return
+        with tf:
+            for member in tf:
+                if member.isfile():
+                    yield _ArchiveMember(member.name, member.size, lambda member=member: tf.extractfile(member))
+
+    elif archive_type == "rar":
+        try:
+            import rarfile
+        except ImportError:
+            logger.warning("RAR support requires 'rarfile' package + unrar binary")
+            return
+        with rarfile.RarFile(fileobj) as rf:
+            for info in rf.infolist():
+                if not info.is_dir():
+                    yield _ArchiveMember(info.filename, info.file_size, lambda info=info: rf.open(info))
+
+    elif archive_type == "7z":
+        try:
+            import py7zr
+        except ImportError:
+            logger.warning("7z support requires 'py7zr' package")
+            return
+        # py7zr decompresses to a directory, and every extract() call starts
+        # a solid block from its beginning — extracting member by member is
+        # O(n²). So everything the budget will admit (dry run of the
+        # consumer's _ArchiveBudget) is extracted in one sequential pass on
+        # the first read into a private temp dir under ARCHIVE_SPILL_DIR, and
+        # re-opened from disk by each reader. Disk use is bounded by
+        # _MAX_ARCHIVE_TOTAL_BYTES.
+        from app.config import settings
+        spill_root = settings.ARCHIVE_SPILL_DIR or None
+        with py7zr.SevenZipFile(fileobj, mode="r") as sz, tempfile.TemporaryDirectory(prefix="docext-7z-", dir=spill_root) as out:
+            extracted = False
+
+            def _open(name: str) -> BinaryIO:
+                nonlocal extracted
+                if not extracted:
+                    extracted = True
+                    sz.extract(path=out, targets=targets)
+                path = os.path.join(out, name)
+                if not os.path.exists(path):
+                    # Not in the plan (consumer diverged) — extract just this one
+                    sz.reset()
+                    sz.extract(path=out, targets=[name])
+                src = open(path, "rb")
+                _remove_quietly(path)   # unlinked; open handle keeps the data
+                return src
+
+            members = [
+                _ArchiveMember(info.filename, info.uncompressed or 0, lambda name=info.filename: _open(name))
+                for info in sz.list()
+                if not info.is_directory
+            ]
+            plan = _ArchiveBudget()
+            targets: list[str] = []
+            for member in members:
+                verdict = plan.admit(member)
+                if verdict == "stop":
+                    break
+                if verdict == "extract":
+                    targets.append(member.name)
+            yield from members
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Main extractor
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -265,8 +484,23 @@ def _human_size(size_bytes: int) -> str:
 class DocumentExtractor:
     """Document extraction service — any file → plain text."""
 
-    def __init__(self, ollama_router_url: str = "http://jervis-ollama-router:8080"):
+    def __init__(
+        self,
+        ollama_router_url: str = "http://jervis-ollama-router:8080",
+        pool: ExtractionPool | None = None,
+    ):
         self.router_url = ollama_router_url
+        self._pool = pool
+
+    def _get_pool(self) -> ExtractionPool:
+        if self._pool is None:
+            from app.config import settings
+            self._pool = ExtractionPool(
+                workers=settings.EXTRACT_POOL_WORKERS,
+                memory_mb=settings.EXTRACT_JOB_MEMORY_MB,
+                timeout_s=settings.EXTRACT_JOB_TIMEOUT_S,
+            )
+        return self._pool
 
     async def extract(
         self,
@@ -280,36 +514,91 @@ class DocumentExtractor:
         logger.info("DocumentExtractor: file=%s mime=%s type=%s size=%d depth=%d",
                      filename, mime_type, doc_type, len(file_bytes), _depth)
 
-        # Sync extractors
+        if doc_type in _POOLED_TYPES:
+            units = [u async for u in self._get_pool().stream(_extract_units, doc_type, file_bytes, filename)]
+            return self._collect(units)
+        elif doc_type == "pdf":
+            return await self._extract_pdf(file_bytes, max_tier)
+        elif doc_type == "image":
+            return await self._extract_image(file_bytes, max_tier)
+        elif doc_type in ("zip", "tar", "rar", "7z"):
+            return await self._extract_archive(file_bytes, filename, doc_type, max_tier, _depth)
+        else:
+            return self._extract_text_direct(file_bytes, filename)
+
+    async def extract_stream(
+        self,
+        file_bytes: bytes,
+        filename: str,
+        mime_type: str = "",
+        max_tier: str = "NONE",
+    ) -> AsyncIterator[ExtractionUnit]:
+        """Like extract(), but yields each PageContent as soon as it is parsed,
+        followed by an ExtractedDocument with method + metadata only.
+
+        Formats without natural pages arrive as a single page 1.
+        """
+        doc_type = _detect_type(mime_type, filename)
+        logger.info("DocumentExtractor: stream file=%s mime=%s type=%s size=%d",
+                    filename, mime_type, doc_type, len(file_bytes))
+
+        if doc_type in _POOLED_TYPES:
+            async for unit in self._get_pool().stream(_extract_units, doc_type, file_bytes, filename):
+                yield unit
+        elif doc_type == "pdf":
+            async for unit in self._iter_pdf(file_bytes, max_tier):
+                yield unit
+        else:
+            for unit in self._units(await self.extract(file_bytes, filename, mime_type, max_tier)):
+                yield unit
+
+    def _extract_sync(self, doc_type: str, file_bytes: bytes, filename: str) -> ExtractedDocument:
+        """Non-paged synchronous extractors (runs inside a pool child)."""
         sync_extractors = {
             "text": lambda: self._extract_text_direct(file_bytes, filename),
             "csv": lambda: self._extract_csv(file_bytes, filename),
             "html": lambda: self._extract_html(file_bytes),
             "docx": lambda: self._extract_docx(file_bytes),
             "doc": lambda: self._extract_doc_legacy(file_bytes),
-            "xlsx": lambda: self._extract_xlsx(file_bytes),
-            "xls": lambda: self._extract_xls_legacy(file_bytes),
-            "pptx": lambda: self._extract_pptx(file_bytes),
             "odt": lambda: self._extract_odf(file_bytes, "odt"),
             "ods": lambda: self._extract_odf(file_bytes, "ods"),
             "odp": lambda: self._extract_odf(file_bytes, "odp"),
             "rtf": lambda: self._extract_rtf(file_bytes),
             "msg": lambda: self._extract_msg(file_bytes),
             "eml": lambda: self._extract_eml(file_bytes),
-            "epub": lambda: self._extract_epub(file_bytes),
             "vsdx": lambda: self._extract_vsdx(file_bytes),
         }
-
         if doc_type in sync_extractors:
             return sync_extractors[doc_type]()
-        elif doc_type == "pdf":
-            return await self._extract_pdf(file_bytes, max_tier)
-        elif doc_type == "image":
-            return await self._extract_image(file_bytes, max_tier)
-        elif doc_type in ("zip", "tar", "rar", "7z"):
-            return await self._extract_archive(file_bytes, filename, doc_type, max_tier, _depth)
-        else:
-            return self._extract_text_direct(file_bytes, filename)
+        return self._extract_text_direct(file_bytes, filename)
+
+    def _iter_paged(self, doc_type: str, file_bytes: bytes) -> Iterator[ExtractionUnit] | None:
+        paged = {
+            "xlsx": self._iter_xlsx,
+            "xls": self._iter_xls_legacy,
+            "pptx": self._iter_pptx,
+            "epub": self._iter_epub,
+        }
+        it = paged.get(doc_type)
+        return it(file_bytes) if it else None
+
+    @staticmethod
+    def _units(doc: ExtractedDocument) -> Iterator[ExtractionUnit]:
+        """Single-page unit stream for a fully extracted document."""
+        yield PageContent(page_number=1, text=doc.text)
+        yield ExtractedDocument(text="", method=doc.method, metadata=doc.metadata)
+
+    @staticmethod
+    def _collect(units) -> ExtractedDocument:
+        """Reassemble a unit stream into the document extract() always returned."""
+        texts = []
+        summary = ExtractedDocument(text="")
+        for unit in units:
+            if isinstance(unit, PageContent):
+                texts.append(unit.text)
+            else:
+                summary = unit
+        return ExtractedDocument(text="\n\n".join(texts), method=summary.method, metadata=summary.metadata)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Text / CSV / HTML
@@ -399,74 +688,87 @@ class DocumentExtractor:
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _extract_xlsx(self, file_bytes: bytes) -> ExtractedDocument:
+        return self._collect(self._iter_xlsx(file_bytes))
+
+    def _iter_xlsx(self, file_bytes: bytes) -> Iterator[ExtractionUnit]:
+        """One page per non-empty sheet."""
         from openpyxl import load_workbook
         wb = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
-        parts = []
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            sheet_rows = []
-            for row in ws.iter_rows(values_only=True):
-                cells = [str(c) if c is not None else "" for c in row]
-                if any(cells):
-                    sheet_rows.append(" | ".join(cells))
-            if sheet_rows:
-                parts.append(f"=== Sheet: {sheet_name} ===\n" + "\n".join(sheet_rows))
-        wb.close()
-        text = "\n\n".join(parts)
-        return ExtractedDocument(text=text, method="xlsx", metadata={"sheet_count": len(wb.sheetnames)})
+        page = 0
+        try:
+            for sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+                sheet_rows = []
+                for row in ws.iter_rows(values_only=True):
+                    cells = [str(c) if c is not None else "" for c in row]
+                    if any(cells):
+                        sheet_rows.append(" | ".join(cells))
+                if sheet_rows:
+                    page += 1
+                    yield PageContent(page_number=page,
+                                      text=f"=== Sheet: {sheet_name} ===\n" + "\n".join(sheet_rows))
+        finally:
+            wb.close()
+        yield ExtractedDocument(text="", method="xlsx", metadata={"sheet_count": len(wb.sheetnames)})
 
     def _extract_xls_legacy(self, file_bytes: bytes) -> ExtractedDocument:
+        return self._collect(self._iter_xls_legacy(file_bytes))
+
+    def _iter_xls_legacy(self, file_bytes: bytes) -> Iterator[ExtractionUnit]:
         try:
             import xlrd
             wb = xlrd.open_workbook(file_contents=file_bytes)
-            parts = []
-            for sheet_name in wb.sheet_names():
-                ws = wb.sheet_by_name(sheet_name)
-                sheet_rows = []
-                for row_idx in range(ws.nrows):
-                    cells = [str(ws.cell_value(row_idx, col_idx)) for col_idx in range(ws.ncols)]
-                    if any(c.strip() for c in cells):
-                        sheet_rows.append(" | ".join(cells))
-                if sheet_rows:
-                    parts.append(f"=== Sheet: {sheet_name} ===\n" + "\n".join(sheet_rows))
-            text = "\n\n".join(parts)
-            return ExtractedDocument(text=text, method="xls-xlrd",
-                                     metadata={"sheet_count": wb.nsheets})
         except Exception as e:
             logger.warning("Legacy .xls extraction failed: %s — trying openpyxl", e)
-            return self._extract_xlsx(file_bytes)
+            yield from self._iter_xlsx(file_bytes)
+            return
+        page = 0
+        for sheet_name in wb.sheet_names():
+            ws = wb.sheet_by_name(sheet_name)
+            sheet_rows = []
+            for row_idx in range(ws.nrows):
+                cells = [str(ws.cell_value(row_idx, col_idx)) for col_idx in range(ws.ncols)]
+                if any(c.strip() for c in cells):
+                    sheet_rows.append(" | ".join(cells))
+            if sheet_rows:
+                page += 1
+                yield PageContent(page_number=page,
+                                  text=f"=== Sheet: {sheet_name} ===\n" + "\n".join(sheet_rows))
+        yield ExtractedDocument(text="", method="xls-xlrd", metadata={"sheet_count": wb.nsheets})
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PowerPoint: PPTX
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _extract_pptx(self, file_bytes: bytes) -> ExtractedDocument:
+        return self._collect(self._iter_pptx(file_bytes))
+
+    def _iter_pptx(self, file_bytes: bytes) -> Iterator[ExtractionUnit]:
+        """One page per slide."""
         try:
             from pptx import Presentation
             prs = Presentation(io.BytesIO(file_bytes))
-            parts = []
-            for slide_num, slide in enumerate(prs.slides, 1):
-                slide_parts = [f"--- Slide {slide_num} ---"]
-                for shape in slide.shapes:
-                    if shape.has_text_frame:
-                        for para in shape.text_frame.paragraphs:
-                            if para.text.strip():
-                                slide_parts.append(para.text)
-                    if shape.has_table:
-                        for row in shape.table.rows:
-                            cells = [cell.text.strip() for cell in row.cells]
-                            slide_parts.append(" | ".join(cells))
-                if slide.has_notes_slide and slide.notes_slide.notes_text_frame:
-                    notes = slide.notes_slide.notes_text_frame.text.strip()
-                    if notes:
-                        slide_parts.append(f"[Notes: {notes}]")
-                parts.append("\n".join(slide_parts))
-            text = "\n\n".join(parts)
-            return ExtractedDocument(text=text, method="pptx",
-                                     metadata={"slide_count": len(prs.slides)})
         except Exception as e:
             logger.warning("PPTX extraction failed: %s — trying as text", e)
-            return self._extract_text_direct(file_bytes, "presentation.pptx")
+            yield from self._units(self._extract_text_direct(file_bytes, "presentation.pptx"))
+            return
+        for slide_num, slide in enumerate(prs.slides, 1):
+            slide_parts = [f"--- Slide {slide_num} ---"]
+            for shape in slide.shapes:
+                if shape.has_text_frame:
+                    for para in shape.text_frame.paragraphs:
+                        if para.text.strip():
+                            slide_parts.append(para.text)
+                if shape.has_table:
+                    for row in shape.table.rows:
+                        cells = [cell.text.strip() for cell in row.cells]
+                        slide_parts.append(" | ".join(cells))
+            if slide.has_notes_slide and slide.notes_slide.notes_text_frame:
+                notes = slide.notes_slide.notes_text_frame.text.strip()
+                if notes:
+                    slide_parts.append(f"[Notes: {notes}]")
+            yield PageContent(page_number=slide_num, text="\n".join(slide_parts))
+        yield ExtractedDocument(text="", method="pptx", metadata={"slide_count": len(prs.slides)})
 
     # ═══════════════════════════════════════════════════════════════════════════
     # OpenDocument: ODT, ODS, ODP
@@ -613,29 +915,34 @@ class DocumentExtractor:
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _extract_epub(self, file_bytes: bytes) -> ExtractedDocument:
+        return self._collect(self._iter_epub(file_bytes))
+
+    def _iter_epub(self, file_bytes: bytes) -> Iterator[ExtractionUnit]:
+        """One page per chapter; the book title heads the first one."""
         try:
             from ebooklib import epub
             from bs4 import BeautifulSoup
 
             book = epub.read_epub(io.BytesIO(file_bytes))
-            parts = []
-
             title = book.get_metadata('DC', 'title')
-            if title:
-                parts.append(f"# {title[0][0]}")
-
-            for item in book.get_items_of_type(9):  # ITEM_DOCUMENT
-                soup = BeautifulSoup(item.get_content(), "lxml")
-                text = soup.get_text(separator="\n", strip=True)
-                if text.strip():
-                    parts.append(text)
-
-            text = "\n\n".join(parts)
-            return ExtractedDocument(text=text, method="epub",
-                                     metadata={"title": title[0][0] if title else ""})
         except Exception as e:
             logger.warning("EPUB extraction failed: %s", e)
-            return ExtractedDocument(text="(EPUB extraction failed)", method="epub-error")
+            yield from self._units(ExtractedDocument(text="(EPUB extraction failed)", method="epub-error"))
+            return
+
+        heading = f"# {title[0][0]}" if title else ""
+        page = 0
+        for item in book.get_items_of_type(9):  # ITEM_DOCUMENT
+            soup = BeautifulSoup(item.get_content(), "lxml")
+            text = soup.get_text(separator="\n", strip=True)
+            if text.strip():
+                page += 1
+                if heading:
+                    text, heading = f"{heading}\n\n{text}", ""
+                yield PageContent(page_number=page, text=text)
+        if heading:
+            yield PageContent(page_number=1, text=heading)
+        yield ExtractedDocument(text="", method="epub", metadata={"title": title[0][0] if title else ""})
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Visio (VSDX)
@@ -667,192 +974,249 @@ class DocumentExtractor:
     # ═══════════════════════════════════════════════════════════════════════════
 
     async def _extract_archive(
-        self, file_bytes: bytes, filename: str, archive_type: str,
+        self, source: bytes | str, filename: str, archive_type: str,
         max_tier: str, depth: int,
     ) -> ExtractedDocument:
+        """Walk an archive lazily and extract eligible members in parallel.
+
+        source is the archive bytes, or the path of an archive that was
+        spilled to disk by the parent level. Members are decompressed one at
+        a time, only after the file/byte budgets admitted their declared
+        size (_ArchiveBudget), and at most ARCHIVE_EXTRACT_CONCURRENCY
+        decompressed members are held at once (7z decompresses the admitted
+        members to disk in one pass, see _walk_archive). Members above
+        ARCHIVE_SPILL_BYTES go to a temp file; nested archives are then
+        opened from that file. Output keeps archive order.
+        """
         if depth >= _MAX_ARCHIVE_DEPTH:
             return ExtractedDocument(
                 text=f"(archive recursion limit reached: {filename})",
                 method="archive-skip",
             )
 
-        parts = []
-        binary_listing = []
-        files_processed = 0
-        total_bytes = 0
-        truncated = False
+        from app.config import settings
 
-        try:
-            entries = self._list_archive_entries(file_bytes, filename, archive_type)
-
-            for entry_name, entry_bytes in entries:
-                if files_processed >= _MAX_ARCHIVE_FILES:
-                    truncated = True
-                    break
-                if total_bytes >= _MAX_ARCHIVE_TOTAL_BYTES:
-                    truncated = True
-                    break
-
-                base = PurePosixPath(entry_name).name.lower()
-                size = len(entry_bytes)
+        window = asyncio.Semaphore(max(1, settings.ARCHIVE_EXTRACT_CONCURRENCY))
+        results: list[asyncio.Task | tuple[str, str]] = []   # archive order
+        budget = _ArchiveBudget()
+        truncated = False
+        walk_error: Exception | None = None
 
-                # Skip OS metadata
-                if base in ("thumbs.db", "desktop.ini", ".ds_store"):
-                    continue
+        async def _extract_member(name: str, payload: bytes | str, size: int) -> tuple[str, str]:
+            try:
+                member_type = _detect_type("", name)
+                if isinstance(payload, str) and member_type in ("zip", "tar", "rar", "7z"):
+                    result = await self._extract_archive(payload, name, member_type, max_tier, depth + 1)
+                else:
+                    data = payload if isinstance(payload, bytes) else await asyncio.to_thread(_read_file, payload)
+                    result = await self.extract(data, name, max_tier=max_tier, _depth=depth + 1)
+                return ("part", f"=== {name} ===\n{result.text}") if result.text.strip() else ("", "")
+            except Exception as e:
+                logger.warning("Failed to extract %s from archive: %s", name, e)
+                return "error", f"  {name} ({_human_size(size)}, extraction error)"
+            finally:
+                if isinstance(payload, str):
+                    _remove_quietly(payload)
+                window.release()
 
-                # Binary files — list but don't extract content
-                if _is_binary_extension(base):
-                    binary_listing.append(f"  {entry_name} ({_human_size(size)})")
-                    files_processed += 1
-                    continue
+        with tempfile.TemporaryDirectory(prefix="docext-", dir=settings.ARCHIVE_SPILL_DIR or None) as spill_dir:
+            walker = _walk_archive(source, filename, archive_type)
+            try:
+                while True:
+                    try:
+                        member = await asyncio.to_thread(next, walker, None)
+                    except Exception as e:
+                        walk_error = e
+                        break
+                    if member is None:
+                        break
 
-                # Empty files
-                if size == 0:
-                    continue
+                    verdict = budget.admit(member)
+                    if verdict is None:
+                        continue
+                    if verdict == "stop":
+                        truncated = True
+                        break
+                    if verdict == "binary":
+                        results.append(("binary", f"  {member.name} ({_human_size(member.size)})"))
+                        continue
+                    if verdict == "too_large":
+                        results.append(("binary", f"  {member.name} ({_human_size(member.size)}, too large to extract)"))
+                        continue
 
-                # Too large for extraction — list with size
-                if size > _MAX_SINGLE_FILE_BYTES:
-                    binary_listing.append(f"  {entry_name} ({_human_size(size)}, too large to extract)")
-                    files_processed += 1
-                    continue
+                    await window.acquire()
+                    try:
+                        payload = await asyncio.to_thread(
+                            member.read, spill_dir, settings.ARCHIVE_SPILL_BYTES, _MAX_SINGLE_FILE_BYTES,
+                        )
+                    except Exception as e:
+                        window.release()
+                        logger.warning("Skipping %s in %s archive: %s", member.name, archive_type, e)
+                        results.append(("error", f"  {member.name} ({_human_size(member.size)}, extraction error)"))
+                        continue
+                    size = member.size if member.size > 0 else _payload_size(payload)
+                    results.append(asyncio.create_task(_extract_member(member.name, payload, size)))
 
+                done = [await r if isinstance(r, asyncio.Task) else r for r in results]
+            finally:
                 try:
-                    result = await self.extract(
-                        entry_bytes, entry_name, max_tier=max_tier, _depth=depth + 1,
-                    )
-                    if result.text.strip():
-                        parts.append(f"=== {entry_name} ===\n{result.text}")
-                        files_processed += 1
-                        total_bytes += size
-                except Exception as e:
-                    logger.warning("Failed to extract %s from archive: %s", entry_name, e)
-                    binary_listing.append(f"  {entry_name} ({_human_size(size)}, extraction error)")
-
-        except Exception as e:
-            logger.warning("Archive extraction failed for %s: %s", filename, e)
+                    walker.close()
+                except ValueError:
+                    pass  # cancelled while a worker thread was advancing it
+                for r in results:
+                    if isinstance(r, asyncio.Task):
+                        r.cancel()
+
+        if walk_error is not None and not results:
+            logger.warning("Archive extraction failed for %s: %s", filename, walk_error)
             return ExtractedDocument(
-                text=f"(failed to open archive: {filename}: {e})",
+                text=f"(failed to open archive: {filename}: {walk_error})",
                 method="archive-error",
             )
+        if walk_error is not None:
+            logger.warning("Archive %s: walk stopped after %d members: %s", filename, len(results), walk_error)
 
+        parts = [text for kind, text in done if kind == "part"]
+        binary_listing = [text for kind, text in done if kind in ("binary", "error")]
         if binary_listing:
             parts.append("=== Binary/non-text files ===\n" + "\n".join(binary_listing))
         if truncated:
-            parts.append(f"(archive truncated: limit reached at {files_processed} files)")
+            parts.append(f"(archive truncated: limit reached at {budget.files} files)")
 
         text = "\n\n".join(parts) if parts else "(empty archive)"
         return ExtractedDocument(
             text=text, method=f"archive-{archive_type}",
             metadata={
                 "archive_type": archive_type,
-                "files_extracted": files_processed,
+                "files_extracted": sum(1 for kind, _ in done if kind in ("part", "binary")),
                 "binary_files": len(binary_listing),
             },
         )
 
-    def _list_archive_entries(
-        self, file_bytes: bytes, filename: str, archive_type: str,
-    ) -> list[tuple[str, bytes]]:
-        """Yield (name, bytes) for each file in the archive."""
-        entries = []
-
-        if archive_type == "zip":
-            with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
-                for info in zf.infolist():
-                    if info.is_dir():
-                        continue
-                    try:
-                        entries.append((info.filename, zf.read(info)))
-                    except Exception as e:
-                        logger.warning("Skipping %s in ZIP: %s", info.filename, e)
-
-        elif archive_type == "tar":
-            mode = "r:*"  # auto-detect compression
-            try:
-                with tarfile.open(fileobj=io.BytesIO(file_bytes), mode=mode) as tf:
-                    for member in tf.getmembers():
-                        if not member.isfile():
-                            continue
-                        f = tf.extractfile(member)
-                        if f:
-                            entries.append((member.name, f.read()))
-            except Exception:
-                # Try plain gzip single file
-                import gzip
-                try:
-                    data = gzip.decompress(file_bytes)
-                    inner_name = filename.replace(".gz", "")
-                    entries.append((inner_name, data))
-                except Exception:
-                    pass
-
-        elif archive_type == "rar":
-            try:
-                import rarfile
-                with rarfile.RarFile(io.BytesIO(file_bytes)) as rf:
-                    for info in rf.infolist():
-                        if info.is_dir():
-                            continue
-                        entries.append((info.filename, rf.read(info)))
-            except ImportError:
-                logger.warning("RAR support requires 'rarfile' package + unrar binary")
-            except Exception as e:
-                logger.warning("RAR extraction failed: %s", e)
-
-        elif archive_type == "7z":
-            try:
-                import py7zr
-                with py7zr.SevenZipFile(io.BytesIO(file_bytes), mode='r') as sz:
-                    for fname, bio in sz.readall().items():
-                        entries.append((fname, bio.read()))
-            except ImportError:
-                logger.warning("7z support requires 'py7zr' package")
-            except Exception as e:
-                logger.warning("7z extraction failed: %s", e)
-
-        return entries
-
     # ═══════════════════════════════════════════════════════════════════════════
     # PDF (hybrid: pymupdf text + VLM for scanned pages)
     # ═══════════════════════════════════════════════════════════════════════════
 
     async def _extract_pdf(self, file_bytes: bytes, max_tier: str) -> ExtractedDocument:
-        import fitz
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
         pages: list[PageContent] = []
-        method = "pymupdf"
-        has_vlm_pages = False
+        summary = ExtractedDocument(text="")
+        async for unit in self._iter_pdf(file_bytes, max_tier):
+            if isinstance(unit, PageContent):
+                pages.append(unit)
+            else:
+                summary = unit
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text("text").strip()
-            image_list = page.get_images(full=True)
-            has_images = len(image_list) > 0
-            is_scan = len(page_text) < 100
+        full_text = "\n\n".join(f"--- Page {p.page_number} ---\n{p.text}" for p in pages if p.text)
+        return ExtractedDocument(text=full_text, pages=pages, method=summary.method, metadata=summary.metadata)
+
+    async def _iter_pdf(self, file_bytes: bytes, max_tier: str) -> AsyncIterator[ExtractionUnit]:
+        """Pipelined PDF extraction, pages yielded in page order.
+
+        A pool child walks the pages (pymupdf text, 200-dpi render of scanned
+        pages, fingerprint) while VLM calls for already rendered pages run
+        in a window of PDF_VLM_CONCURRENCY. The next page is read from the
+        child only while the window has a free slot, so rendering is paced
+        by VLM throughput and at most a window's worth of page images (plus
+        the child's small read-ahead) is in memory. Scanned pages that look
+        the same as an earlier one (blank pages, repeated letterheads) reuse
+        its VLM call. Per-page timings go to the log and
+        metadata["page_timings"].
+        """
+        import json
+        from app.config import settings
 
-            if (has_images or is_scan) and (is_scan or not page_text):
+        vlm_slots = max(1, settings.PDF_VLM_CONCURRENCY)
+        window = asyncio.Semaphore(vlm_slots)
+        started = time.monotonic()
+
+        async def _vlm(scan: _PdfPageScan) -> tuple[str, float]:
+            async with window:
+                t0 = time.monotonic()
                 try:
-                    pix = page.get_pixmap(dpi=200)
-                    image_bytes = pix.tobytes("png")
-                    vlm_text = await self._call_vlm(image_bytes, max_tier)
-                    page_content = PageContent(
-                        page_number=page_num + 1, text=vlm_text,
-                        images=[ImageDescription(description=vlm_text)])
-                    has_vlm_pages = True
-                except Exception as e:
-                    logger.warning("VLM failed for PDF page %d: %s — using pymupdf text", page_num + 1, e)
-                    page_content = PageContent(page_number=page_num + 1, text=page_text)
+                    text = await self._call_vlm(scan.image, max_tier)
+                finally:
+                    scan.image = None   # PNGs of finished pages are not kept around
+                return text, time.monotonic() - t0
+
+        # In page order: (scan, VLM task or None, source)
+        pending: deque[tuple[_PdfPageScan, asyncio.Task | None, str]] = deque()
+        vlm_pages: list[tuple[_PdfPageScan, asyncio.Task]] = []
+        tasks: list[asyncio.Task] = []
+        timings: list[dict] = []
+        counts = {"text": 0, "vlm": 0, "dedup": 0, "fallback": 0}
+        render_s = 0.0
+
+        def _resolve(scan: _PdfPageScan, task: asyncio.Task | None, source: str) -> PageContent:
+            vlm_s = 0.0
+            if task is None:
+                page = PageContent(page_number=scan.page_number, text=scan.text)
             else:
-                page_content = PageContent(page_number=page_num + 1, text=page_text)
-            pages.append(page_content)
-
-        doc.close()
-        if has_vlm_pages:
-            method = "hybrid"
+                try:
+                    vlm_text, vlm_s = task.result()
+                    page = PageContent(page_number=scan.page_number, text=vlm_text,
+                                       images=[ImageDescription(description=vlm_text)])
+                except Exception as e:
+                    logger.warning("VLM failed for PDF page %d: %s — using pymupdf text", scan.page_number, e)
+                    page = PageContent(page_number=scan.page_number, text=scan.text)
+                    source = "fallback"
+                if source == "dedup":
+                    vlm_s = 0.0
+            counts[source] += 1
+            timings.append({"page": scan.page_number, "source": source,
+                            "render_ms": round(scan.render_s * 1000),
+                            "vlm_ms": round(vlm_s * 1000),
+                            "ready_ms": round((time.monotonic() - started) * 1000)})
+            logger.info("PDF_PAGE: page=%d source=%s render=%.2fs vlm=%.2fs",
+                        scan.page_number, source, scan.render_s, vlm_s)
+            return page
 
-        full_text = "\n\n".join(f"--- Page {p.page_number} ---\n{p.text}" for p in pages if p.text)
-        return ExtractedDocument(text=full_text, pages=pages, method=method,
-                                 metadata={"page_count": len(pages), "has_images": has_vlm_pages})
+        try:
+            scans = self._get_pool().stream(
+                _scan_pdf_pages, file_bytes, settings.PDF_RENDER_DPI, maxsize=_PDF_READ_AHEAD,
+            )
+            async for scan in scans:
+                render_s += scan.render_s
+                if scan.image is None:
+                    pending.append((scan, None, "text"))
+                else:
+                    leader = _find_duplicate(scan, vlm_pages) if settings.PDF_DEDUP_ENABLED else None
+                    if leader is not None:
+                        scan.image = None
+                        pending.append((scan, leader, "dedup"))
+                    else:
+                        task = asyncio.create_task(_vlm(scan))
+                        tasks.append(task)
+                        vlm_pages.append((scan, task))
+                        pending.append((scan, task, "vlm"))
+                        # Window full — wait for a slot before reading the next page
+                        in_flight = [t for t in tasks if not t.done()]
+                        if len(in_flight) >= vlm_slots:
+                            await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                # Hand out every page whose predecessors are all done
+                while pending and (pending[0][1] is None or pending[0][1].done()):
+                    yield _resolve(*pending.popleft())
+
+            while pending:
+                scan, task, source = pending.popleft()
+                if task is not None:
+                    await asyncio.wait([task])
+                yield _resolve(scan, task, source)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        has_vlm_pages = counts["vlm"] + counts["dedup"] > 0
+        logger.info("PDF: pages=%d text=%d vlm=%d dedup=%d fallback=%d render=%.2fs wall=%.2fs",
+                    len(timings), counts["text"], counts["vlm"], counts["dedup"], counts["fallback"],
+                    render_s, time.monotonic() - started)
+        yield ExtractedDocument(
+            text="", method="hybrid" if has_vlm_pages else "pymupdf",
+            metadata={
+                "page_count": len(timings), "has_images": has_vlm_pages,
+                "vlm_pages": counts["vlm"], "vlm_deduplicated": counts["dedup"],
+                "page_timings": json.dumps(timings),
+            },
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Image (VLM)
@@ -924,3 +1288,96 @@ class DocumentExtractor:
             u = u.split("://", 1)[1]
         host = u.split("/")[0].split(":")[0]
         return f"{host}:5501"
+
+
+def _extract_units(doc_type: str, file_bytes: bytes, filename: str) -> Iterator[ExtractionUnit]:
+    """Process-pool job — must stay module-level (picklable).
+
+    Paged formats yield page by page; the rest yield their whole text as page 1.
+    """
+    extractor = DocumentExtractor()
+    paged = extractor._iter_paged(doc_type, file_bytes)
+    if paged is not None:
+        yield from paged
+    else:
+        yield from extractor._units(extractor._extract_sync(doc_type, file_bytes, filename))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PDF page walk (pool child) + duplicate page detection
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_DEDUP_MAX_HAMMING = 4           # dHash bits that may differ for a candidate
+_DEDUP_PIXEL_DELTA = 64          # grayscale delta counted as a changed thumb pixel
+_DEDUP_MAX_CHANGED_PX = 16       # changed 72-dpi pixels still "same page" (scan noise)
+
+
+def _gray_samples(page, sx: float, sy: float) -> tuple[bytes, int, int]:
+    import fitz
+    pix = page.get_pixmap(matrix=fitz.Matrix(sx, sy), colorspace=fitz.csGRAY, alpha=False)
+    rows = [pix.samples[y * pix.stride:y * pix.stride + pix.width] for y in range(pix.height)]
+    return b"".join(rows), pix.width, pix.height
+
+
+def _page_fingerprint(page) -> tuple[int, bytes, int]:
+    """(64-bit dHash over a 9×8 grayscale render, 72-dpi grayscale page, its width)."""
+    rect = page.rect
+    small, w, h = _gray_samples(page, 9 / rect.width, 8 / rect.height)
+    bits = 0
+    for y in range(h):
+        row = small[y * w:(y + 1) * w]
+        for x in range(w - 1):
+            bits = (bits << 1) | (row[x] < row[x + 1])
+    thumb, thumb_width, _ = _gray_samples(page, 1.0, 1.0)
+    return bits, thumb, thumb_width
+
+
+def _same_thumb(a: bytes, b: bytes, width: int) -> bool:
+    """At most _DEDUP_MAX_CHANGED_PX clearly different pixels (row-wise, early exit)."""
+    changed = 0
+    for start in range(0, len(a), width):
+        row_a, row_b = a[start:start + width], b[start:start + width]
+        if row_a == row_b:
+            continue
+        changed += sum(1 for x, y in zip(row_a, row_b) if abs(x - y) > _DEDUP_PIXEL_DELTA)
+        if changed > _DEDUP_MAX_CHANGED_PX:
+            return False
+    return True
+
+
+def _find_duplicate(scan: _PdfPageScan, seen: list[tuple[_PdfPageScan, asyncio.Task]]) -> asyncio.Task | None:
+    """VLM task of an earlier page that renders the same as this one, if any.
+
+    dHash picks candidates; the 72-dpi comparison rejects pages that only
+    share a layout (two pages of one contract hash alike at 9×8) — a single
+    changed word is well over the pixel budget.
+    """
+    for other, task in seen:
+        if bin(scan.dhash ^ other.dhash).count("1") > _DEDUP_MAX_HAMMING:
+            continue
+        if not scan.thumb or len(scan.thumb) != len(other.thumb) or scan.thumb_width != other.thumb_width:
+            continue
+        if _same_thumb(scan.thumb, other.thumb, scan.thumb_width):
+            return task
+    return None
+
+
+def _scan_pdf_pages(file_bytes: bytes, dpi: int) -> Iterator[_PdfPageScan]:
+    """Process-pool job: pymupdf text per page, PNG + fingerprint for scanned pages."""
+    import fitz
+    doc = fitz.open(stream=file_bytes, filetype="pdf")
+    try:
+        for page_num in range(len(doc)):
+            t0 = time.monotonic()
+            page = doc[page_num]
+            page_text = page.get_text("text").strip()
+            has_images = len(page.get_images(full=True)) > 0
+            is_scan = len(page_text) < 100
+            scan = _PdfPageScan(page_number=page_num + 1, text=page_text)
+            if (has_images or is_scan) and (is_scan or not page_text):
+                scan.image = page.get_pixmap(dpi=dpi).tobytes("png")
+                scan.dhash, scan.thumb, scan.thumb_width = _page_fingerprint(page)
+            scan.render_s = time.monotonic() - t0
+            yield scan
+    finally:
+        doc.close()
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
 
     # -- Microservice endpoints -------------------------------------------------
     DOCUMENT_EXTRACTION_URL: str = "http://jervis-document-extraction:8080"  # Dedicated text extraction service
+    DOCUMENT_EXTRACTION_STREAMING: bool = True               # ingest_file: embed pages while later ones still parse
     KOTLIN_SERVER_URL: str = ""                              # Kotlin server for progress callbacks (e.g. http://jervis-server:5500)
 
     # -- Model configuration ----------------------------------------------------
@@ -59,6 +60,7 @@ class Settings(BaseSettings):
     INGEST_PROMPT_RESERVE: int = 1_500      # Reserve tokens for instruction/system part of prompt
     TOKEN_ESTIMATE_RATIO: float = 2.5       # chars / 2.5 ≈ tokens (Czech text heuristic)
     MAX_EXTRACTION_CHUNKS: int = 30         # Max chunks for LLM graph extraction per document
+    INGEST_EXTRACT_CONCURRENCY: int = 2     # Parallel extraction LLM calls per ingest (GPU queue flooding)
     LLM_CALL_TIMEOUT: float = 86400.0       # ChatOllama wrapper potřebuje float, prakticky neomezeno (24h)
 
     # -- Image processing -------------------------------------------------------
@@ -88,11 +90,36 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_READS: int = 1000  # Effectively unlimited (pod capacity limit)
     MAX_CONCURRENT_WRITES: int = 10   # Max parallel write requests (queue others)
 
+    # -- Alias registry cache (see alias_registry.py) ----------------------------
+    ALIAS_CACHE_MAX_ENTRIES: int = 100_000   # In-process LRU alias → canonical
+    ALIAS_CACHE_TTL_S: int = 300             # Bounds staleness vs. writes from other pods
+    ALIAS_SEEN_FLUSH_S: int = 30             # Buffered seenCount flush interval
+
+    # -- Code structure ingest (tree-sitter process pool, see code_parse_pool.py)
+    CODE_PARSE_WORKERS: int = 4              # Parser processes per KB pod
+    CODE_PARSE_CHUNK_FILES: int = 32         # Files per pool task (amortizes IPC)
+    CODE_INGEST_INCREMENTAL: bool = True     # Skip files whose git blob hash is unchanged
+
+    # -- LLM extraction queue (see llm_extraction_queue.py) --------------------
+    EXTRACTION_CLAIM_BATCH: int = 8          # Tasks claimed per dequeue transaction (= packing window)
+    EXTRACTION_LEASE_S: int = 600            # Claim lease; renewed while the worker holds the task
+    EXTRACTION_PACK_ENABLED: bool = True     # Pack small tasks of one client into shared extraction prompts
+    EXTRACTION_PACK_MAX_DOC_CHARS: int = 4_000   # Larger tasks are extracted on their own (with progress)
+    EXTRACTION_PACK_MAX_CHUNKS: int = 8      # Chunks per packed prompt
+    EXTRACTION_PACK_INPUT_TOKENS: int = 6_000    # Chunk text tokens per packed prompt
+
     # -- Thought Map maintenance -------------------------------------------------
     THOUGHT_DECAY_FACTOR: float = 0.995
     THOUGHT_MERGE_THRESHOLD: float = 0.92
     THOUGHT_ARCHIVE_THRESHOLD: float = 0.05
     THOUGHT_ARCHIVE_DAYS: int = 30
+    THOUGHT_MERGE_MAX_BLOCK_MB: int = 64     # RAM cap per corpus block in all-pairs merge
+
+    # -- Thought vector index (in-process, see thought_index.py) ---------------
+    THOUGHT_INDEX_ENABLED: bool = True       # False = always exact AQL cosine scan
+    THOUGHT_INDEX_REFRESH_S: int = 300       # Reload bucket after N s (picks up other pods' writes)
+    THOUGHT_INDEX_IVF_MIN: int = 20_000      # Rows per client before switching exact scan → IVF
+    THOUGHT_INDEX_IVF_NPROBE: int = 8        # IVF lists scanned per query
 
     # -- Embedding concurrency --------------------------------------------------
     # GPU-2 benchmark (2026-03-04): sweet spot = 4-5 concurrent requests
@@ -101,6 +128,17 @@ class Settings(BaseSettings):
     # WRITE (1 worker): set to 5 → optimal for single process batch embedding
     MAX_CONCURRENT_EMBEDDINGS: int = 5
 
+    # -- Embedding cache (see embedding_cache.py) -------------------------------
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "/opt/jervis/data/embedding_cache.db"  # Empty = memory tier only
+    EMBEDDING_CACHE_MEMORY_ENTRIES: int = 20_000   # ~80 MB of float32 at 1024d
+    EMBEDDING_CACHE_DISK_ENTRIES: int = 2_000_000  # ~8 GB of float32 blobs at 1024d
+
+    # -- Hybrid retrieval cache (see retrieval_cache.py) --------------------------
+    RETRIEVAL_CACHE_ENABLED: bool = True
+    RETRIEVAL_CACHE_MAX_ENTRIES: int = 2_000       # EvidencePacks per process
+    RETRIEVAL_CACHE_TTL_S: int = 120               # Upper bound if a generation bump is lost
+
     class Config:
         env_file = ".env"
 
@@ -913,7 +913,8 @@ class IngestServicer(ingest_pb2_grpc.KnowledgeIngestServiceServicer):
 class RetrieveServicer(retrieve_pb2_grpc.KnowledgeRetrieveServiceServicer):
     """KnowledgeRetrieveService — read-side RAG + graph retrieval.
 
-    Retrieve (hybrid) and RetrieveSimple (RAG-only) land in this slice.
+    Retrieve (hybrid), RetrieveSimple (RAG-only) and RetrieveBatch (several
+    of either, one embedding batch) land in this slice.
     RetrieveHybrid with full knobs, AnalyzeCode, JoernScan, and
     ListChunksByKind stay on FastAPI until their slices land.
     """
@@ -980,6 +981,30 @@ class RetrieveServicer(retrieve_pb2_grpc.KnowledgeRetrieveServiceServicer):
             return retrieve_pb2.EvidencePack(items=[])
         return self._evidence_to_proto(pack)
 
+    async def RetrieveBatch(
+        self,
+        request: retrieve_pb2.BatchRetrievalRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> retrieve_pb2.BatchEvidencePack:
+        """Several Retrieve/RetrieveSimple queries sharing one embedding batch."""
+        queries = [(self._to_pydantic(q.request), q.simple) for q in request.queries]
+        if not queries:
+            return retrieve_pb2.BatchEvidencePack()
+        try:
+            packs, incomplete = await self._service().retrieve_batch(
+                queries, budget_s=request.budget_ms / 1000.0,
+            )
+        except Exception as e:
+            logger.warning("RETRIEVE_BATCH_ERROR queries=%d error=%s", len(queries), e)
+            return retrieve_pb2.BatchEvidencePack(
+                packs=[retrieve_pb2.EvidencePack(items=[]) for _ in queries],
+                incomplete=list(range(len(queries))),
+            )
+        return retrieve_pb2.BatchEvidencePack(
+            packs=[self._evidence_to_proto(pack) for pack in packs],
+            incomplete=incomplete,
+        )
+
     async def RetrieveHybrid(
         self,
         request: retrieve_pb2.HybridRetrievalRequest,
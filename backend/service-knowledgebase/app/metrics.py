@@ -36,6 +36,40 @@ rag_query_duration = Histogram(
     buckets=[0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10],
 )
 
+# ── Embedding cache ───────────────────────────────────────────────────
+
+embedding_cache_lookups_total = Counter(
+    "kb_embedding_cache_lookups_total",
+    "Embedding cache lookups per text (hit_memory, hit_disk, miss)",
+    ["result"],
+)
+
+embedding_cache_entries = Gauge(
+    "kb_embedding_cache_entries",
+    "Entries held by the embedding cache",
+    ["tier"],
+)
+
+# ── Hybrid retrieval ──────────────────────────────────────────────────
+
+retrieval_cache_lookups_total = Counter(
+    "kb_retrieval_cache_lookups_total",
+    "Hybrid retrieval cache lookups (hit, miss, expired, bypass)",
+    ["result"],
+)
+
+retrieval_cache_entries = Gauge(
+    "kb_retrieval_cache_entries",
+    "EvidencePacks held by the hybrid retrieval cache",
+)
+
+retrieval_stage_duration = Histogram(
+    "kb_retrieval_stage_duration_seconds",
+    "Hybrid retrieval latency per pipeline stage",
+    ["stage"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5],
+)
+
 # ── Graph (ArangoDB) operations ───────────────────────────────────────
 
 graph_write_total = Counter(
@@ -88,6 +122,18 @@ extraction_task_duration = Histogram(
     buckets=[1, 5, 10, 30, 60, 120, 300, 600],
 )
 
+extraction_llm_calls_total = Counter(
+    "kb_extraction_llm_calls_total",
+    "Graph extraction LLM calls (packed = several chunks in one prompt)",
+    ["mode"],
+)
+
+extraction_chunks_total = Counter(
+    "kb_extraction_chunks_total",
+    "Text chunks sent to graph extraction",
+    ["mode"],
+)
+
 # ── HTTP request metrics ──────────────────────────────────────────────
 
 http_requests_total = Counter(
@@ -25,11 +25,20 @@ Usage:
 
     # Merge two entities (all aliases of source → target)
     await registry.merge("client-abc", "user:john", "user:john.doe")
+
+Resolution is served from an in-process LRU (alias → canonical, including
+"not an alias" answers) with a TTL so other pods' writes show up. Misses
+are looked up in one AQL query per batch. seenCount/lastSeenAt updates are
+buffered and flushed as one batch update every ALIAS_SEEN_FLUSH_S.
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional
+from app.core.config import settings
 from app.services.normalizer import normalize_graph_ref
 
 logger = logging.getLogger(__name__)
@@ -50,6 +59,12 @@ class AliasRegistry:
             db: ArangoDB database instance
         """
         self.db = db
+        # (clientId, normalizedAlias) → (canonicalKey, exists_in_db, expires_at)
+        self._cache: OrderedDict[tuple[str, str], tuple[str, bool, float]] = OrderedDict()
+        # doc_key → pending seenCount increment
+        self._seen: dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._flush_task: asyncio.Task | None = None
         self._ensure_collection()
 
     def _ensure_collection(self):
@@ -73,7 +88,7 @@ class AliasRegistry:
         Resolve an alias to its canonical key.
 
         If alias is not found in registry, returns the normalized alias itself.
-        Also increments the seen counter for analytics.
+        Also increments the seen counter for analytics (buffered).
 
         Args:
             client_id: Client ID for scoping
@@ -82,33 +97,16 @@ class AliasRegistry:
         Returns:
             Canonical key (or normalized alias if not found)
         """
-        # Normalize input
-        normalized_alias = normalize_graph_ref(alias_key)
-        if not normalized_alias:
-            return alias_key
-
-        doc_key = self._make_key(client_id, normalized_alias)
-        collection = self.db.collection(self.COLLECTION_NAME)
-
-        try:
-            if collection.has(doc_key):
-                doc = collection.get(doc_key)
-                # Update seen counter
-                collection.update({
-                    "_key": doc_key,
-                    "seenCount": doc.get("seenCount", 0) + 1,
-                    "lastSeenAt": datetime.now(timezone.utc).isoformat()
-                })
-                return doc.get("canonicalKey", normalized_alias)
-        except Exception as e:
-            logger.warning("Alias resolution failed: %s", e)
-
-        return normalized_alias
+        result = await self.resolve_batch(client_id, [alias_key])
+        return result[alias_key]
 
     async def resolve_batch(self, client_id: str, alias_keys: list[str]) -> dict[str, str]:
         """
         Resolve multiple aliases at once.
 
+        Cache hits are answered locally; all misses go to ArangoDB in a single
+        `FOR k IN @keys` lookup.
+
         Args:
             client_id: Client ID for scoping
             alias_keys: List of aliases to resolve
@@ -116,11 +114,114 @@ class AliasRegistry:
         Returns:
             Dict mapping alias → canonical key
         """
-        result = {}
+        result: dict[str, str] = {}
+        misses: dict[str, str] = {}  # doc_key → normalized alias
+        pending: list[tuple[str, str]] = []  # (original alias, normalized)
+        now = time.monotonic()
+
         for alias in alias_keys:
-            result[alias] = await self.resolve(client_id, alias)
+            normalized_alias = normalize_graph_ref(alias)
+            if not normalized_alias:
+                result[alias] = alias
+                continue
+            cached = self._cache_get(client_id, normalized_alias, now)
+            if cached is not None:
+                canonical, exists = cached
+                result[alias] = canonical
+                if exists:
+                    self._mark_seen(self._make_key(client_id, normalized_alias))
+                continue
+            misses[self._make_key(client_id, normalized_alias)] = normalized_alias
+            pending.append((alias, normalized_alias))
+
+        if misses:
+            aql = f"""
+            FOR k IN @keys
+                LET d = DOCUMENT({self.COLLECTION_NAME}, k)
+                FILTER d != null
+                RETURN {{ key: k, canonicalKey: d.canonicalKey }}
+            """
+            try:
+                found = await asyncio.to_thread(
+                    lambda: {r["key"]: r["canonicalKey"] for r in self.db.aql.execute(aql, bind_vars={"keys": list(misses)})}
+                )
+            except Exception as e:
+                logger.warning("Alias resolution failed: %s", e)
+                found = None
+
+            for doc_key, normalized_alias in misses.items():
+                if found is None:
+                    continue  # DB error — answer with the alias, don't cache
+                if doc_key in found:
+                    self._cache_put(client_id, normalized_alias, found[doc_key] or normalized_alias, True)
+                    self._mark_seen(doc_key)
+                else:
+                    self._cache_put(client_id, normalized_alias, normalized_alias, False)
+            for alias, normalized_alias in pending:
+                doc_key = self._make_key(client_id, normalized_alias)
+                result[alias] = (found or {}).get(doc_key) or normalized_alias
+
+        self._maybe_flush_seen()
         return result
 
+    # ── Cache + seen-counter buffering ───────────────────────────────────
+
+    def _cache_get(self, client_id: str, alias: str, now: float) -> tuple[str, bool] | None:
+        entry = self._cache.get((client_id, alias))
+        if entry is None:
+            return None
+        canonical, exists, expires_at = entry
+        if now >= expires_at:
+            del self._cache[(client_id, alias)]
+            return None
+        self._cache.move_to_end((client_id, alias))
+        return canonical, exists
+
+    def _cache_put(self, client_id: str, alias: str, canonical: str, exists: bool):
+        self._cache[(client_id, alias)] = (canonical, exists, time.monotonic() + settings.ALIAS_CACHE_TTL_S)
+        self._cache.move_to_end((client_id, alias))
+        while len(self._cache) > settings.ALIAS_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _invalidate_canonical(self, client_id: str, canonical: str):
+        """Drop cached aliases of a client that resolve to `canonical`."""
+        stale = [k for k, v in self._cache.items() if k[0] == client_id and v[0] == canonical]
+        for k in stale:
+            del self._cache[k]
+
+    def _mark_seen(self, doc_key: str):
+        self._seen[doc_key] = self._seen.get(doc_key, 0) + 1
+
+    def _maybe_flush_seen(self):
+        if not self._seen or time.monotonic() - self._last_flush < settings.ALIAS_SEEN_FLUSH_S:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush_seen())
+
+    async def flush_seen(self) -> int:
+        """Write buffered seenCount increments in one AQL batch update."""
+        self._last_flush = time.monotonic()
+        if not self._seen:
+            return 0
+        updates = [{"key": k, "n": n} for k, n in self._seen.items()]
+        self._seen = {}
+        aql = f"""
+        FOR u IN @updates
+            LET d = DOCUMENT({self.COLLECTION_NAME}, u.key)
+            FILTER d != null
+            UPDATE d WITH {{ seenCount: (d.seenCount || 0) + u.n, lastSeenAt: @now }} IN {self.COLLECTION_NAME}
+        """
+        try:
+            await asyncio.to_thread(
+                self.db.aql.execute, aql,
+                bind_vars={"updates": updates, "now": datetime.now(timezone.utc).isoformat()},
+            )
+        except Exception as e:
+            logger.warning("Alias seen-counter flush failed (%d keys): %s", len(updates), e)
+            return 0
+        return len(updates)
+
     async def register(
         self,
         client_id: str,
@@ -148,10 +249,14 @@ class AliasRegistry:
         if not normalized_alias:
             return alias_key
 
+        cached = self._cache_get(client_id, normalized_alias, time.monotonic())
+        if cached is not None and cached[1]:
+            return cached[0]
+
         doc_key = self._make_key(client_id, normalized_alias)
         collection = self.db.collection(self.COLLECTION_NAME)
 
-        try:
+        def _register() -> str:
             if collection.has(doc_key):
                 # Already exists - return existing canonical
                 doc = collection.get(doc_key)
@@ -170,6 +275,11 @@ class AliasRegistry:
             collection.insert(doc)
             return normalized_canonical
 
+        try:
+            canonical = await asyncio.to_thread(_register)
+            self._cache_put(client_id, normalized_alias, canonical, True)
+            return canonical
+
         except Exception as e:
             logger.warning("Alias registration failed: %s", e)
             return normalized_alias
@@ -202,7 +312,7 @@ class AliasRegistry:
         doc_key = self._make_key(client_id, normalized_alias)
         collection = self.db.collection(self.COLLECTION_NAME)
 
-        try:
+        def _set():
             if collection.has(doc_key):
                 collection.update({
                     "_key": doc_key,
@@ -220,6 +330,10 @@ class AliasRegistry:
                     "lastSeenAt": datetime.now(timezone.utc).isoformat()
                 }
                 collection.insert(doc)
+
+        try:
+            await asyncio.to_thread(_set)
+            self._cache_put(client_id, normalized_alias, normalized_canonical, True)
             return True
         except Exception as e:
             logger.warning("Set canonical failed: %s", e)
@@ -259,20 +373,20 @@ class AliasRegistry:
         RETURN doc._key
         """
 
-        try:
+        def _merge() -> tuple[int, bool]:
             cursor = self.db.aql.execute(aql, bind_vars={
                 "clientId": client_id,
                 "sourceKey": normalized_source
             })
 
-            count = 0
+            updated = 0
             for doc_key in cursor:
                 collection.update({
                     "_key": doc_key,
                     "canonicalKey": normalized_target,
                     "lastSeenAt": datetime.now(timezone.utc).isoformat()
                 })
-                count += 1
+                updated += 1
 
             # Also redirect source itself to target
             source_doc_key = self._make_key(client_id, normalized_source)
@@ -282,13 +396,17 @@ class AliasRegistry:
                     "canonicalKey": normalized_target,
                     "lastSeenAt": datetime.now(timezone.utc).isoformat()
                 })
-                count += 1
-            else:
+                return updated + 1, True
+            return updated, False
+
+        try:
+            count, source_exists = await asyncio.to_thread(_merge)
+            self._invalidate_canonical(client_id, normalized_source)
+            self._cache.pop((client_id, normalized_source), None)
+            if not source_exists:
                 # Create redirect entry
                 await self.set_canonical(client_id, normalized_source, normalized_target)
-                count += 1
-
-            return count
+            return count + (0 if source_exists else 1)
 
         except Exception as e:
             logger.warning("Merge failed: %s", e)
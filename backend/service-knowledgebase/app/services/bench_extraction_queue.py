@@ -0,0 +1,94 @@
+"""Load benchmark for LLMExtractionQueue — `python -m app.services.bench_extraction_queue`.
+
+N spawned worker processes drain a queue of 10k tasks on one SQLite file
+(claim + complete, no extraction work), for every combination of --workers
+and --batch (tasks per dequeue_many claim):
+
+    python -m app.services.bench_extraction_queue --workers 1 4 8 --batch 1 8 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.services.llm_extraction_queue import ExtractionTask, LLMExtractionQueue
+
+
+def _bench_worker(args: tuple[str, str, int]) -> tuple[int, float]:
+    """Drain the queue as one worker process: claim, complete, repeat."""
+    queue_dir, worker_id, batch = args
+
+    async def _drain() -> int:
+        queue = LLMExtractionQueue(Path(queue_dir))
+        done = 0
+        while True:
+            tasks = await queue.dequeue_many(worker_id, batch)
+            if not tasks:
+                return done
+            for task in tasks:
+                await queue.mark_completed(task.task_id)
+                done += 1
+
+    started = time.perf_counter()
+    done = asyncio.run(_drain())
+    return done, time.perf_counter() - started
+
+
+def _bench_run(tasks: int, workers: int, batch: int) -> None:
+    with tempfile.TemporaryDirectory() as queue_dir:
+        queue = LLMExtractionQueue(Path(queue_dir))
+        created = datetime.now(timezone.utc).isoformat()
+
+        async def _fill():
+            for i in range(tasks):
+                await queue.enqueue(ExtractionTask(
+                    task_id=uuid.uuid4().hex,
+                    source_urn=f"bench:{i}",
+                    content="x" * 2000,
+                    client_id="bench",
+                    project_id=None,
+                    kind="bench",
+                    chunk_ids=[],
+                    created_at=created,
+                    priority=1 + i % 4,
+                ))
+
+        logging.disable(logging.INFO)  # Per-task log lines would dominate the timing
+        asyncio.run(_fill())
+        started = time.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            results = pool.map(_bench_worker, [(queue_dir, f"w{i}", batch) for i in range(workers)])
+        wall = time.perf_counter() - started
+        logging.disable(logging.NOTSET)
+
+        drained = sum(done for done, _ in results)
+        left = asyncio.run(queue.size())
+        print(
+            f"  workers={workers:<3} batch={batch:<3} drained={drained:<6} left={left:<4} "
+            f"wall={wall:6.2f}s  {drained / wall:8.0f} tasks/s"
+        )
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Load benchmark for the SQLite extraction queue")
+    ap.add_argument("--tasks", type=int, default=10_000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    ap.add_argument("--batch", type=int, nargs="+", default=[1, 8, 32])
+    args = ap.parse_args()
+
+    print(f"Draining {args.tasks} queued tasks (claim + complete, no extraction work)")
+    for workers in args.workers:
+        for batch in args.batch:
+            _bench_run(args.tasks, workers, batch)
+
+
+if __name__ == "__main__":
+    main()
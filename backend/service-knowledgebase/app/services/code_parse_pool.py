@@ -0,0 +1,103 @@
+"""Process pool for tree-sitter parsing of git structure ingests.
+
+Parsing is CPU-bound and holds the GIL, so running it on the event loop (or in
+the default thread pool) stalls every other KB request on the pod. Files are
+sent to a spawn-context ProcessPoolExecutor in chunks; each worker keeps its
+own cached tree-sitter parsers (code_parser._parsers is per process). Results
+come back as ParsedFile batches in completion order, so the Arango upsert can
+start on early batches while later ones are still parsing.
+
+Benchmark: app/services/bench_code_parse.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator
+
+from app.services.code_parser import ParsedFile, detect_language, parse_source
+
+logger = logging.getLogger(__name__)
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def _default_workers() -> int:
+    try:
+        from app.core.config import settings
+        return settings.CODE_PARSE_WORKERS
+    except Exception:
+        return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _get_executor(workers: int | None = None) -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn, not fork: the KB process runs gRPC/HTTP threads that must not be forked
+        _executor = ProcessPoolExecutor(
+            max_workers=workers or _default_workers(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _reset_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _parse_chunk(files: list[tuple[str, str]]) -> list[ParsedFile]:
+    """Worker entry point — must stay module-level (picklable)."""
+    return [parse_source(path, content) for path, content in files]
+
+
+async def parse_sources(
+    files: list[tuple[str, str]],
+    chunk_files: int = 32,
+    workers: int | None = None,
+) -> AsyncIterator[list[ParsedFile]]:
+    """Parse (path, content) pairs in the process pool, yielding batches as they finish.
+
+    At most 2 × workers chunks are in flight, bounding the pickled source held
+    in pipes. If the pool breaks (worker OOM-killed), the remaining chunks are
+    parsed in a thread instead so ingest still completes.
+    """
+    files = [(p, c) for p, c in files if p and c and detect_language(p)]
+    if not files:
+        return
+
+    loop = asyncio.get_running_loop()
+    chunks = [files[i:i + chunk_files] for i in range(0, len(files), chunk_files)]
+    max_in_flight = 2 * (workers or _default_workers())
+    in_flight: dict[asyncio.Future, list[tuple[str, str]]] = {}
+    next_chunk = 0
+    broken = False
+
+    def _submit(chunk):
+        if broken:
+            return asyncio.ensure_future(asyncio.to_thread(_parse_chunk, chunk))
+        return loop.run_in_executor(_get_executor(workers), _parse_chunk, chunk)
+
+    while next_chunk < len(chunks) or in_flight:
+        while next_chunk < len(chunks) and len(in_flight) < max_in_flight:
+            in_flight[_submit(chunks[next_chunk])] = chunks[next_chunk]
+            next_chunk += 1
+
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for fut in done:
+            chunk = in_flight.pop(fut)
+            try:
+                yield fut.result()
+            except BrokenProcessPool:
+                if not broken:
+                    logger.warning("Code parse pool broke, falling back to thread parsing")
+                    broken = True
+                    _reset_executor()
+                yield await asyncio.to_thread(_parse_chunk, chunk)
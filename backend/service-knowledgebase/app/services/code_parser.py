@@ -9,6 +9,7 @@ Supported languages: Kotlin, Java, Python, TypeScript, JavaScript, Go, Rust.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -28,8 +29,10 @@ _EXTENSION_TO_LANG: dict[str, str] = {
     ".rs": "rust",
 }
 
-# Lazy-loaded tree-sitter languages
+# Lazy-loaded tree-sitter languages and parsers (per process — each parse
+# pool worker keeps its own)
 _loaded_languages: dict[str, object] = {}
+_parsers: dict[str, object] = {}
 
 
 @dataclass
@@ -53,6 +56,16 @@ class ClassInfo:
         }
 
 
+@dataclass
+class ParsedFile:
+    """Everything extracted from one source file in a single parse."""
+    path: str
+    language: str | None
+    classes: list[ClassInfo] = field(default_factory=list)
+    imports: list[str] = field(default_factory=list)
+    parse_seconds: float = 0.0
+
+
 def _get_language(lang_name: str):
     """Lazy-load a tree-sitter language."""
     if lang_name in _loaded_languages:
@@ -69,14 +82,19 @@ def _get_language(lang_name: str):
 
 
 def _get_parser(lang_name: str):
-    """Create a tree-sitter parser for the given language."""
+    """Get (cached) tree-sitter parser for the given language."""
+    if lang_name in _parsers:
+        return _parsers[lang_name]
+
     lang = _get_language(lang_name)
     if not lang:
         return None
 
     try:
         from tree_sitter_languages import get_parser
-        return get_parser(lang_name)
+        parser = get_parser(lang_name)
+        _parsers[lang_name] = parser
+        return parser
     except Exception as e:
         logger.warning("Failed to create parser for %s: %s", lang_name, e)
         return None
@@ -88,45 +106,62 @@ def detect_language(file_path: str) -> str | None:
     return _EXTENSION_TO_LANG.get(ext)
 
 
-def parse_file(file_path: str, content: str) -> list[ClassInfo]:
-    """Parse a source file and extract class/interface definitions.
+def parse_source(file_path: str, content: str) -> ParsedFile:
+    """Parse a source file once and extract both classes and imports.
 
     Args:
         file_path: Path to the file (used for language detection and qualified names).
         content: Source code content.
 
     Returns:
-        List of ClassInfo extracted from the file.
+        ParsedFile with classes, imports and parse time (empty for unsupported files).
     """
     lang = detect_language(file_path)
+    result = ParsedFile(path=file_path, language=lang)
     if not lang:
-        return []
+        return result
 
     parser = _get_parser(lang)
     if not parser:
-        return []
+        return result
 
+    started = time.perf_counter()
     try:
         tree = parser.parse(content.encode("utf-8"))
         root = tree.root_node
+    except Exception as e:
+        logger.warning("Failed to parse %s: %s", file_path, e)
+        return result
 
-        if lang == "kotlin":
-            return _extract_kotlin(root, content, file_path)
-        elif lang == "java":
-            return _extract_java(root, content, file_path)
-        elif lang == "python":
-            return _extract_python(root, content, file_path)
-        elif lang in ("typescript", "javascript"):
-            return _extract_typescript(root, content, file_path)
-        elif lang == "go":
-            return _extract_go(root, content, file_path)
-        elif lang == "rust":
-            return _extract_rust(root, content, file_path)
-        else:
-            return []
+    try:
+        extractor = _CLASS_EXTRACTORS.get(lang)
+        if extractor:
+            result.classes = extractor(root, content, file_path)
     except Exception as e:
         logger.warning("Failed to parse %s: %s", file_path, e)
-        return []
+
+    try:
+        extractor = _IMPORT_EXTRACTORS.get(lang)
+        if extractor:
+            result.imports = extractor(root, content)
+    except Exception as e:
+        logger.warning("Failed to extract imports from %s: %s", file_path, e)
+
+    result.parse_seconds = time.perf_counter() - started
+    return result
+
+
+def parse_file(file_path: str, content: str) -> list[ClassInfo]:
+    """Parse a source file and extract class/interface definitions.
+
+    Args:
+        file_path: Path to the file (used for language detection and qualified names).
+        content: Source code content.
+
+    Returns:
+        List of ClassInfo extracted from the file.
+    """
+    return parse_source(file_path, content).classes
 
 
 def parse_files(files: list[tuple[str, str]], max_files: int = 100) -> list[ClassInfo]:
@@ -152,33 +187,7 @@ def parse_file_imports(file_path: str, content: str) -> list[str]:
     Returns list of qualified import names (e.g., "com.jervis.service.UserService").
     Used to create 'imports' edges in the knowledge graph.
     """
-    lang = detect_language(file_path)
-    if not lang:
-        return []
-
-    parser = _get_parser(lang)
-    if not parser:
-        return []
-
-    try:
-        tree = parser.parse(content.encode("utf-8"))
-        root = tree.root_node
-
-        if lang == "kotlin":
-            return _extract_imports_kotlin(root, content)
-        elif lang == "java":
-            return _extract_imports_java(root, content)
-        elif lang == "python":
-            return _extract_imports_python(root, content)
-        elif lang in ("typescript", "javascript"):
-            return _extract_imports_typescript(root, content)
-        elif lang == "go":
-            return _extract_imports_go(root, content)
-        else:
-            return []
-    except Exception as e:
-        logger.warning("Failed to extract imports from %s: %s", file_path, e)
-        return []
+    return parse_source(file_path, content).imports
 
 
 # ---------------------------------------------------------------------------
@@ -594,3 +603,23 @@ def _extract_rust(root, source: str, file_path: str) -> list[ClassInfo]:
                 break
 
     return classes
+
+
+_CLASS_EXTRACTORS = {
+    "kotlin": _extract_kotlin,
+    "java": _extract_java,
+    "python": _extract_python,
+    "typescript": _extract_typescript,
+    "javascript": _extract_typescript,
+    "go": _extract_go,
+    "rust": _extract_rust,
+}
+
+_IMPORT_EXTRACTORS = {
+    "kotlin": _extract_imports_kotlin,
+    "java": _extract_imports_java,
+    "python": _extract_imports_python,
+    "typescript": _extract_imports_typescript,
+    "javascript": _extract_imports_typescript,
+    "go": _extract_imports_go,
+}
@@ -3,7 +3,8 @@
 All extraction logic (VLM, pymupdf, python-docx, openpyxl, etc.) lives in the
 dedicated jervis-document-extraction service. This module is a thin gRPC
 client that delegates to it over DocumentExtractionService.Extract, keeping
-KB service focused on ingestion and retrieval.
+KB service focused on ingestion and retrieval. extract_stream() uses
+ExtractStream instead, yielding pages as the service parses them.
 
 The dataclass interfaces (ExtractedDocument, PageContent, ImageDescription) are
 preserved for backward compatibility with all callers in knowledge_service.py.
@@ -14,7 +15,7 @@ from __future__ import annotations
 import logging
 import mimetypes
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import grpc.aio
 
@@ -47,6 +48,31 @@ class ExtractedDocument:
     metadata: dict = field(default_factory=dict)
 
 
+class ExtractionStream:
+    """Pages of one ExtractStream call, in arrival order.
+
+    Iterate for PageContent; method / metadata / page_count are set from the
+    terminal message once iteration has finished.
+    """
+
+    def __init__(self, call, filename: str):
+        self._call = call
+        self.filename = filename
+        self.method = "unknown"
+        self.metadata: dict = {}
+        self.page_count = 0
+
+    async def __aiter__(self) -> AsyncIterator[PageContent]:
+        async for resp in self._call:
+            kind = resp.WhichOneof("payload")
+            if kind == "page":
+                self.page_count += 1
+                yield PageContent(page_number=int(resp.page.page_number), text=str(resp.page.text), images=[])
+            elif kind == "done":
+                self.method = resp.done.method or "unknown"
+                self.metadata = dict(resp.done.metadata)
+
+
 _channel: Optional[grpc.aio.Channel] = None
 _stub: Optional[extract_pb2_grpc.DocumentExtractionServiceStub] = None
 
@@ -135,3 +161,32 @@ class DocumentExtractor:
             method=method,
             metadata=metadata,
         )
+
+    def extract_stream(
+        self,
+        file_bytes: bytes,
+        filename: str,
+        mime_type: str = "",
+        max_tier: str = "NONE",
+    ) -> ExtractionStream:
+        """Extract via DocumentExtractionService.ExtractStream (pages as parsed)."""
+        if not mime_type:
+            mime_type, _ = mimetypes.guess_type(filename)
+            mime_type = mime_type or "application/octet-stream"
+
+        logger.info(
+            "DocumentExtractor: streaming from %s file=%s mime=%s size=%d",
+            self._base_url, filename, mime_type, len(file_bytes),
+        )
+
+        call = _get_stub().ExtractStream(
+            extract_pb2.ExtractStreamRequest(
+                ctx=types_pb2.RequestContext(trace={"caller": "service-knowledgebase"}),
+                content=bytes(file_bytes),
+                filename=filename,
+                mime_type=mime_type,
+                max_tier=max_tier,
+            ),
+            timeout=1800.0,
+        )
+        return ExtractionStream(call, filename)
@@ -0,0 +1,148 @@
+"""Two-tier embedding cache keyed by (model, sha256(text)).
+
+Tier 1: in-process LRU (OrderedDict) — repeated kb_search queries, thought
+        summaries embedded twice within minutes.
+Tier 2: SQLite on PVC (float32 blobs, WAL) — survives pod restarts, so a
+        purge-and-reingest of unchanged chunks never reaches the GPU.
+
+Entries never go stale: the same model + text always yields the same
+vector, and the model name is part of the key.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from app.metrics import embedding_cache_entries, embedding_cache_lookups_total
+
+logger = logging.getLogger(__name__)
+
+# Disk eviction check runs every N inserts (COUNT on a big table is not free)
+_EVICT_EVERY = 1_000
+
+
+def cache_key(model: str, text: str) -> str:
+    return f"{model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+class EmbeddingCache:
+    """LRU in memory + optional SQLite store. Disk I/O runs in worker threads."""
+
+    def __init__(self, db_path: Path | None, max_memory_entries: int, max_disk_entries: int):
+        # float32 arrays, not lists: a 1024d list of Python floats costs ~32 KB, an array 4 KB
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._max_memory = max_memory_entries
+        self._max_disk = max_disk_entries
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._inserts_since_evict = 0
+
+        if db_path is not None:
+            try:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(db_path), timeout=30.0, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA busy_timeout=5000")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS embeddings (
+                        key TEXT NOT NULL UNIQUE,
+                        vector BLOB NOT NULL
+                    )
+                """)
+                conn.commit()
+                self._conn = conn
+                logger.info("EMBED_CACHE: disk tier at %s", db_path)
+            except Exception as e:
+                logger.warning("EMBED_CACHE: disk tier disabled (%s): %s", db_path, e)
+
+    # ── Public API ────────────────────────────────────────────────────────
+
+    async def get_many(self, model: str, texts: list[str]) -> list[list[float] | None]:
+        """Look up vectors for texts; None marks a miss (memory → disk)."""
+        keys = [cache_key(model, t) for t in texts]
+        results: list[list[float] | None] = [None] * len(texts)
+        disk_idx = []
+        for i, key in enumerate(keys):
+            vec = self._memory.get(key)
+            if vec is not None:
+                self._memory.move_to_end(key)
+                results[i] = vec.tolist()
+            else:
+                disk_idx.append(i)
+
+        memory_hits = len(texts) - len(disk_idx)
+        disk_hits = 0
+        if disk_idx and self._conn is not None:
+            found = await asyncio.to_thread(self._disk_get, [keys[i] for i in disk_idx])
+            for i in disk_idx:
+                vec = found.get(keys[i])
+                if vec is not None:
+                    results[i] = vec.tolist()
+                    self._remember(keys[i], vec)
+                    disk_hits += 1
+
+        if memory_hits:
+            embedding_cache_lookups_total.labels(result="hit_memory").inc(memory_hits)
+        if disk_hits:
+            embedding_cache_lookups_total.labels(result="hit_disk").inc(disk_hits)
+        if len(disk_idx) - disk_hits:
+            embedding_cache_lookups_total.labels(result="miss").inc(len(disk_idx) - disk_hits)
+        return results
+
+    async def put_many(self, model: str, texts: list[str], vectors: list[list[float]]) -> None:
+        items = [(cache_key(model, t), np.asarray(v, dtype=np.float32)) for t, v in zip(texts, vectors) if v]
+        for key, vec in items:
+            self._remember(key, vec)
+        if items and self._conn is not None:
+            try:
+                await asyncio.to_thread(self._disk_put, items)
+            except Exception as e:
+                logger.warning("EMBED_CACHE: disk write failed: %s", e)
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+        embedding_cache_entries.labels(tier="memory").set(len(self._memory))
+
+    def _disk_get(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            # SQLite default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds
+            for start in range(0, len(keys), 500):
+                part = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(part))})",
+                    part,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def _disk_put(self, items: list[tuple[str, np.ndarray]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, vec.tobytes()) for key, vec in items],
+            )
+            self._inserts_since_evict += len(items)
+            if self._inserts_since_evict >= _EVICT_EVERY:
+                self._inserts_since_evict = 0
+                # Oldest rowids first — INSERT OR REPLACE moves refreshed keys to the end
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE rowid <= (SELECT MAX(rowid) FROM embeddings) - ?",
+                    (self._max_disk,),
+                )
+                count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                embedding_cache_entries.labels(tier="disk").set(count)
+            self._conn.commit()
@@ -1,7 +1,9 @@
 import json
 import asyncio
+import hashlib
 import logging
 import re
+import time
 
 import httpx
 import tiktoken
@@ -14,11 +16,21 @@ from app.services.normalizer import (
     build_graph_key
 )
 from app.services.alias_registry import AliasRegistry
+from app.services.retrieval_cache import bump_scope
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from app.core.config import settings
+from app import metrics
 
 logger = logging.getLogger(__name__)
 
+_EXTRACTION_RULES = """Rules:
+- Extract every entity you can identify (people, organizations, systems, concepts, documents, amounts, dates...)
+- Choose the most specific type that fits
+- Create edges for every relationship between entities
+- Thoughts = high-level insights, decisions, problems, action items
+- IMPORTANT: Always extract at least one node. Empty result means you missed something.
+"""
+
 
 class GraphService:
     def __init__(self):
@@ -42,13 +54,24 @@ class GraphService:
             self.db.create_collection("KnowledgeNodes")
         if not self.db.has_collection("KnowledgeEdges"):
             self.db.create_collection("KnowledgeEdges", edge=True)
+        # Code graph lookups per branch (incremental git structure ingest)
+        nodes = self.db.collection("KnowledgeNodes")
+        if "idx_code_branch" not in {idx.get("name") for idx in nodes.indexes()}:
+            nodes.add_index({
+                "type": "persistent",
+                "fields": ["projectId", "branchName", "type"],
+                "name": "idx_code_branch",
+                "sparse": True,
+            })
 
     async def _llm_call(self, prompt: str, priority: int | None = None, max_retries: int = 2,
-                        max_tier: str = "NONE", client_id: str | None = None) -> str:
+                        max_tier: str = "NONE", client_id: str | None = None,
+                        response_reserve: int | None = None) -> str:
         """Route-aware LLM call: local GPU or OpenRouter based on client tier.
 
         Dynamic num_ctx: sized to actual prompt + response reserve, rounded to 4k,
-        capped at INGEST_CONTEXT_CAP (P40 VRAM limit).
+        capped at INGEST_CONTEXT_CAP (P40 VRAM limit). Packed prompts pass a
+        larger response_reserve (one JSON result per chunk).
 
         Retries on connection errors (router restart, network blip).
         """
@@ -56,7 +79,7 @@ class GraphService:
 
         # Dynamic num_ctx: tiktoken count + response reserve, rounded up to 4k
         input_tokens = len(self._tokenizer.encode(prompt))
-        num_ctx = input_tokens + settings.INGEST_RESPONSE_RESERVE
+        num_ctx = input_tokens + (response_reserve or settings.INGEST_RESPONSE_RESERVE)
         num_ctx = min(((num_ctx + 4095) // 4096) * 4096, settings.INGEST_CONTEXT_CAP)
 
         for attempt in range(1 + max_retries):
@@ -126,6 +149,145 @@ class GraphService:
             len(request.content), len(chunk_ids) if chunk_ids else 0
         )
 
+        chunks = self._select_extraction_chunks(request)
+        self._cap_llm_credibility(request)
+
+        nodes_created = 0
+        edges_created = 0
+        all_entity_keys = []
+
+        # Process chunks in parallel — router queue manages backend concurrency
+        _extract_sem = asyncio.Semaphore(settings.INGEST_EXTRACT_CONCURRENCY)
+        _completed = 0
+
+        async def _process_one(idx: int, chunk_text: str):
+            nonlocal _completed
+            async with _extract_sem:
+                logger.info("GRAPH_WRITE: LLM_EXTRACT chunk %d/%d sourceUrn=%s", idx, len(chunks), request.sourceUrn)
+                n, e, keys = await self._process_chunk(chunk_text, request, chunk_ids, embedding_priority=embedding_priority, max_tier=max_tier, client_id=request.clientId)
+                _completed += 1
+                logger.info(
+                    "GRAPH_WRITE: CHUNK_DONE %d/%d nodes=%d edges=%d entities=%d",
+                    _completed, len(chunks), n, e, len(keys),
+                )
+                if on_progress:
+                    try:
+                        await on_progress(_completed, len(chunks))
+                    except Exception:
+                        pass
+                return n, e, keys
+
+        results = await asyncio.gather(*[_process_one(i, c) for i, c in enumerate(chunks, 1)])
+        for n, e, keys in results:
+            nodes_created += n
+            edges_created += e
+            all_entity_keys.extend(keys)
+
+        # Deduplicate entity keys
+        all_entity_keys = list(set(all_entity_keys))
+
+        # Post-processing: email thread linking (REPLY_TO edges + EMAIL_THREAD nodes)
+        t_nodes, t_edges = await self._link_email_thread(request, chunk_ids)
+        nodes_created += t_nodes
+        edges_created += t_edges
+
+        logger.info(
+            "GRAPH_WRITE: INGEST_COMPLETE sourceUrn=%s nodes=%d edges=%d entities=%d clientId=%s projectId=%s",
+            request.sourceUrn, nodes_created, edges_created, len(all_entity_keys),
+            request.clientId, request.projectId or ""
+        )
+        return nodes_created, edges_created, all_entity_keys
+
+    async def ingest_packed(
+        self,
+        items: list[tuple[IngestRequest, list[str]]],
+        embedding_priority: int | None = None,
+        max_tier: str = "NONE",
+    ) -> list[tuple[int, int, list[str]]]:
+        """
+        Ingest several small documents of one client with shared LLM calls.
+
+        Chunks of all documents are packed (up to EXTRACTION_PACK_MAX_CHUNKS /
+        EXTRACTION_PACK_INPUT_TOKENS) into one extraction prompt with per-chunk
+        delimiters. The per-chunk results are parsed back out and written with
+        the owning document's request (sourceUrn, scope, credibility) and RAG
+        chunk IDs — the graph ends up the same as with ingest() per document.
+        Chunks the model skipped in a packed answer are re-extracted on their own.
+
+        Args:
+            items: (request, chunk_ids) per document; all with the same clientId
+            embedding_priority: Ollama priority (1=high, 4=background)
+
+        Returns:
+            One (nodes_created, edges_created, entity_keys) tuple per item, in order.
+        """
+        if len({request.clientId for request, _ in items}) > 1:
+            raise ValueError("ingest_packed: all items must belong to one client")
+
+        # (item index, chunk text, token count) — documents stay contiguous
+        entries = []
+        for idx, (request, chunk_ids) in enumerate(items):
+            logger.info(
+                "GRAPH_WRITE: INGEST_START sourceUrn=%s clientId=%s projectId=%s content_len=%d chunk_ids=%d packed=true",
+                request.sourceUrn, request.clientId, request.projectId or "",
+                len(request.content), len(chunk_ids) if chunk_ids else 0
+            )
+            for chunk_text in self._select_extraction_chunks(request):
+                entries.append((idx, chunk_text, len(self._tokenizer.encode(chunk_text))))
+            self._cap_llm_credibility(request)
+
+        packs = []
+        current, current_tokens = [], 0
+        for entry in entries:
+            if current and (
+                len(current) >= settings.EXTRACTION_PACK_MAX_CHUNKS
+                or current_tokens + entry[2] > settings.EXTRACTION_PACK_INPUT_TOKENS
+            ):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(entry)
+            current_tokens += entry[2]
+        if current:
+            packs.append(current)
+
+        logger.info(
+            "GRAPH_WRITE: PACK documents=%d chunks=%d → llm_calls=%d clientId=%s",
+            len(items), len(entries), len(packs), items[0][0].clientId if items else "",
+        )
+
+        _extract_sem = asyncio.Semaphore(settings.INGEST_EXTRACT_CONCURRENCY)
+
+        async def _run(pack):
+            async with _extract_sem:
+                return await self._process_pack(
+                    [(items[idx][0], items[idx][1], text) for idx, text, _ in pack],
+                    embedding_priority=embedding_priority,
+                    max_tier=max_tier,
+                )
+
+        totals = [[0, 0, set()] for _ in items]
+        pack_results = await asyncio.gather(*[_run(pack) for pack in packs])
+        for pack, results in zip(packs, pack_results):
+            for (idx, _, _), (n, e, keys) in zip(pack, results):
+                totals[idx][0] += n
+                totals[idx][1] += e
+                totals[idx][2].update(keys)
+
+        out = []
+        for (request, chunk_ids), (nodes_created, edges_created, entity_keys) in zip(items, totals):
+            t_nodes, t_edges = await self._link_email_thread(request, chunk_ids)
+            nodes_created += t_nodes
+            edges_created += t_edges
+            logger.info(
+                "GRAPH_WRITE: INGEST_COMPLETE sourceUrn=%s nodes=%d edges=%d entities=%d clientId=%s projectId=%s packed=true",
+                request.sourceUrn, nodes_created, edges_created, len(entity_keys),
+                request.clientId, request.projectId or ""
+            )
+            out.append((nodes_created, edges_created, list(entity_keys)))
+        return out
+
+    def _select_extraction_chunks(self, request: IngestRequest) -> list[str]:
+        """Split content and apply the MAX_EXTRACTION_CHUNKS budget (see ingest)."""
         # 1. Split text into chunks for processing
         all_chunks = self.text_splitter.split_text(request.content)
         max_chunks = settings.MAX_EXTRACTION_CHUNKS
@@ -156,13 +318,19 @@ class GraphService:
         else:
             chunks = all_chunks
 
-        nodes_created = 0
-        edges_created = 0
-        all_entity_keys = []
+        logger.info(
+            "GRAPH_WRITE: SPLIT sourceUrn=%s → %d text chunks (processing %d, LLM model=%s)",
+            request.sourceUrn, len(all_chunks), len(chunks), settings.LLM_MODEL
+        )
+        return chunks
+
+    @staticmethod
+    def _cap_llm_credibility(request: IngestRequest) -> None:
+        """Cap request.credibility at LLM_EXTRACTED (in place).
 
-        # LLM-extracted entities: credibility is capped at LLM_EXTRACTED
-        # (even if the source document has higher credibility like STRUCTURED_DATA,
-        # the extracted relationships are only as reliable as the LLM's interpretation)
+        Even if the source document has higher credibility like STRUCTURED_DATA,
+        the extracted relationships are only as reliable as the LLM's interpretation.
+        """
         from app.api.models import SourceCredibility
         _CREDIBILITY_ORDER = [
             SourceCredibility.INFERRED, SourceCredibility.LLM_EXTRACTED,
@@ -178,42 +346,8 @@ class GraphService:
         else:
             request.credibility = llm_cap
 
-        logger.info(
-            "GRAPH_WRITE: SPLIT sourceUrn=%s → %d text chunks (processing %d, LLM model=%s)",
-            request.sourceUrn, len(all_chunks), len(chunks), settings.LLM_MODEL
-        )
-
-        # Process chunks in parallel — router queue manages backend concurrency
-        _extract_sem = asyncio.Semaphore(2)  # Reduced from 4 to prevent GPU queue flooding
-        _completed = 0
-
-        async def _process_one(idx: int, chunk_text: str):
-            nonlocal _completed
-            async with _extract_sem:
-                logger.info("GRAPH_WRITE: LLM_EXTRACT chunk %d/%d sourceUrn=%s", idx, len(chunks), request.sourceUrn)
-                n, e, keys = await self._process_chunk(chunk_text, request, chunk_ids, embedding_priority=embedding_priority, max_tier=max_tier, client_id=request.clientId)
-                _completed += 1
-                logger.info(
-                    "GRAPH_WRITE: CHUNK_DONE %d/%d nodes=%d edges=%d entities=%d",
-                    _completed, len(chunks), n, e, len(keys),
-                )
-                if on_progress:
-                    try:
-                        await on_progress(_completed, len(chunks))
-                    except Exception:
-                        pass
-                return n, e, keys
-
-        results = await asyncio.gather(*[_process_one(i, c) for i, c in enumerate(chunks, 1)])
-        for n, e, keys in results:
-            nodes_created += n
-            edges_created += e
-            all_entity_keys.extend(keys)
-
-        # Deduplicate entity keys
-        all_entity_keys = list(set(all_entity_keys))
-
-        # Post-processing: email thread linking (REPLY_TO edges + EMAIL_THREAD nodes)
+    async def _link_email_thread(self, request: IngestRequest, chunk_ids: list[str] | None) -> tuple[int, int]:
+        """Email thread linking (REPLY_TO edges + EMAIL_THREAD nodes) from request metadata."""
         metadata = getattr(request, "metadata", None) or {}
         if isinstance(metadata, str):
             try:
@@ -234,30 +368,48 @@ class GraphService:
             email_thread_id = email_message_id
             logger.info("EMAIL_THREAD: No threadId, using messageId=%s as thread anchor", email_message_id)
 
-        if email_thread_id:
-            try:
-                t_nodes, t_edges = await self._create_email_thread_edges(
-                    thread_id=email_thread_id,
-                    message_id=email_message_id,
-                    in_reply_to=email_in_reply_to,
-                    subject=metadata.get("emailSubject", ""),
-                    sender=metadata.get("emailFrom", ""),
-                    client_id=request.clientId,
-                    project_id=request.projectId or "",
-                    chunk_ids=chunk_ids or [],
-                    references=metadata.get("emailReferences", ""),
-                )
-                nodes_created += t_nodes
-                edges_created += t_edges
-            except Exception as exc:
-                logger.warning("EMAIL_THREAD: Failed to create thread edges: %s", exc)
+        if not email_thread_id:
+            return 0, 0
+        try:
+            t_nodes, t_edges = await self._create_email_thread_edges(
+                thread_id=email_thread_id,
+                message_id=email_message_id,
+                in_reply_to=email_in_reply_to,
+                subject=metadata.get("emailSubject", ""),
+                sender=metadata.get("emailFrom", ""),
+                client_id=request.clientId,
+                project_id=request.projectId or "",
+                chunk_ids=chunk_ids or [],
+                references=metadata.get("emailReferences", ""),
+            )
+        except Exception as exc:
+            logger.warning("EMAIL_THREAD: Failed to create thread edges: %s", exc)
+            return 0, 0
+        if t_nodes or t_edges:
+            await bump_scope(request.clientId)
+        return t_nodes, t_edges
 
-        logger.info(
-            "GRAPH_WRITE: INGEST_COMPLETE sourceUrn=%s nodes=%d edges=%d entities=%d clientId=%s projectId=%s",
-            request.sourceUrn, nodes_created, edges_created, len(all_entity_keys),
-            request.clientId, request.projectId or ""
-        )
-        return nodes_created, edges_created, all_entity_keys
+    @staticmethod
+    def _parse_llm_json(content: str) -> dict:
+        """Parse the JSON object from a raw extraction response (raises on failure)."""
+        # Strip thinking tags if present (qwen3 with /no_think sometimes still thinks)
+        if "<think>" in content:
+            content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL).strip()
+
+        # Clean up markdown code blocks if present
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0]
+        elif "```" in content:
+            content = content.split("```")[1].split("```")[0]
+
+        # Find JSON object in free text (model may prefix with explanation)
+        content = content.strip()
+        if not content.startswith("{"):
+            idx = content.find("{")
+            if idx >= 0:
+                content = content[idx:]
+
+        return json.loads(content)
 
     async def _process_chunk(
         self,
@@ -281,13 +433,7 @@ Extract a knowledge graph from text. Return ONLY a JSON object:
  "edges": [{{"source": "...", "target": "...", "relation": "..."}}],
  "thoughts": [{{"type": "...", "label": "...", "summary": "...", "related_entities": [...]}}]}}
 
-Rules:
-- Extract every entity you can identify (people, organizations, systems, concepts, documents, amounts, dates...)
-- Choose the most specific type that fits
-- Create edges for every relationship between entities
-- Thoughts = high-level insights, decisions, problems, action items
-- IMPORTANT: Always extract at least one node. Empty result means you missed something.
-
+{_EXTRACTION_RULES}
 Text: {text}
 """
 
@@ -295,6 +441,8 @@ Text: {text}
             "GRAPH_WRITE: LLM_CALL sourceUrn=%s text_len=%d model=%s priority=%s",
             request.sourceUrn, len(text), settings.LLM_MODEL, embedding_priority
         )
+        metrics.extraction_llm_calls_total.labels(mode="single").inc()
+        metrics.extraction_chunks_total.labels(mode="single").inc()
 
         try:
             content = await self._llm_call(prompt, priority=embedding_priority, max_tier=max_tier, client_id=client_id)
@@ -303,25 +451,7 @@ Text: {text}
                 request.sourceUrn, len(content), content.replace("\n", " ")[:200]
             )
 
-            # Strip thinking tags if present (qwen3 with /no_think sometimes still thinks)
-            if "<think>" in content:
-                import re
-                content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL).strip()
-
-            # Clean up markdown code blocks if present
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            # Find JSON object in free text (model may prefix with explanation)
-            content = content.strip()
-            if not content.startswith("{"):
-                idx = content.find("{")
-                if idx >= 0:
-                    content = content[idx:]
-
-            data = json.loads(content)
+            data = self._parse_llm_json(content)
             logger.info(
                 "GRAPH_WRITE: LLM_PARSED sourceUrn=%s nodes=%d edges=%d",
                 request.sourceUrn, len(data.get("nodes", [])), len(data.get("edges", []))
@@ -335,11 +465,108 @@ Text: {text}
             )
             return 0, 0, []
 
+        return await self._apply_extraction(data, request, chunk_ids, embedding_priority)
+
+    async def _process_pack(
+        self,
+        pack: list[tuple[IngestRequest, list[str], str]],
+        embedding_priority: int | None = None,
+        max_tier: str = "NONE",
+    ) -> list[tuple[int, int, list[str]]]:
+        """
+        Extract several chunks (request, chunk_ids, text) with one LLM call.
+
+        Each chunk's result is applied with its own request and chunk IDs.
+        Chunks missing from the answer (or all of them, if the answer does not
+        parse) fall back to _process_chunk.
+
+        Returns: (nodes_created, edges_created, entity_keys) per chunk, in order.
+        """
+        if len(pack) == 1:
+            request, chunk_ids, text = pack[0]
+            return [await self._process_chunk(
+                text, request, chunk_ids, embedding_priority=embedding_priority,
+                max_tier=max_tier, client_id=request.clientId,
+            )]
+
+        sections = "\n".join(
+            f"<<<CHUNK {i}>>>\n{text}\n<<<END CHUNK {i}>>>"
+            for i, (_, _, text) in enumerate(pack, 1)
+        )
+        prompt = f"""/no_think
+Extract a knowledge graph from EACH numbered text chunk below. The chunks are
+unrelated documents: never connect entities across chunks. Return ONLY a JSON object
+with exactly one entry per chunk, "chunk" being the number from its <<<CHUNK n>>> header:
+{{"chunks": [{{"chunk": 1,
+  "nodes": [{{"label": "...", "type": "...", "description": "..."}}],
+  "edges": [{{"source": "...", "target": "...", "relation": "..."}}],
+  "thoughts": [{{"type": "...", "label": "...", "summary": "...", "related_entities": [...]}}]}}]}}
+
+{_EXTRACTION_RULES}
+{sections}
+"""
+        urns = ",".join(request.sourceUrn for request, _, _ in pack)
+        logger.info(
+            "GRAPH_WRITE: LLM_CALL_PACKED chunks=%d sourceUrns=%s text_len=%d model=%s priority=%s",
+            len(pack), urns, sum(len(text) for _, _, text in pack), settings.LLM_MODEL, embedding_priority
+        )
+        metrics.extraction_llm_calls_total.labels(mode="packed").inc()
+        metrics.extraction_chunks_total.labels(mode="packed").inc(len(pack))
+
+        by_chunk: dict[int, dict] = {}
+        try:
+            content = await self._llm_call(
+                prompt, priority=embedding_priority, max_tier=max_tier,
+                client_id=pack[0][0].clientId,
+                response_reserve=settings.INGEST_RESPONSE_RESERVE * len(pack),
+            )
+            data = self._parse_llm_json(content)
+            for entry in data.get("chunks", []):
+                if not isinstance(entry, dict):
+                    continue
+                try:
+                    by_chunk[int(entry.get("chunk"))] = entry
+                except (TypeError, ValueError):
+                    continue
+        except Exception as e:
+            error_detail = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            logger.warning(
+                "GRAPH_WRITE: LLM_EXTRACTION_FAILED packed chunks=%d sourceUrns=%s error=%s — extracting one by one",
+                len(pack), urns, error_detail,
+            )
+
+        results = []
+        for i, (request, chunk_ids, text) in enumerate(pack, 1):
+            data = by_chunk.get(i)
+            if data is None:
+                results.append(await self._process_chunk(
+                    text, request, chunk_ids, embedding_priority=embedding_priority,
+                    max_tier=max_tier, client_id=request.clientId,
+                ))
+                continue
+            logger.info(
+                "GRAPH_WRITE: LLM_PARSED sourceUrn=%s nodes=%d edges=%d packed=%d/%d",
+                request.sourceUrn, len(data.get("nodes", [])), len(data.get("edges", [])), i, len(pack)
+            )
+            results.append(await self._apply_extraction(data, request, chunk_ids, embedding_priority))
+        return results
+
+    async def _apply_extraction(
+        self,
+        data: dict,
+        request: IngestRequest,
+        chunk_ids: list[str] | None,
+        embedding_priority: int | None = None,
+    ) -> tuple[int, int, list[str]]:
+        """Write one chunk's extraction result (nodes, edges, thoughts) for request.
+
+        Returns: (nodes_created, edges_created, entity_keys)
+        """
         entity_keys = []
         label_to_key = {}  # Map original labels to canonical keys
 
-        # Phase 1: Resolve aliases (async) and prepare node data
-        resolved_nodes = []
+        # Phase 1: Resolve aliases (one bulk lookup) and prepare node data
+        candidates = []
         for node in data.get("nodes", []):
             label = node.get('label', '').strip()
             if not label:
@@ -349,9 +576,15 @@ Text: {text}
             raw_key = build_graph_key(entity_type, label)
             if not raw_key:
                 continue
+            candidates.append((node, label, entity_type, raw_key))
+
+        canonical_by_raw = await self.alias_registry.resolve_batch(
+            request.clientId, [raw_key for _, _, _, raw_key in candidates],
+        )
 
-            # Resolve through alias registry (async — must stay outside thread)
-            canonical_key = await self.alias_registry.resolve(request.clientId, raw_key)
+        resolved_nodes = []
+        for node, label, entity_type, raw_key in candidates:
+            canonical_key = canonical_by_raw[raw_key]
             await self.alias_registry.register(request.clientId, raw_key, canonical_key)
 
             label_to_key[label.lower()] = canonical_key
@@ -470,6 +703,9 @@ Text: {text}
             return local_nodes, local_edges
 
         local_nodes, local_edges = await asyncio.to_thread(_arango_upsert)
+        if resolved_nodes:
+            # Existing nodes gain ragChunks even when nothing new was inserted
+            await bump_scope(request.clientId)
 
         # Phase 4: Process thoughts (Thought Map)
         if self._thought_service and data.get("thoughts"):
@@ -524,12 +760,16 @@ Text: {text}
 
         return local_nodes, local_edges, entity_keys
 
-    async def purge_chunk_refs(self, deleted_chunk_ids: list[str]) -> tuple[int, int, int, int]:
+    async def purge_chunk_refs(
+        self, deleted_chunk_ids: list[str], client_id: str | None = None,
+    ) -> tuple[int, int, int, int]:
         """
         Remove references to deleted RAG chunks from graph nodes and edges.
         Delete orphaned nodes/edges that have no remaining evidence.
         Processes in batches to avoid OOM on large graphs.
 
+        client_id scopes retrieval cache invalidation (None = every client).
+
         Returns:
             Tuple of (nodes_cleaned, edges_cleaned, nodes_deleted, edges_deleted)
         """
@@ -609,6 +849,8 @@ Text: {text}
             return nodes_cleaned, edges_cleaned, nodes_deleted, edges_deleted
 
         nodes_cleaned, edges_cleaned, nodes_deleted, edges_deleted = await asyncio.to_thread(_purge)
+        if nodes_cleaned or edges_cleaned or nodes_deleted or edges_deleted:
+            await bump_scope(client_id)
 
         # Clean up ThoughtAnchors pointing to deleted KnowledgeNodes
         if nodes_deleted > 0:
@@ -697,7 +939,8 @@ Text: {text}
                 nodes_collection = self.db.collection("KnowledgeNodes")
                 if nodes_collection.has(arango_key):
                     doc = nodes_collection.get(arango_key)
-                    return doc.get("ragChunks", [])
+                    if not doc.get("tombstoned"):  # deleted code (see _tombstone_code_nodes)
+                        return doc.get("ragChunks", [])
                 return []
 
             return await asyncio.to_thread(_fetch)
@@ -906,27 +1149,7 @@ Text: {text}
         }
 
         # Build filter expression with bind parameters
-        if request.clientId:
-            client_expr = "(v.clientId == '' OR v.clientId == null OR v.clientId == @clientId)"
-            bind_vars["clientId"] = request.clientId
-        else:
-            client_expr = "(v.clientId == '' OR v.clientId == null)"
-
-        if request.projectId:
-            if request.groupId:
-                project_expr = (
-                    "(v.projectId == '' OR v.projectId == null "
-                    "OR v.projectId == @projectId "
-                    "OR v.groupId == @groupId)"
-                )
-                bind_vars["projectId"] = request.projectId
-                bind_vars["groupId"] = request.groupId
-            else:
-                project_expr = "(v.projectId == '' OR v.projectId == null OR v.projectId == @projectId)"
-                bind_vars["projectId"] = request.projectId
-            filter_expr = f"({client_expr} AND {project_expr})"
-        else:
-            filter_expr = client_expr
+        filter_expr = self._scope_filter(request.clientId, request.projectId, request.groupId, bind_vars)
 
         # Validate direction to prevent injection
         direction = request.spec.direction.upper()
@@ -941,6 +1164,7 @@ Text: {text}
         FOR v, e, p IN @minDepth..@maxDepth {direction}
         @startNode
         KnowledgeEdges
+        PRUNE v.tombstoned == true
         FILTER {filter_expr}
         LIMIT @maxResults
         RETURN {{vertex: v, depth: LENGTH(p.edges)}}
@@ -979,6 +1203,125 @@ Text: {text}
             )
             return []
 
+    @staticmethod
+    def _scope_filter(client_id: str, project_id: str | None, group_id: str | None, bind_vars: dict) -> str:
+        """Tenant visibility filter on traversal vertex `v` (see traverse); fills bind_vars.
+
+        Tombstoned code nodes (deleted files and their classes/methods) are
+        never visible; callers also PRUNE at them so nothing is reached through
+        them.
+        """
+        if client_id:
+            client_expr = "(v.tombstoned != true AND (v.clientId == '' OR v.clientId == null OR v.clientId == @clientId))"
+            bind_vars["clientId"] = client_id
+        else:
+            client_expr = "(v.tombstoned != true AND (v.clientId == '' OR v.clientId == null))"
+
+        if not project_id:
+            return client_expr
+        if group_id:
+            project_expr = (
+                "(v.projectId == '' OR v.projectId == null "
+                "OR v.projectId == @projectId "
+                "OR v.groupId == @groupId)"
+            )
+            bind_vars["groupId"] = group_id
+        else:
+            project_expr = "(v.projectId == '' OR v.projectId == null OR v.projectId == @projectId)"
+        bind_vars["projectId"] = project_id
+        return f"({client_expr} AND {project_expr})"
+
+    async def batch_expand(
+        self,
+        entity_keys: list[str],
+        seed_keys: list[str],
+        client_id: str = "",
+        project_id: str | None = None,
+        group_id: str | None = None,
+        max_depth: int = 2,
+        max_seeds: int = 10,
+    ) -> tuple[dict[str, list[str]], list[dict]]:
+        """
+        Entity chunk lookup + multi-seed graph expansion in one AQL query.
+
+        Replaces get_node_chunks per entity and traverse per seed for the
+        hybrid retriever. All keys are resolved through the alias registry in
+        one batch. Seeds that are not graph nodes are skipped and do not count
+        toward max_seeds. Each seed's traversal (ANY, 1..max_depth, tenant
+        filtered like traverse) is capped at MAX_GRAPH_TRAVERSAL_RESULTS.
+
+        Returns:
+            Tuple of (ragChunks per entity key, for entities that are nodes;
+            reached nodes as {"seed", "seedIdx", "key", "depth", "ragChunks"}
+            in seed order, then traversal order)
+        """
+        if not entity_keys and not seed_keys:
+            return {}, []
+
+        canonical = await self.alias_registry.resolve_batch(client_id, list(dict.fromkeys(entity_keys + seed_keys)))
+
+        def _arango(key: str) -> str:
+            return canonical.get(key, key).replace(":", "__")
+
+        bind_vars = {
+            "entities": [{"entity": k, "key": _arango(k)} for k in entity_keys],
+            "seeds": [{"seed": k, "key": _arango(k)} for k in seed_keys],
+            "maxSeeds": max_seeds,
+            "maxDepth": max_depth,
+            "maxResults": settings.MAX_GRAPH_TRAVERSAL_RESULTS,
+        }
+        filter_expr = self._scope_filter(client_id, project_id, group_id, bind_vars)
+
+        aql = f"""
+        LET entities = (
+            FOR ent IN @entities
+                LET doc = DOCUMENT(CONCAT("KnowledgeNodes/", ent.key))
+                FILTER doc != null AND doc.tombstoned != true
+                RETURN {{entity: ent.entity, ragChunks: doc.ragChunks || []}}
+        )
+        LET expansion = (
+            FOR s IN @seeds
+                LET seed = DOCUMENT(CONCAT("KnowledgeNodes/", s.key))
+                FILTER seed != null AND seed.tombstoned != true
+                LIMIT @maxSeeds
+                LET reached = (
+                    FOR v, e, p IN 1..@maxDepth ANY CONCAT("KnowledgeNodes/", s.key)
+                    KnowledgeEdges
+                    PRUNE v.tombstoned == true
+                    FILTER {filter_expr}
+                    LIMIT @maxResults
+                    RETURN {{key: v._key, depth: LENGTH(p.edges), ragChunks: v.ragChunks || []}}
+                )
+                RETURN {{seed: s.seed, reached: reached}}
+        )
+        RETURN {{entities: entities, expansion: expansion}}
+        """
+
+        def _execute():
+            return next(self.db.aql.execute(aql, bind_vars=bind_vars), {"entities": [], "expansion": []})
+
+        t0 = time.monotonic()
+        try:
+            result = await asyncio.to_thread(_execute)
+        except Exception as e:
+            logger.warning("GRAPH_READ: BATCH_EXPAND_FAILED entities=%d seeds=%d error=%s",
+                           len(entity_keys), len(seed_keys), e)
+            return {}, []
+
+        entity_chunks = {row["entity"]: row["ragChunks"] for row in result["entities"]}
+        reached = [
+            {"seed": row["seed"], "seedIdx": idx, "key": node["key"],
+             "depth": node["depth"], "ragChunks": node["ragChunks"]}
+            for idx, row in enumerate(result["expansion"])
+            for node in row["reached"]
+        ]
+        logger.info(
+            "GRAPH_READ: BATCH_EXPAND entities=%d/%d seeds=%d/%d reached=%d (%.0fms)",
+            len(entity_chunks), len(entity_keys), len(result["expansion"]), len(seed_keys),
+            len(reached), (time.monotonic() - t0) * 1000,
+        )
+        return entity_chunks, reached
+
     async def get_node(self, key: str, client_id: str = "", project_id: str = None, group_id: str = None) -> GraphNode | None:
         """
         Get a single node by key with multi-tenant filtering.
@@ -1094,6 +1437,7 @@ Text: {text}
         aql = f"""
         FOR doc IN KnowledgeNodes
         FILTER LOWER(doc.label) LIKE @query AND {filter_expr}
+        FILTER doc.tombstoned != true
         LIMIT @limit
         RETURN doc
         """
@@ -1152,6 +1496,104 @@ Text: {text}
     def _make_method_key(self, class_qname: str, method_name: str, branch_name: str, project_id: str) -> str:
         return self._safe_arango_key(["method", class_qname, method_name, "branch", branch_name, project_id])
 
+    @staticmethod
+    def _git_blob_hash(content: str) -> str:
+        """Same id `git hash-object` gives the file, so callers can compare with ls-tree."""
+        data = content.encode("utf-8")
+        return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+    def _load_branch_file_states(self, project_id: str, branch: str) -> dict[str, dict]:
+        """path -> {contentHash, tombstoned} for every file node of the branch."""
+        aql = """
+            FOR n IN KnowledgeNodes
+                FILTER n.projectId == @projectId AND n.branchName == @branch AND n.type == 'file'
+                RETURN { path: n.path, contentHash: n.contentHash, tombstoned: n.tombstoned == true }
+        """
+        cursor = self.db.aql.execute(
+            aql, bind_vars={"projectId": project_id, "branch": branch}, stream=True,
+        )
+        return {doc["path"]: doc for doc in cursor if doc.get("path")}
+
+    def _load_code_snapshots(self, keys: list[str]) -> dict[str, dict]:
+        """file key -> {contentHash, codeStructure} (missing keys are skipped)."""
+        if not keys:
+            return {}
+        aql = """
+            FOR k IN @keys
+                LET n = DOCUMENT(KnowledgeNodes, k)
+                FILTER n != null AND n.codeStructure != null
+                RETURN { key: k, contentHash: n.contentHash, codeStructure: n.codeStructure }
+        """
+        cursor = self.db.aql.execute(aql, bind_vars={"keys": keys})
+        return {doc["key"]: doc for doc in cursor}
+
+    def _tombstone_code_nodes(
+        self, project_id: str, branch: str, file_paths: list[str], node_keys: list[str],
+        keep_keys: list[str] | None = None,
+    ) -> int:
+        """Mark deleted files (with their classes/methods) and explicit node keys as tombstoned.
+
+        Nodes stay in the graph so evidence/ragChunks links survive a revert;
+        the branch -> file edge is dropped so traversals stop reaching them.
+        `keep_keys` (classes/methods upserted in the same ingest, e.g. moved
+        out of a deleted file) are never tombstoned.
+        """
+        tombstoned = 0
+        if file_paths:
+            tombstoned += self.db.aql.execute(
+                """
+                LET marked = (
+                    FOR n IN KnowledgeNodes
+                        FILTER n.projectId == @projectId AND n.branchName == @branch
+                        FILTER n.type IN ['file', 'class', 'method']
+                        FILTER (n.type == 'file' ? n.path : n.filePath) IN @paths
+                        FILTER n.tombstoned != true AND n._key NOT IN @keep
+                        UPDATE n WITH { tombstoned: true, tombstonedAt: DATE_ISO8601(DATE_NOW()) }
+                            IN KnowledgeNodes
+                        RETURN 1
+                )
+                RETURN LENGTH(marked)
+                """,
+                bind_vars={
+                    "projectId": project_id, "branch": branch, "paths": file_paths,
+                    "keep": keep_keys or [],
+                },
+            ).next()
+            branch_key = self._make_branch_key(branch, project_id)
+            edge_keys = [
+                self._safe_arango_key(
+                    [branch_key, "contains_file", self._make_file_key(p, branch, project_id)],
+                    max_len=250,
+                )
+                for p in file_paths
+            ]
+            self.db.aql.execute(
+                "FOR k IN @keys REMOVE k IN KnowledgeEdges OPTIONS { ignoreErrors: true }",
+                bind_vars={"keys": edge_keys},
+            )
+        if node_keys:
+            tombstoned += self.db.aql.execute(
+                """
+                LET marked = (
+                    FOR k IN @keys
+                        UPDATE { _key: k, tombstoned: true, tombstonedAt: DATE_ISO8601(DATE_NOW()) }
+                            IN KnowledgeNodes OPTIONS { ignoreErrors: true }
+                        RETURN 1
+                )
+                RETURN LENGTH(marked)
+                """,
+                bind_vars={"keys": node_keys},
+            ).next()
+        return tombstoned
+
+    def _save_code_snapshots(self, docs: list[dict]):
+        """Store contentHash + parsed structure on file nodes (missing nodes ignored)."""
+        if docs:
+            self.db.aql.execute(
+                "FOR d IN @docs UPDATE d IN KnowledgeNodes OPTIONS { ignoreErrors: true }",
+                bind_vars={"docs": docs},
+            )
+
     async def ingest_git_structure(
         self,
         client_id: str,
@@ -1169,6 +1611,12 @@ Text: {text}
         When file_contents are provided, invokes tree-sitter to extract classes,
         methods, and imports — creating richer graph nodes than metadata alone.
 
+        Incremental (CODE_INGEST_INCREMENTAL): each file node remembers the git
+        blob hash and parsed structure it was built from. Unchanged files are
+        skipped, a branch file identical to the default branch reuses that
+        parse, classes/methods gone from a changed file and files missing from
+        `files` are tombstoned.
+
         Args:
             client_id: Client ID
             project_id: Project ID
@@ -1186,57 +1634,65 @@ Text: {text}
         classes = classes or []
         file_contents = file_contents or []
 
-        # --- Tree-sitter parsing: extract classes + methods from source code ---
-        parsed_classes = []
+        # Tree-sitter results (streamed from the parse pool below)
         file_imports: dict[str, list[str]] = {}  # file_path -> [import_names]
-        if file_contents:
-            try:
-                from app.services.code_parser import parse_file
-                for fc in file_contents:
-                    path = fc.get("path", "")
-                    content = fc.get("content", "")
-                    if not path or not content:
-                        continue
-                    file_classes = parse_file(path, content)
-                    for cls_info in file_classes:
-                        parsed_classes.append(cls_info.to_dict())
-                    # Collect imports per file
-                    if hasattr(file_classes[0] if file_classes else None, 'imports'):
-                        pass  # imports collected via parse_file_imports
-                    # Try extracting imports
-                    try:
-                        from app.services.code_parser import parse_file_imports
-                        imports = parse_file_imports(path, content)
-                        if imports:
-                            file_imports[path] = imports
-                    except ImportError:
-                        pass
-                logger.info(
-                    "Tree-sitter parsed %d files → %d classes",
-                    len(file_contents), len(parsed_classes),
-                )
-            except Exception as e:
-                logger.warning("Tree-sitter parsing failed, using classes from request: %s", e)
-
-        # Use tree-sitter results if available, otherwise fall back to request classes
-        effective_classes = parsed_classes if parsed_classes else classes
 
         repo_key = self._make_repo_key(repo_identifier)
         current_branch_key = self._make_branch_key(branch, project_id)
 
-        def _upsert():
+        # --- Incremental plan: which file contents actually need parsing ---
+        incremental = settings.CODE_INGEST_INCREMENTAL
+        known_files: dict[str, dict] = {}  # path -> {contentHash, tombstoned}
+        content_hashes: dict[str, str] = {}  # path -> git blob hash
+        old_snapshots: dict[str, dict] = {}  # path -> codeStructure this branch was built from
+        reused: list[tuple[str, dict]] = []  # (path, codeStructure) copied from default branch
+        to_parse = [
+            (fc.get("path", ""), fc.get("content", "")) for fc in file_contents
+            if fc.get("path") and fc.get("content")
+        ]
+        unchanged_files = 0
+        if incremental:
+            known_files = await asyncio.to_thread(self._load_branch_file_states, project_id, branch)
+        if incremental and to_parse:
+            content_hashes = await asyncio.to_thread(
+                lambda: {path: self._git_blob_hash(content) for path, content in to_parse}
+            )
+            changed = []
+            for path, content in to_parse:
+                state = known_files.get(path)
+                if state and not state["tombstoned"] and state.get("contentHash") == content_hashes[path]:
+                    unchanged_files += 1
+                else:
+                    changed.append((path, content))
+
+            keys = {self._make_file_key(p, branch, project_id): (p, False) for p, _ in changed}
+            if branch != default_branch:
+                keys.update({self._make_file_key(p, default_branch, project_id): (p, True) for p, _ in changed})
+            snapshots = await asyncio.to_thread(self._load_code_snapshots, list(keys))
+
+            to_parse = []
+            for path, content in changed:
+                own = snapshots.get(self._make_file_key(path, branch, project_id))
+                if own:
+                    old_snapshots[path] = own["codeStructure"]
+                base = snapshots.get(self._make_file_key(path, default_branch, project_id))
+                if base and branch != default_branch and base.get("contentHash") == content_hashes[path]:
+                    reused.append((path, base["codeStructure"]))
+                else:
+                    to_parse.append((path, content))
+
+        # Determine branch role for credibility
+        _is_default = branch == default_branch
+        _branch_role = "default" if _is_default else "active"
+        _cred = "structured_data"  # repo-level = structured
+        _code_cred = "code_analysis"  # code nodes = code_analysis
+
+        def _upsert_structure():
             nodes_col = self.db.collection("KnowledgeNodes")
             edges_col = self.db.collection("KnowledgeEdges")
             created = 0
             updated = 0
             edge_count = 0
-            methods_count = 0
-
-            # Determine branch role for credibility
-            _is_default = branch == default_branch
-            _branch_role = "default" if _is_default else "active"
-            _cred = "structured_data"  # repo-level = structured
-            _code_cred = "code_analysis"  # code nodes = code_analysis
 
             # 1. Upsert repository node
             if not nodes_col.has(repo_key):
@@ -1352,8 +1808,14 @@ Text: {text}
 
             # 4. Upsert file nodes (limit to 500 per branch)
             for f in files[:500]:
+                known = known_files.get(f["path"])
+                if known and not known["tombstoned"]:
+                    continue  # Node + contains_file edge already in place
                 f_key = self._make_file_key(f["path"], branch, project_id)
-                if not nodes_col.has(f_key):
+                if known:
+                    nodes_col.update({"_key": f_key, "tombstoned": False})
+                    updated += 1
+                elif not nodes_col.has(f_key):
                     nodes_col.insert({
                         "_key": f_key,
                         "canonicalKey": f"file:{f['path']}:branch:{branch}:{project_id}",
@@ -1390,8 +1852,20 @@ Text: {text}
                     except Exception:
                         pass
 
+            return created, updated, edge_count, 0
+
+        upserted_keys: set[str] = set()  # class/method keys written by this ingest
+
+        def _upsert_classes(batch_classes: list[dict]):
+            nodes_col = self.db.collection("KnowledgeNodes")
+            edges_col = self.db.collection("KnowledgeEdges")
+            created = 0
+            updated = 0
+            edge_count = 0
+            methods_count = 0
+
             # 5. Upsert class nodes (from tree-sitter or request)
-            for cls in effective_classes:
+            for cls in batch_classes:
                 qname = cls.get("qualifiedName") or cls["name"]
                 c_key = self._make_class_key(qname, branch, project_id)
                 methods = cls.get("methods", [])
@@ -1420,8 +1894,11 @@ Text: {text}
                     nodes_col.update({
                         "_key": c_key,
                         "methodCount": len(methods),
+                        "tombstoned": False,
+                        **({"filePath": cls["filePath"]} if cls.get("filePath") else {}),
                     })
                     updated += 1
+                upserted_keys.add(c_key)
                 # file -> class edge
                 if cls.get("filePath"):
                     f_key = self._make_file_key(cls["filePath"], branch, project_id)
@@ -1463,7 +1940,13 @@ Text: {text}
                         created += 1
                         methods_count += 1
                     else:
+                        nodes_col.update({
+                            "_key": m_key,
+                            "tombstoned": False,
+                            **({"filePath": cls["filePath"]} if cls.get("filePath") else {}),
+                        })
                         updated += 1
+                    upserted_keys.add(m_key)
                     # class -> method edge (has_method)
                     e_key = self._safe_arango_key([c_key, "has_method", m_key], max_len=250)
                     if not edges_col.has(e_key):
@@ -1480,6 +1963,13 @@ Text: {text}
                         except Exception:
                             pass
 
+            return created, updated, edge_count, methods_count
+
+        def _upsert_imports():
+            nodes_col = self.db.collection("KnowledgeNodes")
+            edges_col = self.db.collection("KnowledgeEdges")
+            edge_count = 0
+
             # 7. Create import edges (file → class, from tree-sitter imports)
             for import_file_path, import_names in file_imports.items():
                 f_key = self._make_file_key(import_file_path, branch, project_id)
@@ -1509,17 +1999,112 @@ Text: {text}
                         except Exception:
                             pass
 
-            return created, updated, edge_count, methods_count
+            return 0, 0, edge_count, 0
+
+        totals = [0, 0, 0, 0]  # created, updated, edges, methods
+
+        def _add(counts):
+            for i, v in enumerate(counts):
+                totals[i] += v
+
+        _add(await asyncio.to_thread(_upsert_structure))
 
-        nodes_created, nodes_updated, edges_created, methods_indexed = await asyncio.to_thread(_upsert)
+        # Files the branch no longer lists (deleted / renamed away)
+        deleted_paths: list[str] = []
+        if incremental and files:
+            listed = {f["path"] for f in files}
+            deleted_paths = [p for p, st in known_files.items() if not st["tombstoned"] and p not in listed]
+
+        def _code_keys(structure: dict) -> set[str]:
+            keys = set()
+            for cls in structure.get("classes", []):
+                qname = cls.get("qualifiedName") or cls["name"]
+                keys.add(self._make_class_key(qname, branch, project_id))
+                for method_name in cls.get("methods", [])[:50]:
+                    keys.add(self._make_method_key(qname, method_name, branch, project_id))
+            return keys
+
+        stale_keys: set[str] = set()
+        live_keys: set[str] = set()  # A class moved between two changed files must stay alive
+
+        async def _apply_structures(structures: list[tuple[str, dict]]) -> int:
+            """Upsert classes/methods for (path, codeStructure) pairs and record the snapshots."""
+            batch_classes = [cls for _, st in structures for cls in st["classes"]]
+            for path, st in structures:
+                if st["imports"]:
+                    file_imports[path] = st["imports"]
+                if path in old_snapshots:
+                    new_keys = _code_keys(st)
+                    live_keys.update(new_keys)
+                    stale_keys.update(_code_keys(old_snapshots[path]) - new_keys)
+            if batch_classes:
+                _add(await asyncio.to_thread(_upsert_classes, batch_classes))
+            if incremental:
+                await asyncio.to_thread(self._save_code_snapshots, [
+                    {
+                        "_key": self._make_file_key(path, branch, project_id),
+                        "contentHash": content_hashes[path],
+                        "codeStructure": st,
+                    }
+                    for path, st in structures
+                ])
+            return len(batch_classes)
+
+        # --- Tree-sitter parsing in the process pool: each file parsed once
+        # (classes + imports from one tree); class batches are upserted while
+        # later files are still parsing ---
+        parsed_classes_count = 0
+        if reused:
+            parsed_classes_count += await _apply_structures(reused)
+        if to_parse:
+            try:
+                from app.services.code_parse_pool import parse_sources
+                from app.services.code_parser import detect_language
+
+                # No grammar for these — remember the hash so they are not revisited
+                unsupported = [(p, {"classes": [], "imports": []}) for p, _ in to_parse if not detect_language(p)]
+                if unsupported:
+                    await _apply_structures(unsupported)
+
+                async for batch in parse_sources(to_parse, chunk_files=settings.CODE_PARSE_CHUNK_FILES):
+                    parsed_classes_count += await _apply_structures([
+                        (pf.path, {"classes": [cls.to_dict() for cls in pf.classes], "imports": pf.imports})
+                        for pf in batch
+                    ])
+                logger.info(
+                    "Tree-sitter parsed %d files → %d classes",
+                    len(to_parse), parsed_classes_count,
+                )
+            except Exception as e:
+                logger.warning("Tree-sitter parsing failed, using classes from request: %s", e)
+
+        # Use tree-sitter results if available, otherwise fall back to request classes
+        if not parsed_classes_count and not unchanged_files and classes:
+            _add(await asyncio.to_thread(_upsert_classes, classes))
+        classes_indexed = parsed_classes_count or len(classes)
+
+        tombstoned = 0
+        stale_keys -= live_keys | upserted_keys
+        if deleted_paths or stale_keys:
+            tombstoned = await asyncio.to_thread(
+                self._tombstone_code_nodes, project_id, branch, deleted_paths, sorted(stale_keys),
+                sorted(upserted_keys),
+            )
+
+        if file_imports:
+            _add(await asyncio.to_thread(_upsert_imports))
+
+        nodes_created, nodes_updated, edges_created, methods_indexed = totals
 
         logger.info(
             "Git structure ingest: repo=%s branch=%s nodes_created=%d "
             "nodes_updated=%d edges=%d files=%d classes=%d methods=%d "
-            "file_contents=%d tree_sitter=%s",
+            "file_contents=%d tree_sitter=%s unchanged=%d reused=%d parsed=%d "
+            "deleted=%d tombstoned=%d",
             repo_identifier, branch, nodes_created, nodes_updated,
-            edges_created, len(files), len(effective_classes), methods_indexed,
-            len(file_contents), bool(parsed_classes),
+            edges_created, len(files), classes_indexed, methods_indexed,
+            len(file_contents), bool(parsed_classes_count), unchanged_files,
+            len(reused), len(to_parse), len(deleted_paths), tombstoned,
         )
 
         return {
@@ -1529,7 +2114,7 @@ Text: {text}
             "repository_key": repo_key,
             "branch_key": current_branch_key,
             "files_indexed": min(len(files), 500),
-            "classes_indexed": len(effective_classes),
+            "classes_indexed": classes_indexed,
             "methods_indexed": methods_indexed,
         }
 
@@ -1537,6 +2122,33 @@ Text: {text}
     # Joern CPG ingest — enriches graph with semantic edges
     # -----------------------------------------------------------------------
 
+    def _load_code_graph_state(self, project_id: str, branch: str) -> tuple[dict[str, str], set[str]]:
+        """Live class/method keys (-> signature) and semantic edge keys of one branch."""
+        signatures = {
+            doc["key"]: doc["signature"]
+            for doc in self.db.aql.execute(
+                """
+                FOR n IN KnowledgeNodes
+                    FILTER n.projectId == @projectId AND n.branchName == @branch
+                    FILTER n.type IN ['class', 'method'] AND n.tombstoned != true
+                    RETURN { key: n._key, signature: n.signature || "" }
+                """,
+                bind_vars={"projectId": project_id, "branch": branch}, stream=True,
+            )
+        }
+        existing_edges = set(self.db.aql.execute(
+            """
+            FOR n IN KnowledgeNodes
+                FILTER n.projectId == @projectId AND n.branchName == @branch
+                FILTER n.type IN ['class', 'method']
+                FOR e IN KnowledgeEdges
+                    FILTER e._from == n._id AND e.relation IN ['calls', 'extends', 'uses_type']
+                    RETURN e._key
+            """,
+            bind_vars={"projectId": project_id, "branch": branch}, stream=True,
+        ))
+        return signatures, existing_edges
+
     async def ingest_cpg_export(
         self,
         client_id: str,
@@ -1553,6 +2165,11 @@ Text: {text}
 
         Also enriches method nodes with Joern-specific data (signature).
 
+        Existing class/method keys, signatures and semantic edges of the branch
+        are loaded up front in two queries, so a re-run only writes what the
+        new export changed instead of probing ArangoDB once per CPG entry.
+        Tombstoned nodes (deleted files) are not linked.
+
         Args:
             client_id: Client ID
             project_id: Project ID
@@ -1570,6 +2187,8 @@ Text: {text}
         def _ingest():
             nodes_col = self.db.collection("KnowledgeNodes")
             edges_col = self.db.collection("KnowledgeEdges")
+            # method/class key -> signature ("" for classes), live nodes only
+            signatures, existing_edges = self._load_code_graph_state(project_id, branch)
             enriched = 0
             edges_created = 0
             nodes_created = 0
@@ -1595,7 +2214,7 @@ Text: {text}
                     continue
 
                 m_key = self._make_method_key(class_qname, method_name, branch, project_id)
-                if nodes_col.has(m_key):
+                if m_key in signatures and signatures[m_key] != signature:
                     try:
                         nodes_col.update({
                             "_key": m_key,
@@ -1614,25 +2233,25 @@ Text: {text}
                     continue
 
                 child_key = self._make_class_key(child_name, branch, project_id)
-                if not nodes_col.has(child_key):
+                if child_key not in signatures:
                     # Try short name
                     short = child_name.rsplit(".", 1)[-1]
                     child_key = self._make_class_key(short, branch, project_id)
-                    if not nodes_col.has(child_key):
+                    if child_key not in signatures:
                         continue
 
                 for parent_name in parents:
                     if not parent_name or parent_name in ("ANY", "Object", "java.lang.Object"):
                         continue
                     parent_key = self._make_class_key(parent_name, branch, project_id)
-                    if not nodes_col.has(parent_key):
+                    if parent_key not in signatures:
                         short_parent = parent_name.rsplit(".", 1)[-1]
                         parent_key = self._make_class_key(short_parent, branch, project_id)
-                        if not nodes_col.has(parent_key):
+                        if parent_key not in signatures:
                             continue
 
                     e_key = self._safe_arango_key([child_key, "extends", parent_key], max_len=250)
-                    if not edges_col.has(e_key):
+                    if e_key not in existing_edges:
                         try:
                             edges_col.insert({
                                 "_key": e_key,
@@ -1642,6 +2261,7 @@ Text: {text}
                                 "relationNormalized": "extends",
                                 "evidenceChunkIds": [],
                             })
+                            existing_edges.add(e_key)
                             edges_created += 1
                         except Exception:
                             pass
@@ -1667,11 +2287,11 @@ Text: {text}
                 caller_key = self._make_method_key(caller_cls, caller_method, branch, project_id)
                 callee_key = self._make_method_key(callee_cls, callee_method, branch, project_id)
 
-                if not nodes_col.has(caller_key) or not nodes_col.has(callee_key):
+                if caller_key not in signatures or callee_key not in signatures:
                     continue
 
                 e_key = self._safe_arango_key([caller_key, "calls", callee_key], max_len=250)
-                if not edges_col.has(e_key):
+                if e_key not in existing_edges:
                     try:
                         edges_col.insert({
                             "_key": e_key,
@@ -1681,6 +2301,7 @@ Text: {text}
                             "relationNormalized": "calls",
                             "evidenceChunkIds": [],
                         })
+                        existing_edges.add(e_key)
                         edges_created += 1
                     except Exception:
                         pass
@@ -1698,17 +2319,17 @@ Text: {text}
                     continue
 
                 owner_key = self._make_class_key(class_name, branch, project_id)
-                if not nodes_col.has(owner_key):
+                if owner_key not in signatures:
                     short_owner = class_name.rsplit(".", 1)[-1]
                     owner_key = self._make_class_key(short_owner, branch, project_id)
-                    if not nodes_col.has(owner_key):
+                    if owner_key not in signatures:
                         continue
 
                 ref_key = self._make_class_key(member_type, branch, project_id)
-                if not nodes_col.has(ref_key):
+                if ref_key not in signatures:
                     short_ref = member_type.rsplit(".", 1)[-1]
                     ref_key = self._make_class_key(short_ref, branch, project_id)
-                    if not nodes_col.has(ref_key):
+                    if ref_key not in signatures:
                         continue
 
                 # Don't create self-references
@@ -1716,7 +2337,7 @@ Text: {text}
                     continue
 
                 e_key = self._safe_arango_key([owner_key, "uses_type", ref_key], max_len=250)
-                if not edges_col.has(e_key):
+                if e_key not in existing_edges:
                     try:
                         edges_col.insert({
                             "_key": e_key,
@@ -1726,6 +2347,7 @@ Text: {text}
                             "relationNormalized": "uses_type",
                             "evidenceChunkIds": [],
                         })
+                        existing_edges.add(e_key)
                         edges_created += 1
                     except Exception:
                         pass
@@ -2241,7 +2863,10 @@ Text: {text}
             return {"completed": completed, "processed": len(nodes), "findings": len(orphans),
                     "fixed": fixed, "totalEstimate": 0, "nextCursor": last_key if not completed else None}
 
-        return await asyncio.to_thread(_execute)
+        result = await asyncio.to_thread(_execute)
+        if result["fixed"]:
+            await bump_scope(client_id)
+        return result
 
     async def maintenance_consistency_batch(self, client_id: str, cursor: str | None, batch_size: int) -> dict:
         """Check KB consistency — find nodes with broken edge references.
@@ -2282,7 +2907,10 @@ Text: {text}
             return {"completed": completed, "processed": len(edges), "findings": len(broken),
                     "fixed": fixed, "totalEstimate": 0, "nextCursor": last_key if not completed else None}
 
-        return await asyncio.to_thread(_execute)
+        result = await asyncio.to_thread(_execute)
+        if result["fixed"]:
+            await bump_scope(client_id)
+        return result
 
     async def retag_project(self, source_project_id: str, target_project_id: str) -> dict[str, int]:
         """Migrate all ArangoDB data from one projectId to another.
@@ -2316,6 +2944,12 @@ Text: {text}
                 logger.info("retag_project: %s — %d docs migrated (%s → %s)",
                             coll_name, updated, source_project_id, target_project_id)
 
+        # Thought index caches projectId per row — reload on next query
+        if results.get("ThoughtNodes") and self._thought_service and self._thought_service.index:
+            self._thought_service.index.invalidate()
+        if any(results.values()):
+            await bump_scope(None)
+
         return results
 
     async def retag_group(self, project_id: str, new_group_id: str | None) -> int:
@@ -2338,6 +2972,8 @@ Text: {text}
 
         try:
             updated = await asyncio.to_thread(_execute)
+            if updated:
+                await bump_scope(None)
             logger.info("retag_group: projectId=%s newGroupId=%s updated=%d nodes", project_id, new_group_id, updated)
             return updated
         except Exception as e:
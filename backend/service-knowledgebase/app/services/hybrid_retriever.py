@@ -9,7 +9,6 @@ This module implements sophisticated hybrid search combining:
 5. Source diversity and deduplication
 """
 
-import asyncio
 import logging
 import re
 import time
@@ -19,12 +18,13 @@ import httpx
 from app.core.config import settings
 from app.api.models import (
     RetrievalRequest, EvidencePack, EvidenceItem,
-    TraversalRequest, TraversalSpec, GraphNode,
     CREDIBILITY_WEIGHTS, BRANCH_ROLE_BOOST, SourceCredibility
 )
 from app.services.rag_service import RagService
 from app.services.graph_service import GraphService
 from app.services.normalizer import normalize_graph_ref, extract_namespace
+from app.services.retrieval_cache import RetrievalCache, get_scope_generations
+from app.metrics import retrieval_cache_lookups_total, retrieval_stage_duration
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +65,9 @@ class HybridRetriever:
     def __init__(self, rag_service: RagService, graph_service: GraphService):
         self.rag_service = rag_service
         self.graph_service = graph_service
+        self._cache = RetrievalCache(
+            settings.RETRIEVAL_CACHE_MAX_ENTRIES, settings.RETRIEVAL_CACHE_TTL_S,
+        ) if settings.RETRIEVAL_CACHE_ENABLED else None
 
     async def retrieve(
         self,
@@ -92,13 +95,58 @@ class HybridRetriever:
 
         Returns:
             EvidencePack with ranked results
+
+        Results are cached per (normalized query, scope, filters, flags) and
+        invalidated by the scope's write generation (see retrieval_cache.py).
         """
-        all_chunks: dict[str, ScoredChunk] = {}
         t_start = time.monotonic()
+        flags = (expand_graph, extract_entities, use_rrf, max_graph_hops, max_seeds,
+                 diversity_factor, bool(settings.RERANKER_URL))
+        key = None
+        if self._cache is not None:
+            try:
+                generations = await get_scope_generations().current(request.clientId)
+                key = self._cache.make_key(request, generations, flags)
+            except Exception as e:
+                # Unknown generation = can't tell if an entry is stale; don't cache
+                retrieval_cache_lookups_total.labels(result="bypass").inc()
+                logger.warning("HYBRID: retrieval cache bypassed (generation lookup failed): %s", e)
+            if key is not None:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    elapsed = time.monotonic() - t_start
+                    retrieval_stage_duration.labels(stage="cache_hit").observe(elapsed)
+                    logger.info("HYBRID: cache hit clientId=%s items=%d (%.0fms)",
+                                request.clientId, len(cached.items), elapsed * 1000)
+                    return cached
+
+        pack = await self._retrieve_uncached(
+            request, expand_graph, extract_entities, use_rrf, max_graph_hops,
+            max_seeds, diversity_factor, embedding_priority,
+        )
+        if key is not None:
+            self._cache.put(key, pack)
+        retrieval_stage_duration.labels(stage="total").observe(time.monotonic() - t_start)
+        return pack
+
+    async def _retrieve_uncached(
+        self,
+        request: RetrievalRequest,
+        expand_graph: bool,
+        extract_entities: bool,
+        use_rrf: bool,
+        max_graph_hops: int,
+        max_seeds: int,
+        diversity_factor: float,
+        embedding_priority: int | None,
+    ) -> EvidencePack:
+        """The full retrieval pipeline (see retrieve); records per-stage timings."""
+        all_chunks: dict[str, ScoredChunk] = {}
 
         # 1. RAG Vector Search
         t0 = time.monotonic()
         rag_evidence = await self.rag_service.retrieve(request, embedding_priority=embedding_priority)
+        retrieval_stage_duration.labels(stage="rag").observe(time.monotonic() - t0)
         logger.info("HYBRID: RAG returned %d items (%.0fms)", len(rag_evidence.items), (time.monotonic() - t0) * 1000)
         for i, item in enumerate(rag_evidence.items):
             chunk_id = item.metadata.get("id", f"rag_{i}")
@@ -116,45 +164,39 @@ class HybridRetriever:
             )
             all_chunks[chunk_id] = chunk
 
-        # 2. Extract entities from query (optional)
-        if extract_entities:
-            query_entities = self._extract_query_entities(request.query)
-            if query_entities:
-                entity_chunks = await self._fetch_entity_chunks(
-                    query_entities,
-                    request.clientId,
-                    request.projectId,
-                    getattr(request, 'groupId', None)
-                )
-                for chunk in entity_chunks:
-                    if chunk.chunk_id in all_chunks:
-                        all_chunks[chunk.chunk_id].entity_score = chunk.entity_score
-                    else:
-                        all_chunks[chunk.chunk_id] = chunk
-
-        # 3. Graph Expansion (optional)
-        if expand_graph:
+        # 2 + 3. Entity lookup and graph expansion (optional) — one AQL query
+        # for both plus one Weaviate fetch for the union of their chunks
+        query_entities = self._extract_query_entities(request.query) if extract_entities else []
+        seed_nodes = self._collect_seed_nodes(all_chunks, max_seeds) if expand_graph else []
+        if query_entities or seed_nodes:
             t0 = time.monotonic()
-            seed_nodes = self._collect_seed_nodes(all_chunks, max_seeds)
-            if seed_nodes:
-                graph_chunks = await self._expand_via_graph(
-                    seed_nodes,
-                    request.clientId,
-                    request.projectId,
-                    max_graph_hops,
-                    getattr(request, 'groupId', None)
-                )
-                for chunk in graph_chunks:
-                    if chunk.chunk_id in all_chunks:
-                        # Update graph score if better
-                        existing = all_chunks[chunk.chunk_id]
-                        if chunk.graph_score > existing.graph_score:
-                            existing.graph_score = chunk.graph_score
-                            existing.graph_distance = chunk.graph_distance
-                    else:
-                        all_chunks[chunk.chunk_id] = chunk
+            entity_chunks, graph_chunks = await self._expand_batch(
+                query_entities,
+                seed_nodes,
+                request.clientId,
+                request.projectId,
+                max_graph_hops,
+                max_seeds if expand_graph else 0,
+                getattr(request, 'groupId', None)
+            )
+            retrieval_stage_duration.labels(stage="expand").observe(time.monotonic() - t0)
+            for chunk in entity_chunks:
+                if chunk.chunk_id in all_chunks:
+                    all_chunks[chunk.chunk_id].entity_score = chunk.entity_score
+                else:
+                    all_chunks[chunk.chunk_id] = chunk
+            for chunk in graph_chunks:
+                if chunk.chunk_id in all_chunks:
+                    # Update graph score if better
+                    existing = all_chunks[chunk.chunk_id]
+                    if chunk.graph_score > existing.graph_score:
+                        existing.graph_score = chunk.graph_score
+                        existing.graph_distance = chunk.graph_distance
+                else:
+                    all_chunks[chunk.chunk_id] = chunk
 
         # 4. Combine scores
+        t0 = time.monotonic()
         if use_rrf:
             self._apply_rrf_scoring(all_chunks)
         else:
@@ -176,6 +218,7 @@ class HybridRetriever:
 
         # Filter by min confidence
         filtered = [c for c in sorted_chunks if c.combined_score >= request.minConfidence]
+        retrieval_stage_duration.labels(stage="scoring").observe(time.monotonic() - t0)
 
         # 7. Cross-encoder reranking (if reranker available)
         if settings.RERANKER_URL and filtered:
@@ -183,6 +226,7 @@ class HybridRetriever:
             # Take top RERANKER_TOP_K candidates for reranking
             candidates = filtered[:settings.RERANKER_TOP_K]
             reranked = await self._rerank(request.query, candidates)
+            retrieval_stage_duration.labels(stage="rerank").observe(time.monotonic() - t0)
             if reranked is not None:
                 filtered = reranked
                 logger.info("HYBRID: RERANK %d→%d candidates (%.0fms)",
@@ -275,40 +319,6 @@ class HybridRetriever:
 
         return list(set(entities))
 
-    async def _fetch_entity_chunks(
-        self,
-        entities: list[str],
-        client_id: str,
-        project_id: str,
-        group_id: str = None
-    ) -> list[ScoredChunk]:
-        """
-        Fetch chunks directly associated with entities.
-        """
-        chunks = []
-
-        for entity in entities:
-            try:
-                chunk_ids = await self.graph_service.get_node_chunks(entity, client_id)
-                if chunk_ids:
-                    fetched = await self.rag_service.get_chunks_by_ids(chunk_ids[:5])
-                    for i, chunk in enumerate(fetched):
-                        # Score decreases for later chunks
-                        score = 0.9 - (i * 0.1)
-                        chunks.append(ScoredChunk(
-                            chunk_id=chunk["id"],
-                            content=chunk["content"],
-                            source_urn=chunk["sourceUrn"],
-                            entity_score=score,
-                            graph_refs=chunk.get("graphRefs", []),
-                            source="entity",
-                            metadata={"matchedEntity": entity}
-                        ))
-            except Exception as e:
-                logger.warning("Entity chunk fetch failed for %s: %s", entity, e)
-
-        return chunks
-
     def _collect_seed_nodes(
         self,
         chunks: dict[str, ScoredChunk],
@@ -339,104 +349,97 @@ class HybridRetriever:
 
         return seeds
 
-    async def _traverse_single_seed(
-        self,
-        seed_idx: int,
-        seed_key: str,
-        client_id: str,
-        project_id: str,
-        max_hops: int,
-        group_id: str = None,
-    ) -> list[ScoredChunk]:
-        """Traverse a single seed node and return scored chunks."""
-        seed_priority_factor = 1.0 - (seed_idx * 0.05)
-        chunks = []
-        try:
-            t0 = time.monotonic()
-            traversal_request = TraversalRequest(
-                clientId=client_id,
-                projectId=project_id,
-                groupId=group_id,
-                startKey=seed_key,
-                spec=TraversalSpec(direction="ANY", minDepth=1, maxDepth=max_hops)
-            )
-            related_nodes = await self.graph_service.traverse(traversal_request)
-            elapsed = (time.monotonic() - t0) * 1000
-            logger.info("GRAPH_EXPAND: seed[%d] %s → %d nodes (%.0fms)", seed_idx, seed_key, len(related_nodes), elapsed)
-
-            for node in related_nodes:
-                for chunk_id in node.properties.get("ragChunks", []):
-                    distance = node.properties.get("_depth", 1)
-                    distance_factor = 1.0 / (distance + 1)
-                    graph_score = 0.8 * seed_priority_factor * distance_factor
-                    chunks.append(ScoredChunk(
-                        chunk_id=chunk_id,
-                        content="",
-                        source_urn="",
-                        graph_score=graph_score,
-                        graph_distance=distance,
-                        source="graph",
-                        metadata={"seedNode": seed_key, "discoveredVia": node.key}
-                    ))
-        except Exception as e:
-            logger.warning("Graph expansion failed for %s: %s", seed_key, e)
-        return chunks
-
-    async def _expand_via_graph(
+    async def _expand_batch(
         self,
+        entities: list[str],
         seed_nodes: list[str],
         client_id: str,
         project_id: str,
         max_hops: int,
+        max_seeds: int,
         group_id: str = None
-    ) -> list[ScoredChunk]:
+    ) -> tuple[list[ScoredChunk], list[ScoredChunk]]:
         """
-        Expand search via graph traversal from seed nodes (parallel).
+        Fetch chunks directly associated with query entities and expand via
+        graph traversal from seed nodes.
+
+        Matched entity nodes are seeds too, ahead of the RAG-derived ones (their
+        chunks would otherwise have contributed the top seeds). Costs one
+        GraphService.batch_expand query and one get_chunks_by_ids fetch.
+
+        Returns:
+            (entity chunks, graph-discovered chunks), both with content
         """
-        from ..core.config import settings as kb_settings
-        max_expansion_chunks = kb_settings.MAX_GRAPH_EXPANSION_CHUNKS
+        max_expansion_chunks = settings.MAX_GRAPH_EXPANSION_CHUNKS
 
         t0 = time.monotonic()
+        seeds = list(dict.fromkeys(entities + seed_nodes)) if max_seeds > 0 else []
+        entity_refs, reached = await self.graph_service.batch_expand(
+            entities, seeds, client_id, project_id, group_id,
+            max_depth=max_hops, max_seeds=max_seeds,
+        )
 
-        # Run all seed traversals in parallel
-        tasks = [
-            self._traverse_single_seed(idx, key, client_id, project_id, max_hops, group_id)
-            for idx, key in enumerate(seed_nodes)
-        ]
-        results = await asyncio.gather(*tasks)
-
-        # Merge and deduplicate
-        chunks = []
+        # Entity chunks: first 5 per entity, score decreases for later chunks
+        entity_chunks = []
+        for entity, chunk_ids in entity_refs.items():
+            for i, chunk_id in enumerate(chunk_ids[:5]):
+                entity_chunks.append(ScoredChunk(
+                    chunk_id=chunk_id,
+                    content="",
+                    source_urn="",
+                    entity_score=0.9 - (i * 0.1),
+                    source="entity",
+                    metadata={"matchedEntity": entity}
+                ))
+
+        # Graph chunks: deduplicated in seed order, capped
+        graph_chunks = []
         visited_chunks = set()
-        for seed_chunks in results:
-            for chunk in seed_chunks:
-                if chunk.chunk_id not in visited_chunks:
-                    visited_chunks.add(chunk.chunk_id)
-                    chunks.append(chunk)
-                    if len(chunks) >= max_expansion_chunks:
-                        logger.info("GRAPH_EXPAND: chunk cap reached (%d), stopping", max_expansion_chunks)
-                        break
-            if len(chunks) >= max_expansion_chunks:
+        for node in reached:
+            seed_priority_factor = 1.0 - (node["seedIdx"] * 0.05)
+            distance = node["depth"]
+            distance_factor = 1.0 / (distance + 1)
+            graph_score = 0.8 * seed_priority_factor * distance_factor
+            for chunk_id in node["ragChunks"]:
+                if chunk_id in visited_chunks:
+                    continue
+                visited_chunks.add(chunk_id)
+                graph_chunks.append(ScoredChunk(
+                    chunk_id=chunk_id,
+                    content="",
+                    source_urn="",
+                    graph_score=graph_score,
+                    graph_distance=distance,
+                    source="graph",
+                    metadata={"seedNode": node["seed"], "discoveredVia": node["key"]}
+                ))
+                if len(graph_chunks) >= max_expansion_chunks:
+                    break
+            if len(graph_chunks) >= max_expansion_chunks:
+                logger.info("GRAPH_EXPAND: chunk cap reached (%d), stopping", max_expansion_chunks)
                 break
 
-        # Fetch content for graph-discovered chunks
-        if chunks:
+        # Fetch content for the union in one round trip
+        chunk_ids = list(dict.fromkeys(c.chunk_id for c in entity_chunks + graph_chunks))
+        if chunk_ids:
             t1 = time.monotonic()
-            chunk_ids = [c.chunk_id for c in chunks]
             fetched = await self.rag_service.get_chunks_by_ids(chunk_ids)
             fetched_map = {c["id"]: c for c in fetched}
-            for chunk in chunks:
-                if chunk.chunk_id in fetched_map:
-                    data = fetched_map[chunk.chunk_id]
+            for chunk in entity_chunks + graph_chunks:
+                data = fetched_map.get(chunk.chunk_id)
+                if data:
                     chunk.content = data["content"]
                     chunk.source_urn = data["sourceUrn"]
                     chunk.graph_refs = data.get("graphRefs", [])
             logger.info("GRAPH_EXPAND: fetched %d/%d chunks (%.0fms)", len(fetched_map), len(chunk_ids), (time.monotonic() - t1) * 1000)
 
         total_ms = (time.monotonic() - t0) * 1000
-        logger.info("GRAPH_EXPAND: total %d seeds → %d chunks (%.0fms)", len(seed_nodes), len(chunks), total_ms)
+        logger.info(
+            "GRAPH_EXPAND: total %d entities + %d seeds → %d entity chunks, %d graph chunks (%.0fms)",
+            len(entities), len(seeds), len(entity_chunks), len(graph_chunks), total_ms,
+        )
 
-        return [c for c in chunks if c.content]
+        return [c for c in entity_chunks if c.content], [c for c in graph_chunks if c.content]
 
     def _apply_rrf_scoring(self, chunks: dict[str, ScoredChunk]):
         """
@@ -170,12 +170,14 @@ class KnowledgeService:
         """
         Ingest content with async LLM extraction.  Supports upsert semantics:
         if chunks already exist for the same sourceUrn and content changed,
-        old chunks are purged before re-ingest.  If content is identical, skip.
+        only the chunk-level delta is applied (see RagService.upsert_chunks).
+        If content is identical, skip.
 
         Flow:
         1. Upsert check — compare contentHash for sourceUrn
-        2. RAG Ingest → embedding + Weaviate insert (fast, returns immediately)
-        3. Enqueue LLM extraction task → background worker processes later
+        2. RAG Ingest → embedding + Weaviate insert of new chunks only;
+           vanished chunks deleted and their graph refs purged
+        3. Enqueue LLM extraction task for the new chunks only
         4. Return immediately without waiting for LLM
 
         Queue has two priority levels (FIFO within each):
@@ -209,16 +211,38 @@ class KnowledgeService:
                     chunk_ids=[],
                     entity_keys=[],
                 )
-            else:
-                logger.info(
-                    "KB_WRITE: UPSERT_PURGE sourceUrn=%s old_hash=%s new_hash=%s — purging %d old chunks",
-                    request.sourceUrn, existing_hash, content_hash, existing_count
-                )
-                await self.purge(request.sourceUrn)
 
         # 1. RAG Ingest - get chunk IDs (fast)
         rag_start = time.time()
-        chunks_count, chunk_ids = await self.rag_service.ingest(request, embedding_priority=embedding_priority, content_hash=content_hash)
+        extraction_request = request
+        if existing_count > 0:
+            logger.info(
+                "KB_WRITE: UPSERT_DIFF sourceUrn=%s old_hash=%s new_hash=%s existing_chunks=%d",
+                request.sourceUrn, existing_hash, content_hash, existing_count
+            )
+            chunks_count, chunk_ids, removed_ids, new_chunks = await self.rag_service.upsert_chunks(
+                request, content_hash=content_hash, embedding_priority=embedding_priority,
+            )
+            if removed_ids:
+                await self.graph_service.purge_chunk_refs(removed_ids, client_id=request.clientId)
+            # Graph extraction sees only the new text, attributed to the new chunks
+            extraction_request = request.model_copy(update={"content": "\n\n".join(new_chunks)})
+        else:
+            chunks_count, chunk_ids = await self.rag_service.ingest(request, embedding_priority=embedding_priority, content_hash=content_hash)
+        return await self._finish_ingest(
+            request, extraction_request, chunks_count, chunk_ids, rag_start, embedding_priority,
+        )
+
+    async def _finish_ingest(
+        self,
+        request: IngestRequest,
+        extraction_request: IngestRequest,
+        chunks_count: int,
+        chunk_ids: list[str],
+        rag_start: float,
+        embedding_priority: int | None,
+    ) -> IngestResult:
+        """RAG metrics + LLM extraction enqueue after the chunks are written."""
         rag_ingest_duration.observe(time.time() - rag_start)
         rag_ingest_total.labels(status="success").inc()
         rag_ingest_chunks.observe(chunks_count)
@@ -231,7 +255,7 @@ class KnowledgeService:
         effective_priority = embedding_priority if embedding_priority is not None else 4
 
         if self.extraction_queue and chunk_ids:
-            await self._enqueue_extraction(request, chunk_ids, effective_priority)
+            await self._enqueue_extraction(extraction_request, chunk_ids, effective_priority)
         elif chunk_ids:
             logger.warning(
                 "KB_WRITE: NO_EXTRACTION_QUEUE sourceUrn=%s has_chunks=%s",
@@ -343,6 +367,11 @@ class KnowledgeService:
 
     async def ingest_file(self, file_bytes: bytes, filename: str, request: IngestRequest) -> IngestResult:
         mime_type = self._guess_mime(filename)
+        # New sources stream: pages are chunked + embedded while later pages
+        # still parse. Re-ingests need the whole text for the upsert diff.
+        if settings.DOCUMENT_EXTRACTION_STREAMING and await self.rag_service.count_by_source(request.sourceUrn) == 0:
+            return await self._ingest_file_streaming(file_bytes, filename, mime_type, request)
+
         result = await self.document_extractor.extract(file_bytes, filename, mime_type)
         logger.info("DocumentExtractor: file=%s method=%s chars=%d", filename, result.method, len(result.text))
 
@@ -351,6 +380,33 @@ class KnowledgeService:
             request.kind = "image"
         return await self.ingest(request)
 
+    async def _ingest_file_streaming(
+        self, file_bytes: bytes, filename: str, mime_type: str, request: IngestRequest,
+    ) -> IngestResult:
+        logger.info(
+            "KB_WRITE: INGEST_STREAM_START sourceUrn=%s file=%s clientId=%s projectId=%s",
+            request.sourceUrn, filename, request.clientId, request.projectId or "",
+        )
+        stream = self.document_extractor.extract_stream(file_bytes, filename, mime_type)
+        is_pdf = mime_type == "application/pdf"
+
+        async def _texts():
+            async for page in stream:
+                # Same document text as the unary Extract response
+                if is_pdf:
+                    if page.text:
+                        yield f"--- Page {page.page_number} ---\n{page.text}"
+                else:
+                    yield page.text
+            if stream.method == "vlm":
+                request.kind = "image"
+
+        rag_start = time.time()
+        chunks_count, chunk_ids, _ = await self.rag_service.ingest_stream(request, _texts())
+        logger.info("DocumentExtractor: file=%s method=%s chars=%d pages=%d (streamed)",
+                    filename, stream.method, len(request.content), stream.page_count)
+        return await self._finish_ingest(request, request, chunks_count, chunk_ids, rag_start, None)
+
     async def extract_text_only(self, file_bytes: bytes, filename: str, mime_type: str) -> dict:
         """Extract text from a file without RAG indexing.
 
@@ -450,6 +506,64 @@ class KnowledgeService:
         """
         return await self.rag_service.retrieve(request, embedding_priority=embedding_priority)
 
+    async def retrieve_batch(
+        self,
+        queries: list[tuple[RetrievalRequest, bool]],
+        budget_s: float = 0.0,
+    ) -> tuple[list[EvidencePack], list[int]]:
+        """
+        Answer several (request, simple) queries in one pass.
+
+        All query texts are embedded in a single router call; simple queries
+        reuse those vectors directly, hybrid ones find them in the embedding
+        cache. Searches run concurrently. With budget_s > 0 the budget covers
+        the whole call, embedding included: queries still running at the
+        deadline are cancelled and come back empty, and if the embedding
+        itself misses it, every query comes back empty and incomplete.
+
+        Returns (packs in query order, indexes of failed/cut queries).
+        """
+        deadline = time.monotonic() + budget_s if budget_s > 0 else None
+        texts = list(dict.fromkeys(req.query for req, _ in queries))
+        try:
+            embedded = await asyncio.wait_for(self.rag_service._embed_with_priority(texts), timeout=budget_s or None)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "KB_READ: RETRIEVE_BATCH queries=%d embedding exceeded budget_s=%.1f",
+                len(queries), budget_s,
+            )
+            return [EvidencePack(items=[]) for _ in queries], list(range(len(queries)))
+        vectors = dict(zip(texts, embedded))
+
+        tasks = [
+            asyncio.create_task(
+                self.rag_service.retrieve(req, vector=vectors.get(req.query)) if simple
+                else self.retrieve(req)
+            )
+            for req, simple in queries
+        ]
+        remaining = max(deadline - time.monotonic(), 0.0) if deadline is not None else None
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+        for task in pending:
+            task.cancel()
+
+        packs: list[EvidencePack] = []
+        incomplete: list[int] = []
+        for i, task in enumerate(tasks):
+            if task in done and task.exception() is None:
+                packs.append(task.result())
+                continue
+            if task in done:
+                logger.warning("KB_READ: RETRIEVE_BATCH query='%s' failed: %s", queries[i][0].query, task.exception())
+            packs.append(EvidencePack(items=[]))
+            incomplete.append(i)
+
+        logger.info(
+            "KB_READ: RETRIEVE_BATCH queries=%d embedded=%d incomplete=%d budget_s=%.1f",
+            len(queries), len(texts), len(incomplete), budget_s,
+        )
+        return packs, incomplete
+
     async def traverse(self, request: TraversalRequest) -> list[GraphNode]:
         traverse_start = time.time()
         try:
@@ -690,9 +804,8 @@ Respond with JSON: {{"relevant": true/false, "reason": "brief reason"}}"""
                     nodes_created=0, edges_created=0,
                 )
             else:
-                logger.info("Full ingest: sourceUrn=%s content changed (old_hash=%s new_hash=%s), purge+re-ingest",
+                logger.info("Full ingest: sourceUrn=%s content changed (old_hash=%s new_hash=%s), incremental re-ingest",
                             request.sourceUrn, existing_hash, content_hash)
-                await self.rag_service.purge_by_source(request.sourceUrn)
                 ingest_result = await self.ingest(ingest_req, content_hash=content_hash)
         else:
             ingest_result = await self.ingest(ingest_req, content_hash=content_hash)
@@ -1002,8 +1115,7 @@ Respond with JSON: {{"relevant": true/false, "reason": "brief reason"}}"""
             summary_data = await self._generate_summary(combined_content, request.sourceType or "unknown", request.subject, embedding_priority=embedding_priority, max_tier=getattr(request, "maxTier", "NONE"))
         else:
             if existing_chunks > 0:
-                yield await _emit("purge", "Obsah změněn, mažu staré chunks...")
-                await self.rag_service.purge_by_source(request.sourceUrn)
+                yield await _emit("purge", "Obsah změněn, aktualizuji jen změněné chunks...")
 
             # ── 4. Parallel RAG + Summary ──
             yield await _emit("rag_start", "Ukládám chunks do vektorové DB...")
@@ -7,15 +7,21 @@ PRODUCTION-GRADE with:
 - SQLite WAL mode (Write-Ahead Logging) - crash safe, no data loss
 - ACID transactions - atomic operations
 - Task states (PENDING, IN_PROGRESS, COMPLETED, FAILED)
-- Crash recovery (stale IN_PROGRESS tasks reset to PENDING)
+- Batch claims with time-bounded leases (expired lease = claimable again,
+  no stale-minutes sweep needed)
 - Retry logic with max attempts
+- Per-status counters maintained by triggers (no COUNT(*) on the hot path)
+- One persistent connection per thread (no reconnect per call on NFS)
 - Handles millions of tasks without performance degradation
+
+Load benchmark: app/services/bench_extraction_queue.py
 """
 
 import asyncio
 import json
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timedelta, timezone
@@ -97,6 +103,28 @@ class ExtractionTask:
             data["metadata"] = {}
         return cls(**data)
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "ExtractionTask":
+        keys = row.keys()
+        return cls(
+            task_id=row["task_id"],
+            source_urn=row["source_urn"],
+            content=row["content"],
+            client_id=row["client_id"],
+            project_id=row["project_id"],
+            kind=row["kind"],
+            chunk_ids=json.loads(row["chunk_ids"]),
+            created_at=row["created_at"],
+            status=row["status"],
+            attempts=row["attempts"],
+            last_attempt_at=row["last_attempt_at"],
+            worker_id=row["worker_id"],
+            error=row["error"],
+            priority=row["priority"] if "priority" in keys else 4,
+            max_tier=row["max_tier"] if "max_tier" in keys else "NONE",
+            metadata=json.loads(row["metadata"]) if "metadata" in keys and row["metadata"] else {},
+        )
+
 
 class LLMExtractionQueue:
     """Persistent queue using SQLite with WAL mode for crash safety.
@@ -104,8 +132,10 @@ class LLMExtractionQueue:
     Uses SQLite database with:
     - WAL (Write-Ahead Logging) mode - changes written to log first, then DB
     - ACID transactions - atomic operations, rollback on crash
-    - Indexes on status + attempts for fast dequeue
-    - Automatic recovery of stale IN_PROGRESS tasks
+    - Covering claim index (status, priority, created_at, retry_after, attempts)
+    - Leases: a claimed task carries lease_expires_at; once it passes, the
+      task is claimable again (worker died) without any sweep
+    - queue_counters table kept exact by triggers on tasks
     """
 
     def __init__(self, queue_dir: Path):
@@ -118,15 +148,20 @@ class LLMExtractionQueue:
         self.queue_dir.mkdir(parents=True, exist_ok=True)
 
         self.db_path = self.queue_dir / "extraction_queue.db"
+        self._local = threading.local()
 
         self._init_db()
 
         logger.info("Initialized SQLite extraction queue at %s", self.db_path)
 
     def _nfs_safe_connect(self, db_path=None) -> sqlite3.Connection:
-        """Connect to SQLite with busy_timeout for multi-worker contention."""
+        """Connect to SQLite with busy_timeout for multi-worker contention.
+
+        Autocommit mode: single statements commit on their own, multi-statement
+        work runs in explicit BEGIN IMMEDIATE ... COMMIT blocks.
+        """
         path = str(db_path or self.db_path)
-        conn = sqlite3.connect(path, timeout=30.0)
+        conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
         conn.execute("PRAGMA busy_timeout=5000")
         return conn
 
@@ -193,11 +228,20 @@ class LLMExtractionQueue:
                 except sqlite3.OperationalError:
                     pass  # Column already exists
 
-            # Indexes for fast dequeue and stats
+            # Migration: add lease column for time-bounded claims
+            try:
+                conn.execute("ALTER TABLE tasks ADD COLUMN lease_expires_at TEXT")
+                logger.info("Added lease_expires_at column to tasks table")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            # Covering index for the claim query: filter + ORDER BY answered
+            # from the index alone, rowids picked without touching the table
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_status_priority_created
-                ON tasks(status, priority, created_at)
+                CREATE INDEX IF NOT EXISTS idx_claim
+                ON tasks(status, priority, created_at, retry_after, attempts)
             """)
+            conn.execute("DROP INDEX IF EXISTS idx_status_priority_created")  # Prefix of idx_claim
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_status_attempts_created
                 ON tasks(status, attempts, created_at)
@@ -208,227 +252,276 @@ class LLMExtractionQueue:
                 ON tasks(last_attempt_at)
                 WHERE status = 'in_progress'
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lease
+                ON tasks(lease_expires_at)
+                WHERE status = 'in_progress'
+            """)
+
+            # Per-status counters — seeded once from COUNT(*), then maintained
+            # by triggers in the same transaction as the row change
+            conn.execute("BEGIN IMMEDIATE")
+            seeded = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'queue_counters'"
+            ).fetchone()
+            if not seeded:
+                conn.execute("""
+                    CREATE TABLE queue_counters (
+                        status TEXT PRIMARY KEY,
+                        count INTEGER NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    INSERT INTO queue_counters (status, count)
+                    SELECT status, COUNT(*) FROM tasks GROUP BY status
+                """)
+                logger.info("Created queue_counters table")
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_tasks_count_insert AFTER INSERT ON tasks
+                BEGIN
+                    INSERT INTO queue_counters (status, count) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET count = count + 1;
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_tasks_count_delete AFTER DELETE ON tasks
+                BEGIN
+                    UPDATE queue_counters SET count = count - 1 WHERE status = OLD.status;
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_tasks_count_update AFTER UPDATE OF status ON tasks
+                WHEN OLD.status != NEW.status
+                BEGIN
+                    UPDATE queue_counters SET count = count - 1 WHERE status = OLD.status;
+                    INSERT INTO queue_counters (status, count) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET count = count + 1;
+                END
+            """)
+            conn.execute("COMMIT")
 
-            conn.commit()
             logger.info("SQLite queue schema initialized with WAL mode")
         finally:
             conn.close()
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get connection with proper settings (NFS-safe, no fcntl locking)."""
-        conn = self._nfs_safe_connect()
-        conn.row_factory = sqlite3.Row
+        """Persistent connection for the calling thread (NFS-safe, no fcntl locking).
+
+        Opening a connection on NFS costs several round trips; the worker loop
+        and request handlers reuse one per thread for the queue's lifetime.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._nfs_safe_connect()
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
         return conn
 
-    async def enqueue(self, task: ExtractionTask) -> None:
-        """Add task to queue (atomic, crash-safe)."""
-        conn = self._get_conn()
-        try:
-            conn.execute("""
-                INSERT INTO tasks (
-                    task_id, source_urn, content, client_id, project_id, kind,
-                    chunk_ids, created_at, status, attempts, priority, max_tier, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task.task_id,
-                task.source_urn,
-                task.content,
-                task.client_id,
-                task.project_id,
-                task.kind,
-                json.dumps(task.chunk_ids),
-                task.created_at,
-                TaskStatus.PENDING,
-                0,
-                task.priority,
-                task.max_tier,
-                json.dumps(task.metadata or {}),
-            ))
-            conn.commit()
-
-            # Get queue size for logging
-            size = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
-            logger.info("Enqueued extraction task: %s (queue size: %d)", task.task_id, size)
-        finally:
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
 
-    async def dequeue(self, worker_id: str, max_attempts: int = 3) -> Optional[ExtractionTask]:
-        """Claim next PENDING task and mark as IN_PROGRESS (atomic).
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
 
-        Production-safe: task stays in DB until marked as COMPLETED.
-        If worker crashes, task remains IN_PROGRESS and will be recovered.
+    @staticmethod
+    def _counts(conn: sqlite3.Connection) -> dict[str, int]:
+        return {row["status"]: row["count"] for row in conn.execute("SELECT status, count FROM queue_counters")}
+
+    async def enqueue(self, task: ExtractionTask) -> None:
+        """Add task to queue (atomic, crash-safe)."""
+        conn = self._get_conn()
+        conn.execute("""
+            INSERT INTO tasks (
+                task_id, source_urn, content, client_id, project_id, kind,
+                chunk_ids, created_at, status, attempts, priority, max_tier, metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            task.task_id,
+            task.source_urn,
+            task.content,
+            task.client_id,
+            task.project_id,
+            task.kind,
+            json.dumps(task.chunk_ids),
+            task.created_at,
+            TaskStatus.PENDING,
+            0,
+            task.priority,
+            task.max_tier,
+            json.dumps(task.metadata or {}),
+        ))
+
+        # Get queue size for logging
+        size = sum(self._counts(conn).values())
+        logger.info("Enqueued extraction task: %s (queue size: %d)", task.task_id, size)
+
+    async def dequeue_many(
+        self,
+        worker_id: str,
+        n: int,
+        max_attempts: int = 3,
+        lease_seconds: int = 600,
+    ) -> list[ExtractionTask]:
+        """Claim up to n tasks in one write transaction and lease them to worker_id.
+
+        Tasks whose lease expired (holder crashed or hung) are reclaimed first;
+        those with no attempts left are marked FAILED instead. Then PENDING
+        tasks by priority (1 before 4), oldest first, skipping retry_after backoff.
+        The holder must renew_leases() while working and either complete,
+        fail or release each task.
         """
         conn = self._get_conn()
+        now_dt = datetime.now(timezone.utc)
+        now = now_dt.isoformat()
+        lease_until = (now_dt + timedelta(seconds=lease_seconds)).isoformat()
         try:
-            # Atomic claim: SELECT + UPDATE in single transaction
             conn.execute("BEGIN IMMEDIATE")  # Write lock
 
-            # Find first PENDING task with attempts < max (priority 1 before 4).
-            # Respects retry_after: tasks with future retry_after are skipped (backoff).
-            now = datetime.now(timezone.utc).isoformat()
-            row = conn.execute("""
-                SELECT * FROM tasks
-                WHERE status = ? AND attempts < ?
-                  AND (retry_after IS NULL OR retry_after <= ?)
-                ORDER BY priority ASC, created_at ASC
-                LIMIT 1
-            """, (TaskStatus.PENDING, max_attempts, now)).fetchone()
-
-            if not row:
-                conn.rollback()
-                return None
-
-            task_id = row["task_id"]
-            attempts = row["attempts"] + 1
-            now = datetime.now(timezone.utc).isoformat()
-
-            # Mark as IN_PROGRESS (atomic)
             conn.execute("""
                 UPDATE tasks
-                SET status = ?, attempts = ?, last_attempt_at = ?, worker_id = ?
-                WHERE task_id = ?
-            """, (TaskStatus.IN_PROGRESS, attempts, now, worker_id, task_id))
-
-            conn.commit()
-
-            # Build task object
-            task = ExtractionTask(
-                task_id=row["task_id"],
-                source_urn=row["source_urn"],
-                content=row["content"],
-                client_id=row["client_id"],
-                project_id=row["project_id"],
-                kind=row["kind"],
-                chunk_ids=json.loads(row["chunk_ids"]),
-                created_at=row["created_at"],
-                status=TaskStatus.IN_PROGRESS,
-                attempts=attempts,
-                last_attempt_at=now,
-                worker_id=worker_id,
-                priority=row["priority"] if "priority" in row.keys() else 4,
-                max_tier=row["max_tier"] if "max_tier" in row.keys() else "NONE",
-                metadata=json.loads(row["metadata"]) if "metadata" in row.keys() and row["metadata"] else {},
-            )
-
-            # Log stats
-            pending_count = conn.execute(
-                "SELECT COUNT(*) FROM tasks WHERE status = ?", (TaskStatus.PENDING,)
-            ).fetchone()[0]
-
-            logger.info(
-                "Claimed task %s (attempt %d/%d, %d pending remaining)",
-                task_id, attempts, max_attempts, pending_count
-            )
+                SET status = ?, error = 'lease expired', worker_id = NULL, lease_expires_at = NULL
+                WHERE status = ? AND lease_expires_at < ? AND attempts >= ?
+            """, (TaskStatus.FAILED, TaskStatus.IN_PROGRESS, now, max_attempts))
 
-            return task
+            rowids = [r[0] for r in conn.execute("""
+                SELECT rowid FROM tasks
+                WHERE status = ? AND lease_expires_at < ? AND attempts < ?
+                LIMIT ?
+            """, (TaskStatus.IN_PROGRESS, now, max_attempts, n))]
+            if len(rowids) < n:
+                rowids += [r[0] for r in conn.execute("""
+                    SELECT rowid FROM tasks
+                    WHERE status = ? AND attempts < ?
+                      AND (retry_after IS NULL OR retry_after <= ?)
+                    ORDER BY priority ASC, created_at ASC
+                    LIMIT ?
+                """, (TaskStatus.PENDING, max_attempts, now, n - len(rowids)))]
+
+            if not rowids:
+                conn.execute("ROLLBACK")
+                return []
+
+            placeholders = ",".join("?" * len(rowids))
+            conn.execute(f"""
+                UPDATE tasks
+                SET status = ?, attempts = attempts + 1, last_attempt_at = ?,
+                    worker_id = ?, lease_expires_at = ?
+                WHERE rowid IN ({placeholders})
+            """, (TaskStatus.IN_PROGRESS, now, worker_id, lease_until, *rowids))
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE rowid IN ({placeholders}) ORDER BY priority ASC, created_at ASC",
+                rowids,
+            ).fetchall()
+            pending_count = self._counts(conn).get(TaskStatus.PENDING, 0)
+            conn.execute("COMMIT")
         except sqlite3.Error as e:
-            conn.rollback()
-            logger.error("Failed to dequeue task: %s", e, exc_info=True)
-            return None
+            self._rollback(conn)
+            logger.error("Failed to dequeue tasks: %s", e, exc_info=True)
+            return []
         except Exception as e:
-            conn.rollback()
+            self._rollback(conn)
             logger.error("Unexpected error in dequeue: %s", e, exc_info=True)
-            return None
-        finally:
-            conn.close()
+            return []
+
+        tasks = [ExtractionTask.from_row(row) for row in rows]
+        logger.info(
+            "Claimed %d task(s) %s (lease %ds, %d pending remaining)",
+            len(tasks), ",".join(t.task_id for t in tasks), lease_seconds, pending_count,
+        )
+        return tasks
+
+    async def dequeue(self, worker_id: str, max_attempts: int = 3) -> Optional[ExtractionTask]:
+        """Claim next task and mark as IN_PROGRESS (atomic). See dequeue_many."""
+        tasks = await self.dequeue_many(worker_id, 1, max_attempts=max_attempts)
+        return tasks[0] if tasks else None
+
+    async def renew_leases(self, worker_id: str, task_ids: list[str], lease_seconds: int = 600) -> int:
+        """Extend leases on tasks still held by worker_id. Returns number renewed."""
+        if not task_ids:
+            return 0
+        lease_until = (datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)).isoformat()
+        cursor = self._get_conn().execute(f"""
+            UPDATE tasks SET lease_expires_at = ?
+            WHERE worker_id = ? AND status = ? AND task_id IN ({",".join("?" * len(task_ids))})
+        """, (lease_until, worker_id, TaskStatus.IN_PROGRESS, *task_ids))
+        return cursor.rowcount
+
+    async def release(self, worker_id: str, task_ids: list[str]) -> int:
+        """Return claimed-but-unstarted tasks to PENDING without spending an attempt."""
+        if not task_ids:
+            return 0
+        cursor = self._get_conn().execute(f"""
+            UPDATE tasks
+            SET status = ?, attempts = MAX(attempts - 1, 0), worker_id = NULL, lease_expires_at = NULL
+            WHERE worker_id = ? AND status = ? AND task_id IN ({",".join("?" * len(task_ids))})
+        """, (TaskStatus.PENDING, worker_id, TaskStatus.IN_PROGRESS, *task_ids))
+        if cursor.rowcount:
+            logger.info("Released %d claimed task(s) back to PENDING", cursor.rowcount)
+        return cursor.rowcount
 
     async def peek(self) -> Optional[ExtractionTask]:
         """Return next task without removing it."""
-        conn = self._get_conn()
-        try:
-            row = conn.execute("""
-                SELECT * FROM tasks
-                WHERE status = ?
-                ORDER BY created_at ASC
-                LIMIT 1
-            """, (TaskStatus.PENDING,)).fetchone()
-
-            if not row:
-                return None
-
-            return ExtractionTask(
-                task_id=row["task_id"],
-                source_urn=row["source_urn"],
-                content=row["content"],
-                client_id=row["client_id"],
-                project_id=row["project_id"],
-                kind=row["kind"],
-                chunk_ids=json.loads(row["chunk_ids"]),
-                created_at=row["created_at"],
-                status=row["status"],
-                attempts=row["attempts"],
-                last_attempt_at=row["last_attempt_at"],
-                worker_id=row["worker_id"],
-                error=row["error"],
-            )
-        finally:
-            conn.close()
+        row = self._get_conn().execute("""
+            SELECT * FROM tasks
+            WHERE status = ?
+            ORDER BY created_at ASC
+            LIMIT 1
+        """, (TaskStatus.PENDING,)).fetchone()
+        return ExtractionTask.from_row(row) if row else None
+
+    async def head_priority(self, max_attempts: int = 3) -> Optional[int]:
+        """Priority of the task dequeue_many would claim next from PENDING (None if none)."""
+        row = self._get_conn().execute("""
+            SELECT priority FROM tasks
+            WHERE status = ? AND attempts < ?
+              AND (retry_after IS NULL OR retry_after <= ?)
+            ORDER BY priority ASC
+            LIMIT 1
+        """, (TaskStatus.PENDING, max_attempts, datetime.now(timezone.utc).isoformat())).fetchone()
+        return row[0] if row else None
 
     async def size(self) -> int:
         """Get current queue size (all tasks)."""
-        conn = self._get_conn()
-        try:
-            return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
-        finally:
-            conn.close()
+        return sum(self._counts(self._get_conn()).values())
 
     async def stats(self) -> dict:
-        """Get queue statistics for monitoring."""
-        conn = self._get_conn()
-        try:
-            rows = conn.execute("""
-                SELECT status, COUNT(*) as count
-                FROM tasks
-                GROUP BY status
-            """).fetchall()
-
-            stats = {
-                "total": 0,
-                "pending": 0,
-                "in_progress": 0,
-                "failed": 0,
-            }
-
-            for row in rows:
-                status = row["status"]
-                count = row["count"]
-                stats["total"] += count
-                if status == TaskStatus.PENDING:
-                    stats["pending"] = count
-                elif status == TaskStatus.IN_PROGRESS:
-                    stats["in_progress"] = count
-                elif status == TaskStatus.FAILED:
-                    stats["failed"] = count
-
-            return stats
-        finally:
-            conn.close()
+        """Get queue statistics for monitoring (from queue_counters, O(1))."""
+        counts = self._counts(self._get_conn())
+        return {
+            "total": sum(counts.values()),
+            "pending": counts.get(TaskStatus.PENDING, 0),
+            "in_progress": counts.get(TaskStatus.IN_PROGRESS, 0),
+            "failed": counts.get(TaskStatus.FAILED, 0),
+        }
 
     async def mark_completed(self, task_id: str) -> bool:
         """Mark task as COMPLETED and remove from queue (success case)."""
         conn = self._get_conn()
-        try:
-            cursor = conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
-            conn.commit()
-
-            if cursor.rowcount > 0:
-                remaining = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
-                logger.info("Task %s completed and removed from queue (remaining: %d)", task_id, remaining)
-                return True
-            return False
-        finally:
-            conn.close()
+        cursor = conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+        if cursor.rowcount > 0:
+            remaining = sum(self._counts(conn).values())
+            logger.info("Task %s completed and removed from queue (remaining: %d)", task_id, remaining)
+            return True
+        return False
 
     async def mark_failed(self, task_id: str, error: str, max_attempts: int = 3) -> bool:
         """Mark task as FAILED if max attempts reached, or reset to PENDING for retry."""
         conn = self._get_conn()
         try:
+            conn.execute("BEGIN IMMEDIATE")
             # Get current attempts
             row = conn.execute(
                 "SELECT attempts FROM tasks WHERE task_id = ?", (task_id,)
             ).fetchone()
 
             if not row:
+                conn.execute("ROLLBACK")
                 return False
 
             attempts = row["attempts"]
@@ -437,10 +530,10 @@ class LLMExtractionQueue:
                 # Max attempts reached - mark as FAILED
                 conn.execute("""
                     UPDATE tasks
-                    SET status = ?, error = ?
+                    SET status = ?, error = ?, lease_expires_at = NULL
                     WHERE task_id = ?
                 """, (TaskStatus.FAILED, error, task_id))
-                conn.commit()
+                conn.execute("COMMIT")
                 logger.error("Task %s FAILED after %d attempts: %s", task_id, attempts, error)
             else:
                 # Reset to PENDING with exponential backoff via retry_after timestamp.
@@ -449,30 +542,26 @@ class LLMExtractionQueue:
                 retry_after = (datetime.now(timezone.utc) + timedelta(seconds=backoff_seconds)).isoformat()
                 conn.execute("""
                     UPDATE tasks
-                    SET status = ?, worker_id = NULL, error = ?, retry_after = ?
+                    SET status = ?, worker_id = NULL, error = ?, retry_after = ?, lease_expires_at = NULL
                     WHERE task_id = ?
                 """, (TaskStatus.PENDING, error, retry_after, task_id))
-                conn.commit()
+                conn.execute("COMMIT")
                 logger.warning(
                     "Task %s failed (attempt %d/%d), retry after %ds: %s",
                     task_id, attempts, max_attempts, backoff_seconds, error
                 )
 
             return True
-        finally:
-            conn.close()
+        except Exception:
+            self._rollback(conn)
+            raise
 
     async def update_progress(self, task_id: str, current: int, total: int) -> None:
         """Update extraction progress (chunk current/total) for an IN_PROGRESS task."""
-        conn = self._get_conn()
-        try:
-            conn.execute("""
-                UPDATE tasks SET progress_current = ?, progress_total = ?
-                WHERE task_id = ? AND status = 'in_progress'
-            """, (current, total, task_id))
-            conn.commit()
-        finally:
-            conn.close()
+        self._get_conn().execute("""
+            UPDATE tasks SET progress_current = ?, progress_total = ?
+            WHERE task_id = ? AND status = 'in_progress'
+        """, (current, total, task_id))
 
     async def list_queue(self, limit: int = 100) -> list[dict]:
         """Return all PENDING + IN_PROGRESS tasks ordered by priority ASC, created_at ASC.
@@ -480,102 +569,44 @@ class LLMExtractionQueue:
         Used by UI to display the real KB extraction queue.
         Does NOT include content (large) — only metadata fields.
         """
-        conn = self._get_conn()
-        try:
-            rows = conn.execute("""
-                SELECT task_id, source_urn, client_id, project_id, kind,
-                       created_at, status, attempts, priority, error,
-                       last_attempt_at, worker_id,
-                       progress_current, progress_total
-                FROM tasks
-                WHERE status IN ('pending', 'in_progress')
-                ORDER BY
-                    CASE status WHEN 'in_progress' THEN 0 ELSE 1 END,
-                    priority ASC, created_at ASC
-                LIMIT ?
-            """, (limit,)).fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+        rows = self._get_conn().execute("""
+            SELECT task_id, source_urn, client_id, project_id, kind,
+                   created_at, status, attempts, priority, error,
+                   last_attempt_at, worker_id,
+                   progress_current, progress_total
+            FROM tasks
+            WHERE status IN ('pending', 'in_progress')
+            ORDER BY
+                CASE status WHEN 'in_progress' THEN 0 ELSE 1 END,
+                priority ASC, created_at ASC
+            LIMIT ?
+        """, (limit,)).fetchall()
+        return [dict(row) for row in rows]
 
     async def delete_failed(self) -> int:
         """Delete all FAILED tasks from the queue."""
-        conn = self._get_conn()
-        try:
-            cursor = conn.execute(
-                "DELETE FROM tasks WHERE status = ?",
-                (TaskStatus.FAILED,)
-            )
-            conn.commit()
-            deleted = cursor.rowcount
-            if deleted > 0:
-                logger.info("Deleted %d FAILED tasks from extraction queue", deleted)
-            return deleted
-        finally:
-            conn.close()
-
-    async def recover_stale_tasks(self, stale_threshold_minutes: int = 30) -> int:
-        """Reset stale IN_PROGRESS tasks to PENDING (crash recovery).
-
-        Called periodically. Any task IN_PROGRESS for > threshold is considered stale
-        (worker crashed) and reset to PENDING for retry.
-
-        Returns: number of tasks recovered.
-        """
-        conn = self._get_conn()
-        try:
-            threshold_time = (
-                datetime.now(timezone.utc) - timedelta(minutes=stale_threshold_minutes)
-            ).isoformat()
-
-            # Find stale tasks
-            stale_rows = conn.execute("""
-                SELECT task_id, worker_id, last_attempt_at
-                FROM tasks
-                WHERE status = ? AND (
-                    last_attempt_at IS NULL OR last_attempt_at < ?
-                )
-            """, (TaskStatus.IN_PROGRESS, threshold_time)).fetchall()
-
-            if not stale_rows:
-                return 0
-
-            # Reset to PENDING
-            conn.execute("""
-                UPDATE tasks
-                SET status = ?, worker_id = NULL
-                WHERE status = ? AND (
-                    last_attempt_at IS NULL OR last_attempt_at < ?
-                )
-            """, (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, threshold_time))
-
-            conn.commit()
-
-            recovered = len(stale_rows)
-            for row in stale_rows:
-                logger.warning(
-                    "Recovered stale task %s (worker %s, last attempt: %s)",
-                    row["task_id"],
-                    row["worker_id"] or "?",
-                    row["last_attempt_at"] or "never",
-                )
-
-            logger.info("Recovered %d stale IN_PROGRESS tasks to PENDING", recovered)
-            return recovered
-        finally:
-            conn.close()
+        cursor = self._get_conn().execute(
+            "DELETE FROM tasks WHERE status = ?",
+            (TaskStatus.FAILED,)
+        )
+        deleted = cursor.rowcount
+        if deleted > 0:
+            logger.info("Deleted %d FAILED tasks from extraction queue", deleted)
+        return deleted
 
     async def recover_foreign_worker_tasks(self, current_worker_id: str) -> int:
         """Reset ALL IN_PROGRESS tasks from workers other than the current one.
 
         Called on worker startup. Since we run a single worker pod, any IN_PROGRESS
         task from a different worker_id means the old pod died. Reset immediately
-        regardless of time threshold.
+        instead of waiting for the lease to run out (also covers rows claimed
+        before leases existed).
 
         Returns: number of tasks recovered.
         """
         conn = self._get_conn()
         try:
+            conn.execute("BEGIN IMMEDIATE")
             # Find tasks from other workers (or with NULL worker_id)
             stale_rows = conn.execute("""
                 SELECT task_id, worker_id, last_attempt_at
@@ -584,31 +615,32 @@ class LLMExtractionQueue:
             """, (TaskStatus.IN_PROGRESS, current_worker_id)).fetchall()
 
             if not stale_rows:
+                conn.execute("ROLLBACK")
                 return 0
 
             # Reset to PENDING
             conn.execute("""
                 UPDATE tasks
-                SET status = ?, worker_id = NULL
+                SET status = ?, worker_id = NULL, lease_expires_at = NULL
                 WHERE status = ? AND (worker_id IS NULL OR worker_id != ?)
             """, (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, current_worker_id))
 
-            conn.commit()
-
-            recovered = len(stale_rows)
-            for row in stale_rows:
-                logger.warning(
-                    "Recovered foreign-worker task %s (worker %s, last attempt: %s)",
-                    row["task_id"],
-                    row["worker_id"] or "?",
-                    row["last_attempt_at"] or "never",
-                )
-
-            logger.info(
-                "Recovered %d IN_PROGRESS tasks from dead workers (current: %s)",
-                recovered, current_worker_id,
+            conn.execute("COMMIT")
+        except Exception:
+            self._rollback(conn)
+            raise
+
+        recovered = len(stale_rows)
+        for row in stale_rows:
+            logger.warning(
+                "Recovered foreign-worker task %s (worker %s, last attempt: %s)",
+                row["task_id"],
+                row["worker_id"] or "?",
+                row["last_attempt_at"] or "never",
             )
-            return recovered
-        finally:
-            conn.close()
 
+        logger.info(
+            "Recovered %d IN_PROGRESS tasks from dead workers (current: %s)",
+            recovered, current_worker_id,
+        )
+        return recovered
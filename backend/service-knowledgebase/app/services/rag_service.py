@@ -1,7 +1,9 @@
 import asyncio
+import hashlib
 import logging
 import uuid
-from typing import Optional
+from pathlib import Path
+from typing import AsyncIterator, Optional
 
 import grpc.aio
 
@@ -9,6 +11,8 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 from app.core.config import settings
 from app.db.weaviate import get_weaviate_client
 from app.api.models import IngestRequest, RetrievalRequest, EvidenceItem, EvidencePack
+from app.services.embedding_cache import EmbeddingCache
+from app.services.retrieval_cache import bump_scope
 from jervis.common import enums_pb2, types_pb2
 from jervis.router import inference_pb2, inference_pb2_grpc
 from jervis_contracts.interceptors import prepare_context
@@ -48,6 +52,11 @@ def _get_router_stub() -> inference_pb2_grpc.RouterInferenceServiceStub:
     return _router_stub
 
 
+def _chunk_hash(chunk: str) -> str:
+    """Hash of the raw chunk text (same truncation as document contentHash)."""
+    return hashlib.sha256(chunk.encode()).hexdigest()[:32]
+
+
 class RagService:
 
     def __init__(self):
@@ -61,6 +70,13 @@ class RagService:
         # With multi-worker uvicorn, total concurrent = UVICORN_WORKERS × this value.
         self._max_concurrent = settings.MAX_CONCURRENT_EMBEDDINGS
         self._embedding_semaphore = asyncio.Semaphore(self._max_concurrent)
+        self._embedding_cache = None
+        if settings.EMBEDDING_CACHE_ENABLED:
+            self._embedding_cache = EmbeddingCache(
+                db_path=Path(settings.EMBEDDING_CACHE_PATH) if settings.EMBEDDING_CACHE_PATH else None,
+                max_memory_entries=settings.EMBEDDING_CACHE_MEMORY_ENTRIES,
+                max_disk_entries=settings.EMBEDDING_CACHE_DISK_ENTRIES,
+            )
         self.client = get_weaviate_client()
         self._ensure_schema()
 
@@ -80,6 +96,8 @@ class RagService:
                     wvc.Property(name="graphRefs", data_type=wvc.DataType.TEXT_ARRAY),
                     # Content hash for idempotent re-ingest detection
                     wvc.Property(name="contentHash", data_type=wvc.DataType.TEXT),
+                    # Per-chunk hash (raw chunk text, before contextual prefix) for incremental re-ingest
+                    wvc.Property(name="chunkHash", data_type=wvc.DataType.TEXT),
                     # When the source content was observed/created (ISO format)
                     wvc.Property(name="observedAt", data_type=wvc.DataType.TEXT),
                 ]
@@ -129,6 +147,15 @@ class RagService:
                 logger.info("Added branchRole property to KnowledgeChunk schema")
             except Exception:
                 pass
+            # Per-chunk hash — chunks ingested before this have none and are replaced on next change
+            try:
+                collection = self.client.collections.get("KnowledgeChunk")
+                collection.config.add_property(
+                    wvc.Property(name="chunkHash", data_type=wvc.DataType.TEXT)
+                )
+                logger.info("Added chunkHash property to KnowledgeChunk schema")
+            except Exception:
+                pass
 
     async def _embed_with_priority(self, text: str | list[str], priority: int | None = None) -> list[float] | list[list[float]]:
         """Embed text via RouterInferenceService.Embed (gRPC).
@@ -141,10 +168,28 @@ class RagService:
 
         Uses a semaphore (MAX_CONCURRENT_EMBEDDINGS=5) to prevent GPU
         starvation when many ingest requests arrive simultaneously.
+
+        Texts already in the embedding cache (memory LRU, then SQLite) are
+        served locally; only the misses (deduplicated) go to the router.
         """
         is_batch = isinstance(text, list)
         inputs = text if is_batch else [text]
 
+        if self._embedding_cache is None:
+            embeddings = await self._embed_remote(inputs)
+        else:
+            embeddings = await self._embedding_cache.get_many(settings.EMBEDDING_MODEL, inputs)
+            misses = list(dict.fromkeys(t for t, v in zip(inputs, embeddings) if v is None))
+            if misses:
+                fresh = await self._embed_remote(misses)
+                await self._embedding_cache.put_many(settings.EMBEDDING_MODEL, misses, fresh)
+                by_text = dict(zip(misses, fresh))
+                embeddings = [v if v is not None else by_text.get(t, []) for t, v in zip(inputs, embeddings)]
+
+        return embeddings if is_batch else (embeddings[0] if embeddings else [])
+
+    async def _embed_remote(self, inputs: list[str]) -> list[list[float]]:
+        """Embed a batch via RouterInferenceService.Embed, with retries."""
         ctx = types_pb2.RequestContext(
             scope=types_pb2.Scope(),
             priority=enums_pb2.PRIORITY_BACKGROUND,
@@ -172,8 +217,7 @@ class RagService:
             try:
                 async with self._embedding_semaphore:
                     resp = await stub.Embed(request)
-                embeddings = [list(e.vector) for e in resp.embeddings]
-                return embeddings if is_batch else (embeddings[0] if embeddings else [])
+                return [list(e.vector) for e in resp.embeddings]
             except grpc.aio.AioRpcError as e:
                 last_err = e
                 if e.code() in (
@@ -279,7 +323,188 @@ Document:
 
         chunks = self.text_splitter.split_text(request.content)
         logger.info("RAG_WRITE: SPLIT sourceUrn=%s → %d chunks", request.sourceUrn, len(chunks))
+        chunk_ids = await self._insert_chunks(request, chunks, graph_refs, embedding_priority, content_hash)
+        return len(chunk_ids), chunk_ids
+
+    async def ingest_stream(
+        self,
+        request: IngestRequest,
+        texts: AsyncIterator[str],
+        embedding_priority: int | None = None,
+    ) -> tuple[int, list[str], str]:
+        """Ingest a document whose text arrives page by page (ExtractStream).
+
+        Chunks are settled as soon as later text can no longer change them
+        (everything but the last chunk of the buffer) and embedded right away,
+        while the extractor is still parsing later pages. The contextual
+        prefix is generated from the first ~2000 chars once they are in.
+        Weaviate is written only after the stream ended — a failed
+        extraction leaves nothing half-indexed — with the contentHash of the
+        full text. Sets request.content to the full text (pages joined by
+        blank lines).
 
+        Returns:
+            Tuple of (chunk_count, list of chunk UUIDs, content hash)
+        """
+        logger.info(
+            "RAG_WRITE: STREAM_START sourceUrn=%s clientId=%s projectId=%s kind=%s priority=%s",
+            request.sourceUrn, request.clientId, request.projectId or "", request.kind or "", embedding_priority,
+        )
+        pages: list[str] = []
+        seen_chars = 0
+        tail = ""                       # unsettled text — starts at the last (open) chunk
+        raw_chunks: list[str] = []
+        unembedded: list[str] = []      # settled, waiting for the contextual prefix
+        embedded_chunks: list[str] = []  # as stored (prefix + chunk)
+        embed_tasks: list[asyncio.Task] = []
+        prefix_task: asyncio.Task | None = None
+        use_prefix = settings.CONTEXTUAL_PREFIX_ENABLED
+
+        def _settle(chunks: list[str]):
+            raw_chunks.extend(chunks)
+            unembedded.extend(chunks)
+
+        def _embed_settled():
+            if not unembedded:
+                return
+            prefix = prefix_task.result() if prefix_task else ""
+            batch = [f"{prefix}\n\n{c}" for c in unembedded] if prefix else list(unembedded)
+            unembedded.clear()
+            embedded_chunks.extend(batch)
+            embed_tasks.append(asyncio.create_task(self._embed_with_priority(batch, priority=embedding_priority)))
+
+        def _start_prefix():
+            sample = request.model_copy(update={"content": "\n\n".join(pages)})
+            return asyncio.create_task(self._generate_contextual_prefix(sample))
+
+        try:
+            async for text in texts:
+                pages.append(text)
+                seen_chars += len(text)
+                tail = f"{tail}\n\n{text}" if tail else text
+                chunks = self.text_splitter.split_text(tail)
+                if len(chunks) > 1:
+                    _settle(chunks[:-1])
+                    tail = chunks[-1]
+                if use_prefix and prefix_task is None and seen_chars >= 2000:
+                    prefix_task = _start_prefix()
+                if not use_prefix or (prefix_task and prefix_task.done()):
+                    _embed_settled()
+
+            content = "\n\n".join(pages)
+            _settle(self.text_splitter.split_text(tail))
+            if use_prefix and prefix_task is None and len(content) > 200:
+                prefix_task = _start_prefix()
+            if prefix_task:
+                context_prefix = await prefix_task
+                if context_prefix:
+                    logger.info("RAG_WRITE: CONTEXTUAL_PREFIX sourceUrn=%s prefix_len=%d",
+                                request.sourceUrn, len(context_prefix))
+            _embed_settled()
+            vectors = [v for batch in await asyncio.gather(*embed_tasks) for v in batch]
+        except BaseException:
+            for task in embed_tasks + ([prefix_task] if prefix_task else []):
+                task.cancel()
+            raise
+
+        request.content = content
+        content_hash = hashlib.sha256(content.encode()).hexdigest()[:32]
+        logger.info("RAG_WRITE: STREAM_SPLIT sourceUrn=%s pages=%d chars=%d → %d chunks (%d embed batches)",
+                    request.sourceUrn, len(pages), len(content), len(raw_chunks), len(embed_tasks))
+        if not raw_chunks:
+            return 0, [], content_hash
+        chunk_ids = await self._write_chunks(
+            request, embedded_chunks, [_chunk_hash(c) for c in raw_chunks], vectors, None, content_hash,
+        )
+        return len(chunk_ids), chunk_ids, content_hash
+
+    async def upsert_chunks(
+        self,
+        request: IngestRequest,
+        content_hash: str,
+        embedding_priority: int | None = None,
+    ) -> tuple[int, list[str], list[str], list[str]]:
+        """Incremental re-ingest of a changed sourceUrn, diffed per chunk.
+
+        Splits the new content, matches chunks by chunkHash against what is
+        stored (multiset — repeated chunks match one-for-one), then:
+          - unchanged chunks stay (vector, graphRefs kept; contentHash bumped)
+          - new chunks are embedded and inserted
+          - vanished chunks are deleted
+
+        Returns:
+            Tuple of (total_chunk_count, new chunk UUIDs, removed chunk UUIDs, new raw chunk texts)
+        """
+        chunks = self.text_splitter.split_text(request.content)
+        existing = await self.get_chunk_hashes(request.sourceUrn)
+
+        available: dict[str, list[str]] = {}
+        for chunk_id, chunk_hash in existing:
+            if chunk_hash:
+                available.setdefault(chunk_hash, []).append(chunk_id)
+
+        kept_ids: list[str] = []
+        new_chunks: list[str] = []
+        for chunk in chunks:
+            ids = available.get(_chunk_hash(chunk))
+            if ids:
+                kept_ids.append(ids.pop())
+            else:
+                new_chunks.append(chunk)
+        kept = set(kept_ids)
+        removed_ids = [chunk_id for chunk_id, _ in existing if chunk_id not in kept]
+
+        logger.info(
+            "RAG_WRITE: CHUNK_DIFF sourceUrn=%s total=%d kept=%d new=%d removed=%d",
+            request.sourceUrn, len(chunks), len(kept_ids), len(new_chunks), len(removed_ids),
+        )
+
+        def _apply_diff():
+            collection = self.client.collections.get("KnowledgeChunk")
+            for chunk_id in removed_ids:
+                try:
+                    collection.data.delete_by_id(chunk_id)
+                except Exception as e:
+                    logger.warning("Failed to delete chunk %s: %s", chunk_id, e)
+            # Keep get_content_hash() answering with the new document hash
+            for chunk_id in kept_ids:
+                try:
+                    collection.data.update(uuid=chunk_id, properties={"contentHash": content_hash})
+                except Exception as e:
+                    logger.warning("Failed to update contentHash on chunk %s: %s", chunk_id, e)
+
+        await asyncio.to_thread(_apply_diff)
+
+        new_ids: list[str] = []
+        if new_chunks:
+            new_ids = await self._insert_chunks(request, new_chunks, None, embedding_priority, content_hash)
+        elif removed_ids:
+            await bump_scope(request.clientId)
+        return len(kept_ids) + len(new_ids), new_ids, removed_ids, new_chunks
+
+    async def get_chunk_hashes(self, source_urn: str) -> list[tuple[str, str]]:
+        """(chunk UUID, chunkHash) for every chunk of a sourceUrn; legacy chunks have ''."""
+        def _fetch():
+            collection = self.client.collections.get("KnowledgeChunk")
+            response = collection.query.fetch_objects(
+                filters=wvq.Filter.by_property("sourceUrn").equal(source_urn),
+                limit=10000,
+                return_properties=["chunkHash"],
+            )
+            return [(str(obj.uuid), obj.properties.get("chunkHash") or "") for obj in response.objects]
+
+        return await asyncio.to_thread(_fetch)
+
+    async def _insert_chunks(
+        self,
+        request: IngestRequest,
+        chunks: list[str],
+        graph_refs: list[str] | None,
+        embedding_priority: int | None,
+        content_hash: str,
+    ) -> list[str]:
+        """Contextual prefix + embed + Weaviate batch insert for raw chunks. Returns chunk UUIDs."""
+        chunk_hashes = [_chunk_hash(chunk) for chunk in chunks]
         # Contextual prefix: generate document-level context and prepend to each chunk
         # This significantly improves retrieval by giving each chunk context about the source.
         if settings.CONTEXTUAL_PREFIX_ENABLED and len(request.content) > 200:
@@ -293,7 +518,18 @@ Document:
                     request.sourceUrn, len(chunks), settings.EMBEDDING_MODEL, embedding_priority)
         vectors = await self._embed_with_priority(chunks, priority=embedding_priority)
         logger.info("RAG_WRITE: EMBEDDED sourceUrn=%s vectors=%d", request.sourceUrn, len(vectors))
+        return await self._write_chunks(request, chunks, chunk_hashes, vectors, graph_refs, content_hash)
 
+    async def _write_chunks(
+        self,
+        request: IngestRequest,
+        chunks: list[str],
+        chunk_hashes: list[str],
+        vectors: list[list[float]],
+        graph_refs: list[str] | None,
+        content_hash: str,
+    ) -> list[str]:
+        """Weaviate batch insert of embedded chunks. Returns chunk UUIDs."""
         def _weaviate_batch_insert():
             collection = self.client.collections.get("KnowledgeChunk")
             chunk_ids = []
@@ -312,6 +548,7 @@ Document:
                             "kind": request.kind or "",
                             "graphRefs": graph_refs or [],
                             "contentHash": content_hash,
+                            "chunkHash": chunk_hashes[i],
                             "observedAt": observed_at_str,
                     }
                     # Source credibility & branch scope (optional)
@@ -336,12 +573,13 @@ Document:
             return chunk_ids
 
         chunk_ids = await asyncio.to_thread(_weaviate_batch_insert)
+        await bump_scope(request.clientId)
         logger.info(
             "RAG_WRITE: COMPLETE sourceUrn=%s chunks_written=%d clientId=%s projectId=%s chunk_ids=%s",
             request.sourceUrn, len(chunk_ids), request.clientId, request.projectId or "",
             chunk_ids[:3] if len(chunk_ids) > 3 else chunk_ids
         )
-        return len(chunk_ids), chunk_ids
+        return chunk_ids
 
     async def update_chunk_graph_refs(self, chunk_id: str, graph_refs: list[str]) -> bool:
         """
@@ -376,8 +614,10 @@ Document:
             collection = self.client.collections.get("KnowledgeChunk")
             results = []
 
-            # Batch fetch using filter on UUID list (much faster than N individual queries)
-            BATCH_SIZE = 100
+            # Batch fetch using filter on UUID list (much faster than N individual queries).
+            # Sized so a hybrid query's union (MAX_GRAPH_EXPANSION_CHUNKS + entity
+            # chunks) is one round trip.
+            BATCH_SIZE = 1000
             for batch_start in range(0, len(chunk_ids), BATCH_SIZE):
                 batch_ids = chunk_ids[batch_start:batch_start + BATCH_SIZE]
                 try:
@@ -451,19 +691,23 @@ Document:
             response = collection.query.fetch_objects(
                 filters=wvq.Filter.by_property("sourceUrn").equal(source_urn),
                 limit=10000,
-                return_properties=["sourceUrn"],
+                return_properties=["sourceUrn", "clientId"],
             )
             deleted_ids = []
+            client_ids = set()
             for obj in response.objects:
                 chunk_id = str(obj.uuid)
                 try:
                     collection.data.delete_by_id(obj.uuid)
                     deleted_ids.append(chunk_id)
+                    client_ids.add(obj.properties.get("clientId") or "")
                 except Exception as e:
                     logger.warning("Failed to delete chunk %s: %s", chunk_id, e)
-            return deleted_ids
+            return deleted_ids, client_ids
 
-        deleted_ids = await asyncio.to_thread(_purge)
+        deleted_ids, client_ids = await asyncio.to_thread(_purge)
+        for client_id in client_ids:
+            await bump_scope(client_id)
         logger.info("Purged %d RAG chunks for sourceUrn=%s", len(deleted_ids), source_urn)
         return len(deleted_ids), deleted_ids
 
@@ -504,14 +748,21 @@ Document:
 
         return await asyncio.to_thread(_query)
 
-    async def retrieve(self, request: RetrievalRequest, embedding_priority: int | None = None) -> EvidencePack:
+    async def retrieve(
+        self,
+        request: RetrievalRequest,
+        embedding_priority: int | None = None,
+        vector: list[float] | None = None,
+    ) -> EvidencePack:
+        """Vector search over KnowledgeChunk; `vector` skips embedding the query."""
         logger.info(
             "RAG_READ: START query='%s' clientId=%s projectId=%s groupId=%s maxResults=%d priority=%s",
             request.query, request.clientId, request.projectId or "",
             request.groupId or "", request.maxResults, embedding_priority
         )
 
-        vector = await self._embed_with_priority(request.query, priority=embedding_priority)
+        if vector is None:
+            vector = await self._embed_with_priority(request.query, priority=embedding_priority)
         logger.info("RAG_READ: EMBEDDED query vector_dim=%d", len(vector))
 
         def _weaviate_query():
@@ -702,6 +953,8 @@ Document:
 
         try:
             updated = await asyncio.to_thread(_retag)
+            if updated:
+                await bump_scope(None)
             logger.info("retag_project (Weaviate): %s → %s updated=%d chunks",
                         source_project_id, target_project_id, updated)
             return updated
@@ -750,6 +1003,8 @@ Document:
 
         try:
             updated = await asyncio.to_thread(_retag)
+            if updated:
+                await bump_scope(None)
             logger.info("retag_group (Weaviate): projectId=%s newGroupId=%s updated=%d chunks", project_id, new_group_id, updated)
             return updated
         except Exception as e:
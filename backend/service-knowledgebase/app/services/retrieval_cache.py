@@ -0,0 +1,154 @@
+"""Hybrid retrieval result cache with per-scope write generations.
+
+The orchestrator repeats the same query for one client within seconds
+(prefetch, chat tools, background tasks). HybridRetriever caches the final
+EvidencePack keyed by the normalized query, the tenant scope, the filters
+and the retrieval flags.
+
+Invalidation: every write path (RAG insert/upsert/purge, graph extraction,
+chunk ref purge, retag, maintenance) bumps a generation counter for the
+affected client. The counters live in ArangoDB ("RetrievalGenerations"), so
+bumps from the write pod and from other uvicorn workers are seen by every
+reader. The generations of the request's client and of the global scope
+("" — visible to every client) are part of the cache key: a bump makes
+old entries unreachable and LRU eviction drops them. Writes whose client is
+unknown bump the global scope, which invalidates everything.
+
+The TTL only bounds memory held by idle entries and staleness when a bump
+fails; correctness comes from the generations.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+
+from app.api.models import EvidencePack, RetrievalRequest
+from app.core.config import settings
+from app.db.arango import get_arango_db
+from app.metrics import retrieval_cache_entries, retrieval_cache_lookups_total
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = ""
+_GLOBAL_KEY = "_global"
+
+
+def _scope_key(client_id: str | None) -> str:
+    if not client_id:
+        return _GLOBAL_KEY
+    return "c_" + re.sub(r"[^A-Za-z0-9_\-:.@()+,=;$!*'%]", "_", client_id)[:250]
+
+
+class ScopeGenerations:
+    """Per-client write generation counters stored in ArangoDB."""
+
+    COLLECTION_NAME = "RetrievalGenerations"
+
+    def __init__(self, db):
+        self.db = db
+        if not self.db.has_collection(self.COLLECTION_NAME):
+            self.db.create_collection(self.COLLECTION_NAME)
+
+    def _bump(self, scope_key: str) -> None:
+        self.db.aql.execute(
+            f"""
+            UPSERT {{ _key: @key }}
+            INSERT {{ _key: @key, gen: 1 }}
+            UPDATE {{ gen: OLD.gen + 1 }}
+            IN {self.COLLECTION_NAME}
+            """,
+            bind_vars={"key": scope_key},
+        )
+
+    async def bump(self, client_id: str | None) -> None:
+        """Invalidate cached retrievals of client_id (None / "" = every client)."""
+        await asyncio.to_thread(self._bump, _scope_key(client_id))
+
+    async def current(self, client_id: str) -> tuple[int, int]:
+        """(global generation, client generation) — one AQL round trip."""
+        keys = [_GLOBAL_KEY, _scope_key(client_id)]
+
+        def _fetch():
+            cursor = self.db.aql.execute(
+                f"FOR k IN @keys RETURN DOCUMENT({self.COLLECTION_NAME}, k).gen || 0",
+                bind_vars={"keys": keys},
+            )
+            return tuple(cursor)
+
+        gens = await asyncio.to_thread(_fetch)
+        return gens[0], gens[1]
+
+
+_generations: ScopeGenerations | None = None
+
+
+def get_scope_generations() -> ScopeGenerations:
+    """Process-wide ScopeGenerations (lazy — first use creates the collection)."""
+    global _generations
+    if _generations is None:
+        _generations = ScopeGenerations(get_arango_db())
+    return _generations
+
+
+async def bump_scope(client_id: str | None) -> None:
+    """Bump the retrieval generation of client_id. Never raises — a write
+    must not fail because cache invalidation did (the TTL bounds staleness)."""
+    if not settings.RETRIEVAL_CACHE_ENABLED:
+        return
+    try:
+        await get_scope_generations().bump(client_id)
+    except Exception as e:
+        logger.warning("RETRIEVAL_CACHE: generation bump failed for client=%s: %s", client_id or "*", e)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).casefold()
+
+
+class RetrievalCache:
+    """In-process LRU of EvidencePacks with TTL; keys carry scope generations."""
+
+    def __init__(self, max_entries: int, ttl_s: float):
+        self._entries: OrderedDict[tuple, tuple[float, EvidencePack]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+
+    @staticmethod
+    def make_key(request: RetrievalRequest, generations: tuple[int, int], flags: tuple) -> tuple:
+        return (
+            normalize_query(request.query),
+            request.clientId,
+            request.projectId or "",
+            request.groupId or "",
+            tuple(sorted(request.kinds)) if request.kinds else (),
+            request.asOf.isoformat() if request.asOf else "",
+            request.minConfidence,
+            request.maxResults,
+            flags,
+            generations,
+        )
+
+    def get(self, key: tuple) -> EvidencePack | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            retrieval_cache_lookups_total.labels(result="miss").inc()
+            return None
+        stored_at, pack = entry
+        if time.monotonic() - stored_at > self._ttl_s:
+            del self._entries[key]
+            retrieval_cache_entries.set(len(self._entries))
+            retrieval_cache_lookups_total.labels(result="expired").inc()
+            return None
+        self._entries.move_to_end(key)
+        retrieval_cache_lookups_total.labels(result="hit").inc()
+        # Callers annotate items in place — hand out a copy
+        return pack.model_copy(deep=True)
+
+    def put(self, key: tuple, pack: EvidencePack) -> None:
+        self._entries[key] = (time.monotonic(), pack.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        retrieval_cache_entries.set(len(self._entries))
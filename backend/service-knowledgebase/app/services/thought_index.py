@@ -0,0 +1,336 @@
+"""
+In-process vector index for ThoughtNode embeddings.
+
+Replaces the O(N·D) cosine loop that ThoughtService.find_nearest used to run
+inside AQL. Each tenant bucket (one per clientId, plus "" for global thoughts)
+holds a float32 matrix of L2-normalized embeddings:
+
+  - small buckets (< THOUGHT_INDEX_IVF_MIN rows): exact scan, one matmul
+  - large buckets: IVF — spherical k-means coarse quantizer, scan only the
+    THOUGHT_INDEX_IVF_NPROBE closest lists (+ rows added since the last build)
+
+ArangoDB stays the source of truth; the index is a cache. A bucket is "cold"
+until loaded — cold queries fall back to exact AQL search while the bucket
+warms in the background. Buckets are reloaded after THOUGHT_INDEX_REFRESH_S so
+writes from other KB pods (read/write split, multiple uvicorn workers) appear.
+"""
+
+import asyncio
+import logging
+import time
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tenant codes: project "" / null → 0, group null → -1, unknown query id → -2
+_EMPTY_CODE = 0
+_NULL_CODE = -1
+_MISSING_CODE = -2
+
+_KMEANS_ITERATIONS = 8
+_KMEANS_SAMPLE = 20_000
+
+
+def _normalize(vec) -> np.ndarray | None:
+    arr = np.asarray(vec, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    if norm < 1e-6:
+        return None
+    return arr / norm
+
+
+class _Bucket:
+    """Append-only normalized embedding matrix for one tenant bucket.
+
+    Rows are never moved: removal clears the `alive` bit, updates overwrite
+    in place. Dead rows are dropped on the next full reload.
+    """
+
+    def __init__(self, dim: int, capacity: int = 256):
+        self.dim = dim
+        self.size = 0
+        self.matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.project_codes = np.zeros(capacity, dtype=np.int32)
+        self.group_codes = np.zeros(capacity, dtype=np.int32)
+        self.keys: list[str] = []
+        self.row_of: dict[str, int] = {}
+        self.codes: dict[str, int] = {"": _EMPTY_CODE}
+        # IVF state (None = exact scan)
+        self.centroids: np.ndarray | None = None
+        self.lists: list[np.ndarray] = []
+        self.unlisted: list[int] = []
+        self.loaded_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def _code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.codes)
+            self.codes[value] = code
+        return code
+
+    def _grow(self):
+        capacity = self.matrix.shape[0] * 2
+        self.matrix = np.resize(self.matrix, (capacity, self.dim))
+        self.alive = np.resize(self.alive, capacity)
+        self.alive[self.size:] = False
+        self.project_codes = np.resize(self.project_codes, capacity)
+        self.group_codes = np.resize(self.group_codes, capacity)
+
+    def add(self, key: str, vec: np.ndarray, project_id, group_id):
+        if self.dim == 0:
+            # Empty bucket from a load that found nothing — first vector fixes the dim
+            self.dim = vec.shape[0]
+            self.matrix = np.zeros((self.matrix.shape[0], self.dim), dtype=np.float32)
+        row = self.row_of.get(key)
+        if row is None:
+            if self.size == self.matrix.shape[0]:
+                self._grow()
+            row = self.size
+            self.size += 1
+            self.keys.append(key)
+            self.row_of[key] = row
+            if self.centroids is not None:
+                self.unlisted.append(row)
+        self.matrix[row] = vec
+        self.alive[row] = True
+        self.project_codes[row] = self._code(project_id or "")
+        self.group_codes[row] = _NULL_CODE if group_id is None else self._code(group_id)
+
+    def remove(self, key: str):
+        row = self.row_of.pop(key, None)
+        if row is not None:
+            self.alive[row] = False
+
+    def build_ivf(self, nprobe: int):
+        """Train a spherical k-means quantizer over the live rows."""
+        rows = np.flatnonzero(self.alive[:self.size])
+        n_lists = max(int(np.sqrt(len(rows))), nprobe)
+        rng = np.random.default_rng(0)
+        sample = rows if len(rows) <= _KMEANS_SAMPLE else rng.choice(rows, _KMEANS_SAMPLE, replace=False)
+        data = self.matrix[sample]
+        centroids = data[rng.choice(len(data), n_lists, replace=False)].copy()
+
+        for _ in range(_KMEANS_ITERATIONS):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = data[assign == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm > 1e-6:
+                        centroids[c] = centroid / norm
+
+        assign = np.argmax(self.matrix[rows] @ centroids.T, axis=1)
+        self.centroids = centroids
+        self.lists = [rows[assign == c] for c in range(n_lists)]
+        self.unlisted = []
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        if self.centroids is None:
+            return np.arange(self.size)
+        probe = np.argpartition(-(self.centroids @ query), min(nprobe, len(self.lists)) - 1)[:nprobe]
+        parts = [self.lists[c] for c in probe]
+        if self.unlisted:
+            parts.append(np.asarray(self.unlisted, dtype=np.int64))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def search(self, query: np.ndarray, project_id: str, group_id: str,
+               threshold: float, top_k: int, nprobe: int) -> list[tuple[str, float]]:
+        rows = self.candidates(query, nprobe)
+        if len(rows) == 0:
+            return []
+        pc = self.codes.get(project_id, _MISSING_CODE)
+        gc = self.codes.get(group_id, _MISSING_CODE)
+        proj = self.project_codes[rows]
+        mask = self.alive[rows] & ((proj == _EMPTY_CODE) | (proj == pc) | (self.group_codes[rows] == gc))
+        rows = rows[mask]
+        if len(rows) == 0:
+            return []
+        sims = self.matrix[rows] @ query
+        keep = sims >= threshold
+        rows, sims = rows[keep], sims[keep]
+        if len(rows) > top_k:
+            top = np.argpartition(-sims, top_k - 1)[:top_k]
+            rows, sims = rows[top], sims[top]
+        order = np.argsort(-sims)
+        return [(self.keys[rows[i]], float(sims[i])) for i in order]
+
+
+class ThoughtVectorIndex:
+    """Per-tenant ANN index over ThoughtNodes.embedding, kept in sync by ThoughtService."""
+
+    GLOBAL_BUCKET = ""
+
+    def __init__(self, db):
+        self.db = db
+        self._buckets: dict[str, _Bucket] = {}
+        self._loading: dict[str, asyncio.Task] = {}
+        # Mutations that arrive while a bucket is loading — replayed after swap
+        self._pending: dict[str, list[tuple]] = {}
+
+    # ── Sync hooks ────────────────────────────────────────────────────────
+
+    def add(self, key: str, embedding: list[float], client_id: str | None,
+            project_id: str | None = "", group_id: str | None = ""):
+        bucket_id = client_id or self.GLOBAL_BUCKET
+        if bucket_id in self._loading:
+            self._pending.setdefault(bucket_id, []).append(("add", key, embedding, project_id, group_id))
+        bucket = self._buckets.get(bucket_id)
+        if bucket is None:
+            return  # Cold — next load picks it up from ArangoDB
+        vec = _normalize(embedding)
+        if vec is None or (bucket.dim and vec.shape[0] != bucket.dim):
+            return
+        bucket.add(key, vec, project_id, group_id)
+
+    def remove(self, key: str, client_id: str | None = None):
+        """Drop a thought. Without client_id every bucket is checked."""
+        bucket_ids = [client_id or self.GLOBAL_BUCKET] if client_id is not None else list(self._buckets)
+        for bucket_id in bucket_ids:
+            if bucket_id in self._loading:
+                self._pending.setdefault(bucket_id, []).append(("remove", key))
+            bucket = self._buckets.get(bucket_id)
+            if bucket is not None:
+                bucket.remove(key)
+
+    def invalidate(self, client_id: str | None = None):
+        """Drop one bucket (or all) — next query falls back to AQL and reloads."""
+        if client_id is None:
+            self._buckets.clear()
+        else:
+            self._buckets.pop(client_id, None)
+
+    # ── Query ─────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        embedding: list[float],
+        client_id: str,
+        project_id: str = "",
+        group_id: str = "",
+        threshold: float = 0.85,
+        top_k: int = 5,
+    ) -> list[tuple[str, float]] | None:
+        """Top-k (key, cosine) within the tenant scope, or None when cold.
+
+        A cold or stale bucket schedules a background (re)load; stale buckets
+        still answer from their current contents.
+        """
+        bucket_ids = [client_id or self.GLOBAL_BUCKET]
+        if client_id:
+            bucket_ids.append(self.GLOBAL_BUCKET)
+
+        cold = False
+        now = time.monotonic()
+        for bucket_id in bucket_ids:
+            bucket = self._buckets.get(bucket_id)
+            if bucket is None:
+                cold = True
+                self._schedule_load(bucket_id)
+            elif now - bucket.loaded_at > settings.THOUGHT_INDEX_REFRESH_S:
+                self._schedule_load(bucket_id)
+        if cold:
+            return None
+
+        query = _normalize(embedding)
+        if query is None:
+            return []
+
+        hits: list[tuple[str, float]] = []
+        for bucket_id in bucket_ids:
+            bucket = self._buckets[bucket_id]
+            if bucket.size == 0 or bucket.dim != query.shape[0]:
+                continue
+            hits.extend(bucket.search(
+                query, project_id or "", group_id or "", threshold, top_k,
+                settings.THOUGHT_INDEX_IVF_NPROBE,
+            ))
+        hits.sort(key=lambda h: -h[1])
+        return hits[:top_k]
+
+    def iter_blocks(self, client_id: str, block_rows: int):
+        """Yield (keys, matrix) chunks of a warm bucket's live rows, or None when cold."""
+        bucket = self._buckets.get(client_id or self.GLOBAL_BUCKET)
+        if bucket is None or bucket.dim == 0:
+            return None
+        rows = np.flatnonzero(bucket.alive[:bucket.size])
+
+        def _blocks():
+            for start in range(0, len(rows), block_rows):
+                selected = rows[start:start + block_rows]
+                yield [bucket.keys[r] for r in selected], bucket.matrix[selected]
+
+        return _blocks()
+
+    # ── Loading ───────────────────────────────────────────────────────────
+
+    def _schedule_load(self, bucket_id: str):
+        if bucket_id in self._loading:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._load(bucket_id))
+        except RuntimeError:
+            return  # No loop (sync caller) — stay cold
+        self._loading[bucket_id] = task
+        self._pending[bucket_id] = []
+
+    async def _load(self, bucket_id: str):
+        started = time.monotonic()
+        try:
+            bucket = await asyncio.to_thread(self._build_bucket, bucket_id)
+        except Exception as e:
+            logger.warning("THOUGHT_INDEX: load failed bucket=%r: %s", bucket_id, e)
+            return
+        finally:
+            self._loading.pop(bucket_id, None)
+
+        pending = self._pending.pop(bucket_id, [])
+        if bucket is None:
+            bucket = _Bucket(dim=0, capacity=1)
+        self._buckets[bucket_id] = bucket
+        for op in pending:
+            if op[0] == "add":
+                self.add(op[1], op[2], bucket_id, op[3], op[4])
+            else:
+                bucket.remove(op[1])
+
+        logger.info(
+            "THOUGHT_INDEX: loaded bucket=%r rows=%d ivf=%s in %.2fs",
+            bucket_id, len(bucket), bucket.centroids is not None, time.monotonic() - started,
+        )
+
+    def _build_bucket(self, bucket_id: str) -> _Bucket | None:
+        if bucket_id == self.GLOBAL_BUCKET:
+            client_filter = "t.clientId == '' OR t.clientId == null"
+            bind_vars = {}
+        else:
+            client_filter = "t.clientId == @clientId"
+            bind_vars = {"clientId": bucket_id}
+        aql = f"""
+            FOR t IN ThoughtNodes
+                FILTER {client_filter}
+                FILTER t.embedding != null AND LENGTH(t.embedding) > 0
+                RETURN {{ key: t._key, embedding: t.embedding,
+                          projectId: t.projectId, groupId: t.groupId }}
+        """
+        bucket = None
+        for doc in self.db.aql.execute(aql, bind_vars=bind_vars, stream=True):
+            vec = _normalize(doc["embedding"])
+            if vec is None:
+                continue
+            if bucket is None:
+                bucket = _Bucket(dim=vec.shape[0])
+            if vec.shape[0] != bucket.dim:
+                continue  # Embedding model changed — old vectors unreachable anyway
+            bucket.add(doc["key"], vec, doc.get("projectId"), doc.get("groupId"))
+
+        if bucket is not None and len(bucket) >= settings.THOUGHT_INDEX_IVF_MIN:
+            bucket.build_ivf(settings.THOUGHT_INDEX_IVF_NPROBE)
+        return bucket
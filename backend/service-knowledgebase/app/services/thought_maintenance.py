@@ -11,6 +11,8 @@ import json
 import logging
 from datetime import datetime, timezone, timedelta
 
+import numpy as np
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,7 @@ DECAY_FACTOR = getattr(settings, "THOUGHT_DECAY_FACTOR", 0.995)
 MERGE_THRESHOLD = getattr(settings, "THOUGHT_MERGE_THRESHOLD", 0.92)
 ARCHIVE_THRESHOLD = getattr(settings, "THOUGHT_ARCHIVE_THRESHOLD", 0.05)
 ARCHIVE_DAYS = getattr(settings, "THOUGHT_ARCHIVE_DAYS", 30)
+MERGE_MAX_BLOCK_MB = getattr(settings, "THOUGHT_MERGE_MAX_BLOCK_MB", 64)
 
 
 async def run_light_maintenance(thought_service, client_id: str) -> dict:
@@ -61,19 +64,22 @@ async def run_light_maintenance(thought_service, client_id: str) -> dict:
                      client_id, stats["decayed"])
         return stats
 
-    # Brute-force pairwise cosine for merge candidates
-    merge_pairs = []
-    for i in range(len(all_thoughts)):
-        for j in range(i + 1, len(all_thoughts)):
-            sim = _cosine_similarity(all_thoughts[i]["embedding"], all_thoughts[j]["embedding"])
-            if sim >= MERGE_THRESHOLD:
-                merge_pairs.append((all_thoughts[i], all_thoughts[j], sim))
+    # Vectorized all-pairs cosine for merge candidates
+    by_key = {t["_key"]: t for t in all_thoughts}
+    keys, vecs = normalize_embeddings(all_thoughts)
+    block_rows = merge_block_rows(vecs.shape[1], len(keys)) if keys else 1
+    merge_pairs = find_similar_pairs(
+        keys, vecs,
+        ((keys[i:i + block_rows], vecs[i:i + block_rows]) for i in range(0, len(keys), block_rows)),
+        MERGE_THRESHOLD,
+    )
 
     # Merge: keep the one with higher activation, delete the other, redirect edges
     merged_keys = set()
-    for node_a, node_b, sim in sorted(merge_pairs, key=lambda x: -x[2]):
-        if node_a["_key"] in merged_keys or node_b["_key"] in merged_keys:
+    for key_a, key_b, sim in sorted(merge_pairs, key=lambda x: -x[2]):
+        if key_a in merged_keys or key_b in merged_keys:
             continue
+        node_a, node_b = by_key[key_a], by_key[key_b]
 
         # Keep the one with higher activation
         if node_a["activationScore"] >= node_b["activationScore"]:
@@ -81,16 +87,9 @@ async def run_light_maintenance(thought_service, client_id: str) -> dict:
         else:
             keep, remove = node_b, node_a
 
-        # Redirect edges from removed to kept
-        await _redirect_edges(thought_service.db, remove["_id"], keep["_id"])
-
-        # Delete removed node
-        try:
-            await asyncio.to_thread(thought_service.db.collection("ThoughtNodes").delete, remove["_key"])
+        if await merge_thought(thought_service, keep, remove, client_id):
             merged_keys.add(remove["_key"])
             stats["merged"] += 1
-        except Exception as e:
-            logger.warning("THOUGHT_MERGE: failed to delete %s: %s", remove["_key"], e)
 
     logger.info("THOUGHT_MAINTENANCE: light client=%s decayed=%d merged=%d",
                  client_id, stats["decayed"], stats["merged"])
@@ -139,6 +138,7 @@ async def run_heavy_maintenance(thought_service, client_id: str) -> dict:
             # Delete connected edges first
             await _delete_node_edges(thought_service.db, node["_id"])
             await asyncio.to_thread(thought_service.db.collection("ThoughtNodes").delete, node["_key"])
+            thought_service.forget_thought(node["_key"], client_id)
             stats["archived"] += 1
         except Exception as e:
             logger.warning("THOUGHT_ARCHIVE: failed to delete %s: %s", node["_key"], e)
@@ -156,16 +156,85 @@ async def run_heavy_maintenance(thought_service, client_id: str) -> dict:
     return stats
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def normalize_embeddings(nodes: list[dict]) -> tuple[list[str], np.ndarray]:
+    """Stack node embeddings into one L2-normalized float32 matrix.
+
+    Zero vectors and embeddings whose dimension differs from the first one
+    (model change) are skipped. Returns (keys, matrix) in input order.
+    """
+    keys: list[str] = []
+    rows: list[np.ndarray] = []
+    dim = None
+    for node in nodes:
+        emb = node.get("embedding")
+        if not emb:
+            continue
+        vec = np.asarray(emb, dtype=np.float32)
+        if dim is None:
+            dim = vec.shape[0]
+        norm = float(np.linalg.norm(vec))
+        if vec.shape[0] != dim or norm < 1e-6:
+            continue
+        keys.append(node["_key"])
+        rows.append(vec / norm)
+    if not rows:
+        return [], np.zeros((0, dim or 0), dtype=np.float32)
+    return keys, np.stack(rows)
+
+
+def merge_block_rows(dim: int, query_rows: int) -> int:
+    """Corpus rows per block so one block + its similarity slab fit MERGE_MAX_BLOCK_MB."""
+    budget = MERGE_MAX_BLOCK_MB * 1024 * 1024
+    return max(budget // (4 * (dim + query_rows)), 64)
+
+
+def find_similar_pairs(
+    query_keys: list[str],
+    query_vecs: np.ndarray,
+    corpus_blocks,
+    threshold: float,
+) -> list[tuple[str, str, float]]:
+    """Blocked all-pairs cosine between query rows and a streamed corpus.
+
+    Vectors must be L2-normalized. corpus_blocks yields (keys, matrix) chunks,
+    so only one block is resident at a time. Each unordered pair is reported
+    once, as (a, b, sim) with a < b.
+    """
+    pairs = []
+    if not query_keys:
+        return pairs
+    for block_keys, block_vecs in corpus_blocks:
+        if len(block_keys) == 0 or block_vecs.shape[1] != query_vecs.shape[1]:
+            continue
+        sims = query_vecs @ block_vecs.T
+        for i, j in zip(*np.nonzero(sims >= threshold)):
+            key_a, key_b = query_keys[i], block_keys[j]
+            if key_a < key_b:
+                pairs.append((key_a, key_b, float(sims[i, j])))
+    return pairs
+
+
+async def merge_thought(thought_service, keep: dict, remove: dict, client_id: str) -> bool:
+    """Fold `remove` into `keep`: redirect its edges, drop self-loops, delete it."""
+    db = thought_service.db
+    await _redirect_edges(db, remove["_id"], keep["_id"])
+    await asyncio.to_thread(
+        db.aql.execute,
+        """
+            FOR e IN ThoughtEdges
+                FILTER e._from == @keepId AND e._to == @keepId
+                REMOVE e IN ThoughtEdges
+        """,
+        bind_vars={"keepId": keep["_id"]},
+    )
+    try:
+        await asyncio.to_thread(db.collection("ThoughtNodes").delete, remove["_key"])
+    except Exception as e:
+        logger.warning("THOUGHT_MERGE: failed to delete %s: %s", remove["_key"], e)
+        return False
+    thought_service.forget_thought(remove["_key"], client_id)
+    logger.debug("THOUGHT_MERGE: %s -> %s", remove.get("label", remove["_key"]), keep.get("label", keep["_key"]))
+    return True
 
 
 async def _redirect_edges(db, old_id: str, new_id: str):
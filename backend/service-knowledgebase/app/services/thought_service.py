@@ -18,6 +18,14 @@ from typing import Optional
 from arango.database import StandardDatabase
 
 from app.core.config import settings
+from app.services.thought_index import ThoughtVectorIndex
+from app.services.thought_maintenance import (
+    MERGE_THRESHOLD,
+    find_similar_pairs,
+    merge_block_rows,
+    merge_thought,
+    normalize_embeddings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,7 @@ class ThoughtService:
     def __init__(self, db: StandardDatabase, rag_service):
         self.db = db
         self.rag_service = rag_service
+        self.index = ThoughtVectorIndex(db) if settings.THOUGHT_INDEX_ENABLED else None
         self._ensure_schema()
 
     # ── Schema ────────────────────────────────────────────────────────────
@@ -110,7 +119,7 @@ class ThoughtService:
         """Embed text using the same model as KB (qwen3-embedding:8b)."""
         return await self.rag_service._embed_with_priority(text, priority=priority)
 
-    # ── Find nearest thoughts (cosine brute-force in ArangoDB) ────────────
+    # ── Find nearest thoughts ─────────────────────────────────────────────
 
     async def find_nearest(
         self,
@@ -121,7 +130,52 @@ class ThoughtService:
         threshold: float = 0.85,
         top_k: int = 5,
     ) -> list[dict]:
-        """Find ThoughtNodes closest to embedding via brute-force cosine in ArangoDB."""
+        """Find ThoughtNodes closest to embedding.
+
+        Served from the in-process vector index; falls back to the exact AQL
+        scan while the client's index bucket is cold (or the index is disabled).
+        """
+        hits = None
+        if self.index is not None:
+            # Over-fetch: hits deleted by another pod are dropped below
+            hits = self.index.search(
+                embedding, client_id, project_id, group_id, threshold, top_k * 2,
+            )
+        if hits is None:
+            return await self._find_nearest_exact(
+                embedding, client_id, project_id, group_id, threshold, top_k,
+            )
+        if not hits:
+            return []
+
+        aql = """
+            FOR key IN @keys
+                LET t = DOCUMENT(CONCAT("ThoughtNodes/", key))
+                FILTER t != null
+                RETURN t
+        """
+        docs = await asyncio.to_thread(
+            lambda: {t["_key"]: t for t in self.db.aql.execute(aql, bind_vars={"keys": [k for k, _ in hits]})}
+        )
+        results = []
+        for key, sim in hits:
+            node = docs.get(key)
+            if node is None:
+                self.index.remove(key, client_id)
+                continue
+            results.append({"node": node, "similarity": sim})
+        return results[:top_k]
+
+    async def _find_nearest_exact(
+        self,
+        embedding: list[float],
+        client_id: str,
+        project_id: str = "",
+        group_id: str = "",
+        threshold: float = 0.85,
+        top_k: int = 5,
+    ) -> list[dict]:
+        """Exact nearest ThoughtNodes via brute-force cosine in ArangoDB."""
         aql = """
             FOR t IN ThoughtNodes
                 FILTER (t.clientId == '' OR t.clientId == null OR t.clientId == @clientId)
@@ -152,6 +206,11 @@ class ThoughtService:
         )
         return list(result)
 
+    def forget_thought(self, key: str, client_id: str | None = None):
+        """Drop a deleted/merged ThoughtNode from the vector index."""
+        if self.index is not None:
+            self.index.remove(key, client_id)
+
     # ── Spreading activation ──────────────────────────────────────────────
 
     async def traverse(
@@ -357,6 +416,8 @@ class ThoughtService:
                 "updatedAt": now,
             }
             await asyncio.to_thread(self.db.collection("ThoughtNodes").insert, doc)
+            if self.index is not None:
+                self.index.add(key, embedding, client_id, doc["projectId"], doc["groupId"])
             logger.info("THOUGHT_UPSERT: created new key=%s type=%s label=%s", key, thought_type, label[:50])
 
         # Create anchors to related KnowledgeNodes
@@ -690,9 +751,13 @@ Return JSON with this exact structure:
         return await asyncio.to_thread(_execute)
 
     async def maintenance_merge_batch(self, client_id: str, cursor: str | None, batch_size: int) -> dict:
-        """Merge highly similar ThoughtNodes (cosine > 0.92).
+        """Merge highly similar ThoughtNodes (cosine >= THOUGHT_MERGE_THRESHOLD).
 
-        Compares each node's embedding with its neighbors. If too similar, merge.
+        Each batch (by _key) is compared against every thought of the client
+        with a greater _key, not just its own batch, so duplicates that land in
+        different batches are still found. The corpus is streamed in blocks
+        (from the warm vector index, else from ArangoDB) sized by
+        THOUGHT_MERGE_MAX_BLOCK_MB, keeping RAM bounded for large clients.
         """
         aql = """
         FOR doc IN ThoughtNodes
@@ -701,64 +766,83 @@ Return JSON with this exact structure:
             FILTER @cursor == null OR doc._key > @cursor
             SORT doc._key ASC
             LIMIT @batchSize
-            RETURN { _key: doc._key, label: doc.label, embedding: doc.embedding, activationScore: doc.activationScore }
+            RETURN { _key: doc._key, embedding: doc.embedding }
         """
 
-        def _execute():
-            import numpy as np
-
+        def _find_pairs():
             nodes = list(self.db.aql.execute(aql, bind_vars={
                 "clientId": client_id, "cursor": cursor, "batchSize": batch_size,
             }))
-
             if not nodes:
-                return {"completed": True, "processed": 0, "findings": 0, "fixed": 0,
-                        "totalEstimate": 0, "nextCursor": None}
-
-            # Pairwise comparison within batch — find highly similar pairs
-            findings = 0
-            fixed = 0
-            merged_keys = set()
-
-            for i, a in enumerate(nodes):
-                if a["_key"] in merged_keys:
-                    continue
-                emb_a = a.get("embedding")
-                if not emb_a:
-                    continue
-                vec_a = np.array(emb_a, dtype=np.float32)
-                norm_a = np.linalg.norm(vec_a)
-                if norm_a < 1e-6:
-                    continue
-
-                for j in range(i + 1, len(nodes)):
-                    b = nodes[j]
-                    if b["_key"] in merged_keys:
-                        continue
-                    emb_b = b.get("embedding")
-                    if not emb_b:
-                        continue
-                    vec_b = np.array(emb_b, dtype=np.float32)
-                    norm_b = np.linalg.norm(vec_b)
-                    if norm_b < 1e-6:
-                        continue
-
-                    cosine = float(np.dot(vec_a, vec_b) / (norm_a * norm_b))
-                    if cosine >= 0.92:
-                        findings += 1
-                        # Keep the one with higher activation score
-                        keep = a if a.get("activationScore", 0) >= b.get("activationScore", 0) else b
-                        remove = b if keep is a else a
-                        merged_keys.add(remove["_key"])
-                        # TODO: migrate edges from remove to keep, then delete remove
-                        # For now just count
-                        logger.debug("THOUGHT_MERGE_CANDIDATE: %s ≈ %s (cosine=%.3f)",
-                                     a.get("label", ""), b.get("label", ""), cosine)
-
-            last_key = nodes[-1]["_key"]
-            completed = len(nodes) < batch_size
-            return {"completed": completed, "processed": len(nodes), "findings": findings,
-                    "fixed": fixed, "totalEstimate": 0,
-                    "nextCursor": last_key if not completed else None}
+                return nodes, []
+
+            keys, vecs = normalize_embeddings(nodes)
+            if not keys:
+                return nodes, []
+            block_rows = merge_block_rows(vecs.shape[1], len(keys))
+            blocks = self.index.iter_blocks(client_id, block_rows) if self.index is not None else None
+            if blocks is None:
+                blocks = self._iter_embedding_blocks(client_id, keys[0], block_rows)
+            return nodes, find_similar_pairs(keys, vecs, blocks, MERGE_THRESHOLD)
+
+        nodes, pairs = await asyncio.to_thread(_find_pairs)
+        if not nodes:
+            return {"completed": True, "processed": 0, "findings": 0, "fixed": 0,
+                    "totalEstimate": 0, "nextCursor": None}
+
+        # Fresh docs for the pair members — index rows may be stale (other pod deleted them)
+        involved = list({k for a, b, _ in pairs for k in (a, b)})
+        docs = {}
+        if involved:
+            aql_docs = """
+                FOR key IN @keys
+                    LET t = DOCUMENT(CONCAT("ThoughtNodes/", key))
+                    FILTER t != null
+                    RETURN { _key: t._key, _id: t._id, label: t.label, activationScore: t.activationScore }
+            """
+            docs = await asyncio.to_thread(
+                lambda: {d["_key"]: d for d in self.db.aql.execute(aql_docs, bind_vars={"keys": involved})}
+            )
 
-        return await asyncio.to_thread(_execute)
+        fixed = 0
+        merged_keys = set()
+        for key_a, key_b, sim in sorted(pairs, key=lambda p: -p[2]):
+            if key_a in merged_keys or key_b in merged_keys:
+                continue
+            a, b = docs.get(key_a), docs.get(key_b)
+            if a is None or b is None:
+                continue
+            # Keep the one with higher activation score
+            keep, remove = (a, b) if (a.get("activationScore") or 0) >= (b.get("activationScore") or 0) else (b, a)
+            if await merge_thought(self, keep, remove, client_id):
+                merged_keys.add(remove["_key"])
+                fixed += 1
+                logger.debug("THOUGHT_MERGE: %s ≈ %s (cosine=%.3f)", a.get("label", ""), b.get("label", ""), sim)
+
+        last_key = nodes[-1]["_key"]
+        completed = len(nodes) < batch_size
+        return {"completed": completed, "processed": len(nodes), "findings": len(pairs),
+                "fixed": fixed, "totalEstimate": 0,
+                "nextCursor": last_key if not completed else None}
+
+    def _iter_embedding_blocks(self, client_id: str, min_key: str, block_rows: int):
+        """Stream a client's normalized embeddings (_key >= min_key) in blocks of block_rows."""
+        aql = """
+        FOR doc IN ThoughtNodes
+            FILTER doc.clientId == @clientId
+            FILTER doc._key >= @minKey
+            FILTER doc.embedding != null AND LENGTH(doc.embedding) > 0
+            RETURN { _key: doc._key, embedding: doc.embedding }
+        """
+        cursor = self.db.aql.execute(
+            aql, bind_vars={"clientId": client_id, "minKey": min_key},
+            stream=True, batch_size=min(block_rows, 1000),
+        )
+        block = []
+        for doc in cursor:
+            block.append(doc)
+            if len(block) >= block_rows:
+                yield normalize_embeddings(block)
+                block = []
+        if block:
+            yield normalize_embeddings(block)
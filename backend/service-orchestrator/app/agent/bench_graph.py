@@ -0,0 +1,211 @@
+"""Scheduler-loop benchmark for AgentGraph — `python -m app.agent.bench_graph`.
+
+Runs the select_next → dispatch_vertex loop of langgraph_runner without
+LLM calls (every vertex completes instantly) on synthetic layered DAGs of
+100 / 1,000 / 5,000 vertices (each vertex depends on 1-3 vertices of the
+previous layer, `--width` vertices per layer run in parallel):
+
+  legacy   what the runner did before the adjacency index: rebuild
+           AgentGraph from the full model_dump() in every node, deep-copy
+           the whole graph per parallel vertex, merge and re-check
+           readiness by scanning graph.edges
+  indexed  live graph handed between nodes, get_ready_vertices /
+           promote_ready_targets on the index, fork + VertexDelta per
+           parallel vertex, compact to_checkpoint() per node
+
+Prints wall time per loop, per superstep, and checkpoint size (full
+model_dump vs. to_checkpoint) at the end of the run. Legacy is skipped
+above --legacy-max vertices (it is quadratic and takes minutes at 5,000).
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import time
+
+from app.agent.graph import (
+    apply_vertex_delta,
+    collect_vertex_delta,
+    complete_vertex,
+    fork_for_vertex,
+    get_ready_vertices,
+    promote_ready_targets,
+    start_vertex,
+)
+from app.agent.models import (
+    AgentGraph,
+    EdgePayload,
+    EdgeType,
+    GraphEdge,
+    GraphStatus,
+    GraphVertex,
+    VertexStatus,
+)
+
+
+def build_graph(size: int, width: int, rng: random.Random) -> AgentGraph:
+    vertices: dict[str, GraphVertex] = {}
+    edges: list[GraphEdge] = []
+    previous: list[str] = []
+    layer: list[str] = []
+    for i in range(size):
+        vid = f"v{i}"
+        vertices[vid] = GraphVertex(
+            id=vid,
+            title=f"Vertex {i}",
+            description=f"Synthetic task {i} " + "lorem ipsum " * 20,
+            input_request=f"Synthetic task {i}",
+            status=VertexStatus.READY if not previous else VertexStatus.PENDING,
+            client_id="bench",
+        )
+        for src in rng.sample(previous, min(len(previous), rng.randint(1, 3))):
+            edges.append(GraphEdge(id=f"e{len(edges)}", source_id=src, target_id=vid))
+        layer.append(vid)
+        if len(layer) == width:
+            previous, layer = layer, []
+    return AgentGraph(
+        id="bench", task_id="bench", client_id="bench", root_vertex_id="v0",
+        vertices=vertices, edges=edges, status=GraphStatus.EXECUTING,
+    )
+
+
+def _fake_result(vertex: GraphVertex) -> str:
+    return f"Result of {vertex.title}: " + "done " * 30
+
+
+# ---------------------------------------------------------------------------
+# Legacy loop (edge scans, full rebuild + deep copy)
+# ---------------------------------------------------------------------------
+
+
+def _legacy_complete(graph: AgentGraph, vid: str) -> None:
+    vertex = graph.vertices[vid]
+    vertex.status = VertexStatus.COMPLETED
+    vertex.result = _fake_result(vertex)
+    vertex.result_summary = vertex.result[:60]
+    for edge in graph.edges:
+        if edge.source_id == vid and edge.edge_type == EdgeType.DEPENDENCY:
+            edge.payload = EdgePayload(
+                source_vertex_id=vid, source_vertex_title=vertex.title, summary=vertex.result_summary,
+            )
+
+
+def _legacy_ready(graph: AgentGraph) -> list[str]:
+    ready = []
+    for v in graph.vertices.values():
+        if v.status == VertexStatus.PENDING:
+            incoming = [e for e in graph.edges if e.target_id == v.id and e.edge_type == EdgeType.DEPENDENCY]
+            if all(e.payload is not None for e in incoming):
+                v.status = VertexStatus.READY
+        if v.status == VertexStatus.READY:
+            ready.append(v.id)
+    return ready
+
+
+def run_legacy(template: AgentGraph) -> tuple[AgentGraph, int]:
+    data = template.model_dump()
+    steps = 0
+    while True:
+        graph = AgentGraph(**data)                      # node_select_next
+        ready = _legacy_ready(graph)
+        data = graph.model_dump()
+        if not ready:
+            return graph, steps
+        steps += 1
+        graph = AgentGraph(**data)                      # node_dispatch_vertex
+        results = []
+        for vid in ready:
+            graph_copy = AgentGraph(**copy.deepcopy(graph.model_dump()))
+            _legacy_complete(graph_copy, vid)
+            results.append(graph_copy)
+        for vid, res in zip(ready, results):
+            graph.vertices[vid] = res.vertices[vid]
+            for edge in res.edges:
+                if edge.payload and edge.source_id == vid:
+                    for orig_edge in graph.edges:
+                        if orig_edge.id == edge.id:
+                            orig_edge.payload = edge.payload
+                            break
+            existing_edge_ids = {e.id for e in graph.edges}
+            for new_edge in res.edges:
+                if new_edge.id not in existing_edge_ids:
+                    graph.edges.append(new_edge)
+        for vid in ready:
+            for edge in [e for e in graph.edges if e.source_id == vid]:
+                target = graph.vertices.get(edge.target_id)
+                if target and target.status == VertexStatus.PENDING:
+                    incoming = [e for e in graph.edges if e.target_id == edge.target_id
+                                and e.edge_type == EdgeType.DEPENDENCY]
+                    if all(e.payload is not None for e in incoming):
+                        target.status = VertexStatus.READY
+        data = graph.model_dump()
+
+
+# ---------------------------------------------------------------------------
+# Indexed loop (what langgraph_runner does now)
+# ---------------------------------------------------------------------------
+
+
+def run_indexed(template: AgentGraph) -> tuple[AgentGraph, int]:
+    graph = AgentGraph.from_checkpoint(template.to_checkpoint())
+    steps = 0
+    while True:
+        ready = [v.id for v in get_ready_vertices(graph)]  # node_select_next
+        graph.to_checkpoint()
+        if not ready:
+            return graph, steps
+        steps += 1
+        forks = {vid: fork_for_vertex(graph, vid) for vid in ready}  # node_dispatch_vertex
+        for vid, fork in forks.items():
+            vertex = start_vertex(fork, vid)
+            result = _fake_result(vertex)
+            complete_vertex(fork, vid, result=result, result_summary=result[:60])
+        for vid, fork in forks.items():
+            apply_vertex_delta(graph, collect_vertex_delta(graph, fork, vid))
+        for vid in forks:
+            promote_ready_targets(graph, vid)
+        graph.to_checkpoint()
+
+
+def _summary(graph: AgentGraph) -> tuple[int, int]:
+    completed = sum(1 for v in graph.vertices.values() if v.status == VertexStatus.COMPLETED)
+    return completed, sum(1 for e in graph.edges if e.payload is not None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AgentGraph scheduler-loop benchmark")
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--width", type=int, default=20, help="parallel vertices per layer")
+    parser.add_argument("--legacy-max", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'vertices':>8} {'edges':>6} {'steps':>5} {'mode':<8} {'total_s':>8} {'ms/step':>8}")
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        template = build_graph(size, args.width, random.Random(args.seed))
+        modes = [("indexed", run_indexed)]
+        if size <= args.legacy_max:
+            modes.insert(0, ("legacy", run_legacy))
+        outcomes = {}
+        for label, fn in modes:
+            start = time.perf_counter()
+            final, steps = fn(template)
+            elapsed = time.perf_counter() - start
+            outcomes[label] = _summary(final)
+            print(
+                f"{size:>8} {len(template.edges):>6} {steps:>5} {label:<8} "
+                f"{elapsed:>8.3f} {elapsed / max(steps, 1) * 1000:>8.2f}"
+            )
+        if len(set(outcomes.values())) > 1:
+            raise SystemExit(f"legacy and indexed loops disagree: {outcomes}")
+        checkpoint = final.to_checkpoint()
+        full = len(json.dumps(final.model_dump(), default=str))
+        compact = len(json.dumps(checkpoint, default=str))
+        print(f"{'':>8} checkpoint bytes: model_dump={full} to_checkpoint={compact}")
+
+
+if __name__ == "__main__":
+    main()
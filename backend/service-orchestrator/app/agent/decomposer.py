@@ -25,7 +25,7 @@ from app.agent.models import (
 
 if TYPE_CHECKING:
     from app.models import EvidencePack
-from app.agent.graph import add_edge, add_vertex, create_task_graph
+from app.agent.graph import add_edge, add_vertex, create_task_graph, has_cycle
 
 logger = logging.getLogger(__name__)
 
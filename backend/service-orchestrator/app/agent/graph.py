@@ -1,19 +1,48 @@
-"""Agent Graph — removed in agent-job migration.
+"""Agent Graph — Memory Graph removed in agent-job migration.
 
 The Memory Graph / Paměťový graf abstraction is gone; Claude CLI owns
 session narrative via compact_store and strategic anchors via the
-KB-backed Thought Map (`thought_*` MCP tools). This file is kept only
-so the remaining inline imports scattered across the orchestrator keep
-resolving — each imported symbol is a no-op stub that returns an empty
-value. When the last caller is gone, this file disappears with it.
+KB-backed Thought Map (`thought_*` MCP tools). The remaining inline
+imports of Memory Graph helpers resolve to no-op stubs that return an
+empty value.
+
+What is still real is the Myšlenkový graf execution that
+`langgraph_runner` drives: vertex/edge construction, readiness and the
+vertex lifecycle (start / complete / fail / block / resume). These use
+the adjacency index on AgentGraph, so each step costs O(degree) instead
+of a scan over all edges, and parallel vertices run on a fork that
+shares everything except the vertex being executed (see
+`fork_for_vertex` / `collect_vertex_delta`).
 """
 
 from __future__ import annotations
 
 import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from .models import (
+    AgentGraph,
+    EdgePayload,
+    EdgeType,
+    GraphEdge,
+    GraphStatus,
+    GraphVertex,
+    VertexStatus,
+    VertexType,
+)
 
 logger = logging.getLogger(__name__)
 
+# Statuses after which a vertex will not run again (without a retry reset).
+TERMINAL_STATUSES = frozenset({
+    VertexStatus.COMPLETED,
+    VertexStatus.FAILED,
+    VertexStatus.SKIPPED,
+    VertexStatus.CANCELLED,
+})
+
 
 def _sync_stub(*args, **kwargs):
     logger.debug("agent.graph sync stub called — Memory Graph removed")
@@ -60,7 +89,6 @@ def create_task_graph(
     This factory builds the smallest valid graph: one root vertex, no edges,
     status=READY so the runner can immediately execute it.
     """
-    from .models import AgentGraph, GraphStatus, GraphVertex, VertexStatus, VertexType
     root_id = f"root-{task_id}"
     root = GraphVertex(
         id=root_id,
@@ -82,18 +110,343 @@ def create_task_graph(
     )
 
 
-# Edge/vertex traversal helpers — validators + langgraph_runner still
-# import these; return empty collections so `len(...)` / iteration works.
-def get_incoming_edges(*args, **kwargs) -> list:
-    return []
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
-def get_outgoing_edges(*args, **kwargs) -> list:
-    return []
+# ---------------------------------------------------------------------------
+# Construction + traversal
+# ---------------------------------------------------------------------------
+
+
+def add_vertex(
+    graph: AgentGraph,
+    *,
+    title: str,
+    description: str,
+    vertex_type: VertexType = VertexType.TASK,
+    parent_id: str | None = None,
+    input_request: str = "",
+    client_id: str = "",
+    project_id: str = "",
+    agent_name: str | None = None,
+) -> GraphVertex:
+    """Add a PENDING vertex; depth follows the parent."""
+    parent = graph.vertices.get(parent_id) if parent_id else None
+    vertex = GraphVertex(
+        id=f"v-{uuid.uuid4().hex[:12]}",
+        title=title,
+        description=description,
+        vertex_type=vertex_type,
+        agent_name=agent_name,
+        input_request=input_request or description,
+        client_id=client_id or graph.client_id,
+        project_id=project_id or (graph.project_id or ""),
+        parent_id=parent_id,
+        depth=parent.depth + 1 if parent else 0,
+    )
+    graph.vertices[vertex.id] = vertex
+    return vertex
+
+
+def add_edge(
+    graph: AgentGraph,
+    source_id: str,
+    target_id: str,
+    edge_type: EdgeType = EdgeType.DEPENDENCY,
+) -> GraphEdge:
+    """Append an edge. A DEPENDENCY edge from an already finished source gets
+    its payload right away — otherwise the target would wait forever."""
+    edge = GraphEdge(
+        id=f"e-{uuid.uuid4().hex[:12]}",
+        source_id=source_id,
+        target_id=target_id,
+        edge_type=edge_type,
+    )
+    source = graph.vertices.get(source_id)
+    if edge_type == EdgeType.DEPENDENCY and source and source.status in (VertexStatus.COMPLETED, VertexStatus.FAILED):
+        edge.payload = _payload_of(source)
+    graph.edges.append(edge)
+    return edge
+
+
+def get_incoming_edges(graph: AgentGraph, vertex_id: str) -> list[GraphEdge]:
+    return graph.incoming_edges(vertex_id)
+
+
+def get_outgoing_edges(graph: AgentGraph, vertex_id: str) -> list[GraphEdge]:
+    return graph.outgoing_edges(vertex_id)
+
+
+def get_fan_in_count(graph: AgentGraph, vertex_id: str) -> int:
+    return len(graph.incoming_edges(vertex_id, EdgeType.DEPENDENCY))
+
+
+def has_cycle(graph: AgentGraph) -> bool:
+    """Kahn's algorithm over all edge types."""
+    indegree = {vid: 0 for vid in graph.vertices}
+    for edge in graph.edges:
+        if edge.target_id in indegree:
+            indegree[edge.target_id] += 1
+    queue = [vid for vid, deg in indegree.items() if deg == 0]
+    visited = 0
+    while queue:
+        vid = queue.pop()
+        visited += 1
+        for edge in graph.outgoing_edges(vid):
+            if edge.target_id in indegree:
+                indegree[edge.target_id] -= 1
+                if indegree[edge.target_id] == 0:
+                    queue.append(edge.target_id)
+    return visited != len(indegree)
+
+
+# ---------------------------------------------------------------------------
+# Readiness
+# ---------------------------------------------------------------------------
+
+
+def get_ready_vertices(graph: AgentGraph) -> list[GraphVertex]:
+    """Vertices that can run now, in insertion order.
+
+    - READY vertices.
+    - PENDING vertices whose incoming DEPENDENCY edges all carry payloads
+      (promoted to READY here).
+    - WAITING_CHILDREN parents whose children all finished — their
+      incoming_context is replaced with the children's summaries and the
+      status is left as is, so the runner takes the resume path.
+    """
+    ready: list[GraphVertex] = []
+    for vertex in graph.vertices.values():
+        if vertex.status == VertexStatus.READY:
+            ready.append(vertex)
+        elif vertex.status == VertexStatus.PENDING:
+            if graph.dependencies_satisfied(vertex.id):
+                vertex.status = VertexStatus.READY
+                ready.append(vertex)
+        elif vertex.status == VertexStatus.WAITING_CHILDREN:
+            if resume_parent_after_children(graph, vertex):
+                ready.append(vertex)
+    return ready
+
+
+def promote_ready_targets(graph: AgentGraph, vertex_id: str) -> list[str]:
+    """PENDING → READY for downstream vertices of `vertex_id` whose
+    dependencies are now all satisfied. Returns the promoted IDs."""
+    promoted: list[str] = []
+    for edge in graph.outgoing_edges(vertex_id, EdgeType.DEPENDENCY):
+        target = graph.vertices.get(edge.target_id)
+        if target and target.status == VertexStatus.PENDING and graph.dependencies_satisfied(target.id):
+            target.status = VertexStatus.READY
+            promoted.append(target.id)
+    return promoted
+
+
+def resume_parent_after_children(graph: AgentGraph, parent: GraphVertex) -> bool:
+    """If every DECOMPOSITION child of `parent` finished, load their
+    summaries into the parent's incoming_context and return True."""
+    children = [
+        graph.vertices[e.target_id]
+        for e in graph.outgoing_edges(parent.id, EdgeType.DECOMPOSITION)
+        if e.target_id in graph.vertices
+    ]
+    if not children or any(c.status not in TERMINAL_STATUSES for c in children):
+        return False
+    parent.incoming_context = [_payload_of(c) for c in children]
+    return True
+
+
+def graph_stats(graph: AgentGraph) -> dict:
+    """Vertex status histogram + totals for the SYNTHESIZE_DONE log line."""
+    statuses: dict[str, int] = {}
+    for v in graph.vertices.values():
+        statuses[v.status.value] = statuses.get(v.status.value, 0) + 1
+    return {
+        "total_vertices": len(graph.vertices),
+        "vertex_statuses": statuses,
+        "total_tokens": graph.total_token_count,
+        "total_llm_calls": graph.total_llm_calls,
+    }
+
+
+def get_final_result(graph: AgentGraph) -> str:
+    """Concatenate results of completed terminal vertices (no outgoing DEPENDENCY edge)."""
+    parts = [
+        f"### {v.title}\n{v.result or v.result_summary}"
+        for v in graph.vertices.values()
+        if v.status == VertexStatus.COMPLETED
+        and (v.result or v.result_summary)
+        and not graph.outgoing_edges(v.id, EdgeType.DEPENDENCY)
+    ]
+    return "\n\n".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Vertex lifecycle
+# ---------------------------------------------------------------------------
+
+
+def start_vertex(graph: AgentGraph, vertex_id: str) -> GraphVertex | None:
+    """READY → RUNNING; collects upstream payloads into incoming_context."""
+    vertex = graph.vertices.get(vertex_id)
+    if not vertex or vertex.status != VertexStatus.READY:
+        return None
+    vertex.status = VertexStatus.RUNNING
+    vertex.started_at = _now()
+    vertex.incoming_context = [
+        e.payload for e in graph.incoming_edges(vertex_id, EdgeType.DEPENDENCY)
+        if e.payload is not None
+    ]
+    graph.status = GraphStatus.EXECUTING
+    return vertex
+
+
+def complete_vertex(
+    graph: AgentGraph,
+    vertex_id: str,
+    *,
+    result: str,
+    result_summary: str,
+    local_context: str = "",
+    tools_used: list[str] | None = None,
+    token_count: int = 0,
+    llm_calls: int = 0,
+) -> None:
+    """Mark COMPLETED, fill outgoing DEPENDENCY payloads, add metrics to the graph totals."""
+    vertex = graph.vertices.get(vertex_id)
+    if not vertex:
+        return
+    vertex.status = VertexStatus.COMPLETED
+    vertex.result = result
+    vertex.result_summary = result_summary
+    vertex.local_context = local_context
+    if tools_used is not None:
+        vertex.tools_used = tools_used
+    vertex.token_count = token_count
+    vertex.llm_calls = llm_calls
+    vertex.completed_at = _now()
+    vertex.error = None
+    _fill_outgoing(graph, vertex)
+    graph.total_token_count += token_count
+    graph.total_llm_calls += llm_calls
+
+
+def fail_vertex(graph: AgentGraph, vertex_id: str, error: str) -> None:
+    """Mark FAILED. Downstream still gets a payload (the error) so one failed
+    branch doesn't stall the graph; a transient retry clears it again."""
+    vertex = graph.vertices.get(vertex_id)
+    if not vertex:
+        return
+    vertex.status = VertexStatus.FAILED
+    vertex.error = error
+    vertex.completed_at = _now()
+    _fill_outgoing(graph, vertex)
+
+
+def block_vertex(graph: AgentGraph, vertex_id: str, question: str) -> None:
+    """Mark BLOCKED on user input; the question is kept in `error`."""
+    vertex = graph.vertices.get(vertex_id)
+    if not vertex:
+        return
+    vertex.status = VertexStatus.BLOCKED
+    vertex.error = question
+    graph.status = GraphStatus.BLOCKED
+
+
+def resume_vertex(graph: AgentGraph, vertex_id: str, user_answer: str) -> None:
+    """BLOCKED → READY with the user's answer appended to the request."""
+    vertex = graph.vertices.get(vertex_id)
+    if not vertex or vertex.status != VertexStatus.BLOCKED:
+        return
+    question = vertex.error or ""
+    vertex.input_request = f"{vertex.input_request}\n\n## User answer\nQ: {question}\nA: {user_answer}"
+    vertex.error = None
+    vertex.status = VertexStatus.READY
+    if graph.status == GraphStatus.BLOCKED:
+        graph.status = GraphStatus.EXECUTING
+
+
+def _payload_of(vertex: GraphVertex) -> EdgePayload:
+    if vertex.status == VertexStatus.COMPLETED:
+        summary = vertex.result_summary or vertex.result
+    else:
+        summary = f"FAILED: {vertex.error or vertex.status.value}"
+    return EdgePayload(
+        source_vertex_id=vertex.id,
+        source_vertex_title=vertex.title,
+        summary=summary,
+    )
+
+
+def _fill_outgoing(graph: AgentGraph, vertex: GraphVertex) -> None:
+    edges = graph.outgoing_edges(vertex.id, EdgeType.DEPENDENCY)
+    if edges:
+        payload = _payload_of(vertex)
+        for edge in edges:
+            edge.payload = payload
+
+
+# ---------------------------------------------------------------------------
+# Parallel execution — fork + per-vertex delta
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class VertexDelta:
+    """Everything executing one vertex on a fork changed in the graph."""
+
+    vertex: GraphVertex
+    edge_payloads: dict[str, EdgePayload | None] = field(default_factory=dict)
+    new_vertices: list[GraphVertex] = field(default_factory=list)
+    new_edges: list[GraphEdge] = field(default_factory=list)
+    token_count: int = 0
+    llm_calls: int = 0
+    extend_count: int = 0
+    synthesis_vertex_id: str | None = None
+
+
+def fork_for_vertex(graph: AgentGraph, vertex_id: str) -> AgentGraph:
+    """Private view of `graph` for running `vertex_id` next to other vertices
+    (see AgentGraph.fork — only the vertex and its outgoing edges are copied)."""
+    return graph.fork(vertex_id)
+
+
+def collect_vertex_delta(base: AgentGraph, fork: AgentGraph, vertex_id: str) -> VertexDelta:
+    """Diff a fork produced by `fork_for_vertex` against its base."""
+    new_vertices, tail_edges = fork.added_since_fork()
+    point = fork.fork_point
+    delta = VertexDelta(
+        vertex=fork.vertices.get(vertex_id) or base.vertices[vertex_id],
+        new_vertices=[v for v in new_vertices if v.id not in base.vertices],
+        new_edges=[e for e in tail_edges if base.get_edge(e.id) is None],
+        token_count=fork.total_token_count - point.total_token_count,
+        llm_calls=fork.total_llm_calls - point.total_llm_calls,
+        extend_count=fork.extend_count - point.extend_count,
+    )
+    for edge in fork.outgoing_edges(vertex_id):
+        if base.get_edge(edge.id) is not None:
+            delta.edge_payloads[edge.id] = edge.payload
+    if fork.synthesis_vertex_id and not base.synthesis_vertex_id:
+        delta.synthesis_vertex_id = fork.synthesis_vertex_id
+    return delta
 
 
-def get_fan_in_count(*args, **kwargs) -> int:
-    return 0
+def apply_vertex_delta(graph: AgentGraph, delta: VertexDelta) -> None:
+    """Merge a VertexDelta into `graph` — O(size of the delta)."""
+    graph.vertices[delta.vertex.id] = delta.vertex
+    for edge_id, payload in delta.edge_payloads.items():
+        edge = graph.get_edge(edge_id)
+        if edge is not None:
+            edge.payload = payload
+    for vertex in delta.new_vertices:
+        graph.vertices.setdefault(vertex.id, vertex)
+    new_edges = [e for e in delta.new_edges if graph.get_edge(e.id) is None]
+    graph.edges.extend(new_edges)
+    graph.total_token_count += delta.token_count
+    graph.total_llm_calls += delta.llm_calls
+    graph.extend_count += delta.extend_count
+    if delta.synthesis_vertex_id and not graph.synthesis_vertex_id:
+        graph.synthesis_vertex_id = delta.synthesis_vertex_id
 
 
 # Legacy public API — every other symbol the orchestrator still tries
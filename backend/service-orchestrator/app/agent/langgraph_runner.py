@@ -39,7 +39,6 @@ from app.graph.nodes._helpers import (
 )
 from app.agent.decomposer import create_child_vertices, _format_evidence
 from app.agent.models import (
-    EdgeType,
     GraphStatus,
     GraphVertex,
     AgentGraph,
@@ -58,7 +57,26 @@ from app.agent.validation import validate_graph
 from app.models import ChatHistoryPayload, CodingTask, DelegationMessage, OrchestrateRequest
 from app.tools.executor import AskUserInterrupt, execute_tool
 from app.tools.ollama_parsing import extract_tool_calls
-from app.agent.graph import get_outgoing_edges, create_task_graph, add_vertex, add_edge
+from app.agent.graph import (
+    add_edge,
+    add_vertex,
+    apply_vertex_delta,
+    block_vertex,
+    collect_vertex_delta,
+    complete_vertex,
+    create_task_graph,
+    fail_vertex,
+    fork_for_vertex,
+    get_final_result,
+    get_outgoing_edges,
+    get_ready_vertices,
+    graph_stats,
+    promote_ready_targets,
+    resume_parent_after_children,
+    resume_vertex,
+    start_vertex,
+)
+from app.graph.ready_scheduler import ReadySetScheduler, parse_kind_limits
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +115,43 @@ class GraphAgentState(TypedDict, total=False):
     final_result: str | None            # Composed final result
 
 
+# ---------------------------------------------------------------------------
+# Graph hand-off between nodes
+# ---------------------------------------------------------------------------
+
+# The node that checkpoints a graph leaves the live AgentGraph here, keyed
+# by id() of the checkpoint dict it returned (the dict is held, so the id
+# can't be reused). The next node picks it up instead of re-validating the
+# whole graph. Entries are taken once: a node that fails halfway leaves
+# the checkpoint dict behind and a retry re-parses it. After a restart
+# (checkpoint loaded from MongoDB) the lookup misses and parses as before.
+_live_graphs: dict[int, tuple[dict, AgentGraph]] = {}
+_MAX_LIVE_GRAPHS = 64
+
+
+def _load_graph(data: dict) -> AgentGraph:
+    entry = _live_graphs.pop(id(data), None)
+    if entry is not None and entry[0] is data:
+        return entry[1]
+    return AgentGraph.from_checkpoint(data)
+
+
+def _peek_graph(data: dict) -> AgentGraph:
+    """Read-only view of a checkpointed graph (does not take the hand-off)."""
+    entry = _live_graphs.get(id(data))
+    if entry is not None and entry[0] is data:
+        return entry[1]
+    return AgentGraph.from_checkpoint(data)
+
+
+def _checkpoint(graph: AgentGraph) -> dict:
+    data = graph.to_checkpoint()
+    while len(_live_graphs) >= _MAX_LIVE_GRAPHS:
+        _live_graphs.pop(next(iter(_live_graphs)))
+    _live_graphs[id(data)] = (data, graph)
+    return data
+
+
 # ---------------------------------------------------------------------------
 # Node: decompose
 # ---------------------------------------------------------------------------
@@ -113,7 +168,7 @@ async def node_decompose(state: GraphAgentState) -> dict:
     """
     # Pre-built thinking graph — skip initialization, graph already has vertices
     if state.get("task_graph"):
-        graph = AgentGraph(**state["task_graph"])
+        graph = _peek_graph(state["task_graph"])
         logger.info(
             "Skipping init — pre-built thinking graph with %d vertices",
             len(graph.vertices),
@@ -182,7 +237,7 @@ async def node_decompose(state: GraphAgentState) -> dict:
     await report_graph_status(graph, "Root vertex ready — trying direct resolution")
 
     return {
-        "task_graph": graph.model_dump(),
+        "task_graph": _checkpoint(graph),
         "current_vertex_id": None,
         "graph_error": None,
     }
@@ -207,12 +262,12 @@ async def node_select_next(state: GraphAgentState) -> dict:
     if not graph_data:
         return {"current_vertex_id": None}
 
-    graph = AgentGraph(**graph_data)
+    graph = _load_graph(graph_data)
 
     # Stop scheduling if graph is cancelled (but NOT failed — retry may fix it)
     if graph.status == GraphStatus.CANCELLED:
         logger.info("Graph %s cancelled — stopping vertex scheduling", graph.id)
-        return {"task_graph": graph.model_dump(), "current_vertex_id": None}
+        return {"task_graph": _checkpoint(graph), "current_vertex_id": None}
 
     ready = get_ready_vertices(graph)
 
@@ -239,7 +294,7 @@ async def node_select_next(state: GraphAgentState) -> dict:
             graph.id, statuses, graph.status.value,
         )
         return {
-            "task_graph": graph.model_dump(),
+            "task_graph": _checkpoint(graph),
             "current_vertex_id": None,
             "ready_vertex_ids": [],
         }
@@ -252,7 +307,7 @@ async def node_select_next(state: GraphAgentState) -> dict:
         graph.id, len(ready_ids), ", ".join(ready_titles[:5]),
     )
     return {
-        "task_graph": graph.model_dump(),
+        "task_graph": _checkpoint(graph),
         "current_vertex_id": ready_ids[0],
         "ready_vertex_ids": ready_ids,
     }
@@ -264,13 +319,25 @@ async def node_select_next(state: GraphAgentState) -> dict:
 
 
 async def node_dispatch_vertex(state: GraphAgentState) -> dict:
-    """Execute ready vertices — parallel when multiple are ready.
+    """Execute ready vertices — each one as soon as its dependencies land.
 
     Each VertexType maps to a specific handler:
     - PLANNER/DECOMPOSE → recursive decomposition
     - All others        → agentic tool loop
+
+    Vertices run on a ReadySetScheduler instead of in supersteps: when any
+    vertex finishes, its delta is merged and the vertices it unlocked
+    (dependency targets, new children, a parent whose children are all
+    done) start right away, up to the global and per-agent caps. A slow
+    vertex only delays its own downstream.
+
+    The node returns — and LangGraph checkpoints — when nothing is running
+    or ready, or after `graph_dispatch_checkpoint_interval_s` (no new
+    vertices are started after that; running ones are drained). Vertices
+    left READY are picked up by the next select_next round, and a restart
+    resets vertices still RUNNING in the last checkpoint to READY.
     """
-    graph = AgentGraph(**state["task_graph"])
+    graph = _load_graph(state["task_graph"])
     ready_ids = state.get("ready_vertex_ids", [])
 
     # Fallback to single vertex for backward compat
@@ -279,74 +346,97 @@ async def node_dispatch_vertex(state: GraphAgentState) -> dict:
         ready_ids = [vid] if vid else []
 
     if not ready_ids:
-        return {"task_graph": graph.model_dump()}
-
-    # If only one vertex → execute directly (no asyncio.gather overhead)
-    if len(ready_ids) == 1:
-        graph = await _execute_single_vertex(graph, ready_ids[0], state)
-        return {"task_graph": graph.model_dump()}
-
-    # Multiple ready vertices → execute in parallel with asyncio.gather
-    # Each coroutine gets a deep-copy of the graph to avoid race conditions
-    # on shared mutable state (vertices dict, edges, token counts).
-    import copy
-
-    async def _run(vid: str) -> AgentGraph:
-        graph_copy = AgentGraph(**copy.deepcopy(graph.model_dump()))
-        return await _execute_single_vertex(graph_copy, vid, state)
-
-    results = await asyncio.gather(
-        *[_run(vid) for vid in ready_ids],
-        return_exceptions=True,
-    )
-
-    # Merge results back: copy each executed vertex + updated edges/vertices
-    for i, res in enumerate(results):
-        vid = ready_ids[i]
+        return {"task_graph": _checkpoint(graph)}
+
+    deadline = time.monotonic() + settings.graph_dispatch_checkpoint_interval_s
+
+    async def _run(vid: str) -> AgentGraph | None:
+        vertex = graph.vertices.get(vid)
+        if vertex is None or vertex.status not in _DISPATCHABLE_STATUSES:
+            return None
+        if vertex.status == VertexStatus.READY and not graph.dependencies_satisfied(vid):
+            # A vertex merged since it was queued (e.g. an impact validator)
+            # added a dependency — wait for it.
+            vertex.status = VertexStatus.PENDING
+            return None
+        # Each vertex — a lone one too, since others may start while it
+        # runs — gets a fork that privately owns only its vertex and
+        # outgoing edges. Other vertices/edges are shared read-only and the
+        # adjacency lists are copy-on-write, so edges merged into `graph`
+        # meanwhile and edges the fork adds never cross over; what it
+        # changed comes back as a VertexDelta and is merged in O(delta).
+        return await _execute_single_vertex(fork_for_vertex(graph, vid), vid, state)
+
+    async def _on_done(vid: str, res: object) -> list[str]:
         if isinstance(res, GraphInterrupt):
             # ASK_USER interrupt — mark vertex BLOCKED (not FAILED)
-            logger.info("Parallel vertex %s blocked (ASK_USER)", vid)
+            logger.info("Vertex %s blocked (ASK_USER)", vid)
             block_vertex(graph, vid, "Waiting for user input")
-        elif isinstance(res, Exception):
-            logger.error("Parallel vertex %s failed: %s", vid, res)
+            new_vertices: list[GraphVertex] = []
+        elif isinstance(res, BaseException):
+            logger.error("Vertex %s failed: %s", vid, res)
             fail_vertex(graph, vid, str(res))
+            new_vertices = []
         elif isinstance(res, AgentGraph):
-            # 1. Merge the executed vertex itself
-            if vid in res.vertices:
-                graph.vertices[vid] = res.vertices[vid]
-            # 2. Merge outgoing edge payloads filled by complete_vertex
-            for edge in res.edges:
-                if edge.payload and edge.source_id == vid:
-                    for orig_edge in graph.edges:
-                        if orig_edge.id == edge.id:
-                            orig_edge.payload = edge.payload
-                            break
-            # 3. Merge any new vertices/edges added by impact analysis
-            for new_vid, new_v in res.vertices.items():
-                if new_vid not in graph.vertices:
-                    graph.vertices[new_vid] = new_v
-            existing_edge_ids = {e.id for e in graph.edges}
-            for new_edge in res.edges:
-                if new_edge.id not in existing_edge_ids:
-                    graph.edges.append(new_edge)
-            # 4. Accumulate token/LLM counts
-            src_v = res.vertices.get(vid)
-            if src_v:
-                graph.total_token_count += src_v.token_count
-                graph.total_llm_calls += src_v.llm_calls
-
-    # Recalculate downstream readiness after all merges are done
-    for vid in ready_ids:
-        for edge in get_outgoing_edges(graph, vid):
-            target = graph.vertices.get(edge.target_id)
-            if target and target.status == VertexStatus.PENDING:
-                # Check if all incoming edges now have payloads
-                incoming = [e for e in graph.edges if e.target_id == edge.target_id
-                            and e.edge_type == EdgeType.DEPENDENCY]
-                if all(e.payload is not None for e in incoming):
-                    target.status = VertexStatus.READY
+            delta = collect_vertex_delta(graph, res, vid)
+            apply_vertex_delta(graph, delta)
+            new_vertices = delta.new_vertices
+        else:
+            return []
+        if graph.status == GraphStatus.CANCELLED:
+            return []
+        return _newly_ready(graph, vid, new_vertices)
+
+    def _kind(vid: str) -> str:
+        vertex = graph.vertices.get(vid)
+        if vertex is None:
+            return ""
+        return vertex.agent_name or vertex.vertex_type.value
+
+    # The per-agent default caps agent_name kinds only; vertex-type kinds
+    # (homogeneous fan-outs such as decomposer children) are bounded by the
+    # global cap unless listed explicitly in AGENT_MAX_CONCURRENT.
+    kind_limits = parse_kind_limits(settings.agent_max_concurrent)
+    for vertex_type in VertexType:
+        kind_limits.setdefault(vertex_type.value, settings.graph_max_concurrent_vertices)
+    scheduler: ReadySetScheduler[str] = ReadySetScheduler(
+        max_concurrency=settings.graph_max_concurrent_vertices,
+        kind_limits=kind_limits,
+        default_kind_limit=settings.agent_max_concurrent_default,
+        name=f"DISPATCH graph={graph.id}",
+    )
+    started = await scheduler.run(
+        ready_ids, _run, _on_done,
+        kind=_kind,
+        stop_starting=lambda: (
+            time.monotonic() > deadline or graph.status == GraphStatus.CANCELLED
+        ),
+    )
+    logger.info("DISPATCH | graph=%s | vertices_run=%d", graph.id, started)
 
-    return {"task_graph": graph.model_dump()}
+    return {"task_graph": _checkpoint(graph)}
+
+
+_DISPATCHABLE_STATUSES = (VertexStatus.READY, VertexStatus.WAITING_CHILDREN)
+
+
+def _newly_ready(graph: AgentGraph, vertex_id: str, new_vertices: list[GraphVertex]) -> list[str]:
+    """Vertices that became runnable because `vertex_id` finished."""
+    ready = promote_ready_targets(graph, vertex_id)
+    for v in new_vertices:
+        if v.status == VertexStatus.PENDING and graph.dependencies_satisfied(v.id):
+            v.status = VertexStatus.READY
+        if v.status == VertexStatus.READY:
+            ready.append(v.id)
+    vertex = graph.vertices.get(vertex_id)
+    parent = graph.vertices.get(vertex.parent_id) if vertex and vertex.parent_id else None
+    if (
+        parent is not None
+        and parent.status == VertexStatus.WAITING_CHILDREN
+        and resume_parent_after_children(graph, parent)
+    ):
+        ready.append(parent.id)
+    return ready
 
 
 async def _execute_single_vertex(
@@ -476,7 +566,7 @@ async def node_synthesize(state: GraphAgentState) -> dict:
     if not graph_data:
         return {"final_result": state.get("graph_error", "No graph available")}
 
-    graph = AgentGraph(**graph_data)
+    graph = _load_graph(graph_data)
     has_blocked = any(v.status == VertexStatus.BLOCKED for v in graph.vertices.values())
     has_failures = any(v.status == VertexStatus.FAILED for v in graph.vertices.values())
     if has_blocked:
@@ -503,10 +593,10 @@ async def node_synthesize(state: GraphAgentState) -> dict:
                 "SYNTHESIZE | graph BLOCKED — surfacing %d pending question(s) as result",
                 len(blocked_questions),
             )
-            return {"final_result": blocked_summary, "task_graph": graph.model_dump()}
+            return {"final_result": blocked_summary, "task_graph": _checkpoint(graph)}
 
     # Always compute stats (needed for final logging)
-    stats = {}
+    stats = graph_stats(graph)
 
     # Check for a SYNTHESIS vertex first (foreground decomposed graphs).
     # This takes priority over root vertex, which may be a placeholder.
@@ -586,7 +676,7 @@ async def node_synthesize(state: GraphAgentState) -> dict:
         len(result) if result else 0,
     )
 
-    return {"final_result": result, "task_graph": graph.model_dump()}
+    return {"final_result": result, "task_graph": _checkpoint(graph)}
 
 
 # ---------------------------------------------------------------------------
@@ -890,7 +980,7 @@ async def run_graph_agent(
                 result_summary="Pre-built thinking graph",
             )
         existing_graph.status = GraphStatus.EXECUTING
-        pre_built_graph = existing_graph.model_dump()
+        pre_built_graph = existing_graph.to_checkpoint()
 
     initial_state: GraphAgentState = {
         "task": CodingTask(
@@ -1164,8 +1254,8 @@ async def _agentic_vertex(
         # --- Cancellation check: bail out if graph was cancelled externally ---
         graph_data = state.get("task_graph")
         if graph_data:
-            live_graph = AgentGraph(**graph_data) if isinstance(graph_data, dict) else graph_data
-            if live_graph.status == GraphStatus.CANCELLED:
+            graph_status = graph_data.get("status") if isinstance(graph_data, dict) else graph_data.status
+            if graph_status == GraphStatus.CANCELLED:
                 logger.info("Vertex %s: graph cancelled, aborting agentic loop", vertex.id)
                 vertex.status = VertexStatus.CANCELLED
                 return ("Cancelled by user.", "Cancelled")
@@ -1593,8 +1683,8 @@ def _handle_extend_thinking_graph(
                 # Add edge so current vertex's downstream gets this vertex's context
                 # Check edge doesn't already exist
                 edge_exists = any(
-                    e.source_id == existing_vid and e.target_id == vertex.id
-                    for e in graph.edges
+                    e.source_id == existing_vid
+                    for e in graph.incoming_edges(vertex.id)
                 )
                 if not edge_exists:
                     reused.append(existing_vid)
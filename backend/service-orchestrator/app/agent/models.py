@@ -20,7 +20,9 @@ Graph types:
 from __future__ import annotations
 
 from enum import Enum
-from pydantic import BaseModel, Field
+from itertools import islice
+from typing import NamedTuple
+from pydantic import BaseModel, Field, PrivateAttr
 
 # Client isolation constant — used for system/global vertices (memory map root).
 # Every vertex MUST have a non-empty client_id. Use this for vertices that are
@@ -204,6 +206,87 @@ class GraphVertex(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+class ForkPoint(NamedTuple):
+    """Sizes / counters of the base graph when AgentGraph.fork() was called."""
+
+    vertex_count: int
+    edge_count: int
+    total_token_count: int
+    total_llm_calls: int
+    extend_count: int
+
+
+class _EdgeIndex:
+    """Adjacency index over AgentGraph.edges (see AgentGraph._edge_index).
+
+    `derive()` shares adjacency lists between a graph and its forks, so the
+    lists are copy-on-write: `owned_in` / `owned_out` name the vertex ids
+    whose list this index may append to; any other list is copied before
+    its first append.
+    """
+
+    __slots__ = ("edges", "count", "by_id", "position", "incoming", "outgoing", "owned_in", "owned_out")
+
+    def __init__(self, edges: list[GraphEdge]):
+        self.edges = edges
+        self.count = 0
+        self.by_id: dict[str, GraphEdge] = {}
+        self.position: dict[str, int] = {}
+        self.incoming: dict[str, list[GraphEdge]] = {}
+        self.outgoing: dict[str, list[GraphEdge]] = {}
+        self.owned_in: set[str] = set()
+        self.owned_out: set[str] = set()
+        self.extend()
+
+    def extend(self) -> None:
+        for i in range(self.count, len(self.edges)):
+            edge = self.edges[i]
+            self.by_id[edge.id] = edge
+            self.position[edge.id] = i
+            _append(self.incoming, self.owned_in, edge.target_id, edge)
+            _append(self.outgoing, self.owned_out, edge.source_id, edge)
+        self.count = len(self.edges)
+
+    def derive(self, edges: list[GraphEdge], replaced: dict[str, GraphEdge]) -> _EdgeIndex:
+        """Index for `edges` = this index's list with `replaced` swapped in
+        at the same positions. Costs O(replaced) Python work instead of a
+        rebuild (the dict copies are shallow, C-level).
+
+        Afterwards both indexes share every untouched adjacency list, so
+        neither owns any of them any more.
+        """
+        index = _EdgeIndex.__new__(_EdgeIndex)
+        index.edges = edges
+        index.count = self.count
+        index.by_id = dict(self.by_id)
+        index.position = dict(self.position)
+        index.incoming = dict(self.incoming)
+        index.outgoing = dict(self.outgoing)
+        index.owned_in = {e.target_id for e in replaced.values()}
+        index.owned_out = {e.source_id for e in replaced.values()}
+        index.by_id.update(replaced)
+        for adjacency, vertex_ids in (
+            (index.incoming, index.owned_in),
+            (index.outgoing, index.owned_out),
+        ):
+            for vid in vertex_ids:
+                adjacency[vid] = [replaced.get(e.id, e) for e in adjacency[vid]]
+        self.owned_in = set()
+        self.owned_out = set()
+        return index
+
+
+def _append(
+    adjacency: dict[str, list[GraphEdge]], owned: set[str], vertex_id: str, edge: GraphEdge,
+) -> None:
+    """Append to an adjacency list, copying it first if it may be shared."""
+    edges = adjacency.get(vertex_id)
+    if vertex_id not in owned:
+        edges = adjacency[vertex_id] = list(edges) if edges else []
+        owned.add(vertex_id)
+    edges.append(edge)
+
+
 class AgentGraph(BaseModel):
     """Complete execution DAG — Paměťový graf or Myšlenkový graf.
 
@@ -238,6 +321,106 @@ class AgentGraph(BaseModel):
     total_llm_calls: int = 0
     extend_count: int = 0  # Total extend_thinking_graph vertices added (global cap)
 
+    _index: _EdgeIndex | None = PrivateAttr(default=None)
+    _fork_point: ForkPoint | None = PrivateAttr(default=None)
+
+    # -- Adjacency ------------------------------------------------------------
+    # Edges are only ever appended (add_edge) or the whole list is replaced
+    # (decomposer rollback), so the index extends itself with the tail on
+    # append and rebuilds when the list object changes or shrinks.
+
+    def _edge_index(self) -> _EdgeIndex:
+        index = self._index
+        if index is None or index.edges is not self.edges or index.count > len(self.edges):
+            index = self._index = _EdgeIndex(self.edges)
+        elif index.count < len(self.edges):
+            index.extend()
+        return index
+
+    def incoming_edges(self, vertex_id: str, edge_type: EdgeType | None = None) -> list[GraphEdge]:
+        edges = self._edge_index().incoming.get(vertex_id, [])
+        if edge_type is None:
+            return list(edges)
+        return [e for e in edges if e.edge_type == edge_type]
+
+    def outgoing_edges(self, vertex_id: str, edge_type: EdgeType | None = None) -> list[GraphEdge]:
+        edges = self._edge_index().outgoing.get(vertex_id, [])
+        if edge_type is None:
+            return list(edges)
+        return [e for e in edges if e.edge_type == edge_type]
+
+    def get_edge(self, edge_id: str) -> GraphEdge | None:
+        return self._edge_index().by_id.get(edge_id)
+
+    def dependencies_satisfied(self, vertex_id: str) -> bool:
+        """True when every incoming DEPENDENCY edge carries a payload."""
+        return all(
+            e.payload is not None
+            for e in self._edge_index().incoming.get(vertex_id, ())
+            if e.edge_type == EdgeType.DEPENDENCY
+        )
+
+    # -- Fork -----------------------------------------------------------------
+
+    def fork(self, vertex_id: str) -> AgentGraph:
+        """Copy that privately owns `vertex_id` and its outgoing edges.
+
+        Vertex dict / edge list are new containers, so vertices and edges
+        the fork adds stay in it (see `added_since_fork`); all other vertex
+        and edge objects are shared with this graph and must not be mutated
+        through the fork.
+        """
+        index = self._edge_index()
+        fork = self.model_copy()
+        fork.vertices = dict(self.vertices)
+        fork.vertices[vertex_id] = self.vertices[vertex_id].model_copy(deep=True)
+        fork.edges = list(self.edges)
+        replaced: dict[str, GraphEdge] = {}
+        for edge in index.outgoing.get(vertex_id, ()):
+            replaced[edge.id] = fork.edges[index.position[edge.id]] = edge.model_copy()
+        fork._index = index.derive(fork.edges, replaced)
+        fork._fork_point = ForkPoint(
+            vertex_count=len(self.vertices),
+            edge_count=len(self.edges),
+            total_token_count=self.total_token_count,
+            total_llm_calls=self.total_llm_calls,
+            extend_count=self.extend_count,
+        )
+        return fork
+
+    @property
+    def fork_point(self) -> ForkPoint | None:
+        return self._fork_point
+
+    def added_since_fork(self) -> tuple[list[GraphVertex], list[GraphEdge]]:
+        """Vertices / edges appended to this fork since `fork()` — O(added).
+
+        Only additions happen at the tail; the decomposer's cycle rollback
+        removes just what it added, so the prefix stays the forked one.
+        """
+        point = self._fork_point
+        if point is None:
+            raise ValueError("added_since_fork() called on a graph that is not a fork")
+        added = len(self.vertices) - point.vertex_count
+        vertices = list(islice(reversed(self.vertices.values()), added)) if added > 0 else []
+        vertices.reverse()
+        return vertices, self.edges[point.edge_count:]
+
+    # -- Checkpoint -----------------------------------------------------------
+
+    def to_checkpoint(self) -> dict:
+        """Compact dict for LangGraph state — fields at their default are omitted
+        (empty agent_messages / incoming_context, unset timestamps, ...).
+
+        Round-trips through `from_checkpoint` (and plain `AgentGraph(**data)`),
+        so full `model_dump()` checkpoints written before stay readable.
+        """
+        return self.model_dump(exclude_defaults=True)
+
+    @classmethod
+    def from_checkpoint(cls, data: dict) -> AgentGraph:
+        return cls.model_validate(data)
+
 
 # Backward compatibility alias
 TaskGraph = AgentGraph
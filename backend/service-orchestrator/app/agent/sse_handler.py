@@ -22,7 +22,7 @@ from app.agent.chat_router import route_chat_message
 from app.chat.context import chat_context_assembler
 from app.chat.handler_agentic import run_agentic_loop
 from app.chat.handler_context import load_runtime_context, build_messages, load_task_context_message
-from app.chat.handler_streaming import call_llm, stream_text, save_assistant_message
+from app.chat.handler_streaming import LlmTokenStream, stream_text, save_assistant_message
 from app.chat.models import ChatRequest, ChatStreamEvent
 from app.chat.system_prompt import build_system_prompt
 from app.chat.tools import CHAT_INITIAL_TOOLS
@@ -128,25 +128,45 @@ async def handle_chat_sse(
                                            attachments=request.attachments or None,
                                            client_id=request.active_client_id,
                                            project_id=request.active_project_id)
+            llm_stream: LlmTokenStream | None = None
             try:
-                resp = await call_llm(
+                llm_stream = LlmTokenStream(
                     messages=messages,
                     capability="chat",
                     client_id=request.active_client_id,
                 )
-                text = resp.choices[0].message.content or ""
+                try:
+                    async for event in llm_stream:
+                        yield event
+                finally:
+                    if llm_stream.interrupted:
+                        # Cut off mid-answer — keep what the client already shows
+                        await save_assistant_message(
+                            request.session_id, llm_stream.streamed_text,
+                            {"direct_answer": "true", "interrupted": "true"}, compress=False,
+                        )
+                text = llm_stream.streamed_text or llm_stream.response.choices[0].message.content or ""
                 if text.strip():
                     _response_chunks.append(text)
                     await save_assistant_message(
                         request.session_id, text, {"direct_answer": "true"},
                     )
-                    async for event in stream_text(text):
-                        yield event
+                    if not llm_stream.streamed_text:
+                        async for event in stream_text(text):
+                            yield event
                     yield ChatStreamEvent(type="done", metadata={
                         "direct_answer": True, "iterations": 0,
                     })
                     return
             except Exception as e:
+                if llm_stream is not None and llm_stream.interrupted:
+                    # Tokens already reached the client (and were saved) —
+                    # the agentic path would append a second answer to them
+                    logger.warning("SSE: direct response failed mid-stream (%s)", e)
+                    yield ChatStreamEvent(type="done", metadata={
+                        "direct_answer": True, "iterations": 0, "interrupted": True,
+                    })
+                    return
                 logger.warning("SSE: direct response failed (%s), falling through", e)
 
         # ── 4b. Build messages for agentic path ─────────────────────
@@ -495,6 +515,7 @@ async def _run_foreground_graph(
     """
     from app.agent.langgraph_runner import (
         _get_compiled_graph,
+        _peek_graph,
         node_dispatch_vertex,
         node_select_next,
         node_synthesize,
@@ -523,7 +544,7 @@ async def _run_foreground_graph(
         "rules": {
             "max_openrouter_tier": max_tier,
         },
-        "task_graph": graph.model_dump(),
+        "task_graph": graph.to_checkpoint(),
         "current_vertex_id": None,
         "ready_vertex_ids": [],
         "graph_error": None,
@@ -545,7 +566,7 @@ async def _run_foreground_graph(
 
         # Report progress
         ready_titles = []
-        g = AgentGraph(**state["task_graph"])
+        g = _peek_graph(state["task_graph"])
         for vid in ready_ids:
             v = g.vertices.get(vid)
             if v:
@@ -562,7 +583,7 @@ async def _run_foreground_graph(
         state.update(dispatch_result)
 
         # Report completed vertices
-        g = AgentGraph(**state["task_graph"])
+        g = _peek_graph(state["task_graph"])
         for vid in ready_ids:
             v = g.vertices.get(vid)
             if v and v.status == VertexStatus.COMPLETED:
@@ -590,7 +611,7 @@ async def _run_foreground_graph(
             yield event
 
     # Stats
-    g = AgentGraph(**state["task_graph"])
+    g = _peek_graph(state["task_graph"])
     completed = sum(1 for v in g.vertices.values() if v.status == VertexStatus.COMPLETED)
     failed = sum(1 for v in g.vertices.values() if v.status == VertexStatus.FAILED)
     logger.info(
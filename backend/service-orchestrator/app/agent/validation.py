@@ -26,6 +26,7 @@ from app.agent.graph import (
     get_incoming_edges,
     get_outgoing_edges,
     get_fan_in_count,
+    has_cycle,
 )
 
 logger = logging.getLogger(__name__)
@@ -205,11 +206,7 @@ def _check_convergence(graph: AgentGraph, result: ValidationResult) -> None:
             continue
         if vertex.vertex_type in (VertexType.ROOT, VertexType.SYNTHESIS):
             continue
-        outgoing_deps = [
-            e for e in graph.edges
-            if e.source_id == vid and e.edge_type == EdgeType.DEPENDENCY
-        ]
-        if not outgoing_deps:
+        if not graph.outgoing_edges(vid, EdgeType.DEPENDENCY):
             result.add_warning(
                 f"Leaf vertex {vid} ({vertex.title[:40]}) has no path to synthesis"
             )
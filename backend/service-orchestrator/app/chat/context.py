@@ -12,7 +12,7 @@ Used by:
 - Background orchestrator (replaces Kotlin prepareChatHistoryPayload)
 
 MongoDB collections:
-- chat_messages:   {conversationId, role, content, requestTime|responseTime, sequence, correlationId, ...}
+- chat_messages:   {conversationId, role, content, requestTime|responseTime, sequence, correlationId, tokenCount, ...}
 - chat_summaries:  {conversationId, sequenceStart, sequenceEnd, summary, keyDecisions, topics, ...}
 
 Note: 'conversationId' is the ObjectId linking messages to a conversation thread.
@@ -22,6 +22,11 @@ Hardening:
 - W-15: Compression error handling — retry with marker, callback on done
 - W-20: Sequence number race — atomic findOneAndUpdate counter
 - W-10: Checkpoint message growth — truncate tool results in stored messages
+
+Token counts: every message stores `tokenCount` (estimate_tokens of content)
+when saved; messages written without it (Kotlin-saved user messages, legacy
+rows) are counted once on load and backfilled, so assembly never
+re-tokenizes history.
 """
 
 from __future__ import annotations
@@ -34,11 +39,16 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
 
 from app.config import settings, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget tasks — the event loop only keeps
+# weak ones, so an unreferenced task can be garbage-collected mid-flight.
+_background_tasks: set[asyncio.Task] = set()
+
 
 # ---------------------------------------------------------------------------
 # Configuration — driven by Settings (env vars with ORCHESTRATOR_ prefix).
@@ -91,6 +101,7 @@ class ChatMessage:
     content: str
     timestamp: str     # ISO datetime — effective (responseTime ?? requestTime)
     sequence: int
+    token_count: int = 0  # estimate_tokens(content) — stored as tokenCount
 
 
 @dataclass
@@ -267,7 +278,7 @@ class ChatContextAssembler:
         message_tokens = 0
 
         for msg in reversed(recent_messages):  # newest first
-            msg_tokens = estimate_tokens(msg.content) + 30  # +30 for role/JSON wrapping
+            msg_tokens = msg.token_count + 30  # +30 for role/JSON wrapping
             if message_tokens + msg_tokens > remaining_budget:
                 break
             included_messages.insert(0, msg)  # restore chronological order
@@ -455,10 +466,15 @@ class ChatContextAssembler:
         docs.reverse()  # newest-first -> chronological
 
         messages = []
+        backfill: list[UpdateOne] = []
         for doc in docs:
             content = doc.get("content", "")
             if _is_error_message(content):
                 continue
+            token_count = doc.get("tokenCount")
+            if token_count is None:
+                token_count = estimate_tokens(content)
+                backfill.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"tokenCount": token_count}}))
             raw_role = doc["role"].lower()
             # Map BACKGROUND/ALERT roles to "system" for LLM compatibility
             # The content already has [Background]/[Urgent Alert] prefix from ChatRpcImpl
@@ -471,10 +487,23 @@ class ChatContextAssembler:
                 content=content,
                 timestamp=_effective_ts(doc),
                 sequence=doc.get("sequence", 0),
+                token_count=token_count,
             ))
 
+        if backfill:
+            task = asyncio.create_task(self._backfill_token_counts(conversation_id, backfill))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
         return messages
 
+    async def _backfill_token_counts(self, conversation_id: str, updates: list[UpdateOne]) -> None:
+        """Store token counts computed on load (fire-and-forget, best effort)."""
+        try:
+            await self.db["chat_messages"].bulk_write(updates, ordered=False)
+        except Exception as e:
+            logger.debug("TOKEN_COUNT_BACKFILL_FAILED | conversationId=%s | %s", conversation_id, e)
+
     async def _load_all_messages(self, conversation_id: str) -> list[ChatMessage]:
         """Load ALL messages ordered by sequence ASC. Used for compression."""
         from bson import ObjectId
@@ -747,6 +776,7 @@ class ChatContextAssembler:
             "requestTime": now if is_user else None,
             "responseTime": None if is_user else now,
             "sequence": sequence,
+            "tokenCount": estimate_tokens(saved_content),
             "metadata": metadata or {},
         }
         if client_id:
@@ -758,6 +788,22 @@ class ChatContextAssembler:
 
         await self.db["chat_messages"].insert_one(doc)
 
+    async def update_message_metadata(
+        self,
+        conversation_id: str,
+        correlation_id: str,
+        metadata: dict[str, str],
+    ) -> None:
+        """Merge keys into the metadata of a saved message."""
+        from bson import ObjectId
+
+        if not metadata:
+            return
+        await self.db["chat_messages"].update_one(
+            {"conversationId": ObjectId(conversation_id), "correlationId": correlation_id},
+            {"$set": {f"metadata.{key}": value for key, value in metadata.items()}},
+        )
+
     async def get_next_sequence(self, conversation_id: str) -> int:
         """Get the next sequence number for a conversation thread.
 
@@ -19,7 +19,7 @@ from bson import ObjectId
 from app.chat.drift import detect_drift
 from app.chat.hallucination_guard import needs_verification_retry, is_empty_promise, claims_no_web_access, detects_language_mismatch, detects_template_leak
 from app.chat.handler_fact_check import run_fact_check, fact_check_metadata, confidence_badge
-from app.chat.handler_streaming import call_llm, stream_text, save_assistant_message
+from app.chat.handler_streaming import LlmTokenStream, stream_text, save_assistant_message, update_assistant_metadata
 from app.chat.source_attribution import SourceTracker
 from app.chat.topic_tracker import detect_topics, update_conversation_topics, topic_metadata
 from app.llm.router_client import report_model_error
@@ -35,14 +35,18 @@ from app.chat.handler_tools import (
 )
 from app.chat.models import ChatRequest, ChatStreamEvent
 from app.chat.system_prompt import RuntimeContext
-from app.chat.tools import TOOL_DOMAINS
-from app.config import settings, estimate_tokens
+from app.chat.tools import READ_ONLY_TOOLS, TOOL_DOMAINS
+from app.config import settings
 from app.llm.provider import llm_provider
+from app.llm.token_count import TokenLedger
 from app.models import ModelTier
 from app.tools.executor import ApprovalRequiredInterrupt
 
 logger = logging.getLogger(__name__)
 
+# Internal graph labels the model must not echo (hallucination guard 3)
+_ANCHOR_PATTERN = r'(?:thought-anchor|thought-node|knowledge-node):[a-zA-Z0-9_:.-]+'
+
 # Pending approval futures: session_id → asyncio.Future
 _pending_approvals: dict[str, asyncio.Future] = {}
 # Global auto-approved actions (persistent — loaded from MongoDB on startup)
@@ -242,13 +246,6 @@ def resolve_pending_approval(session_id: str, approved: bool, always: bool = Fal
         logger.warning("No pending approval for session %s", session_id)
 
 
-def _estimate_tokens_total(messages: list[dict], tools: list[dict]) -> int:
-    """Estimate total token count for routing decisions."""
-    message_tokens = sum(estimate_tokens(str(m)) for m in messages)
-    tools_tokens = sum(estimate_tokens(str(t)) for t in tools)
-    return message_tokens + tools_tokens + settings.default_output_tokens
-
-
 # ---------------------------------------------------------------------------
 # Main agentic loop
 # ---------------------------------------------------------------------------
@@ -289,18 +286,28 @@ async def run_agentic_loop(
     distinct_tools_used: set[str] = set()
     tool_call_history: list[tuple[str, str]] = []
     tool_result_cache: dict[str, str] = {}  # "tool_name:args_json" → result
+    token_ledger = TokenLedger()  # Routing estimate — counts only messages added since last iteration
     source_tracker = SourceTracker()  # EPIC 14-S2: Track KB sources for attribution
     effective_client_id = request.active_client_id
     effective_project_id = request.active_project_id
     effective_group_id = getattr(request, "active_group_id", None)
 
     # Scope-aware save helper — all assistant messages carry client/project context
-    async def _save_msg(content: str, meta: dict | None = None, compress: bool = True) -> None:
-        await save_assistant_message(
+    async def _save_msg(content: str, meta: dict | None = None, compress: bool = True) -> str:
+        return await save_assistant_message(
             request.session_id, content, meta, compress=compress,
             client_id=effective_client_id, project_id=effective_project_id,
             group_id=effective_group_id,
         )
+
+    # A live answer cut off mid-stream (disconnect, router error) — the
+    # client already shows its tokens, so keep them.
+    async def _save_interrupted_stream(stream: LlmTokenStream) -> None:
+        if stream.interrupted:
+            meta = {"interrupted": "true"}
+            if request.context_task_id:
+                meta["contextTaskId"] = request.context_task_id
+            await _save_msg(stream.streamed_text, meta, compress=False)
     stagnation_counter = 0  # Consecutive iterations without new unique tool calls
     last_unique_tool_count = 0
     _guard_fallback_text: str | None = None  # First unverified answer saved for fallback
@@ -333,7 +340,7 @@ async def run_agentic_loop(
 
         logger.info("Chat: iteration %d/%d", iteration + 1, effective_max_iterations)
 
-        estimated = _estimate_tokens_total(messages, selected_tools)
+        estimated = token_ledger.estimate(messages, selected_tools)
 
         # Caller contract: messages + capability + client_id. Router resolves
         # everything else from the client's CloudModelPolicy (tier, tool-forcing
@@ -375,16 +382,47 @@ async def run_agentic_loop(
             except Exception:
                 pass
 
-        response = await call_llm(
+        # Answers after tool use are streamed live: guards 1/2 (no tools used)
+        # cannot fire on them, and the gate holds back the first
+        # `stream_holdback_chars` until the text-based guards pass on it.
+        def _answer_gate(text: str) -> bool | None:
+            if len(text) < settings.stream_holdback_chars:
+                return None
+            if _guard_retries >= 2:
+                return True
+            import re as _re
+            return not (
+                detects_template_leak(text)
+                or detects_language_mismatch(request.message, text)
+                or _re.search(_ANCHOR_PATTERN, text)
+            )
+
+        llm_stream = LlmTokenStream(
             messages=call_messages, tools=selected_tools,
             capability=route_capability,
             client_id=effective_client_id,
+            gate=_answer_gate if used_tools else (lambda text: False),
         )
+        try:
+            async for event in llm_stream:
+                yield event
+        finally:
+            await _save_interrupted_stream(llm_stream)
+        response = llm_stream.response
+        _streamed = llm_stream.streamed_text
         # Router filled `response.model` with the actual model it dispatched to.
         _used_model = getattr(response, "model", "") or ""
 
         choice = response.choices[0]
         tool_calls, remaining_text = extract_tool_calls(choice.message)
+        if tool_calls and _streamed:
+            # The client already shows the streamed text as the answer and
+            # cannot retract it — finish with it instead of running the calls.
+            logger.warning(
+                "Chat: dropping %d tool calls that followed %d streamed chars",
+                len(tool_calls), len(_streamed),
+            )
+            tool_calls = []
 
         # No tool calls → final text response
         if not tool_calls:
@@ -394,6 +432,10 @@ async def run_agentic_loop(
             final_text = _re.sub(r'<tool_call>.*?</tool_call>', '', raw_final, flags=_re.DOTALL).strip()
             if not final_text:
                 final_text = ""  # Will trigger hallucination guard or empty response handling
+            if _streamed:
+                # What the client received is the answer; the guards below
+                # all skip live-streamed text
+                final_text = _streamed
             logger.info("Chat: final answer after %d iterations (%d chars)", iteration + 1, len(final_text))
 
             # Template-leak guard: if the response contains raw ChatML tokens
@@ -402,7 +444,7 @@ async def run_agentic_loop(
             # trimmed the role markers. Skip this model and retry on the next
             # one in the router queue. Router-side context-budget guard exists
             # to prevent this for the common case; this catch covers the rest.
-            if final_text and _guard_retries < 2 and detects_template_leak(final_text):
+            if final_text and not _streamed and _guard_retries < 2 and detects_template_leak(final_text):
                 _guard_retries += 1
                 logger.warning(
                     "HALLUCINATION_GUARD | template leak (raw ChatML tokens in reply) — model broken, skipping and retrying",
@@ -423,7 +465,7 @@ async def run_agentic_loop(
 
             # Language mismatch guard: if user wrote Czech but model responded in English,
             # retry with next model. Applies regardless of tool usage.
-            if final_text and _guard_retries < 2 and detects_language_mismatch(request.message, final_text):
+            if final_text and not _streamed and _guard_retries < 2 and detects_language_mismatch(request.message, final_text):
                 _guard_retries += 1
                 logger.warning("HALLUCINATION_GUARD | language mismatch — model responded in wrong language, retrying")
                 if _used_model:
@@ -513,9 +555,9 @@ async def run_agentic_loop(
             # Strip the labels from the response and inject a kb_search call
             # so the user at least gets a partial real answer.
             import re as _re
-            _anchor_pattern = r'(?:thought-anchor|thought-node|knowledge-node):[a-zA-Z0-9_:.-]+'
+            _anchor_pattern = _ANCHOR_PATTERN
             _anchor_matches = _re.findall(_anchor_pattern, final_text)
-            if _anchor_matches and _guard_retries < 2:
+            if _anchor_matches and not _streamed and _guard_retries < 2:
                 _guard_retries += 1
                 logger.warning(
                     "HALLUCINATION_GUARD | thought-anchor labels in response (%d matches: %s) — "
@@ -547,7 +589,8 @@ async def run_agentic_loop(
                 continue  # retry with kb_search data injected
 
             # If still has anchor labels after retry — strip them from final text
-            if _anchor_matches:
+            # (a streamed answer is already on screen as is)
+            if _anchor_matches and not _streamed:
                 final_text = _re.sub(
                     r'\s*[-–—]\s*zdroj:\s*' + _anchor_pattern + r'(?:,\s*' + _anchor_pattern + r')*',
                     '', final_text,
@@ -556,6 +599,19 @@ async def run_agentic_loop(
                 final_text = _re.sub(r'\n\s*\n\s*\n', '\n\n', final_text)  # clean up blank lines
                 logger.info("HALLUCINATION_GUARD | stripped %d anchor labels from final response", len(_anchor_matches))
 
+            answer_meta = {
+                **({"used_tools": ",".join(used_tools)} if used_tools else {}),
+                **({"created_tasks": ",".join(str(t.get("title", "")) for t in created_tasks)} if created_tasks else {}),
+                **({"responded_tasks": ",".join(responded_tasks)} if responded_tasks else {}),
+                **({"summarized": "true", "original_length": str(msg_len)} if is_summarized else {}),
+                **({"contextTaskId": request.context_task_id} if request.context_task_id else {}),
+                **source_tracker.build_metadata(),
+            }
+            # Save to DB BEFORE streaming so messages survive window switch —
+            # a live-streamed answer right after its last token, before the
+            # fact-check/topic calls (their metadata is added afterwards)
+            answer_id = await _save_msg(final_text, answer_meta) if _streamed else None
+
             # Fact-check + topic tracking — parallel
             fc_result, topics = await asyncio.gather(
                 run_fact_check(final_text, effective_client_id, effective_project_id,
@@ -564,23 +620,15 @@ async def run_agentic_loop(
             )
             await update_conversation_topics(request.session_id, topics)
 
-            # Save to DB BEFORE streaming so messages survive window switch
-            await _save_msg(
-                final_text,
-                {
-                    **({"used_tools": ",".join(used_tools)} if used_tools else {}),
-                    **({"created_tasks": ",".join(str(t.get("title", "")) for t in created_tasks)} if created_tasks else {}),
-                    **({"responded_tasks": ",".join(responded_tasks)} if responded_tasks else {}),
-                    **({"summarized": "true", "original_length": str(msg_len)} if is_summarized else {}),
-                    **({"contextTaskId": request.context_task_id} if request.context_task_id else {}),
-                    **fact_check_metadata(fc_result),
-                    **topic_metadata(topics),
-                    **source_tracker.build_metadata(),
-                },
-            )
+            check_meta = {**fact_check_metadata(fc_result), **topic_metadata(topics)}
+            if answer_id:
+                await update_assistant_metadata(request.session_id, answer_id, check_meta)
+            else:
+                await _save_msg(final_text, {**answer_meta, **check_meta})
 
-            async for event in stream_text(final_text):
-                yield event
+            if not _streamed:
+                async for event in stream_text(final_text):
+                    yield event
 
             # Extract coding_agent_task_id for inline log streaming in UI bubble
             _ca_tid = next((t["coding_agent_task_id"] for t in created_tasks if "coding_agent_task_id" in t), None)
@@ -634,20 +682,37 @@ async def run_agentic_loop(
                     "7. Respond in the SAME LANGUAGE as the user's message."
                 ),
             })
-            break_response = await call_llm(
+            break_stream = LlmTokenStream(
                 messages=messages,
                 capability=route_capability,
                 client_id=effective_client_id,
+                gate=_min_answer_gate,
             )
-            raw_text = break_response.choices[0].message.content or ""
+            try:
+                async for event in break_stream:
+                    yield event
+            finally:
+                await _save_interrupted_stream(break_stream)
+            raw_text = break_stream.response.choices[0].message.content or ""
 
             # Strip any raw XML tool_call tags that FREE models sometimes generate in text
             import re as _re
             final_text = _re.sub(r'<tool_call>.*?</tool_call>', '', raw_text, flags=_re.DOTALL).strip()
-            if not final_text or len(final_text) < 10:
+            if break_stream.streamed_text:
+                final_text = break_stream.streamed_text  # already on screen as is
+            elif not final_text or len(final_text) < 10:
                 # Model failed to produce useful response — synthesize from tool results
                 final_text = _synthesize_from_tool_results(tool_summaries, request.message)
 
+            drift_meta = {
+                "drift_break": drift_reason, "used_tools": ",".join(used_tools),
+                **({"contextTaskId": request.context_task_id} if request.context_task_id else {}),
+                **source_tracker.build_metadata(),
+            }
+            # Save to DB BEFORE streaming so messages survive window switch
+            # (a live-streamed answer right after its last token)
+            drift_id = await _save_msg(final_text, drift_meta) if break_stream.streamed_text else None
+
             # Fact-check + topic tracking — parallel
             fc_result, drift_topics = await asyncio.gather(
                 run_fact_check(final_text, effective_client_id, effective_project_id,
@@ -656,17 +721,15 @@ async def run_agentic_loop(
             )
             await update_conversation_topics(request.session_id, drift_topics)
 
-            # Save to DB BEFORE streaming so messages survive window switch
-            await _save_msg(
-                final_text,
-                {"drift_break": drift_reason, "used_tools": ",".join(used_tools),
-                 **({"contextTaskId": request.context_task_id} if request.context_task_id else {}),
-                 **fact_check_metadata(fc_result), **topic_metadata(drift_topics),
-                 **source_tracker.build_metadata()},
-            )
+            check_meta = {**fact_check_metadata(fc_result), **topic_metadata(drift_topics)}
+            if drift_id:
+                await update_assistant_metadata(request.session_id, drift_id, check_meta)
+            else:
+                await _save_msg(final_text, {**drift_meta, **check_meta})
 
-            async for event in stream_text(final_text):
-                yield event
+            if not break_stream.streamed_text:
+                async for event in stream_text(final_text):
+                    yield event
 
             _ca_tid2 = next((t["coding_agent_task_id"] for t in created_tasks if "coding_agent_task_id" in t), None)
             yield ChatStreamEvent(type="done", metadata={
@@ -692,10 +755,50 @@ async def run_agentic_loop(
             })
         messages.append(assistant_msg)
 
-        for tool_call in tool_calls:
+        # Read-only calls start ahead of the serial loop below, one run of
+        # consecutive reads at a time — a mutating call ends the run, so reads
+        # after it still see its effects. The loop awaits the tasks in call
+        # order, so events and tool messages are emitted exactly as before.
+        prefetched: dict[int, asyncio.Task] = {}
+        prefetched_until = 0
+        read_slots = asyncio.Semaphore(max(1, settings.chat_parallel_tool_calls))
+
+        async def _run_read_tool(name: str, args: dict) -> str:
+            async with read_slots:
+                return await execute_chat_tool(
+                    name, args,
+                    effective_client_id, effective_project_id,
+                    group_id=getattr(request, "active_group_id", None),
+                    session_id=request.session_id,
+                )
+
+        def _prefetch_reads(start: int) -> int:
+            """Start the run of read-only calls at `start`; returns where it ends."""
+            started: set[str] = set()
+            end = start
+            while end < len(tool_calls) and tool_calls[end].function.name in READ_ONLY_TOOLS:
+                call = tool_calls[end]
+                args = _parse_tool_arguments(call.function.arguments)
+                key = f"{call.function.name}:{call.function.arguments}"
+                # Malformed args are reported by the loop; duplicates hit the cache there
+                if args is not None and key not in tool_result_cache and key not in started:
+                    started.add(key)
+                    prefetched[end] = asyncio.create_task(_run_read_tool(call.function.name, args))
+                end += 1
+            if len(started) > 1:
+                logger.info("Chat: running %d read-only tool calls concurrently (limit %d)",
+                            len(started), settings.chat_parallel_tool_calls)
+            return end
+
+        for call_index, tool_call in enumerate(tool_calls):
+            if call_index >= prefetched_until and tool_call.function.name in READ_ONLY_TOOLS:
+                prefetched_until = _prefetch_reads(call_index)
+
             # Disconnect check inside tool execution
             if disconnect_event and disconnect_event.is_set():
                 logger.info("Chat: disconnect during tool execution (iter %d)", iteration)
+                for task in prefetched.values():
+                    task.cancel()
                 partial = _build_interrupted_content(tool_summaries)
                 if partial:
                     await _save_msg(partial, {"interrupted": "true"}, compress=False)
@@ -703,14 +806,8 @@ async def run_agentic_loop(
                 return
 
             tool_name = tool_call.function.name
-            try:
-                arguments = json.loads(tool_call.function.arguments)
-                # Some models double-serialize: json.loads returns a string
-                if isinstance(arguments, str):
-                    arguments = json.loads(arguments)
-                if not isinstance(arguments, dict):
-                    arguments = {}
-            except (json.JSONDecodeError, TypeError):
+            arguments = _parse_tool_arguments(tool_call.function.arguments)
+            if arguments is None:
                 logger.warning("Chat: malformed tool arguments for %s: %s",
                                tool_name, tool_call.function.arguments[:200])
                 # Provide error response so assistant message with tool_calls stays valid
@@ -824,12 +921,16 @@ async def run_agentic_loop(
                     )
             else:
                 try:
-                    result = await execute_chat_tool(
-                        tool_name, arguments,
-                        effective_client_id, effective_project_id,
-                        group_id=getattr(request, "active_group_id", None),
-                        session_id=request.session_id,
-                    )
+                    read_task = prefetched.pop(call_index, None)
+                    if read_task is not None:
+                        result = await read_task
+                    else:
+                        result = await execute_chat_tool(
+                            tool_name, arguments,
+                            effective_client_id, effective_project_id,
+                            group_id=getattr(request, "active_group_id", None),
+                            session_id=request.session_id,
+                        )
                 except ApprovalRequiredInterrupt as approval_exc:
                     # Check persistent auto-approvals (global, survives restarts)
                     await _ensure_approvals_loaded()
@@ -1018,17 +1119,33 @@ async def run_agentic_loop(
         ),
     })
     try:
-        final_resp = await call_llm(
+        final_stream = LlmTokenStream(
             messages=messages,
             capability=route_capability,
             client_id=effective_client_id,
+            gate=_min_answer_gate,
         )
-        raw_text = final_resp.choices[0].message.content or ""
+        try:
+            async for event in final_stream:
+                yield event
+        finally:
+            await _save_interrupted_stream(final_stream)
+        raw_text = final_stream.response.choices[0].message.content or ""
         import re as _re
         final_text = _re.sub(r'<tool_call>.*?</tool_call>', '', raw_text, flags=_re.DOTALL).strip()
-        if not final_text or len(final_text) < 10:
+        if final_stream.streamed_text:
+            final_text = final_stream.streamed_text  # already on screen as is
+        elif not final_text or len(final_text) < 10:
             final_text = _synthesize_from_tool_results(tool_summaries, request.message)
 
+        max_iter_meta = {
+            "max_iterations": "true", "used_tools": ",".join(used_tools),
+            **source_tracker.build_metadata(),
+        }
+        # Save to DB BEFORE streaming so messages survive window switch
+        # (a live-streamed answer right after its last token)
+        max_iter_id = await _save_msg(final_text, max_iter_meta) if final_stream.streamed_text else None
+
         # EPIC 14-S1 + EPIC 9-S1: Fact-check + topic detection in parallel
         fc_result, max_iter_topics = await asyncio.gather(
             run_fact_check(final_text, effective_client_id, effective_project_id),
@@ -1036,16 +1153,15 @@ async def run_agentic_loop(
         )
         await update_conversation_topics(request.session_id, max_iter_topics)
 
-        # Save to DB BEFORE streaming so messages survive window switch
-        await _save_msg(
-            final_text,
-            {"max_iterations": "true", "used_tools": ",".join(used_tools),
-             **fact_check_metadata(fc_result), **topic_metadata(max_iter_topics),
-             **source_tracker.build_metadata()},
-        )
+        check_meta = {**fact_check_metadata(fc_result), **topic_metadata(max_iter_topics)}
+        if max_iter_id:
+            await update_assistant_metadata(request.session_id, max_iter_id, check_meta)
+        else:
+            await _save_msg(final_text, {**max_iter_meta, **check_meta})
 
-        async for event in stream_text(final_text):
-            yield event
+        if not final_stream.streamed_text:
+            async for event in stream_text(final_text):
+                yield event
 
         _ca_tid3 = next((t["coding_agent_task_id"] for t in created_tasks if "coding_agent_task_id" in t), None)
         yield ChatStreamEvent(type="done", metadata={
@@ -1069,6 +1185,18 @@ async def run_agentic_loop(
         )
 
 
+def _parse_tool_arguments(raw: str) -> dict | None:
+    """Decode tool-call arguments; None when they are not valid JSON."""
+    try:
+        arguments = json.loads(raw)
+        # Some models double-serialize: json.loads returns a string
+        if isinstance(arguments, str):
+            arguments = json.loads(arguments)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return arguments if isinstance(arguments, dict) else {}
+
+
 def _build_interrupted_content(tool_summaries: list[str]) -> str | None:
     """Build partial content for interrupted chat (stop/disconnect)."""
     if not tool_summaries:
@@ -1079,6 +1207,12 @@ def _build_interrupted_content(tool_summaries: list[str]) -> str | None:
     )
 
 
+def _min_answer_gate(text: str) -> bool | None:
+    """Stream gate for forced final answers — shorter than 10 chars they are
+    replaced by `_synthesize_from_tool_results`, so hold them until then."""
+    return True if len(text.strip()) >= 10 else None
+
+
 def _synthesize_from_tool_results(tool_summaries: list[str], original_question: str) -> str:
     """Synthesize a response from tool results when LLM fails to produce one.
 
@@ -2,12 +2,14 @@
 
 `call_llm` is a thin wrapper over `llm_provider.completion()`, which itself
 forwards to the router's `/api/chat`. Cloud model retry on failure lives
-inside the router — not here.
+inside the router — not here. `LlmTokenStream` is the streaming variant:
+router deltas go out as `token` events as soon as they are safe to show.
 """
 from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Callable
 
 from bson import ObjectId
 
@@ -54,6 +56,134 @@ async def stream_text(text: str):
     yield ChatStreamEvent(type="token", content=text)
 
 
+_TOOL_CALL_TAG = "<tool_call"
+
+
+class LlmTokenStream:
+    """`call_llm` that forwards the answer as `token` events while it is generated.
+
+    Usage::
+
+        stream = LlmTokenStream(messages, tools=tools, gate=...)
+        try:
+            async for event in stream:
+                yield event
+        finally:
+            if stream.interrupted:          # cut off mid-answer
+                await save(stream.streamed_text)
+        response = stream.response          # same shape as call_llm()
+        if not stream.streamed_text:        # nothing was forwarded
+            async for event in stream_text(final_text): ...
+
+    Kotlin builds the FINAL message from the streamed tokens, so text is
+    only forwarded once it is known to be the answer:
+
+    - `gate(text_so_far)` decides when forwarding may start — None keeps
+      holding, True starts, False never forwards for this call. Without a
+      gate, forwarding starts with the first non-blank text. A tool call
+      (fragment or inline `<tool_call` tag) before the decision means a
+      tool-call iteration: nothing is forwarded.
+    - Nothing is forwarded once a tool-call fragment arrives, and text from
+      an inline `<tool_call` tag on is held back.
+
+    `streamed_text` is what the client has received (kept current while
+    streaming); callers save and fact-check that, not a re-cleaned version,
+    when it is non-empty. There is no event to retract streamed text, so
+    when `tool_call_after_stream` is set the streamed text is the answer
+    and the tool calls must not run.
+    """
+
+    def __init__(
+        self,
+        messages: list[dict],
+        *,
+        tools: list[dict] | None = None,
+        max_tokens: int = settings.default_output_tokens,
+        temperature: float = 0.1,
+        capability: str = "chat",
+        client_id: str | None = None,
+        gate: Callable[[str], bool | None] | None = None,
+    ):
+        self._stream = llm_provider.completion_stream(
+            messages=messages,
+            capability=capability,
+            tools=tools,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            client_id=client_id,
+        )
+        self._gate = gate or (lambda text: True if text.strip() else None)
+        self._forwarded: list[str] = []
+        self.response = None
+        self.tool_call_after_stream = False
+
+    @property
+    def ttft_s(self) -> float | None:
+        return self._stream.ttft_s
+
+    @property
+    def streamed_text(self) -> str:
+        """Text forwarded to the client so far."""
+        if len(self._forwarded) > 1:
+            self._forwarded[:] = ["".join(self._forwarded)]
+        return self._forwarded[0] if self._forwarded else ""
+
+    @property
+    def interrupted(self) -> bool:
+        """Text was forwarded but the call did not finish (disconnect, error)."""
+        return self.response is None and bool(self._forwarded)
+
+    async def __aiter__(self):
+        decision: bool | None = None
+        blocked = False
+        held = ""  # received but not forwarded — everything until the gate decides
+        async for delta in self._stream:
+            if delta.tool_call:
+                blocked = True
+                if self._forwarded:
+                    self.tool_call_after_stream = True
+            if blocked or not delta.content or decision is False:
+                continue
+            held += delta.content
+            if decision is None:
+                if _TOOL_CALL_TAG in held:
+                    decision = False  # tool-call iteration
+                    continue
+                decision = self._gate(held)
+                if decision is not True:
+                    continue
+            end = _forwardable_end(held)
+            blocked = held.startswith(_TOOL_CALL_TAG, end)
+            if end:
+                self._forwarded.append(held[:end])
+                yield ChatStreamEvent(type="token", content=held[:end])
+                held = held[end:]
+            if blocked and self._forwarded:
+                self.tool_call_after_stream = True
+        if decision is True and not blocked and held:
+            # A held-back trailing "<" that never became a tool-call tag.
+            self._forwarded.append(held)
+            yield ChatStreamEvent(type="token", content=held)
+        self.response = self._stream.response
+        if self.tool_call_after_stream:
+            logger.warning(
+                "LLM_STREAM | %d chars streamed before a tool call arrived — keeping them as the answer",
+                len(self.streamed_text),
+            )
+
+
+def _forwardable_end(text: str) -> int:
+    """End of the prefix that cannot be (the start of) an inline tool call."""
+    tag = text.find(_TOOL_CALL_TAG)
+    if tag >= 0:
+        return tag
+    # Hold back a trailing partial "<tool_c…" until the next delta decides it.
+    tail = text.rfind("<", max(0, len(text) - len(_TOOL_CALL_TAG)))
+    if tail >= 0 and _TOOL_CALL_TAG.startswith(text[tail:]):
+        return tail
+    return len(text)
+
+
 async def save_assistant_message(
     session_id: str,
     content: str,
@@ -62,13 +192,17 @@ async def save_assistant_message(
     client_id: str | None = None,
     project_id: str | None = None,
     group_id: str | None = None,
-) -> None:
-    """Save an assistant message to MongoDB with auto-sequence."""
+) -> str:
+    """Save an assistant message to MongoDB with auto-sequence.
+
+    Returns the message's correlation id (for `update_assistant_metadata`).
+    """
+    correlation_id = str(ObjectId())
     await chat_context_assembler.save_message(
         conversation_id=session_id,
         role="ASSISTANT",
         content=content,
-        correlation_id=str(ObjectId()),
+        correlation_id=correlation_id,
         sequence=await chat_context_assembler.get_next_sequence(session_id),
         metadata=metadata or {},
         client_id=client_id,
@@ -80,3 +214,13 @@ async def save_assistant_message(
             await chat_context_assembler.maybe_compress(session_id)
         except Exception as e:
             logger.warning("Chat compression failed for session=%s: %s", session_id, e)
+    return correlation_id
+
+
+async def update_assistant_metadata(session_id: str, correlation_id: str, metadata: dict) -> None:
+    """Add metadata to a saved assistant message — a live-streamed answer is
+    saved right after its last token, fact-check/topic results come later."""
+    try:
+        await chat_context_assembler.update_message_metadata(session_id, correlation_id, metadata)
+    except Exception as e:
+        logger.warning("Chat metadata update failed for session=%s: %s", session_id, e)
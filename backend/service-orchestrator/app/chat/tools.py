@@ -1376,6 +1376,20 @@ TOOL_DOMAINS: dict[str, str] = {
     "mongo_list_collections": "data", "mongo_get_document": "data",
 }
 
+# Side-effect-free tools — run_agentic_loop may execute several of these
+# concurrently when the model requests them in one turn. Anything not
+# listed here (writes, scope changes, request_tools) runs serially in call order.
+READ_ONLY_TOOLS: frozenset[str] = frozenset({
+    "kb_search", "web_search", "web_fetch",
+    "memory_recall", "get_kb_stats", "get_indexed_items", "list_affairs",
+    "search_tasks", "get_task_status", "list_recent_tasks", "check_task_graph",
+    "list_unclassified_meetings", "get_meeting_transcript", "list_meetings",
+    "get_guidelines", "list_filter_rules", "query_action_log",
+    "finance_summary", "list_invoices", "list_contracts",
+    "check_capacity", "time_summary",
+    *(name for name, domain in TOOL_DOMAINS.items() if domain in ("code", "data")),
+})
+
 # Tool name → tool definition lookup (for intent router)
 _TOOL_BY_NAME: dict[str, dict] = {
     tool["function"]["name"]: tool for tool in CHAT_TOOLS
@@ -140,6 +140,19 @@ class Settings(BaseSettings):
     max_delegation_depth: int = 4
     delegation_timeout: int = 300
 
+    # Ready-set scheduling (DAGExecutor + graph agent dispatch_vertex).
+    # A delegation / vertex starts as soon as its dependencies finish, up to
+    # the global cap; per-agent caps are "name=n,..." (agent_name, or the
+    # vertex type for vertices without one). Unlisted agents get the default;
+    # unlisted vertex types only the global cap.
+    dag_max_concurrent_delegations: int = int(os.getenv("DAG_MAX_CONCURRENT_DELEGATIONS", "4"))
+    graph_max_concurrent_vertices: int = int(os.getenv("GRAPH_MAX_CONCURRENT_VERTICES", "4"))
+    agent_max_concurrent_default: int = int(os.getenv("AGENT_MAX_CONCURRENT_DEFAULT", "2"))
+    agent_max_concurrent: str = os.getenv("AGENT_MAX_CONCURRENT", "coding=1")
+    # dispatch_vertex stops starting new vertices after this long and returns,
+    # so LangGraph checkpoints progress (running vertices are drained first)
+    graph_dispatch_checkpoint_interval_s: float = float(os.getenv("GRAPH_DISPATCH_CHECKPOINT_INTERVAL_S", "300"))
+
     # Token budgets per delegation depth
     token_budget_depth_0: int = 200_000
     token_budget_depth_1: int = 80_000
@@ -164,6 +177,7 @@ class Settings(BaseSettings):
     # Chat handler constants
     chat_max_iterations: int = 200           # Safety ceiling only — actual stop by stagnation/loop detection
     chat_max_iterations_long: int = 200      # Same — no artificial restriction
+    chat_parallel_tool_calls: int = 4        # Max read-only tool calls of one turn running concurrently
     decompose_threshold: int = 8000          # Chars to trigger decomposition (~2k tokens)
     summarize_threshold: int = 16000         # Chars to trigger pre-summarization
     subtopic_max_iterations: int = 3         # Max iterations per sub-topic
@@ -187,6 +201,7 @@ class Settings(BaseSettings):
 
     # Streaming
     stream_chunk_size: int = 40              # Chars per fake-streaming chunk (~10 tokens)
+    stream_holdback_chars: int = 200         # Live answer tokens wait until this prefix passes the hallucination guards
 
     # Guidelines cache
     guidelines_cache_ttl: int = 300          # TTL in seconds for guidelines cache
@@ -205,7 +220,10 @@ class Settings(BaseSettings):
     # Tool execution timeouts (seconds)
     timeout_web_search: float = 15.0
     timeout_kb_search: float = 300.0  # no aggressive timeout — KB handles its own performance
+    kb_prefetch_budget_s: float = 30.0  # Total wait for coding-task KB prefetch; later queries come back empty
     max_tool_result_chars: int = 8000
+    workspace_index_refresh_s: float = 2.0  # Min interval between workspace file-index refreshes (git status)
+    workspace_search_workers: int = 4  # Concurrent grep processes per grep_files call
     tool_execution_timeout: int = 120
 
     # Intent Router (Phase 3 — feature-flagged OFF by default)
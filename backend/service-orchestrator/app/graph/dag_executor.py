@@ -1,9 +1,17 @@
-"""DAG Executor — parallel execution of delegation groups.
+"""DAG Executor — dependency-driven execution of delegations.
 
-Executes an ExecutionPlan by processing parallel groups in order.
-Within each group, delegations run concurrently via asyncio.gather.
-Between groups, execution is sequential (group N must finish before
-group N+1 starts).
+Executes an ExecutionPlan on a ReadySetScheduler: each delegation starts
+as soon as the delegations it depends on have finished (successfully or
+not), instead of waiting for the whole previous parallel group.
+
+Dependencies come from ``plan.dependencies`` when the planner emitted
+``depends_on``; otherwise a delegation depends on every delegation of the
+previous parallel group (the old group ordering). Either way, a slow
+delegation only delays the delegations that actually need its output.
+
+Concurrency is capped globally (``settings.dag_max_concurrent_delegations``)
+and per agent (``settings.agent_max_concurrent`` /
+``settings.agent_max_concurrent_default``).
 
 This module is used by the execute_delegation node when
 ``settings.use_dag_execution`` is enabled.
@@ -13,9 +21,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable
 
 from app.config import settings
+from app.graph.ready_scheduler import ReadySetScheduler, parse_kind_limits
 from app.models import AgentOutput, DelegationMessage, ExecutionPlan
 
 if TYPE_CHECKING:
@@ -24,14 +33,38 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def plan_dependencies(plan: ExecutionPlan) -> dict[str, list[str]]:
+    """delegation_id → delegation_ids that must finish first.
+
+    Only delegations that appear in ``plan.parallel_groups`` are scheduled
+    (all of them, one per group, when the plan has no groups). Unknown IDs
+    in ``plan.dependencies`` are dropped.
+    """
+    groups = plan.parallel_groups or [[d.delegation_id] for d in plan.delegations]
+    scheduled = {did for group in groups for did in group}
+    deps: dict[str, list[str]] = {}
+    previous: list[str] = []
+    for group in groups:
+        for did in group:
+            if did in plan.dependencies:
+                deps[did] = [d for d in plan.dependencies[did] if d in scheduled and d != did]
+            else:
+                deps[did] = list(previous)
+        previous = group
+    return deps
+
+
 class DAGExecutor:
-    """Execute a delegation plan respecting parallel group ordering."""
+    """Execute a delegation plan, starting each delegation once its dependencies finish."""
 
     async def execute_plan(
         self,
         plan: ExecutionPlan,
         state: dict,
         registry: AgentRegistry,
+        *,
+        completed: Iterable[str] = (),
+        on_result: Callable[[str, AgentOutput], Awaitable[None]] | None = None,
     ) -> list[tuple[str, AgentOutput]]:
         """Execute all delegations in the plan.
 
@@ -39,53 +72,79 @@ class DAGExecutor:
             plan: The execution plan with delegations and parallel groups.
             state: The orchestrator state dict.
             registry: The agent registry for looking up agents.
+            completed: Delegation IDs finished in an earlier run (resume) —
+                skipped, and treated as satisfied dependencies.
+            on_result: Awaited with (delegation_id, output) as soon as each
+                delegation finishes, before its dependents start.
 
         Returns:
-            List of (delegation_id, AgentOutput) tuples in execution order.
+            List of (delegation_id, AgentOutput) tuples in completion order.
         """
         delegation_map = {d.delegation_id: d for d in plan.delegations}
+        deps = plan_dependencies(plan)
+        done: set[str] = set(completed)
+        pending = [did for did in deps if did not in done]
+        waiting_on = {did: {d for d in deps[did] if d not in done} for did in pending}
+        dependents: dict[str, list[str]] = {}
+        for did in pending:
+            for dep in waiting_on[did]:
+                dependents.setdefault(dep, []).append(did)
         results: list[tuple[str, AgentOutput]] = []
 
-        for group_idx, group_ids in enumerate(plan.parallel_groups):
-            logger.info(
-                "DAGExecutor: executing group %d/%d (%d delegations)",
-                group_idx + 1, len(plan.parallel_groups), len(group_ids),
-            )
-
-            if len(group_ids) == 1:
-                # Single delegation — no need for gather
-                did = group_ids[0]
-                output = await self._execute_one(
-                    did, delegation_map, registry, state,
+        def agent_of(did: str) -> str:
+            msg = delegation_map.get(did)
+            return msg.agent_name if msg else "unknown"
+
+        async def finished(did: str, output: object) -> list[str]:
+            if not isinstance(output, AgentOutput):
+                logger.error("DAGExecutor: delegation %s raised: %s", did, output)
+                output = AgentOutput(
+                    delegation_id=did,
+                    agent_name=agent_of(did),
+                    success=False,
+                    result=f"Exception: {output}",
+                    confidence=0.0,
                 )
-                results.append((did, output))
-            else:
-                # Parallel execution
-                coros = [
-                    self._execute_one(did, delegation_map, registry, state)
-                    for did in group_ids
-                ]
-                outputs = await asyncio.gather(*coros, return_exceptions=True)
-
-                for did, output_or_exc in zip(group_ids, outputs):
-                    if isinstance(output_or_exc, Exception):
-                        logger.error(
-                            "DAGExecutor: delegation %s raised: %s",
-                            did, output_or_exc,
-                        )
-                        output = AgentOutput(
-                            delegation_id=did,
-                            agent_name=delegation_map.get(did, DelegationMessage(
-                                delegation_id=did, agent_name="unknown",
-                                task_summary="",
-                            )).agent_name,
-                            success=False,
-                            result=f"Exception: {output_or_exc}",
-                            confidence=0.0,
-                        )
-                    else:
-                        output = output_or_exc
-                    results.append((did, output))
+            done.add(did)
+            results.append((did, output))
+            if on_result is not None:
+                await on_result(did, output)
+            unlocked = []
+            for child in dependents.get(did, []):
+                waiting_on[child].discard(did)
+                if not waiting_on[child]:
+                    unlocked.append(child)
+            return unlocked
+
+        scheduler: ReadySetScheduler[str] = ReadySetScheduler(
+            max_concurrency=settings.dag_max_concurrent_delegations,
+            kind_limits=parse_kind_limits(settings.agent_max_concurrent),
+            default_kind_limit=settings.agent_max_concurrent_default,
+            name="DAGExecutor",
+        )
+        logger.info(
+            "DAGExecutor: %d delegations (%d already completed), %d ready",
+            len(deps), len(deps) - len(pending),
+            sum(1 for did in pending if not waiting_on[did]),
+        )
+        await scheduler.run(
+            [did for did in pending if not waiting_on[did]],
+            lambda did: self._execute_one(did, delegation_map, registry, state),
+            finished,
+            kind=agent_of,
+        )
+
+        # Cyclic explicit dependencies never become ready — report them.
+        for did in pending:
+            if did not in done:
+                output = AgentOutput(
+                    delegation_id=did,
+                    agent_name=agent_of(did),
+                    success=False,
+                    result="Dependencies never completed (cycle in plan).",
+                    confidence=0.0,
+                )
+                await finished(did, output)
 
         return results
 
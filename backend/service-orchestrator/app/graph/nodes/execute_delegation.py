@@ -1,8 +1,10 @@
 """Execute Delegation node — dispatches DelegationMessages to agents.
 
 Iterates through the ExecutionPlan's parallel groups, dispatching
-delegations to agents via the AgentRegistry. Reports progress to
-the Kotlin server after each delegation completes.
+delegations to agents via the AgentRegistry — or, with
+``settings.use_dag_execution``, hands the plan to the DAGExecutor, which
+starts each delegation as soon as its dependencies finish. Reports
+progress to the Kotlin server after each delegation completes.
 """
 
 from __future__ import annotations
@@ -15,6 +17,7 @@ from app.agents.registry import AgentRegistry
 from app.config import settings
 from app.context.summarizer import summarize_agent_output, summarize_for_session
 from app.context.session_memory import session_memory_store
+from app.graph.dag_executor import dag_executor
 from app.models import (
     AgentOutput,
     CodingTask,
@@ -66,75 +69,80 @@ async def execute_delegation(state: dict) -> dict:
     total_delegations = len(plan.delegations)
     completed_count = len(completed)
 
-    # --- Execute parallel groups sequentially ---
-    for group_idx, group_ids in enumerate(plan.parallel_groups):
-        # Filter out already-completed delegations (for resume support)
-        pending_ids = [did for did in group_ids if did not in completed]
-        if not pending_ids:
-            continue
+    async def _record(did: str, output: AgentOutput) -> None:
+        nonlocal completed_count
+        ds = delegation_states.get(did)
+        if ds:
+            ds.status = (
+                DelegationStatus.COMPLETED if output.success
+                else DelegationStatus.FAILED
+            )
+            ds.result_summary = output.result or ""
+            delegation_states[did] = ds
+
+        delegation_results[did] = summarize_agent_output(output)
+        completed.append(did)
+        completed_count += 1
+        all_artifacts.extend(output.artifacts)
+        all_changed_files.extend(output.changed_files)
+
+        # Save to session memory
+        try:
+            await session_memory_store.append(
+                client_id=task.client_id,
+                project_id=task.project_id,
+                entry=SessionEntry(
+                    timestamp=str(int(time.time())),
+                    source="orchestrator_decision",
+                    summary=summarize_for_session(output),
+                    task_id=task.id,
+                ),
+            )
+        except Exception as e:
+            logger.debug("Session memory write skipped: %s", e)
 
         await _report(
             task,
-            f"Executing group {group_idx + 1}/{len(plan.parallel_groups)} "
-            f"({len(pending_ids)} delegation(s))",
+            f"✓ {output.agent_name}: {'success' if output.success else 'failed'} "
+            f"({completed_count}/{total_delegations})",
             _calc_percent(completed_count, total_delegations),
         )
 
-        if settings.use_dag_execution and len(pending_ids) > 1:
-            # Parallel execution within group
-            results = await _execute_parallel(
-                pending_ids, delegation_map, delegation_states,
-                registry, state, task,
-            )
-        else:
-            # Sequential execution
-            results = []
-            for did in pending_ids:
-                result = await _execute_single(
-                    did, delegation_map, delegation_states,
-                    registry, state, task,
-                )
-                results.append(result)
-
-        # Process results
-        for did, output in results:
-            ds = delegation_states.get(did)
-            if ds:
-                ds.status = (
-                    DelegationStatus.COMPLETED if output.success
-                    else DelegationStatus.FAILED
-                )
-                ds.result_summary = output.result or ""
-                delegation_states[did] = ds
-
-            delegation_results[did] = summarize_agent_output(output)
-            completed.append(did)
-            completed_count += 1
-            all_artifacts.extend(output.artifacts)
-            all_changed_files.extend(output.changed_files)
-
-            # Save to session memory
-            try:
-                await session_memory_store.append(
-                    client_id=task.client_id,
-                    project_id=task.project_id,
-                    entry=SessionEntry(
-                        timestamp=str(int(time.time())),
-                        source="orchestrator_decision",
-                        summary=summarize_for_session(output),
-                        task_id=task.id,
-                    ),
-                )
-            except Exception as e:
-                logger.debug("Session memory write skipped: %s", e)
+    if settings.use_dag_execution:
+        # Dependency-driven: each delegation starts as soon as the ones it
+        # depends on finish (DAGExecutor); results are recorded as they land.
+        await _report(
+            task,
+            f"Executing {total_delegations - completed_count} delegation(s)",
+            _calc_percent(completed_count, total_delegations),
+        )
+        await dag_executor.execute_plan(
+            plan, state, registry,
+            completed=list(completed),
+            on_result=_record,
+        )
+    else:
+        # --- Execute parallel groups sequentially, one delegation at a time ---
+        for group_idx, group_ids in enumerate(plan.parallel_groups):
+            # Filter out already-completed delegations (for resume support)
+            pending_ids = [did for did in group_ids if did not in completed]
+            if not pending_ids:
+                continue
 
             await _report(
                 task,
-                f"✓ {output.agent_name}: {'success' if output.success else 'failed'} "
-                f"({completed_count}/{total_delegations})",
+                f"Executing group {group_idx + 1}/{len(plan.parallel_groups)} "
+                f"({len(pending_ids)} delegation(s))",
                 _calc_percent(completed_count, total_delegations),
             )
 
+            for did in pending_ids:
+                did, output = await _execute_single(
+                    did, delegation_map, delegation_states,
+                    registry, state, task,
+                )
+                await _record(did, output)
+
     return {
         "delegation_states": {
             k: v.model_dump() if hasattr(v, "model_dump") else v
@@ -224,22 +232,6 @@ async def _execute_single(
     return delegation_id, output
 
 
-async def _execute_parallel(
-    delegation_ids: list[str],
-    delegation_map: dict[str, DelegationMessage],
-    delegation_states: dict[str, DelegationState],
-    registry: AgentRegistry,
-    state: dict,
-    task: CodingTask,
-) -> list[tuple[str, AgentOutput]]:
-    """Execute multiple delegations concurrently."""
-    coros = [
-        _execute_single(did, delegation_map, delegation_states, registry, state, task)
-        for did in delegation_ids
-    ]
-    return await asyncio.gather(*coros, return_exceptions=False)
-
-
 def _calc_percent(completed: int, total: int) -> int:
     """Calculate progress percentage (40-90 range for execution phase)."""
     if total == 0:
@@ -151,6 +151,23 @@ async def plan_delegations(state: dict) -> dict:
         # Default: all sequential (each delegation in its own group)
         parallel_groups = [[d.delegation_id] for d in delegations]
 
+    # Optional per-delegation "depends_on" (indices) → finer-grained DAG:
+    # a delegation with it starts as soon as those finish (DAGExecutor).
+    # An empty (or all-invalid) list counts as "not given" — the delegation
+    # keeps its parallel_groups position instead of starting immediately.
+    dependencies: dict[str, list[str]] = {}
+    for i, d in enumerate(plan_data.get("delegations", [])):
+        raw_deps = d.get("depends_on")
+        if not isinstance(raw_deps, list):
+            continue
+        deps = [
+            delegations[idx].delegation_id
+            for idx in raw_deps
+            if isinstance(idx, int) and 0 <= idx < len(delegations) and idx != i
+        ]
+        if deps:
+            dependencies[delegations[i].delegation_id] = deps
+
     detected_domain = plan_data.get("domain", "code")
     try:
         domain = DomainType(detected_domain)
@@ -160,6 +177,7 @@ async def plan_delegations(state: dict) -> dict:
     plan = ExecutionPlan(
         delegations=delegations,
         parallel_groups=parallel_groups,
+        dependencies=dependencies,
         domain=domain,
     )
 
@@ -222,7 +240,8 @@ Respond with a JSON object:
       "task": "<what this agent should do>",
       "context": "<relevant context to pass>",
       "constraints": ["<constraint>"],
-      "expected_output": "<what we expect back>"
+      "expected_output": "<what we expect back>",
+      "depends_on": [<optional — indices of delegations whose output this one needs; omit if none>]
     }}
   ],
   "parallel_groups": [[0], [1, 2], [3]]
@@ -232,6 +251,9 @@ Rules:
 - parallel_groups contains lists of delegation indices that can run concurrently
 - Groups execute sequentially: group[0] finishes before group[1] starts
 - Within a group, delegations run in parallel
+- depends_on (optional) lists exactly the delegations this one needs; it then
+  starts as soon as those finish instead of waiting for the whole previous group.
+  Omit it when the delegation needs no specific earlier output
 - Use the minimum number of agents needed
 - Prefer specific agents over the legacy fallback
 - If the task is simple advice, use just one "research" or "legacy" agent"""
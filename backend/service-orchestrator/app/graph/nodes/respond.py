@@ -21,10 +21,11 @@ import uuid
 from langgraph.types import interrupt
 
 from app.chat.context import chat_context_assembler
-from app.config import settings, estimate_tokens
+from app.config import settings
 from app.models import CodingTask
 from app.graph.nodes._helpers import llm_with_cloud_fallback, is_error_message, detect_tool_loop
 from app.llm.provider import TIER_CONFIG, llm_provider
+from app.llm.token_count import TokenLedger, tools_tokens as count_tools_tokens
 from app.tools.definitions import ALL_RESPOND_TOOLS_FULL
 from app.tools.executor import execute_tool, AskUserInterrupt, ApprovalRequiredInterrupt, _TOOL_EXECUTION_TIMEOUT_S
 from app.tools.kotlin_client import kotlin_client
@@ -212,13 +213,14 @@ async def respond(state: dict) -> dict:
     tool_call_history: list[tuple[str, str]] = []  # (name, args_json) for loop detection
     state_updates: dict = {}  # Accumulated state changes from tools
     tool_loop_break = False
+    token_ledger = TokenLedger()
     while iteration < _MAX_TOOL_ITERATIONS:
         iteration += 1
         logger.info("Respond: iteration %d/%d", iteration, _MAX_TOOL_ITERATIONS)
 
         # Estimate context tokens
-        message_tokens = sum(estimate_tokens(str(m)) for m in messages)
-        tools_tokens = sum(estimate_tokens(str(t)) for t in respond_tools)
+        message_tokens = token_ledger.sync(messages)
+        tools_tokens = count_tools_tokens(respond_tools)
         estimated_tokens = message_tokens + tools_tokens + settings.default_output_tokens
         logger.debug("Respond: messages=%d tokens, tools=%d tokens, output=%d tokens, total=%d tokens",
                      message_tokens, tools_tokens, settings.default_output_tokens, estimated_tokens)
@@ -394,7 +396,7 @@ async def respond(state: dict) -> dict:
         "role": "system",
         "content": "Poskytni finální odpověď na základě shromážděných informací. Nevolej další nástroje."
     }]
-    final_tokens = sum(estimate_tokens(str(m)) for m in final_messages) + settings.default_output_tokens
+    final_tokens = token_ledger.estimate(final_messages)
 
     # W-12: Try real-time streaming first for forced final answer
     answer = await _stream_answer_realtime(state, final_messages, final_tokens)
@@ -0,0 +1,162 @@
+"""Ready-set scheduler — start work as soon as its dependencies finish.
+
+Superstep scheduling (collect everything ready → asyncio.gather → repeat)
+makes every wave wait for its slowest member: one 10-minute coding vertex
+holds back a research branch that became runnable after 20 seconds.
+`ReadySetScheduler` instead keeps a queue of ready keys and a set of
+running tasks; whenever any task finishes, `on_done` is called right away
+and returns the keys it unlocked, which start immediately if the caps
+allow.
+
+Caps:
+  - global     at most `max_concurrency` tasks in flight,
+  - per kind   `kind(key)` (agent name / vertex type) is limited to
+               `kind_limits[kind]`, or `default_kind_limit` when unlisted.
+
+A key held back by its kind cap does not block keys of other kinds queued
+behind it. `on_done` runs on the event loop between task completions, so
+callers can mutate shared state there without locks.
+
+Used by `DAGExecutor.execute_plan` (delegations) and the graph agent's
+`node_dispatch_vertex` (AgentGraph vertices).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+
+def parse_kind_limits(spec: str) -> dict[str, int]:
+    """Parse ``"coding=1,research=4"`` into ``{"coding": 1, "research": 4}``.
+
+    Malformed entries are logged and skipped; limits below 1 become 1.
+    """
+    limits: dict[str, int] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, value = part.partition("=")
+        try:
+            if not sep or not name.strip():
+                raise ValueError(part)
+            limits[name.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning("ReadySetScheduler: ignoring malformed kind limit %r", part)
+    return limits
+
+
+class ReadySetScheduler(Generic[K]):
+    """Dependency-driven task scheduler with global and per-kind caps."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        kind_limits: dict[str, int] | None = None,
+        default_kind_limit: int | None = None,
+        name: str = "scheduler",
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.kind_limits = dict(kind_limits or {})
+        self.default_kind_limit = default_kind_limit
+        self.name = name
+
+    def _kind_limit(self, kind: str) -> int:
+        limit = self.kind_limits.get(kind, self.default_kind_limit)
+        return self.max_concurrency if limit is None else max(1, limit)
+
+    async def run(
+        self,
+        ready: Iterable[K],
+        start: Callable[[K], Awaitable[object]],
+        on_done: Callable[[K, object], Awaitable[Iterable[K]]],
+        *,
+        kind: Callable[[K], str] = lambda key: "",
+        stop_starting: Callable[[], bool] | None = None,
+    ) -> int:
+        """Run until nothing is running and nothing startable is queued.
+
+        Args:
+            ready: Keys that can start now.
+            start: Coroutine factory for one key.
+            on_done: Called with (key, result) as soon as a task finishes —
+                result is the exception instance if the task raised. Returns
+                keys that became ready. A key may be queued again after it
+                finished (e.g. a decomposed parent resuming).
+            kind: Maps a key to its concurrency class.
+            stop_starting: When it returns True, no further keys are started;
+                running tasks are drained and the queue is left unstarted.
+                Checked only after the first batch (so every call makes
+                progress).
+
+        Returns:
+            Number of tasks that were started.
+        """
+        queue: deque[K] = deque()
+        queued: set[K] = set()
+        running: dict[asyncio.Task, tuple[K, str]] = {}
+        active: set[K] = set()
+        per_kind: dict[str, int] = {}
+        started = 0
+
+        def enqueue(keys: Iterable[K]) -> None:
+            for key in keys:
+                if key not in queued and key not in active:
+                    queue.append(key)
+                    queued.add(key)
+
+        def fill() -> None:
+            nonlocal started
+            if started and stop_starting is not None and stop_starting():
+                return
+            held: list[K] = []
+            while queue and len(running) < self.max_concurrency:
+                key = queue.popleft()
+                k = kind(key)
+                if per_kind.get(k, 0) >= self._kind_limit(k):
+                    held.append(key)
+                    continue
+                queued.discard(key)
+                per_kind[k] = per_kind.get(k, 0) + 1
+                task = asyncio.create_task(start(key))
+                running[task] = (key, k)
+                active.add(key)
+                started += 1
+            queue.extendleft(reversed(held))
+
+        enqueue(ready)
+        fill()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key, k = running.pop(task)
+                    active.discard(key)
+                    per_kind[k] -= 1
+                    if task.cancelled():
+                        result: object = asyncio.CancelledError()
+                    else:
+                        result = task.exception() or task.result()
+                    enqueue(await on_done(key, result))
+                fill()
+        except BaseException:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            raise
+
+        if queue:
+            logger.info(
+                "%s: stopped with %d ready keys not started (started=%d)",
+                self.name, len(queue), started,
+            )
+        return started
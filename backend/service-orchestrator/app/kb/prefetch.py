@@ -8,8 +8,11 @@ Three main functions:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
+import grpc
 
 from app.config import settings, foreground_headers
 
@@ -51,31 +54,46 @@ async def prefetch_kb_context(
     Returns:
         Markdown string with KB context, or empty string if nothing found.
     """
-    from jervis_contracts import kb_client
-
+    caller = "orchestrator.kb.prefetch"
     sections: list[str] = []
 
+    # All lookups are independent — build them up front and issue one
+    # RetrieveBatch call instead of five or six sequential round-trips.
+    queries_to_try = search_queries if search_queries else [task_description]
+    convention_queries = search_queries if search_queries else ["coding conventions style guide rules"]
+    arch_queries = (search_queries if search_queries else ["architecture decisions design patterns"]) if project_id else []
+    file_paths = (files or [])[:3]
+
+    batch: list[dict] = []
+    batch += [
+        dict(query=q, project_id=project_id or "", max_results=5, min_confidence=0.7, expand_graph=True)
+        for q in queries_to_try
+    ]
+    batch += [
+        dict(query=q, project_id="", max_results=3, simple=True)  # Client-level only
+        for q in convention_queries
+    ]
+    batch += [
+        dict(query=q, project_id=project_id, max_results=3, simple=True)
+        for q in arch_queries
+    ]
+    batch += [
+        dict(query=f"file {path} implementation notes", project_id=project_id or "", max_results=2, simple=True)
+        for path in file_paths
+    ]
+    results = await _retrieve_many(caller, client_id, batch)
+    n_task, n_conv, n_arch = len(queries_to_try), len(convention_queries), len(arch_queries)
+    task_batch = results[:n_task]
+    convention_batch = results[n_task:n_task + n_conv]
+    arch_batch = results[n_task + n_conv:n_task + n_conv + n_arch]
+    file_batch = results[n_task + n_conv + n_arch:]
+
     # 1. Relevant knowledge for the task
     task_results: list[dict] = []
-    queries_to_try = search_queries if search_queries else [task_description]
-    for query in queries_to_try:
-        try:
-            results = await kb_client.retrieve(
-                caller="orchestrator.kb.prefetch",
-                query=query,
-                client_id=client_id,
-                project_id=project_id or "",
-                max_results=5,
-                min_confidence=0.7,
-                expand_graph=True,
-                timeout=120.0,
-            )
-        except Exception as _e:
-            logger.debug("KB task query error '%s': %s", query, _e)
-            continue
-        if results:
-            task_results.extend(results)
-            logger.info("KB task query succeeded: '%s' (%d results)", query, len(results))
+    for query, found in zip(queries_to_try, task_batch):
+        if found:
+            task_results.extend(found)
+            logger.info("KB task query succeeded: '%s' (%d results)", query, len(found))
         else:
             logger.debug("KB task query returned no results: '%s'", query)
 
@@ -94,72 +112,28 @@ async def prefetch_kb_context(
             content = (item.get("content", "") or "")[:300]
             sections.append(f"- **{source}**: {content}")
 
-    # 2. Coding conventions for the client
-    convention_queries = search_queries if search_queries else ["coding conventions style guide rules"]
-    for query in convention_queries:
-        try:
-            conventions = await kb_client.retrieve(
-                caller="orchestrator.kb.prefetch",
-                query=query,
-                client_id=client_id,
-                project_id="",  # Client-level only
-                max_results=3,
-                simple=True,
-                timeout=120.0,
-            )
-        except Exception:
-            conventions = []
-        if conventions:
-            if not sections or "Coding Conventions" not in "\n".join(sections):
-                sections.append("\n## Coding Conventions")
-            for item in conventions:
-                sections.append(f"- {(item.get('content', '') or '')[:200]}")
-            break
+    # 2. Coding conventions for the client (first query with results wins)
+    conventions = next((found for found in convention_batch if found), [])
+    if conventions:
+        sections.append("\n## Coding Conventions")
+        for item in conventions:
+            sections.append(f"- {(item.get('content', '') or '')[:200]}")
 
-    # 3. Architecture decisions for the project
-    if project_id:
-        arch_queries = search_queries if search_queries else ["architecture decisions design patterns"]
-        for query in arch_queries:
-            try:
-                arch = await kb_client.retrieve(
-                    caller="orchestrator.kb.prefetch",
-                    query=query,
-                    client_id=client_id,
-                    project_id=project_id,
-                    max_results=3,
-                    simple=True,
-                    timeout=120.0,
-                )
-            except Exception:
-                arch = []
-            if arch:
-                if "\n## Architecture Decisions" not in sections:
-                    sections.append("\n## Architecture Decisions")
-                for item in arch:
-                    sections.append(f"- {(item.get('content', '') or '')[:200]}")
-                break
+    # 3. Architecture decisions for the project (first query with results wins)
+    arch = next((found for found in arch_batch if found), [])
+    if arch:
+        sections.append("\n## Architecture Decisions")
+        for item in arch:
+            sections.append(f"- {(item.get('content', '') or '')[:200]}")
 
     # 4. File-specific knowledge
-    if files:
-        for file_path in files[:3]:
-            try:
-                file_results = await kb_client.retrieve(
-                    caller="orchestrator.kb.prefetch",
-                    query=f"file {file_path} implementation notes",
-                    client_id=client_id,
-                    project_id=project_id or "",
-                    max_results=2,
-                    simple=True,
-                    timeout=120.0,
+    for file_path, file_results in zip(file_paths, file_batch):
+        if file_results:
+            sections.append(f"\n## Notes for `{file_path}`")
+            for item in file_results:
+                sections.append(
+                    f"- {(item.get('content', '') or '')[:200]}"
                 )
-            except Exception:
-                file_results = []
-            if file_results:
-                sections.append(f"\n## Notes for `{file_path}`")
-                for item in file_results:
-                    sections.append(
-                        f"- {(item.get('content', '') or '')[:200]}"
-                    )
 
     context = "\n".join(sections) if sections else ""
     if context:
@@ -171,6 +145,61 @@ async def prefetch_kb_context(
     return context
 
 
+async def _retrieve_many(caller: str, client_id: str, queries: list[dict]) -> list[list[dict]]:
+    """Run independent KB retrievals within `kb_prefetch_budget_s`.
+
+    One RetrieveBatch call (shared embedding batch on the KB side); a KB
+    without that RPC gets the same queries as concurrent unary calls.
+    Queries that fail or miss the budget come back as empty lists.
+    """
+    from jervis_contracts import kb_client
+
+    if not queries:
+        return []
+    budget = settings.kb_prefetch_budget_s
+    start = time.monotonic()
+    try:
+        results, incomplete = await kb_client.retrieve_batch(
+            caller=caller,
+            queries=queries,
+            client_id=client_id,
+            budget_s=budget,
+            timeout=budget + 10.0,  # server answers with partial results at the budget
+        )
+        if incomplete:
+            logger.info("KB pre-fetch: %d/%d queries incomplete within %.0fs budget",
+                        len(incomplete), len(queries), budget)
+        logger.info("KB pre-fetch: %d queries batched in %.2fs", len(queries), time.monotonic() - start)
+        return results
+    except grpc.aio.AioRpcError as e:
+        if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+            logger.warning("KB pre-fetch batch failed: %s", e.code())
+            return [[] for _ in queries]
+    except Exception as e:
+        logger.warning("KB pre-fetch batch failed: %s", e)
+        return [[] for _ in queries]
+
+    # KB pod without RetrieveBatch (rolling deploy) — concurrent unary calls
+    tasks = [
+        asyncio.create_task(kb_client.retrieve(caller=caller, client_id=client_id, timeout=budget, **q))
+        for q in queries
+    ]
+    done, pending = await asyncio.wait(tasks, timeout=budget)
+    for task in pending:
+        task.cancel()
+    results: list[list[dict]] = []
+    for query, task in zip(queries, tasks):
+        if task in done and task.exception() is None:
+            results.append(task.result())
+        else:
+            if task in done:
+                logger.debug("KB query error '%s': %s", query["query"], task.exception())
+            results.append([])
+    if pending:
+        logger.info("KB pre-fetch: %d/%d queries cut by %.0fs budget", len(pending), len(queries), budget)
+    return results
+
+
 async def fetch_project_context(
     client_id: str,
     project_id: str | None,
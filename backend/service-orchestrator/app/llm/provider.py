@@ -5,7 +5,8 @@ rate limiting. The router (service-ollama-router) owns routing, model
 selection, cloud failover, rate limiting, tier resolution. Orchestrator
 dials `RouterInferenceService.Chat` (server-stream) and assembles the
 chunks into a LiteLLM-shape response so existing callers keep working
-unchanged.
+unchanged. `completion_stream()` exposes the same call chunk by chunk for
+callers that forward tokens as they are generated.
 
 See KB agent://claude-code/task-routing-unified-design and
 agent://claude-code/orchestrator-llm-unification-proposal.
@@ -13,6 +14,7 @@ agent://claude-code/orchestrator-llm-unification-proposal.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
@@ -304,48 +306,95 @@ class LlmProvider:
 
         return await _drain_chat(request)
 
+    def completion_stream(
+        self,
+        messages: list[dict],
+        *,
+        capability: str = "chat",
+        client_id: str | None = None,
+        tools: list[dict] | None = None,
+        temperature: float = 0.1,
+        max_tokens: int = 8192,
+    ) -> "ChatStream":
+        """Same request as `completion()`, but hands out router deltas as
+        they arrive. Iterate the returned `ChatStream`; its `.response`
+        holds the assembled `CompletionResponse` afterwards."""
+        ctx = types_pb2.RequestContext(
+            scope=types_pb2.Scope(client_id=client_id or ""),
+            priority=enums_pb2.PRIORITY_FOREGROUND,
+            capability=_CAPABILITY_TO_ENUM.get(capability.lower(), enums_pb2.CAPABILITY_CHAT),
+            intent=capability,
+        )
+        prepare_context(ctx)
+
+        request = inference_pb2.ChatRequest(
+            ctx=ctx,
+            messages=_messages_to_proto(messages),
+            tools=_tools_to_proto(tools),
+            options=inference_pb2.ChatOptions(
+                temperature=temperature,
+                num_predict=max_tokens,
+            ),
+        )
+        return ChatStream(request)
+
 
 async def _drain_chat(request: inference_pb2.ChatRequest) -> CompletionResponse:
     """Stream RouterInferenceService.Chat and assemble a LiteLLM-shape response."""
-    content_parts: list[str] = []
-    thinking_parts: list[str] = []
-    tool_call_slots: list[dict] = []
-    id_to_slot: dict[str, int] = {}
-    model_name = ""
-    prompt_tokens = 0
-    completion_tokens = 0
-    finish_reason = "stop"
-    last_chunk_time = time.monotonic()
-
-    stub = _get_router_stub()
-    async for chunk in stub.Chat(request):
-        now = time.monotonic()
-        if now - last_chunk_time > TOKEN_TIMEOUT_SECONDS:
-            raise TokenTimeoutError(
-                f"No chunk from router for {TOKEN_TIMEOUT_SECONDS}s"
-            )
-        last_chunk_time = now
+    stream = ChatStream(request)
+    async for _ in stream:
+        pass
+    return stream.response
+
+
+@dataclass
+class ChatDelta:
+    """What one router chunk added."""
+    content: str = ""
+    thinking: str = ""
+    tool_call: bool = False     # chunk carried a tool-call fragment
+
+
+class _ChatAssembler:
+    """Folds router chunks into a `CompletionResponse`, one chunk at a time.
 
-        if chunk.model_used and not model_name:
-            model_name = chunk.model_used
+    Tool calls arrive as OpenAI-style fragments (id + name in one chunk,
+    args in later ones); they are merged into slots as they come.
+    """
+
+    def __init__(self) -> None:
+        self.content_parts: list[str] = []
+        self.thinking_parts: list[str] = []
+        self.tool_call_slots: list[dict] = []
+        self._id_to_slot: dict[str, int] = {}
+        self.model_name = ""
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.finish_reason = "stop"
+
+    def feed(self, chunk: inference_pb2.ChatChunk) -> ChatDelta:
+        delta = ChatDelta(content=chunk.content_delta, thinking=chunk.thinking_delta)
+        if chunk.model_used and not self.model_name:
+            self.model_name = chunk.model_used
         if chunk.content_delta:
-            content_parts.append(chunk.content_delta)
+            self.content_parts.append(chunk.content_delta)
         if chunk.thinking_delta:
-            thinking_parts.append(chunk.thinking_delta)
+            self.thinking_parts.append(chunk.thinking_delta)
 
         for idx_in_chunk, tc in enumerate(chunk.tool_calls):
+            delta.tool_call = True
             # OpenAI-style deltas: id+name in one chunk, args in the next.
-            if tc.id and tc.id in id_to_slot:
-                slot = tool_call_slots[id_to_slot[tc.id]]
+            if tc.id and tc.id in self._id_to_slot:
+                slot = self.tool_call_slots[self._id_to_slot[tc.id]]
             elif tc.id:
                 slot = {"id": tc.id, "name": "", "args": {}}
-                id_to_slot[tc.id] = len(tool_call_slots)
-                tool_call_slots.append(slot)
-            elif idx_in_chunk < len(tool_call_slots):
-                slot = tool_call_slots[idx_in_chunk]
+                self._id_to_slot[tc.id] = len(self.tool_call_slots)
+                self.tool_call_slots.append(slot)
+            elif idx_in_chunk < len(self.tool_call_slots):
+                slot = self.tool_call_slots[idx_in_chunk]
             else:
                 slot = {"id": "", "name": "", "args": {}}
-                tool_call_slots.append(slot)
+                self.tool_call_slots.append(slot)
             if tc.name:
                 slot["name"] = tc.name
             if tc.args and tc.args.fields:
@@ -354,47 +403,119 @@ async def _drain_chat(request: inference_pb2.ChatRequest) -> CompletionResponse:
                 slot["args"].update(args_delta)
 
         if chunk.done:
-            prompt_tokens = int(chunk.prompt_tokens) or prompt_tokens
-            completion_tokens = int(chunk.completion_tokens) or completion_tokens
-            finish_reason = chunk.finish_reason or finish_reason
-
-    tool_calls: list[_ToolCall] = []
-    for slot in tool_call_slots:
-        if not slot["name"]:
-            continue
-        tool_calls.append(
-            _ToolCall(
-                id=slot["id"] or "",
-                type="function",
-                function=_FunctionCall(
-                    name=slot["name"],
-                    arguments=json.dumps(slot["args"], ensure_ascii=False),
-                ),
+            self.prompt_tokens = int(chunk.prompt_tokens) or self.prompt_tokens
+            self.completion_tokens = int(chunk.completion_tokens) or self.completion_tokens
+            self.finish_reason = chunk.finish_reason or self.finish_reason
+        return delta
+
+    def response(self) -> CompletionResponse:
+        tool_calls: list[_ToolCall] = []
+        for slot in self.tool_call_slots:
+            if not slot["name"]:
+                continue
+            tool_calls.append(
+                _ToolCall(
+                    id=slot["id"] or "",
+                    type="function",
+                    function=_FunctionCall(
+                        name=slot["name"],
+                        arguments=json.dumps(slot["args"], ensure_ascii=False),
+                    ),
+                )
             )
-        )
 
-    full_content = "".join(content_parts) if content_parts else None
-    full_thinking = "".join(thinking_parts) if thinking_parts else None
-    return CompletionResponse(
-        choices=[
-            _Choice(
-                index=0,
-                message=_Message(
-                    role="assistant",
-                    content=full_content,
-                    tool_calls=tool_calls or None,
-                    thinking=full_thinking,
+        full_content = "".join(self.content_parts) if self.content_parts else None
+        full_thinking = "".join(self.thinking_parts) if self.thinking_parts else None
+        return CompletionResponse(
+            choices=[
+                _Choice(
+                    index=0,
+                    message=_Message(
+                        role="assistant",
+                        content=full_content,
+                        tool_calls=tool_calls or None,
+                        thinking=full_thinking,
+                    ),
+                    finish_reason=self.finish_reason,
                 ),
-                finish_reason=finish_reason,
+            ],
+            usage=_Usage(
+                prompt_tokens=self.prompt_tokens,
+                completion_tokens=self.completion_tokens,
+                total_tokens=self.prompt_tokens + self.completion_tokens,
             ),
-        ],
-        usage=_Usage(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            total_tokens=prompt_tokens + completion_tokens,
-        ),
-        model=model_name,
-    )
+            model=self.model_name,
+        )
+
+
+class ChatStream:
+    """One RouterInferenceService.Chat call, iterated chunk by chunk.
+
+    `async for delta in stream` yields a `ChatDelta` per router chunk the
+    moment it arrives; after the loop `stream.response` is the assembled
+    `CompletionResponse`. Aborts with `TokenTimeoutError` when no chunk
+    arrives within TOKEN_TIMEOUT_SECONDS.
+
+    Timing (logged as one LLM_STREAM line per call, kind=answer|tool_calls):
+      ttft_s   request → first content delta (None if the model only
+               returned tool calls)
+      total_s  request → last chunk
+    """
+
+    def __init__(self, request: inference_pb2.ChatRequest):
+        self._request = request
+        self._assembler = _ChatAssembler()
+        self.response: CompletionResponse | None = None
+        self.ttft_s: float | None = None
+        self.total_s: float = 0.0
+        self._content = ""
+        self._content_parts = 0
+
+    @property
+    def content(self) -> str:
+        """Content received so far (joined only when new parts arrived)."""
+        parts = self._assembler.content_parts
+        if self._content_parts != len(parts):
+            self._content += "".join(parts[self._content_parts:])
+            self._content_parts = len(parts)
+        return self._content
+
+    async def __aiter__(self):
+        start = time.monotonic()
+        call = _get_router_stub().Chat(self._request)
+        chunks = call.__aiter__()
+        finished = False
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), TOKEN_TIMEOUT_SECONDS)
+                except StopAsyncIteration:
+                    finished = True
+                    break
+                except asyncio.TimeoutError:
+                    raise TokenTimeoutError(
+                        f"No chunk from router for {TOKEN_TIMEOUT_SECONDS}s"
+                    ) from None
+                delta = self._assembler.feed(chunk)
+                if delta.content and self.ttft_s is None:
+                    self.ttft_s = time.monotonic() - start
+                yield delta
+        finally:
+            if not finished:
+                # Consumer stopped early, errored or timed out — free the router slot.
+                call.cancel()
+        self.total_s = time.monotonic() - start
+        self.response = self._assembler.response()
+        tool_calls = self.response.choices[0].message.tool_calls or []
+        logger.info(
+            "LLM_STREAM | model=%s | kind=%s | ttft_ms=%s | total_ms=%d | chars=%d | tool_calls=%d",
+            self.response.model or "?",
+            "tool_calls" if tool_calls else "answer",
+            f"{self.ttft_s * 1000:.0f}" if self.ttft_s is not None else "-",
+            self.total_s * 1000,
+            sum(len(p) for p in self._assembler.content_parts),
+            len(tool_calls),
+        )
 
 
 llm_provider = LlmProvider()
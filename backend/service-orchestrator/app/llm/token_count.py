@@ -0,0 +1,103 @@
+"""Memoized token counts for LLM payloads.
+
+`estimate_tokens` (tiktoken) is accurate but not free, and the agentic
+loops used to re-tokenize every message and the full tool schema list on
+every iteration just to pick a routing tier. This module counts each
+distinct piece of text once:
+
+- `count_tokens(text)`  — estimate_tokens memoized by content hash
+                          (bounded LRU, keeps no references to the text)
+- `tools_tokens(tools)` — per tool-schema set (keyed by tool names)
+- `TokenLedger`         — running total of a message list; only appended
+                          or replaced messages are counted, so a loop
+                          iteration costs O(new messages)
+
+Chat history messages additionally carry a stored `tokenCount`
+(see ChatContextAssembler.save_message), so context assembly does not
+tokenize them at all.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from app.config import estimate_tokens, settings
+
+_MEMO_MAX_ENTRIES = 4096
+_memo: OrderedDict[tuple[int, int], int] = OrderedDict()
+_tool_set_memo: dict[tuple[str, ...], int] = {}
+
+
+def count_tokens(text: str) -> int:
+    """estimate_tokens() memoized by (length, hash) of the text."""
+    key = (len(text), hash(text))
+    tokens = _memo.get(key)
+    if tokens is not None:
+        _memo.move_to_end(key)
+        return tokens
+    tokens = estimate_tokens(text)
+    _memo[key] = tokens
+    if len(_memo) > _MEMO_MAX_ENTRIES:
+        _memo.popitem(last=False)
+    return tokens
+
+
+def message_tokens(message: dict) -> int:
+    """Token estimate for one chat-completions message (content + structure)."""
+    return count_tokens(str(message))
+
+
+def tools_tokens(tools: list[dict]) -> int:
+    """Token estimate for a tool schema list, computed once per set of names."""
+    if not tools:
+        return 0
+    key = tuple(t.get("function", {}).get("name", "") for t in tools)
+    tokens = _tool_set_memo.get(key)
+    if tokens is None:
+        tokens = sum(count_tokens(str(t)) for t in tools)
+        if len(_tool_set_memo) >= _MEMO_MAX_ENTRIES:
+            _tool_set_memo.clear()
+        _tool_set_memo[key] = tokens
+    return tokens
+
+
+class TokenLedger:
+    """Incremental token total of an append-mostly message list.
+
+    `sync(messages)` compares the list against what was counted last time
+    by identity (message dict and its content object): the unchanged
+    prefix is kept, everything after the first difference is recounted.
+    Appending costs one count per new message; compacting or replacing a
+    message in place recounts from that position.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[dict, object, int]] = []
+        self._total = 0
+
+    def sync(self, messages: list[dict]) -> int:
+        """Bring the ledger in line with `messages`; returns their token total."""
+        keep = 0
+        for (msg, content, _), current in zip(self._entries, messages):
+            if current is not msg or current.get("content") is not content:
+                break
+            keep += 1
+        for _, _, tokens in self._entries[keep:]:
+            self._total -= tokens
+        del self._entries[keep:]
+        for msg in messages[keep:]:
+            tokens = message_tokens(msg)
+            self._entries.append((msg, msg.get("content"), tokens))
+            self._total += tokens
+        return self._total
+
+    def estimate(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        output_tokens: int | None = None,
+    ) -> int:
+        """Messages + tool schemas + output reserve — the routing estimate."""
+        if output_tokens is None:
+            output_tokens = settings.default_output_tokens
+        return self.sync(messages) + tools_tokens(tools or []) + output_tokens
@@ -372,6 +372,9 @@ class ExecutionPlan(BaseModel):
 
     delegations: list[DelegationMessage] = Field(default_factory=list)
     parallel_groups: list[list[str]] = Field(default_factory=list)
+    # delegation_id → delegation_ids it needs. Delegations listed here start
+    # as soon as those finish; the rest wait for the previous parallel group.
+    dependencies: dict[str, list[str]] = Field(default_factory=dict)
     domain: DomainType = DomainType.CODE
 
 
@@ -722,6 +722,11 @@ TOOL_READ_FILE: dict = {
                     "description": "Maximum number of lines to read (default: 1000)",
                     "default": 1000,
                 },
+                "start_line": {
+                    "type": "integer",
+                    "description": "First line to read, 1-based (default: 1) — use with max_lines to page through large files",
+                    "default": 1,
+                },
             },
             "required": ["file_path"],
         },
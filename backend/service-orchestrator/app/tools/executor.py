@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 import httpx
 
 from app.config import settings, foreground_headers
+from app.tools.workspace_index import BinaryFileError, SearchTimeout, get_workspace_index
 
 logger = logging.getLogger(__name__)
 
@@ -322,6 +323,7 @@ async def execute_tool(
             result = await _execute_read_file(
                 file_path=arguments.get("file_path", ""),
                 max_lines=arguments.get("max_lines", 1000),
+                start_line=arguments.get("start_line", 1),
                 client_id=client_id,
                 project_id=project_id,
             )
@@ -2352,8 +2354,9 @@ async def _execute_read_file(
     max_lines: int,
     client_id: str,
     project_id: str | None,
+    start_line: int = 1,
 ) -> str:
-    """Read file contents from workspace."""
+    """Read file contents from workspace (seeks to start_line, reads max_lines)."""
     workspace = await _get_workspace_path(client_id, project_id)
     if not workspace:
         return "Error: Workspace for this project is not cloned yet. \n\nTry one of these alternatives that read from the Knowledge Base (no clone needed):\n- get_recent_commits(limit=10) — latest commits with hash, author, message, date\n- get_repository_info() — repo overview with branches\n- git_branch_list() — all branches\n- get_repository_structure() — file tree structure\n- get_technology_stack() — detected languages/frameworks\n\nOr call init_workspace(project_id=\"<id>\") to trigger async clone (takes ~30s-5min for large repos), then retry this tool."
@@ -2378,22 +2381,24 @@ async def _execute_read_file(
         if size_bytes > 10 * 1024 * 1024:  # 10MB limit
             return f"Error: File too large ({size_bytes / (1024 * 1024):.1f}MB). Max 10MB."
 
-        # Try to read as text
+        # Try to read as text — only the requested line range is loaded
         try:
-            content = full_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+            chunk = await get_workspace_index(workspace).read_lines(file_path, start_line, max_lines)
+        except BinaryFileError:
             return f"Error: Binary file cannot be displayed: {file_path}"
 
-        lines = content.split("\n")
-        total_lines = len(lines)
+        total_lines = chunk.total
+        if chunk.start > total_lines:
+            return f"Error: start_line {start_line} is past the end of {file_path} ({total_lines} lines)"
 
-        if total_lines > max_lines:
-            content = "\n".join(lines[:max_lines])
-            truncated_msg = f"\n\n... (truncated, showing {max_lines}/{total_lines} lines)"
-        else:
+        if chunk.start == 1 and chunk.end == total_lines:
             truncated_msg = ""
+        elif chunk.start == 1:
+            truncated_msg = f"\n\n... (truncated, showing {chunk.end}/{total_lines} lines)"
+        else:
+            truncated_msg = f"\n\n... (showing lines {chunk.start}-{chunk.end} of {total_lines})"
 
-        return f"## File: {file_path} ({total_lines} lines)\n\n```\n{content}{truncated_msg}\n```"
+        return f"## File: {file_path} ({total_lines} lines)\n\n```\n{chunk.text}{truncated_msg}\n```"
     except Exception as e:
         return f"Error: Failed to read file: {str(e)[:200]}"
 
@@ -2422,24 +2427,8 @@ async def _execute_find_files(
         if not base_path.exists():
             return f"Error: Path not found: {path}"
 
-        # Use glob to find files
-        matches = []
-        if "**" in pattern:
-            # Recursive glob
-            for match in base_path.glob(pattern):
-                if match.is_file():
-                    rel_path = match.relative_to(workspace)
-                    matches.append(str(rel_path))
-                    if len(matches) >= max_results:
-                        break
-        else:
-            # Non-recursive glob
-            for match in base_path.glob(pattern):
-                if match.is_file():
-                    rel_path = match.relative_to(workspace)
-                    matches.append(str(rel_path))
-                    if len(matches) >= max_results:
-                        break
+        # Glob over the workspace file index (git-tracked + untracked, not ignored)
+        matches = await get_workspace_index(workspace).find(pattern, path, max_results)
 
         if not matches:
             return f"No files found matching pattern: {pattern}"
@@ -2468,47 +2457,20 @@ async def _execute_grep_files(
         return "Error: pattern required."
 
     try:
-        # Use grep command for efficient search
-        cmd = ["grep", "-r", "-n"]  # recursive, line numbers
-
-        # Add context lines
-        if context_lines > 0:
-            cmd.extend(["-C", str(context_lines)])
-
-        # Add file pattern
-        if file_pattern != "*":
-            cmd.extend(["--include", file_pattern])
-
-        cmd.extend([pattern, "."])
-
-        result = subprocess.run(
-            cmd,
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=30,
+        # grep worker pool over the workspace file index — stops at max_results
+        lines, limit_reached = await get_workspace_index(workspace).grep(
+            pattern, file_pattern, max_results, context_lines, timeout=30.0,
         )
-
-        # grep returns 1 if no matches, which is not an error
-        if result.returncode not in (0, 1):
-            return f"Error: grep failed: {result.stderr}"
-
-        if not result.stdout.strip():
+        if not lines:
             return f"No matches found for pattern: {pattern}"
 
-        lines = result.stdout.strip().split("\n")
-        total_matches = len(lines)
-
-        if total_matches > max_results:
-            lines = lines[:max_results]
-            truncated_msg = f"\n\n... (showing {max_results}/{total_matches} matches)"
-        else:
-            truncated_msg = ""
-
+        truncated_msg = f"\n\n... (showing first {max_results} matches)" if limit_reached else ""
         matches_text = "\n".join(lines)
         return f"## Matches for '{pattern}' in {file_pattern}{truncated_msg}\n\n```\n{matches_text}\n```"
-    except subprocess.TimeoutExpired:
+    except SearchTimeout:
         return "Error: grep timed out after 30s"
+    except RuntimeError as e:
+        return f"Error: grep failed: {e}"
     except Exception as e:
         return f"Error: Failed to search files: {str(e)[:200]}"
 
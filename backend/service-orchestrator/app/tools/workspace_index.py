@@ -0,0 +1,376 @@
+"""Workspace file index + async search for the filesystem tools.
+
+grep_files used to run a blocking `subprocess.run(grep -r ...)` on the
+event loop, find_files walked the tree with Path.glob and read_file slurped
+whole files — one large workspace stalled every concurrent chat on the pod.
+
+`WorkspaceIndex` (one per workspace path, process-wide):
+
+  files        relative paths of tracked + untracked, non-ignored files
+               (HEAD tree + `git status`); non-git directories are walked.
+  refresh      at most every `workspace_index_refresh_s`: same HEAD →
+               apply `git status --porcelain` on top of the HEAD tree,
+               new HEAD → rebuild. Walked directories are rescanned.
+  find         glob over the index (`*`, `?`, `[..]`, `**/`), no disk walk.
+  grep         index chunks searched by a pool of `grep` subprocesses
+               (`workspace_search_workers`); stops and kills the rest as
+               soon as the match limit is reached.
+  read_lines   line-offset table per file (cached by mtime/size), ranged
+               reads seek straight to the first requested line.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import logging
+import os
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_GREP_CHUNK_FILES = 200          # files per grep subprocess
+_LINE_TABLE_CACHE_SIZE = 64      # files with a cached line-offset table
+_BINARY_SNIFF_BYTES = 8192
+_GREP_LINE_LIMIT = 16 * 1024 * 1024  # stream reader limit — minified files have huge lines
+
+
+@dataclass
+class LineRange:
+    """Result of WorkspaceIndex.read_lines."""
+    text: str            # requested lines joined with "\n"
+    start: int           # first returned line (1-based)
+    end: int             # last returned line (1-based, inclusive)
+    total: int           # total lines in the file (content.split("\n") semantics)
+
+
+class BinaryFileError(ValueError):
+    """read_lines() hit a file that is not UTF-8 text."""
+
+
+class SearchTimeout(TimeoutError):
+    """grep() exceeded its time limit."""
+
+
+def glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a Path.glob-style pattern to a regex over relative POSIX paths."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+async def _run_git(workspace: str, *args: str) -> str | None:
+    """Run git in the workspace; stdout, or None when git fails."""
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=workspace,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await proc.communicate()
+    if proc.returncode != 0:
+        return None
+    return stdout.decode("utf-8", errors="surrogateescape")
+
+
+def _walk_files(workspace: str) -> list[str]:
+    """Regular files below workspace (relative POSIX paths), skipping .git.
+
+    Symlinks are left out like in the git index (a link to a directory or
+    a dangling one makes grep exit 2).
+    """
+    files: list[str] = []
+    for root, dirs, names in os.walk(workspace):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        rel_root = os.path.relpath(root, workspace)
+        for name in names:
+            try:
+                if not stat.S_ISREG(os.lstat(os.path.join(root, name)).st_mode):
+                    continue
+            except OSError:
+                continue
+            rel = name if rel_root == "." else f"{rel_root}/{name}"
+            files.append(rel.replace(os.sep, "/"))
+    return files
+
+
+def _build_line_table(path: str) -> list[int]:
+    """Byte offsets of every line start; raises BinaryFileError on NUL bytes."""
+    offsets = [0]
+    position = 0
+    with open(path, "rb") as f:
+        head = f.read(_BINARY_SNIFF_BYTES)
+        if b"\0" in head:
+            raise BinaryFileError(path)
+        block = head
+        while block:
+            start = 0
+            while (nl := block.find(b"\n", start)) != -1:
+                offsets.append(position + nl + 1)
+                start = nl + 1
+            position += len(block)
+            block = f.read(1 << 20)
+    return offsets
+
+
+class WorkspaceIndex:
+    """File list of one workspace, refreshed incrementally."""
+
+    def __init__(self, workspace: str):
+        self.workspace = workspace
+        self._files: list[str] = []
+        self._head_files: set[str] = set()
+        self._head: str | None = None
+        self._is_git: bool | None = None
+        self._refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+        self._line_tables: OrderedDict[str, tuple[float, int, list[int]]] = OrderedDict()
+        self._line_tables_lock = threading.Lock()  # read_lines runs in to_thread workers
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    async def files(self) -> list[str]:
+        """Current file list (refreshed if older than the refresh interval)."""
+        async with self._lock:
+            if time.monotonic() - self._refreshed_at >= settings.workspace_index_refresh_s:
+                await self._refresh()
+                self._refreshed_at = time.monotonic()
+            return self._files
+
+    async def _refresh(self) -> None:
+        started = time.monotonic()
+        if self._is_git is None:
+            self._is_git = os.path.isdir(os.path.join(self.workspace, ".git"))
+        if not self._is_git:
+            self._files = sorted(await asyncio.to_thread(_walk_files, self.workspace))
+            return
+
+        head = (await _run_git(self.workspace, "rev-parse", "HEAD") or "").strip() or None
+        mode = "status"
+        if head != self._head or not self._head_files:
+            tree = await _run_git(self.workspace, "ls-tree", "-r", "-z", "HEAD") if head else ""
+            if tree is None:
+                # Broken repo — fall back to walking the directory
+                self._is_git = False
+                self._files = sorted(await asyncio.to_thread(_walk_files, self.workspace))
+                return
+            # "<mode> <type> <sha>\t<path>" — regular files only: submodules
+            # (160000) and symlinks (120000) are not grep operands
+            self._head_files = {
+                path for meta, _, path in (entry.partition("\t") for entry in tree.split("\0") if entry)
+                if meta.startswith("100")
+            }
+            self._head = head
+            mode = "rebuild"
+
+        status = await _run_git(
+            self.workspace, "status", "--porcelain", "-z", "--untracked-files=all", "--no-renames",
+        )
+        files = set(self._head_files)
+        for entry in (status or "").split("\0"):
+            if len(entry) < 4:
+                continue
+            code, path = entry[:2], entry[3:]
+            full_path = os.path.join(self.workspace, path)
+            if "D" in code or os.path.islink(full_path) or not os.path.isfile(full_path):
+                files.discard(path)
+            else:
+                files.add(path)
+        self._files = sorted(files)
+        logger.debug(
+            "WORKSPACE_INDEX | %s | mode=%s files=%d took=%.0fms",
+            self.workspace, mode, len(self._files), (time.monotonic() - started) * 1000,
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    async def find(self, pattern: str, path: str = ".", max_results: int = 100) -> list[str]:
+        """Files under `path` matching a glob pattern (relative to `path`)."""
+        prefix = "" if path in ("", ".") else str(PurePosixPath(path)).rstrip("/") + "/"
+        regex = glob_to_regex(pattern)
+        matches: list[str] = []
+        for rel in await self.files():
+            if prefix and not rel.startswith(prefix):
+                continue
+            if regex.match(rel[len(prefix):]):
+                matches.append(rel)
+                if len(matches) >= max_results:
+                    break
+        return matches
+
+    async def grep(
+        self,
+        pattern: str,
+        file_pattern: str = "*",
+        max_results: int = 50,
+        context_lines: int = 0,
+        timeout: float = 30.0,
+    ) -> tuple[list[str], bool]:
+        """grep over indexed files; returns (output lines, limit_reached).
+
+        Chunks are searched concurrently by up to `workspace_search_workers`
+        grep processes. Output keeps index order: as soon as the finished
+        prefix of chunks holds more than `max_results` lines, remaining
+        processes are killed and no new chunks start. One line past the
+        limit is read so limit_reached means the output was really cut.
+        """
+        files = await self.files()
+        if file_pattern != "*":
+            files = [f for f in files if fnmatch.fnmatchcase(f.rsplit("/", 1)[-1], file_pattern)]
+        chunks = [files[i:i + _GREP_CHUNK_FILES] for i in range(0, len(files), _GREP_CHUNK_FILES)]
+        if not chunks:
+            return [], False
+
+        args = ["grep", "-n", "-H", "-s"]  # -s: a file deleted since the refresh is not an error
+        if context_lines > 0:
+            args += ["-C", str(context_lines)]
+        args += ["-e", pattern, "--"]
+
+        wanted = max_results + 1  # one extra line tells truncation from an exact fit
+        slots = asyncio.Semaphore(max(1, settings.workspace_search_workers))
+        procs: set[asyncio.subprocess.Process] = set()
+        stop = asyncio.Event()
+
+        async def search(chunk: list[str]) -> list[str]:
+            async with slots:
+                if stop.is_set():
+                    return []
+                proc = await asyncio.create_subprocess_exec(
+                    *args, *chunk,
+                    cwd=self.workspace,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=_GREP_LINE_LIMIT,
+                )
+                procs.add(proc)
+                if stop.is_set():
+                    proc.kill()
+                lines: list[str] = []
+                try:
+                    assert proc.stdout is not None
+                    async for raw in proc.stdout:
+                        lines.append(raw.decode("utf-8", errors="replace").rstrip("\n"))
+                        if len(lines) >= wanted:
+                            break  # this chunk alone overflows the limit
+                    if len(lines) >= wanted and proc.returncode is None:
+                        proc.kill()
+                    _, stderr = await proc.communicate()
+                    # rc 2 with -s and empty stderr = only unreadable/vanished
+                    # operands; a bad pattern still reports on stderr
+                    error = stderr.decode("utf-8", errors="replace").strip()
+                    if proc.returncode not in (0, 1, -9) and not lines and error:
+                        raise RuntimeError(error[:200])
+                finally:
+                    procs.discard(proc)
+                return lines
+
+        tasks = [asyncio.create_task(search(chunk)) for chunk in chunks]
+        output: list[str] = []
+        limit_reached = False
+        try:
+            async with asyncio.timeout(timeout):
+                for task in tasks:  # consume in index order
+                    output.extend(await task)
+                    if len(output) >= wanted:
+                        limit_reached = True
+                        break
+        except TimeoutError as e:
+            raise SearchTimeout(f"grep timed out after {timeout:.0f}s") from e
+        finally:
+            # Kill running greps and let their tasks drain (cancelling a task
+            # mid-communicate() would leave the child to the watcher)
+            stop.set()
+            for proc in list(procs):
+                if proc.returncode is None:
+                    proc.kill()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return output[:max_results], limit_reached
+
+    async def read_lines(self, rel_path: str, start: int = 1, count: int = 1000) -> LineRange:
+        """Read `count` lines starting at 1-based line `start` without loading the file."""
+        return await asyncio.to_thread(self._read_lines_sync, rel_path, max(1, start), max(0, count))
+
+    def _line_table(self, full_path: str) -> list[int]:
+        st = os.stat(full_path)
+        with self._line_tables_lock:
+            cached = self._line_tables.get(full_path)
+            if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+                self._line_tables.move_to_end(full_path)
+                return cached[2]
+        table = _build_line_table(full_path)  # outside the lock — may read a large file
+        with self._line_tables_lock:
+            self._line_tables[full_path] = (st.st_mtime, st.st_size, table)
+            while len(self._line_tables) > _LINE_TABLE_CACHE_SIZE:
+                self._line_tables.popitem(last=False)
+        return table
+
+    def _read_lines_sync(self, rel_path: str, start: int, count: int) -> LineRange:
+        full_path = os.path.join(self.workspace, rel_path)
+        table = self._line_table(full_path)
+        total = len(table)
+        first = start - 1                             # 0-based
+        last = min(first + count, total)              # exclusive
+        if last <= first:
+            return LineRange(text="", start=start, end=start - 1, total=total)
+        with open(full_path, "rb") as f:
+            f.seek(table[first])
+            if last < total:
+                data = f.read(table[last] - 1 - table[first])  # drop the final "\n"
+            else:
+                data = f.read()
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise BinaryFileError(rel_path) from e
+        return LineRange(text=text, start=first + 1, end=last, total=total)
+
+
+_indexes: dict[str, WorkspaceIndex] = {}
+
+
+def get_workspace_index(workspace: str) -> WorkspaceIndex:
+    """Process-wide index for a workspace path (created on first use)."""
+    key = os.path.realpath(workspace)
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = WorkspaceIndex(key)
+    return index
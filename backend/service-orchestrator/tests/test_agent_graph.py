@@ -0,0 +1,198 @@
+"""Tests for the AgentGraph adjacency index and fork / delta merging.
+
+These tests are unit-level and don't require MongoDB or LLM.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+def _graph_with_fan_in():
+    """c → s next to the root; forks of the root add a second edge into s."""
+    from app.agent.graph import add_edge, add_vertex, create_task_graph
+
+    graph = create_task_graph(task_id="t1", client_id="c1")
+    c = add_vertex(graph, title="child", description="child")
+    s = add_vertex(graph, title="synthesis", description="synthesis")
+    add_edge(graph, c.id, s.id)
+    return graph, c, s
+
+
+# ---------------------------------------------------------------------------
+# Fork isolation
+# ---------------------------------------------------------------------------
+
+class TestForkIndexIsolation:
+    """Edges a fork adds must not leak into the base graph's index (and vice versa)."""
+
+    def _fork_adding_edge(self):
+        from app.agent.graph import add_edge, add_vertex, fork_for_vertex
+
+        graph, c, s = _graph_with_fan_in()
+        graph.incoming_edges(s.id)  # build the base index before forking
+        fork = fork_for_vertex(graph, graph.root_vertex_id)
+        n = add_vertex(fork, title="extension", description="extension")
+        add_edge(fork, n.id, s.id)
+        fork.incoming_edges(s.id)  # the fork's index picks up the new edge
+        return graph, fork, c, s, n
+
+    def test_fork_edges_stay_in_fork(self):
+        graph, fork, c, s, n = self._fork_adding_edge()
+        assert [e.source_id for e in fork.incoming_edges(s.id)] == [c.id, n.id]
+        assert [e.source_id for e in graph.incoming_edges(s.id)] == [c.id]
+        assert graph.outgoing_edges(n.id) == []
+        assert len(graph.edges) == 1
+
+    def test_discarded_fork_does_not_block_synthesis(self):
+        from app.agent.graph import fail_vertex, promote_ready_targets
+        from app.agent.models import VertexStatus
+
+        graph, _fork, c, s, _n = self._fork_adding_edge()
+        fail_vertex(graph, c.id, "boom")
+        assert promote_ready_targets(graph, c.id) == [s.id]
+        assert graph.vertices[s.id].status == VertexStatus.READY
+
+    def test_merged_fork_indexes_edge_once(self):
+        from app.agent.graph import (
+            apply_vertex_delta,
+            collect_vertex_delta,
+            complete_vertex,
+            get_fan_in_count,
+        )
+
+        graph, fork, c, s, n = self._fork_adding_edge()
+        root_id = graph.root_vertex_id
+        complete_vertex(fork, root_id, result="r", result_summary="r")
+        apply_vertex_delta(graph, collect_vertex_delta(graph, fork, root_id))
+        assert get_fan_in_count(graph, s.id) == 2
+        assert [e.source_id for e in graph.incoming_edges(s.id)] == [c.id, n.id]
+        assert n.id in graph.vertices
+
+    def test_base_edges_do_not_leak_into_running_fork(self):
+        from app.agent.graph import add_edge, add_vertex, fork_for_vertex
+
+        graph, c, s = _graph_with_fan_in()
+        fork = fork_for_vertex(graph, graph.root_vertex_id)
+        other = add_vertex(graph, title="other", description="other")
+        add_edge(graph, other.id, s.id)
+        assert [e.source_id for e in graph.incoming_edges(s.id)] == [c.id, other.id]
+        assert [e.source_id for e in fork.incoming_edges(s.id)] == [c.id]
+
+    def test_sibling_forks_are_isolated(self):
+        from app.agent.graph import add_edge, add_vertex, fork_for_vertex
+
+        graph, c, s = _graph_with_fan_in()
+        first = fork_for_vertex(graph, graph.root_vertex_id)
+        second = fork_for_vertex(graph, c.id)
+        n = add_vertex(first, title="extension", description="extension")
+        add_edge(first, n.id, s.id)
+        assert len(second.incoming_edges(s.id)) == 1
+        assert len(graph.incoming_edges(s.id)) == 1
+
+
+# ---------------------------------------------------------------------------
+# Ready-set dispatch with concurrent forks
+# ---------------------------------------------------------------------------
+
+class TestDispatchMergesWhileForkRuns:
+    """A vertex merged while another vertex's fork extends the graph."""
+
+    def test_merge_during_running_extending_fork(self, monkeypatch):
+        import asyncio
+
+        from app.agent import langgraph_runner
+        from app.agent.graph import (
+            add_edge,
+            add_vertex,
+            complete_vertex,
+            create_task_graph,
+            start_vertex,
+        )
+        from app.agent.models import VertexStatus
+
+        # fast (root) and slow both extend the graph with a vertex feeding
+        # `final`, whose incoming list neither fork owns
+        graph = create_task_graph(task_id="t2", client_id="c1")
+        fast_id = graph.root_vertex_id
+        slow = add_vertex(graph, title="slow", description="slow")
+        slow.status = VertexStatus.READY
+        done = add_vertex(graph, title="done", description="done")
+        complete_vertex(graph, done.id, result="done", result_summary="done")
+        final = add_vertex(graph, title="final", description="final")
+        add_edge(graph, done.id, final.id)
+
+        fan_in: dict[str, int] = {}
+
+        async def extend(fork, title):
+            extra = add_vertex(fork, title=title, description=title)
+            add_edge(fork, extra.id, final.id)
+            fork.incoming_edges(final.id)
+
+        async def fake_execute(fork, vertex_id, state):
+            vertex = start_vertex(fork, vertex_id)
+            fan_in[vertex_id] = len(vertex.incoming_context)
+            if vertex_id == fast_id:
+                await extend(fork, "from-fast")
+                await asyncio.sleep(0.01)
+            elif vertex_id == slow.id:
+                # Extends only after the fast vertex has been merged
+                await asyncio.sleep(0.03)
+                await extend(fork, "from-slow")
+                await asyncio.sleep(0.02)
+            elif vertex.title == "from-fast":
+                await asyncio.sleep(0.1)  # keeps `final` waiting until slow merged
+            complete_vertex(fork, vertex_id, result=vertex_id, result_summary=vertex_id)
+            return fork
+
+        monkeypatch.setattr(langgraph_runner, "_execute_single_vertex", fake_execute)
+        state = {
+            "task_graph": langgraph_runner._checkpoint(graph),
+            "ready_vertex_ids": [fast_id, slow.id],
+        }
+        result = asyncio.run(langgraph_runner.node_dispatch_vertex(state))
+        merged = langgraph_runner._load_graph(result["task_graph"])
+
+        assert len(merged.edges) == 3
+        assert len(merged.incoming_edges(final.id)) == 3
+        assert all(v.status == VertexStatus.COMPLETED for v in merged.vertices.values())
+        assert fan_in[final.id] == 3
+
+    def test_vertex_type_fan_out_uses_global_cap(self, monkeypatch):
+        import asyncio
+
+        from app.agent import langgraph_runner
+        from app.agent.graph import add_vertex, complete_vertex, create_task_graph, start_vertex
+        from app.agent.models import VertexStatus
+
+        graph = create_task_graph(task_id="t3", client_id="c1")
+        ready = [graph.root_vertex_id]
+        for i in range(5):
+            child = add_vertex(graph, title=f"child-{i}", description="child")
+            child.status = VertexStatus.READY
+            ready.append(child.id)
+
+        running = 0
+        peak = 0
+
+        async def fake_execute(fork, vertex_id, state):
+            nonlocal running, peak
+            start_vertex(fork, vertex_id)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            complete_vertex(fork, vertex_id, result=vertex_id, result_summary=vertex_id)
+            return fork
+
+        monkeypatch.setattr(langgraph_runner, "_execute_single_vertex", fake_execute)
+        monkeypatch.setattr(langgraph_runner.settings, "graph_max_concurrent_vertices", 4)
+        monkeypatch.setattr(langgraph_runner.settings, "agent_max_concurrent_default", 2)
+        state = {"task_graph": langgraph_runner._checkpoint(graph), "ready_vertex_ids": ready}
+        asyncio.run(langgraph_runner.node_dispatch_vertex(state))
+
+        assert peak == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,171 @@
+"""Micro-benchmark for the rule normalizer — `python -m app.bench_normalizer`.
+
+Builds a realistic rule set (the server's seeded defaults plus a few hundred
+generated client acronyms / replaces / strips, ~330 rules) and times one
+`SpeakStream`-sized input through:
+
+  per-request compile  what every request paid before compiled rule sets:
+                       compile each rule (re cache purged — 600+ patterns
+                       thrash its 512 slots anyway) + apply one by one
+  compile (merged)     one-off cost when a scope's rules change
+  apply (one by one)   precompiled, one regex pass per rule / variant
+  apply (merged)       cached CompiledRuleSet — what a request pays now
+
+and checks that merged and one-by-one output are identical.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import time
+
+from jervis.server import tts_rules_pb2
+
+from app import normalizer
+
+_SAMPLE_TEXT = (
+    "## Stav projektu\n"
+    "- Klient **Commerzbank** (ID 68a33f0c9e1b2a4d5c6e7f80) má otevřené 3 úkoly v BMS.\n"
+    "- API pro SBO vrací chybu 503 od 18. 3. 2026, viz https://jira.example.com/browse/SBO-1234.\n"
+    "Nasazení na GPU serveru proběhlo v pořádku, CPU zátěž je kolem 45,5 procenta. "
+    "Logy najdeš v /var/log/jervis/orchestrator.log a `kubectl logs` ukáže zbytek. "
+    "Faktura s DPH pro IČO 12345678 odešla e-mailem na účtárnu@example.cz – "
+    "„potvrzení“ čekáme do pátku… Mezitím MMB/TUD tým řeší migraci SQL databáze "
+    "a export do PDF; RAM na VD je 64 GB, SSD 2 TB. "
+) * 3
+
+
+def _rule(**kwargs) -> tts_rules_pb2.TtsRule:
+    return tts_rules_pb2.TtsRule(language="any", **kwargs)
+
+
+def _seed_rules() -> list[tts_rules_pb2.TtsRule]:
+    """Mirror of TtsRuleSeeder.defaultRules()."""
+    strip = tts_rules_pb2.STRIP
+    replace = tts_rules_pb2.REPLACE
+    rules = [
+        _rule(type=strip, description="MongoObjectId", pattern=r"\b[0-9a-fA-F]{24}\b", strip_wrapping_parens=True),
+        _rule(
+            type=strip, description="UUID", strip_wrapping_parens=True,
+            pattern=r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b",
+        ),
+        _rule(
+            type=strip, description="Long alphanumeric blob", strip_wrapping_parens=True,
+            pattern=r"\b(?=[A-Za-z0-9]*[A-Za-z])(?=[A-Za-z0-9]*\d)[A-Za-z0-9]{10,}\b",
+        ),
+        _rule(type=strip, description="Markdown heading prefix (#)", pattern=r"^#+\s*"),
+        _rule(type=strip, description="Markdown bullet dash at line start", pattern=r"^\s*-\s+"),
+        _rule(type=replace, description="Markdown bold", pattern=r"\*\*([^*]+)\*\*", replacement="$1"),
+        _rule(type=replace, description="Markdown italic", pattern=r"(?<!\*)\*([^*]+)\*(?!\*)", replacement="$1"),
+        _rule(type=replace, description="Markdown inline code", pattern=r"`([^`]+)`", replacement="$1"),
+        _rule(type=replace, description="URL", pattern=r"https?://\S+", replacement="odkaz"),
+        _rule(type=replace, description="File path (unix)", pattern=r"(?:/[A-Za-z0-9._-]+){2,}", replacement="soubor"),
+        _rule(type=replace, description="Email address", pattern=r"\b[\w.+-]+@[\w-]+\.[\w.-]+\b", replacement="e-mail"),
+        _rule(type=replace, description="Slash word separator", pattern=r"\s*/\s*", replacement=" / "),
+        _rule(type=replace, description="Pipe word separator", pattern=r"\s*\|\s*", replacement=" | "),
+        _rule(type=replace, description="Non-breaking space", pattern=r"[  ]", replacement=" "),
+        _rule(type=replace, description="Non-breaking hyphen", pattern=r"‑", replacement="-"),
+        _rule(type=replace, description="En dash", pattern=r"–", replacement="-"),
+        _rule(type=replace, description="Em dash", pattern=r"—", replacement="-"),
+        _rule(type=replace, description="Horizontal ellipsis", pattern=r"…", replacement="..."),
+        _rule(type=replace, description="Curly quotes", pattern=r"[‘’‚‛′]", replacement="'"),
+        _rule(type=replace, description="Curly double quotes", pattern=r"[“”„‟″]", replacement='"'),
+    ]
+    for acronym, pronunciation, aliases in [
+        ("BMS", "bé-em-es", ["bms", "Bms"]), ("SBO", "es-bé-ó", ["sbo", "Sbo"]), ("VD", "vé-dé", []),
+        ("MMB", "em-em-bé", ["mmb", "Mmb"]), ("ČR", "čé-er", []), ("DPH", "dé-pé-há", []),
+        ("IČO", "í-čé-ó", []), ("DIČ", "dé-í-čé", []), ("TUD", "té-ú-dé", ["tud", "Tud"]),
+        ("API", "ej-pí-aj", []), ("HTTP", "ejč-tí-tí-pí", []), ("URL", "jú-ár-el", []),
+        ("SQL", "es-kvé-el", []), ("JSON", "džej-sn", []), ("GPU", "dží-pí-jú", []),
+        ("CPU", "sí-pí-jú", []), ("PDF", "pí-dý-ef", []), ("AI", "ej-aj", []), ("ML", "em-el", []),
+        ("RAM", "rem", []), ("SSD", "es-es-dé", []),
+    ]:
+        rules.append(tts_rules_pb2.TtsRule(
+            type=tts_rules_pb2.ACRONYM, language="cs", acronym=acronym,
+            pronunciation=pronunciation, aliases=aliases,
+        ))
+    return rules
+
+
+def _generated_rules(rng: random.Random) -> list[tts_rules_pb2.TtsRule]:
+    """Client / project dictionary entries of the kind users add over chat."""
+    letters = string.ascii_uppercase
+    rules: list[tts_rules_pb2.TtsRule] = []
+    acronyms: set[str] = set()
+    while len(acronyms) < 250:
+        acronyms.add("".join(rng.choice(letters) for _ in range(rng.randint(2, 5))))
+    for acronym in sorted(acronyms):
+        pronunciation = "-".join(f"{c.lower()}é" for c in acronym)
+        aliases = [acronym.lower(), acronym.capitalize()] if rng.random() < 0.4 else []
+        rules.append(tts_rules_pb2.TtsRule(
+            type=tts_rules_pb2.ACRONYM, language="cs", acronym=acronym,
+            pronunciation=pronunciation, aliases=aliases,
+        ))
+    for i in range(45):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 9)))
+        rules.append(_rule(
+            type=tts_rules_pb2.REPLACE, description=f"Product name {i}",
+            pattern=rf"\b{word}(?:-v\d+)?\b", replacement=f"produkt {i}",
+        ))
+    for i in range(15):
+        prefix = "".join(rng.choice(letters) for _ in range(3))
+        rules.append(_rule(
+            type=tts_rules_pb2.STRIP, description=f"Ticket key {prefix}",
+            pattern=rf"\b{prefix}-\d+\b", strip_wrapping_parens=True,
+        ))
+    return rules
+
+
+def _per_call_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TTS rule normalizer micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rules = _seed_rules() + _generated_rules(random.Random(args.seed))
+    text = _SAMPLE_TEXT
+
+    def per_request_compile() -> str:
+        re.purge()
+        return normalizer.compile_rules(rules, merge=False).apply(text)
+
+    sequential = normalizer.compile_rules(rules, merge=False)
+    merged = normalizer.compile_rules(rules)
+    if sequential.apply(text) != merged.apply(text):
+        raise SystemExit("merged rule set output differs from one-by-one application")
+
+    def compile_merged() -> normalizer.CompiledRuleSet:
+        re.purge()
+        return normalizer.compile_rules(rules)
+
+    print(f"rules={len(rules)} input_chars={len(text)}")
+    print(f"steps: one-by-one={_step_count(sequential)} merged={_step_count(merged)}")
+    for label, fn, repeat in [
+        ("per-request compile", per_request_compile, max(1, args.repeat // 10)),
+        ("compile (merged)", compile_merged, max(1, args.repeat // 10)),
+        ("apply (one by one)", lambda: sequential.apply(text), args.repeat),
+        ("apply (merged)", lambda: merged.apply(text), args.repeat),
+        ("normalize (merged)", lambda: normalizer.normalize(text, merged), args.repeat),
+    ]:
+        print(f"{label:<22} {_per_call_ms(fn, repeat):8.3f} ms")
+
+
+def _step_count(rule_set: normalizer.CompiledRuleSet) -> int:
+    return len(rule_set.replace_ops) + len(rule_set.strip_ops) + len(rule_set.acronym_ops)
+
+
+if __name__ == "__main__":
+    main()
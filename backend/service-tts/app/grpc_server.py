@@ -106,14 +106,14 @@ class TtsServicer(speak_pb2_grpc.TtsServiceServicer):
             len(text), language, client_id or "-", project_id or "-",
         )
 
-        # 1. Fetch rules, normalize on CPU. Deterministic ~1ms.
-        rules = await rules_client.fetch_rules(
+        # 1. Fetch rules (compiled set cached per scope), normalize on CPU.
+        rules = await rules_client.get_rule_set(
             language=language, client_id=client_id, project_id=project_id,
         )
         lines = normalizer.normalize(text, rules=rules, language=language)
         logger.info(
             "[TTS] NORMALIZE rules=%d input_chars=%d → lines=%d t=%.3fs",
-            len(rules), len(text), len(lines), time.monotonic() - start,
+            rules.rule_count, len(text), len(lines), time.monotonic() - start,
         )
 
         if not lines:
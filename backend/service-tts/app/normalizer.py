@@ -12,10 +12,18 @@ Pipeline (deterministic, in order):
      `max_chars` so XTTS tokenizer (186-char limit) never overflows.
 
 Rules come from the server's `ttsRules` Mongo collection via
-`rules_client.fetch_rules()`. Precedence PROJECT > CLIENT > GLOBAL is
+`rules_client.get_rule_set()`. Precedence PROJECT > CLIENT > GLOBAL is
 already resolved server-side — we apply in the returned order so more
 specific rules win.
 
+`compile_rules()` turns a rule list into a `CompiledRuleSet` once: every
+regex is compiled up front, runs of single-word acronyms collapse into one
+word-token pass with a dict lookup, and runs of literal-character REPLACE
+rules (NBSP, dashes, curly quotes) collapse into one `str.translate` table. Output is identical to
+applying the rules one by one — runs are only merged where a rule can't see
+the output of an earlier rule in the same run. `rules_client.get_rule_set()`
+caches the compiled set per scope.
+
 No LLM anywhere on this path. Deterministic, ~1ms for typical inputs.
 """
 
@@ -23,8 +31,8 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Union
 
 from num2words import num2words
 
@@ -72,42 +80,59 @@ class NormalizedLine:
     lang: str
 
 
+@dataclass
+class CompiledRuleSet:
+    """Rules compiled for repeated use — see `compile_rules()`.
+
+    Each list holds the rule steps of one type in application order;
+    `rule_count` is the number of input rules (for logging).
+    """
+
+    replace_ops: list[Callable[[str], str]] = field(default_factory=list)
+    strip_ops: list[Callable[[str], str]] = field(default_factory=list)
+    acronym_ops: list[Callable[[str], str]] = field(default_factory=list)
+    rule_count: int = 0
+
+    def apply(self, text: str) -> str:
+        # Order matters:
+        # 1) REPLACE first so markdown wrappers (`**text**` → `text`) don't
+        #    leave hollow `****` for STRIP to miss, and unicode punctuation
+        #    (NBSP, em/en dash) normalises to ASCII before anything else
+        #    inspects word boundaries.
+        # 2) STRIP next removes IDs / UUIDs that markdown REPLACE just
+        #    exposed, plus markdown heading / bullet prefixes.
+        # 3) ACRONYM last: acronyms already survive steps 1-2 and get
+        #    spelled out on clean text.
+        for op in self.replace_ops:
+            text = op(text)
+        for op in self.strip_ops:
+            text = op(text)
+        for op in self.acronym_ops:
+            text = op(text)
+        return text
+
+
 def normalize(
     text: str,
-    rules: Iterable[tts_rules_pb2.TtsRule],
+    rules: Union[CompiledRuleSet, Iterable[tts_rules_pb2.TtsRule]],
     language: str = "cs",
     max_chars: int = DEFAULT_MAX_CHARS,
 ) -> list[NormalizedLine]:
     """Run the full pipeline. Returns short lines ready for XTTS.
 
-    `rules` is the ordered output of
-    `ServerTtsRulesService.GetForScope(...)`. We iterate once per rule
-    type (strip first, then replace, then acronym) so their semantics
-    compose cleanly regardless of how the list is ordered server-side.
+    `rules` is a `CompiledRuleSet` or the ordered output of
+    `ServerTtsRulesService.GetForScope(...)` (compiled on the spot). We
+    iterate once per rule type (replace first, then strip, then acronym)
+    so their semantics compose cleanly regardless of how the list is
+    ordered server-side.
     """
     if not text:
         return []
 
-    strip_rules = [r for r in rules if r.type == tts_rules_pb2.STRIP]
-    replace_rules = [r for r in rules if r.type == tts_rules_pb2.REPLACE]
-    acronym_rules = [r for r in rules if r.type == tts_rules_pb2.ACRONYM]
-
-    # Order matters:
-    # 1) REPLACE first so markdown wrappers (`**text**` → `text`) don't
-    #    leave hollow `****` for STRIP to miss, and unicode punctuation
-    #    (NBSP, em/en dash) normalises to ASCII before anything else
-    #    inspects word boundaries.
-    # 2) STRIP next removes IDs / UUIDs that markdown REPLACE just
-    #    exposed, plus markdown heading / bullet prefixes.
-    # 3) ACRONYM last: acronyms already survive steps 1-2 and get
-    #    spelled out on clean text.
-    t = text
-    for r in replace_rules:
-        t = _apply_replace(t, r)
-    for r in strip_rules:
-        t = _apply_strip(t, r)
-    for r in acronym_rules:
-        t = _apply_acronym(t, r)
+    if not isinstance(rules, CompiledRuleSet):
+        rules = compile_rules(rules)
+
+    t = rules.apply(text)
     t = _expand_numbers(t, language)
     # Final safety pass — drop any remaining codepoints outside basic
     # Latin + Czech diacritics. The XTTS Czech tokenizer crashes (CUDA
@@ -119,25 +144,51 @@ def normalize(
     return _split_into_lines(t, language, max_chars)
 
 
-def _apply_strip(text: str, rule: tts_rules_pb2.TtsRule) -> str:
-    if not rule.pattern:
-        return text
-    try:
-        inner = re.compile(rule.pattern)
-    except re.error as e:
-        logger.warning("STRIP rule '%s' has invalid regex: %s", rule.description, e)
-        return text
-    out = text
-    if rule.strip_wrapping_parens:
-        # Remove the entire parenthesized group that contains a match,
-        # even if there's prose between `(` and the match. Typical input:
-        # "klient Commerzbank (ID 68a33…)" → "klient Commerzbank".
-        # `[^()]*?` keeps the match within a single paren depth so we
-        # don't accidentally eat through nested parens.
-        wrapped = re.compile(r"\s*\([^()]*?" + rule.pattern + r"[^()]*?\)\s*")
-        out = wrapped.sub(" ", out)
-    out = inner.sub("", out)
-    return out
+def compile_rules(
+    rules: Iterable[tts_rules_pb2.TtsRule],
+    merge: bool = True,
+) -> CompiledRuleSet:
+    """Compile `rules` once for any number of `normalize()` calls.
+
+    Invalid regexes are logged here and skipped. `merge=False` keeps one
+    step per rule (and per acronym variant) — the reference behaviour the
+    merged runs must reproduce; used by `bench_normalizer`.
+    """
+    rules = list(rules)
+    return CompiledRuleSet(
+        replace_ops=_compile_replace([r for r in rules if r.type == tts_rules_pb2.REPLACE], merge),
+        strip_ops=_compile_strip([r for r in rules if r.type == tts_rules_pb2.STRIP]),
+        acronym_ops=_compile_acronyms([r for r in rules if r.type == tts_rules_pb2.ACRONYM], merge),
+        rule_count=len(rules),
+    )
+
+
+def _compile_strip(rules: list[tts_rules_pb2.TtsRule]) -> list[Callable[[str], str]]:
+    ops: list[Callable[[str], str]] = []
+    for rule in rules:
+        if not rule.pattern:
+            continue
+        try:
+            inner = re.compile(rule.pattern)
+            wrapped = None
+            if rule.strip_wrapping_parens:
+                # Remove the entire parenthesized group that contains a match,
+                # even if there's prose between `(` and the match. Typical input:
+                # "klient Commerzbank (ID 68a33…)" → "klient Commerzbank".
+                # `[^()]*?` keeps the match within a single paren depth so we
+                # don't accidentally eat through nested parens.
+                wrapped = re.compile(r"\s*\([^()]*?" + rule.pattern + r"[^()]*?\)\s*")
+        except re.error as e:
+            logger.warning("STRIP rule '%s' has invalid regex: %s", rule.description, e)
+            continue
+        ops.append(_strip_op(inner, wrapped))
+    return ops
+
+
+def _strip_op(inner: re.Pattern[str], wrapped: re.Pattern[str] | None) -> Callable[[str], str]:
+    if wrapped is None:
+        return lambda text: inner.sub("", text)
+    return lambda text: inner.sub("", wrapped.sub(" ", text))
 
 
 _JVM_BACKREF_RE = re.compile(r"\$(\d+)")
@@ -150,34 +201,150 @@ def _jvm_to_python_backref(replacement: str) -> str:
     return _JVM_BACKREF_RE.sub(r"\\\1", replacement)
 
 
-def _apply_replace(text: str, rule: tts_rules_pb2.TtsRule) -> str:
-    if not rule.pattern or rule.replacement is None:
-        return text
-    try:
-        return re.compile(rule.pattern).sub(_jvm_to_python_backref(rule.replacement), text)
-    except re.error as e:
-        logger.warning("REPLACE rule '%s' has invalid regex: %s", rule.description, e)
-        return text
+# One literal character in regex syntax: `\u2013`, `\x41`, `\|` or a plain
+# non-meta char. A REPLACE pattern that is one of these, or a `[...]` class
+# of them, matches a fixed character set — translatable without regex.
+_LITERAL_CHAR = r"(?:\\u[0-9a-fA-F]{4}|\\x[0-9a-fA-F]{2}|\\[^\w\s]|[^\\\[\]().^$*+?{}|])"
+_LITERAL_CHAR_RE = re.compile(_LITERAL_CHAR)
+_LITERAL_CHAR_SET_RE = re.compile(
+    r"(?:" + _LITERAL_CHAR + r"|\[(?!\^)(?:(?!-)" + _LITERAL_CHAR + r")+\])"
+)
 
 
-def _apply_acronym(text: str, rule: tts_rules_pb2.TtsRule) -> str:
-    if not rule.acronym or not rule.pronunciation:
-        return text
-    variants = [rule.acronym] + list(rule.aliases)
-    # Dedup but preserve order.
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for v in variants:
-        if v and v not in seen:
-            seen.add(v)
-            ordered.append(v)
-    out = text
-    for v in ordered:
-        # `\b` around the variant catches word boundaries. Case-insensitive
-        # so both BMS and bms hit the same rule.
-        pattern = re.compile(r"\b" + re.escape(v) + r"\b", re.IGNORECASE)
-        out = pattern.sub(rule.pronunciation, out)
-    return out
+def _literal_chars(pattern: re.Pattern[str]) -> str | None:
+    """Characters matched by a single-character REPLACE pattern, else None."""
+    source = pattern.pattern
+    if pattern.flags & ~re.UNICODE or not _LITERAL_CHAR_SET_RE.fullmatch(source):
+        return None
+    chars = []
+    for token in _LITERAL_CHAR_RE.findall(source[1:-1] if source.startswith("[") else source):
+        if token[:2] in ("\\u", "\\x"):
+            chars.append(chr(int(token[2:], 16)))
+        elif token.startswith("\\"):
+            chars.append(token[1])
+        else:
+            chars.append(token)
+    if not all(pattern.fullmatch(c) for c in chars):
+        return None
+    return "".join(chars)
+
+
+def _compile_replace(rules: list[tts_rules_pb2.TtsRule], merge: bool) -> list[Callable[[str], str]]:
+    """One step per REPLACE rule, except that consecutive literal-character
+    rules with literal replacements share one `str.translate` table.
+
+    A run is cut before a rule whose characters appear in an earlier
+    replacement of the same run — applied one by one, that rule would
+    rewrite the earlier rule's output; a translate table would not.
+    """
+    ops: list[Callable[[str], str]] = []
+    table: dict[int, str] = {}
+    produced: set[str] = set()
+
+    def flush() -> None:
+        if table:
+            frozen = str.maketrans(dict(table))
+            ops.append(lambda text: text.translate(frozen))
+            table.clear()
+            produced.clear()
+
+    for rule in rules:
+        if not rule.pattern:
+            continue
+        replacement = _jvm_to_python_backref(rule.replacement)
+        try:
+            pattern = re.compile(rule.pattern)
+        except re.error as e:
+            logger.warning("REPLACE rule '%s' has invalid regex: %s", rule.description, e)
+            continue
+        chars = _literal_chars(pattern) if merge and "\\" not in replacement else None
+        if chars is None:
+            flush()
+            ops.append(lambda text, p=pattern, r=replacement: p.sub(r, text))
+            continue
+        if produced.intersection(chars):
+            flush()
+        for c in chars:
+            # First rule wins — later ones never see a char already replaced.
+            table.setdefault(ord(c), replacement)
+        produced.update(replacement)
+    flush()
+    return ops
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _compile_acronyms(rules: list[tts_rules_pb2.TtsRule], merge: bool) -> list[Callable[[str], str]]:
+    """Acronym variants as substitution steps, in rule order.
+
+    Consecutive single-word variants merge into one step: a single `\\w+`
+    pass over the text with a dict lookup per word token. `\\b<variant>\\b`
+    can only match a whole word token, so two such variants never overlap
+    partially, and sequentially the first variant equal to the token
+    (ignoring case) replaces it — which is what the dict keeps. A run is cut
+    before a variant that occurs in an earlier pronunciation of the run
+    (sequentially it would be replaced again).
+
+    Case folding goes through `str.lower()`, which agrees with
+    `re.IGNORECASE` except for a few exotic code points (`ſ`, `ς`, …).
+    A `\\b(?:v1|v2|…)\\b` alternation would keep sre's folding, but with a
+    few hundred variants it costs ~15× more than the token pass.
+    """
+    variants: list[tuple[str, str]] = []
+    for rule in rules:
+        if not rule.acronym or not rule.pronunciation:
+            continue
+        # Dedup but preserve order.
+        seen: set[str] = set()
+        for v in [rule.acronym] + list(rule.aliases):
+            if v and v not in seen:
+                seen.add(v)
+                variants.append((v, rule.pronunciation))
+
+    ops: list[Callable[[str], str]] = []
+    run: list[tuple[str, str]] = []
+    run_words: set[str] = set()
+
+    def flush() -> None:
+        if len(run) == 1:
+            ops.append(_acronym_op(*run[0]))
+        elif run:
+            ops.append(_merged_acronym_op(list(run)))
+        run.clear()
+        run_words.clear()
+
+    for v, pronunciation in variants:
+        mergeable = merge and _WORD_RE.fullmatch(v) is not None and "\\" not in pronunciation
+        if not mergeable:
+            flush()
+            ops.append(_acronym_op(v, pronunciation))
+            continue
+        if v.lower() in run_words:
+            flush()
+        run.append((v, pronunciation))
+        run_words.update(w.lower() for w in _WORD_RE.findall(pronunciation))
+    flush()
+    return ops
+
+
+def _merged_acronym_op(run: list[tuple[str, str]]) -> Callable[[str], str]:
+    by_lower: dict[str, str] = {}
+    for v, pronunciation in run:
+        by_lower.setdefault(v.lower(), pronunciation)
+
+    def pronounce(m: re.Match[str]) -> str:
+        token = m.group(0)
+        return by_lower.get(token.lower(), token)
+
+    return lambda text: _WORD_RE.sub(pronounce, text)
+
+
+def _acronym_op(variant: str, pronunciation: str) -> Callable[[str], str]:
+    # `\b` around the variant catches word boundaries. Case-insensitive
+    # so both BMS and bms hit the same rule.
+    pattern = re.compile(r"\b" + re.escape(variant) + r"\b", re.IGNORECASE)
+    return lambda text: pattern.sub(pronunciation, text)
 
 
 def _expand_numbers(text: str, language: str) -> str:
@@ -0,0 +1,218 @@
+"""Synthesized-PCM cache for repeated phrases.
+
+Jervis says the same short lines over and over — greetings, confirmations,
+status lines, names spelled out by the acronym rules. Each of them used to
+cost a full XTTS pass (~0.5-1.5 s on the P40 before the first PCM byte).
+This cache keeps the int16 PCM of short sentences, keyed by everything
+that changes the audio:
+
+    (model version, speaker fingerprint, language, speed, sentence text)
+
+Two tiers:
+  - memory: LRU bounded by bytes (`TTS_PHRASE_CACHE_MEMORY_MB`),
+  - disk:   entries evicted from memory (and everything still in memory
+            at shutdown) spill to `TTS_PHRASE_CACHE_DIR`, bounded by
+            `TTS_PHRASE_CACHE_DISK_MB`, oldest-used first out. The
+            directory lives on the persistent data mount, so common
+            phrases survive container restarts.
+
+XTTS samples (temperature > 0), so a hit replays one rendition of the
+phrase instead of a fresh one — that is the point.
+
+Thread-safe: the XTTS worker threads call `get` / `put` concurrently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger("tts.phrase_cache")
+
+
+def phrase_key(model_version: str, speaker: str, language: str, speed: float, text: str) -> str:
+    raw = "\0".join((model_version, speaker, language, f"{speed:.3f}", text))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class PhraseCache:
+    """Two-tier (memory LRU → disk) PCM cache. See module docstring."""
+
+    def __init__(self, memory_bytes: int, disk_dir: Path | None, disk_bytes: int):
+        self._memory_budget = memory_bytes
+        self._disk_dir = disk_dir if disk_bytes > 0 else None
+        self._disk_budget = disk_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        # key → file size, in least-recently-used order (rebuilt from mtimes).
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_size = 0
+
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+        if self._disk_dir is not None:
+            self._load_disk_index()
+
+    @property
+    def enabled(self) -> bool:
+        return self._memory_budget > 0
+
+    # ── public API ────────────────────────────────────────────────────
+
+    def get(self, key: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            pcm = self._memory.get(key)
+            if pcm is not None:
+                self._memory.move_to_end(key)
+                self.hits_memory += 1
+                self.bytes_saved += len(pcm)
+                return pcm
+            on_disk = key in self._disk
+        if on_disk:
+            pcm = self._read_disk(key)
+            if pcm is not None:
+                with self._lock:
+                    self.hits_disk += 1
+                    self.bytes_saved += len(pcm)
+                    self._disk.move_to_end(key, last=True)
+                self._store_memory(key, pcm)
+                return pcm
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, pcm: bytes) -> None:
+        if not self.enabled or not pcm or len(pcm) > self._memory_budget:
+            return
+        self._store_memory(key, pcm)
+
+    def flush(self) -> None:
+        """Spill everything still only in memory to disk (shutdown)."""
+        with self._lock:
+            pending = [(k, v) for k, v in self._memory.items() if k not in self._disk]
+        for key, pcm in pending:
+            self._write_disk(key, pcm)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits_memory + self.hits_disk + self.misses
+            return {
+                "hits_memory": self.hits_memory,
+                "hits_disk": self.hits_disk,
+                "misses": self.misses,
+                "hit_rate": (self.hits_memory + self.hits_disk) / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_size,
+            }
+
+    # ── memory tier ───────────────────────────────────────────────────
+
+    def _store_memory(self, key: str, pcm: bytes) -> None:
+        evicted: list[tuple[str, bytes]] = []
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_size -= len(old)
+            self._memory[key] = pcm
+            self._memory_size += len(pcm)
+            while self._memory_size > self._memory_budget and self._memory:
+                k, v = self._memory.popitem(last=False)
+                self._memory_size -= len(v)
+                if k not in self._disk:
+                    evicted.append((k, v))
+        # Disk I/O outside the lock — evicted entries are no longer visible
+        # in memory, a concurrent get() for them is a (harmless) miss.
+        for k, v in evicted:
+            self._write_disk(k, v)
+
+    # ── disk tier ─────────────────────────────────────────────────────
+
+    def _path(self, key: str) -> Path:
+        return self._disk_dir / key[:2] / f"{key}.pcm"
+
+    def _load_disk_index(self) -> None:
+        try:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            entries = []
+            for path in self._disk_dir.glob("*/*.pcm"):
+                st = path.stat()
+                entries.append((st.st_mtime, path.stem, st.st_size))
+        except OSError as e:
+            logger.warning("PHRASE_CACHE: disk tier disabled (%s): %s", self._disk_dir, e)
+            self._disk_dir = None
+            return
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_size += size
+        logger.info(
+            "PHRASE_CACHE: disk tier %s — %d entries, %.1f MB",
+            self._disk_dir, len(self._disk), self._disk_size / 1e6,
+        )
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            pcm = path.read_bytes()
+            os.utime(path)  # LRU order survives restarts
+            return pcm
+        except OSError:
+            with self._lock:
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_size -= size
+            return None
+
+    def _write_disk(self, key: str, pcm: bytes) -> None:
+        if self._disk_dir is None or len(pcm) > self._disk_budget:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(f".tmp{threading.get_ident()}")
+            tmp.write_bytes(pcm)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("PHRASE_CACHE: spill of %s failed: %s", key[:12], e)
+            return
+        stale: list[str] = []
+        with self._lock:
+            if key not in self._disk:
+                self._disk[key] = len(pcm)
+                self._disk_size += len(pcm)
+            while self._disk_size > self._disk_budget and self._disk:
+                k, size = self._disk.popitem(last=False)
+                self._disk_size -= size
+                stale.append(k)
+        for k in stale:
+            try:
+                self._path(k).unlink()
+            except OSError:
+                pass
+
+
+def from_env(data_dir: Path) -> PhraseCache:
+    """Build the process-wide cache from TTS_PHRASE_CACHE_* env vars."""
+    memory_mb = int(os.getenv("TTS_PHRASE_CACHE_MEMORY_MB", "64"))
+    disk_mb = int(os.getenv("TTS_PHRASE_CACHE_DISK_MB", "1024"))
+    disk_dir = Path(os.getenv("TTS_PHRASE_CACHE_DIR", str(data_dir / "phrase-cache")))
+    start = time.monotonic()
+    cache = PhraseCache(memory_mb * 1024 * 1024, disk_dir, disk_mb * 1024 * 1024)
+    logger.info(
+        "PHRASE_CACHE: memory=%d MB disk=%d MB (%s) ready in %.2fs",
+        memory_mb, disk_mb, disk_dir, time.monotonic() - start,
+    )
+    return cache
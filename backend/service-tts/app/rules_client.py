@@ -4,12 +4,22 @@ Called once per `SpeakStream`. Per-request fetch is intentional — rules
 change when the user edits the dictionary over chat, and we want the
 next TTS call to see the update immediately (guideline: simple beats
 clever, 10-20ms of gRPC doesn't matter vs. 2-5s of XTTS synthesis).
+
+What is cached is the compiled form: `get_rule_set()` keeps one
+`CompiledRuleSet` per (language, client, project), keyed by a fingerprint
+of the fetched rule list — the list itself is the etag, so an edit is
+picked up on the next call and an unchanged list costs no `re.compile`.
+`TTS_RULES_CACHE_TTL_S > 0` additionally skips the fetch for that long.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional
 
 import grpc.aio
@@ -17,6 +27,8 @@ import grpc.aio
 from jervis.common import types_pb2
 from jervis.server import tts_rules_pb2, tts_rules_pb2_grpc
 
+from app import normalizer
+
 logger = logging.getLogger("tts.rules_client")
 
 # Kotlin server exposes this service on its pod-to-pod gRPC port. Defaults
@@ -26,6 +38,9 @@ SERVER_GRPC_PORT = int(os.getenv("SERVER_GRPC_PORT", "5501"))
 
 _GRPC_MAX_MSG_BYTES = 16 * 1024 * 1024
 
+RULES_CACHE_TTL_S = float(os.getenv("TTS_RULES_CACHE_TTL_S", "0"))
+_RULE_SET_CACHE_MAX = 256
+
 _channel: Optional[grpc.aio.Channel] = None
 _stub: Optional[tts_rules_pb2_grpc.ServerTtsRulesServiceStub] = None
 
@@ -49,32 +64,68 @@ def _get_stub() -> tts_rules_pb2_grpc.ServerTtsRulesServiceStub:
     return _stub
 
 
-async def fetch_rules(
+@dataclass
+class _ScopeRules:
+    fingerprint: str
+    rule_set: normalizer.CompiledRuleSet
+    fetched_at: float
+
+
+_rule_sets: "OrderedDict[tuple[str, str, str], _ScopeRules]" = OrderedDict()
+
+
+async def get_rule_set(
     language: str,
     client_id: str = "",
     project_id: str = "",
     timeout_s: float = 5.0,
-) -> list[tts_rules_pb2.TtsRule]:
-    """Fetch rules applicable to (language, clientId?, projectId?).
+) -> normalizer.CompiledRuleSet:
+    """Compiled rules for (language, clientId?, projectId?).
 
-    On RPC failure returns an empty list — XTTS will still synthesize
-    the raw input (no crash), just without normalization. Failure is
-    logged so it's visible in Kibana / journald.
+    Recompiles only when the fetched list differs from the cached one. On
+    RPC failure the last good rule set of the scope is reused; with nothing
+    cached it returns an empty rule set — XTTS will still synthesize the
+    raw input (no crash), just without normalization. Failure is logged so
+    it's visible in Kibana / journald.
     """
+    key = (language, client_id, project_id)
+    cached = _rule_sets.get(key)
+    if cached is not None and RULES_CACHE_TTL_S > 0 and time.monotonic() - cached.fetched_at < RULES_CACHE_TTL_S:
+        _rule_sets.move_to_end(key)
+        return cached.rule_set
+
     stub = _get_stub()
-    ctx = types_pb2.RequestContext()
     req = tts_rules_pb2.GetForScopeRequest(
-        ctx=ctx,
+        ctx=types_pb2.RequestContext(),
         language=language,
         client_id=client_id,
         project_id=project_id,
     )
     try:
         resp = await stub.GetForScope(req, timeout=timeout_s)
-        return list(resp.rules)
     except grpc.aio.AioRpcError as e:
         logger.warning(
-            "TTS_RULES_FETCH failed code=%s detail=%s lang=%s client=%s project=%s",
-            e.code(), e.details(), language, client_id or "-", project_id or "-",
+            "TTS_RULES_FETCH failed code=%s detail=%s lang=%s client=%s project=%s cached=%s",
+            e.code(), e.details(), language, client_id or "-", project_id or "-", cached is not None,
         )
-        return []
+        return cached.rule_set if cached is not None else normalizer.CompiledRuleSet()
+
+    fingerprint = hashlib.blake2b(resp.SerializeToString(deterministic=True), digest_size=16).hexdigest()
+    if cached is not None and cached.fingerprint == fingerprint:
+        cached.fetched_at = time.monotonic()
+        _rule_sets.move_to_end(key)
+        return cached.rule_set
+
+    start = time.monotonic()
+    rule_set = normalizer.compile_rules(resp.rules)
+    logger.info(
+        "TTS_RULES_COMPILED rules=%d steps=%d lang=%s client=%s project=%s t=%.1fms",
+        rule_set.rule_count,
+        len(rule_set.replace_ops) + len(rule_set.strip_ops) + len(rule_set.acronym_ops),
+        language, client_id or "-", project_id or "-", (time.monotonic() - start) * 1000,
+    )
+    _rule_sets[key] = _ScopeRules(fingerprint=fingerprint, rule_set=rule_set, fetched_at=time.monotonic())
+    _rule_sets.move_to_end(key)
+    while len(_rule_sets) > _RULE_SET_CACHE_MAX:
+        _rule_sets.popitem(last=False)
+    return rule_set
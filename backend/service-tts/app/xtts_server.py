@@ -4,9 +4,11 @@ Jervis TTS Service — XTTS v2 (Coqui) multilingual voice cloning TTS.
 gRPC-only: consumers dial `jervis.tts.TtsService` on :5501. Runs on the VD
 GPU VM as a systemd unit (see k8s/deploy_xtts_gpu.sh). No HTTP surface.
 Speaker WAVs live under $TTS_DATA_DIR/speakers/ and are picked up at boot
-(env override via TTS_SPEAKER_WAV).
+(env override via TTS_SPEAKER_WAV). Short sentences are served from the
+phrase PCM cache (`phrase_cache.py`) when they were synthesized before.
 """
 import asyncio
+import hashlib
 import io
 import logging
 import os
@@ -21,6 +23,8 @@ from pathlib import Path
 import numpy as np
 import torch
 
+from app import phrase_cache
+
 # ── Configuration ────────────────────────────────────────────────────────
 TTS_DATA_DIR = Path(os.getenv("TTS_DATA_DIR", "/opt/jervis/data/tts"))
 TTS_SPEAKER_WAV = os.getenv("TTS_SPEAKER_WAV", "")  # path to reference voice WAV
@@ -28,6 +32,7 @@ TTS_LANGUAGE = os.getenv("TTS_LANGUAGE", "cs")  # default language
 TTS_MAX_TEXT_LENGTH = int(os.getenv("TTS_MAX_TEXT_LENGTH", "10000"))
 TTS_DEVICE = os.getenv("TTS_DEVICE", "cuda")  # cuda or cpu
 TTS_GRPC_PORT = int(os.getenv("TTS_GRPC_PORT", "5501"))
+TTS_PHRASE_CACHE_MAX_CHARS = int(os.getenv("TTS_PHRASE_CACHE_MAX_CHARS", "80"))  # longer sentences are rarely repeated
 
 logger = logging.getLogger("tts.xtts")
 
@@ -44,6 +49,11 @@ _speaker_embedding = None
 # Multi-speaker cache: speaker_name → (gpt_cond_latent, speaker_embedding)
 _speaker_cache: dict[str, tuple] = {}
 
+# Phrase PCM cache + the parts of its key fixed per process / speaker.
+_phrase_cache: phrase_cache.PhraseCache | None = None
+_model_version = ""
+_speaker_fingerprints: dict[int, tuple[object, str]] = {}  # id(embedding) → (embedding, digest)
+
 
 def _find_speaker_wav() -> str:
     """Find speaker reference WAV file."""
@@ -71,10 +81,11 @@ def _find_speaker_wav() -> str:
 
 def _load_tts():
     """Lazy-load XTTS v2 model and speaker embeddings."""
-    global _tts, _speaker_wav, _gpt_cond_latent, _speaker_embedding
+    global _tts, _speaker_wav, _gpt_cond_latent, _speaker_embedding, _phrase_cache, _model_version
     if _tts is not None:
         return _tts
 
+    from importlib.metadata import PackageNotFoundError, version
     from TTS.api import TTS as CoquiTTS
 
     print(f"[TTS] Loading XTTS v2 model on {TTS_DEVICE}...")
@@ -85,6 +96,12 @@ def _load_tts():
     elapsed = time.monotonic() - start
     print(f"[TTS] XTTS v2 loaded in {elapsed:.1f}s on {TTS_DEVICE}")
 
+    try:
+        _model_version = f"{XTTS_MODEL}@{version('coqui-tts')}"
+    except PackageNotFoundError:
+        _model_version = XTTS_MODEL
+    _phrase_cache = phrase_cache.from_env(TTS_DATA_DIR)
+
     # Pre-compute speaker conditioning for faster inference
     _speaker_wav = _find_speaker_wav()
     if _speaker_wav:
@@ -196,6 +213,32 @@ def _get_speaker(speaker_name: str | None) -> tuple:
     return _gpt_cond_latent, _speaker_embedding
 
 
+def _speaker_fingerprint(speaker: str | None, spk_embedding) -> str:
+    """Phrase-cache key part identifying the voice.
+
+    Hashes the speaker embedding itself rather than the name, so replacing
+    a reference WAV / .pt under the same name doesn't replay the old voice.
+    """
+    if spk_embedding is None:
+        return f"wav:{_speaker_wav}" if _speaker_wav else "xtts-default"
+    cached = _speaker_fingerprints.get(id(spk_embedding))
+    if cached is not None and cached[0] is spk_embedding:
+        return cached[1]
+    values = spk_embedding.detach().cpu().numpy() if isinstance(spk_embedding, torch.Tensor) else np.asarray(spk_embedding)
+    digest = hashlib.blake2b(values.tobytes(), digest_size=12).hexdigest()
+    _speaker_fingerprints[id(spk_embedding)] = (spk_embedding, digest)
+    return digest
+
+
+def _phrase_key(text: str, speed: float, language: str, speaker: str | None, spk_embedding) -> str | None:
+    """Cache key for a sentence, or None when it shouldn't be cached."""
+    if _phrase_cache is None or not _phrase_cache.enabled or len(text) > TTS_PHRASE_CACHE_MAX_CHARS:
+        return None
+    return phrase_cache.phrase_key(
+        _model_version, _speaker_fingerprint(speaker, spk_embedding), language, speed, text,
+    )
+
+
 def _detect_language(text: str) -> str:
     """Simple language detection: if mostly ASCII → English, otherwise Czech."""
     ascii_chars = sum(1 for c in text if ord(c) < 128)
@@ -270,6 +313,12 @@ def _synthesize_chunk(text: str, speed: float, language: str, speaker: str | Non
 
     model = _tts.synthesizer.tts_model
     spk_latent, spk_embedding = _get_speaker(speaker)
+    sample_rate = _tts.synthesizer.output_sample_rate
+
+    cache_key = _phrase_key(text, speed, language, speaker, spk_embedding)
+    cached_pcm = _phrase_cache.get(cache_key) if cache_key else None
+    if cached_pcm is not None:
+        return _pcm_to_wav(cached_pcm, sample_rate)
 
     if spk_latent is not None and spk_embedding is not None:
         # Use pre-computed speaker embedding (faster)
@@ -304,17 +353,21 @@ def _synthesize_chunk(text: str, speed: float, language: str, speaker: str | Non
         wav_array = wav_array.cpu().numpy()
 
     wav_int16 = np.clip(wav_array * 32767, -32768, 32767).astype(np.int16)
+    pcm = wav_int16.tobytes()
+    if cache_key:
+        _phrase_cache.put(cache_key, pcm)
 
-    # Get sample rate from model config
-    sample_rate = _tts.synthesizer.output_sample_rate
+    return _pcm_to_wav(pcm, sample_rate)
 
-    # Wrap in WAV
+
+def _pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """Wrap raw int16 mono PCM in a WAV container."""
     audio_buffer = io.BytesIO()
     with wave.open(audio_buffer, "wb") as wav:
         wav.setframerate(sample_rate)
         wav.setsampwidth(2)  # 16-bit
         wav.setnchannels(1)  # mono
-        wav.writeframes(wav_int16.tobytes())
+        wav.writeframes(pcm)
 
     return audio_buffer.getvalue()
 
@@ -360,10 +413,12 @@ def _synthesize_text(text: str, speed: float = 1.0, language: str = "", speaker:
     return audio_buffer.getvalue()
 
 
-def _run_inference_stream_once(model, text_chunk, language, spk_latent, spk_embedding, speed, chunk_queue):
+def _run_inference_stream_once(model, text_chunk, language, spk_latent, spk_embedding, speed, chunk_queue,
+                               capture: list[bytes] | None = None):
     """One pass of inference_stream with CUDA OOM recovery. Returns the
     number of PCM chunks emitted. Raises on non-OOM failures so the
-    caller can log + report to the client."""
+    caller can log + report to the client. Emitted PCM is also appended
+    to `capture` (phrase cache fill)."""
     chunks_emitted = 0
     try:
         stream_gen = model.inference_stream(
@@ -379,7 +434,10 @@ def _run_inference_stream_once(model, text_chunk, language, spk_latent, spk_embe
                 audio_chunk = audio_chunk.cpu().numpy()
             audio_chunk = audio_chunk.squeeze()
             pcm_int16 = np.clip(audio_chunk * 32767, -32768, 32767).astype(np.int16)
-            chunk_queue.put(("pcm", pcm_int16.tobytes()))
+            pcm = pcm_int16.tobytes()
+            chunk_queue.put(("pcm", pcm))
+            if capture is not None:
+                capture.append(pcm)
             chunks_emitted += 1
     except torch.cuda.OutOfMemoryError:
         # VRAM pressure — another process grabbed memory since XTTS loaded.
@@ -492,6 +550,8 @@ def _stream_inference_from_sentence_queue(
     first_sentence_logged = False
     first_pcm_logged = False
     sentence_index = 0
+    cache_hits = 0
+    cache_bytes = 0
     try:
         if not language:
             language = TTS_LANGUAGE
@@ -546,20 +606,33 @@ def _stream_inference_from_sentence_queue(
                     continue
 
             try:
+                cache_key = _phrase_key(sentence, speed, piece_lang, speaker, spk_embedding)
+                cached_pcm = _phrase_cache.get(cache_key) if cache_key else None
                 # Stream the sentence verbatim. The normalizer prompt tells
                 # the LLM to keep lines under XTTS's ~180 char ceiling —
                 # splitting here again would hide LLM mis-splits.
-                if spk_latent is not None and spk_embedding is not None:
+                if cached_pcm is not None:
+                    # Seen before — replay without touching the GPU.
+                    chunk_queue.put(("pcm", cached_pcm))
+                    total_emitted += 1
+                    cache_hits += 1
+                    cache_bytes += len(cached_pcm)
+                elif spk_latent is not None and spk_embedding is not None:
+                    captured: list[bytes] | None = [] if cache_key else None
                     try:
                         total_emitted += _run_inference_stream_once(
                             model, sentence, piece_lang, spk_latent, spk_embedding,
-                            speed, chunk_queue,
+                            speed, chunk_queue, captured,
                         )
                     except torch.cuda.OutOfMemoryError:
+                        if captured is not None:
+                            captured.clear()
                         total_emitted += _run_inference_stream_once(
                             model, sentence, piece_lang, spk_latent, spk_embedding,
-                            speed, chunk_queue,
+                            speed, chunk_queue, captured,
                         )
+                    if captured:
+                        _phrase_cache.put(cache_key, b"".join(captured))
                 else:
                     wav_data = _synthesize_chunk(sentence, speed, piece_lang, speaker)
                     if wav_data:
@@ -571,7 +644,7 @@ def _stream_inference_from_sentence_queue(
                     print(
                         f"[TTS] WORKER FIRST_PCM t={time.monotonic() - worker_start:.2f}s "
                         f"sentence_synth={time.monotonic() - inf_start:.2f}s "
-                        f"chunks={emitted_now} lang={piece_lang}",
+                        f"chunks={emitted_now} lang={piece_lang} cached={cached_pcm is not None}",
                         flush=True,
                     )
                     first_pcm_logged = True
@@ -579,7 +652,7 @@ def _stream_inference_from_sentence_queue(
                     print(
                         f"[TTS] WORKER SENTENCE #{sentence_index} DONE "
                         f"synth={time.monotonic() - inf_start:.2f}s "
-                        f"chunks={emitted_now} lang={piece_lang}",
+                        f"chunks={emitted_now} lang={piece_lang} cached={cached_pcm is not None}",
                         flush=True,
                     )
             except Exception as e:
@@ -587,6 +660,14 @@ def _stream_inference_from_sentence_queue(
                 chunk_errors.append(err_msg)
                 print(f"[TTS] stream chunk error on '{sentence[:40]}': {err_msg}", flush=True)
 
+        if _phrase_cache is not None and _phrase_cache.enabled:
+            stats = _phrase_cache.stats()
+            print(
+                f"[TTS] PHRASE_CACHE stream_hits={cache_hits}/{sentence_index} stream_bytes_saved={cache_bytes} "
+                f"hit_rate={stats['hit_rate']:.2f} bytes_saved={stats['bytes_saved']} "
+                f"mem={stats['memory_entries']}/{stats['memory_bytes']}B disk={stats['disk_entries']}/{stats['disk_bytes']}B",
+                flush=True,
+            )
         if total_emitted == 0 and chunk_errors:
             chunk_queue.put(("error", f"no audio produced; {len(chunk_errors)} chunk errors: {chunk_errors[0]}"))
         else:
@@ -650,6 +731,8 @@ async def _main() -> None:
     finally:
         logger.info("[TTS] Shutting down gRPC server")
         await grpc_server.stop(grace=5.0)
+        if _phrase_cache is not None:
+            await loop.run_in_executor(None, _phrase_cache.flush)
 
 
 # Entrypoint lives in `app/__main__.py` — running this file directly (or via
@@ -2,7 +2,9 @@
 
 Hosts WhisperService {Transcribe (stream), Health, GpuRelease} on :5501.
 Transcribe bridges the existing REST handler's thread + progress queue
-pattern into gRPC server streaming with fully-typed events.
+pattern into gRPC server streaming with fully-typed events. With
+`stream_segments` every finalized segment is forwarded the moment the
+runner puts it on the queue; progress stays coalesced.
 """
 
 from __future__ import annotations
@@ -52,9 +54,44 @@ def _options_to_dict(options: transcribe_pb2.TranscribeOptions) -> dict:
         "no_speech_threshold": float(options.no_speech_threshold) if options.no_speech_threshold > 0 else 0.6,
         "extraction_ranges": extraction_ranges,
         "diarize": bool(options.diarize),
+        "stream_segments": bool(options.stream_segments),
+        "batched": bool(options.batched),
+        "batch_size": int(options.batch_size) if options.batch_size > 0 else None,
     }
 
 
+class _WakingQueue(queue.Queue):
+    """queue.Queue that wakes the streaming loop on every put.
+
+    The runner thread puts; the event loop waits on `wake` instead of polling,
+    so a streamed segment leaves the server as soon as it is decoded.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, wake: asyncio.Event):
+        super().__init__()
+        self._loop = loop
+        self._wake = wake
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+
+def _drain(progress_queue: queue.Queue) -> tuple[list[dict], dict | None]:
+    """Take everything queued: all segments (in order) + the latest progress."""
+    segments: list[dict] = []
+    latest_progress = None
+    while True:
+        try:
+            item = progress_queue.get_nowait()
+        except queue.Empty:
+            return segments, latest_progress
+        if "segment" in item:
+            segments.append(item["segment"])
+        else:
+            latest_progress = item
+
+
 def _segments_to_proto(segments: list[dict]) -> list[transcribe_pb2.TranscribeSegment]:
     out: list[transcribe_pb2.TranscribeSegment] = []
     for i, seg in enumerate(segments or []):
@@ -68,6 +105,12 @@ def _segments_to_proto(segments: list[dict]) -> list[transcribe_pb2.TranscribeSe
     return out
 
 
+def _segment_event(segment: dict) -> transcribe_pb2.TranscribeEvent:
+    return transcribe_pb2.TranscribeEvent(
+        segment=transcribe_pb2.SegmentEvent(segment=_segments_to_proto([segment])[0]),
+    )
+
+
 def _result_to_event(result: dict) -> transcribe_pb2.TranscribeEvent:
     """Convert the whisper runner's result dict into a typed ResultEvent."""
     speakers = list(result.get("speakers") or [])
@@ -138,19 +181,21 @@ class WhisperServicer(transcribe_pb2_grpc.WhisperServiceServicer):
         task_name = opts.get("task", "transcribe")
         do_diarize = opts.get("diarize", False)
         logger.info(
-            "[%s] Transcription request (gRPC): model=%s task=%s diarize=%s size=%d",
-            request_id, model_name, task_name, do_diarize, len(request.audio),
+            "[%s] Transcription request (gRPC): model=%s task=%s diarize=%s batched=%s stream_segments=%s size=%d",
+            request_id, model_name, task_name, do_diarize, opts["batched"], opts["stream_segments"],
+            len(request.audio),
         )
 
         with wrs._active_lock:
             wrs._active_transcriptions += 1
-        progress_queue: queue.Queue = queue.Queue()
 
         try:
             loop = asyncio.get_event_loop()
             result_container: dict = {}
             error_container: dict = {}
             done_event = asyncio.Event()
+            wake = asyncio.Event()
+            progress_queue: queue.Queue = _WakingQueue(loop, wake)
 
             def run_in_thread():
                 try:
@@ -170,22 +215,21 @@ class WhisperServicer(transcribe_pb2_grpc.WhisperServiceServicer):
                     shutil.rmtree(work_dir, ignore_errors=True)
                     cleanup_done.set()
                     loop.call_soon_threadsafe(done_event.set)
+                    loop.call_soon_threadsafe(wake.set)
 
             loop.run_in_executor(None, run_in_thread)
 
             last_percent = -1.0
             while not done_event.is_set():
                 try:
-                    await asyncio.wait_for(done_event.wait(), timeout=3.0)
+                    await asyncio.wait_for(wake.wait(), timeout=3.0)
                 except asyncio.TimeoutError:
                     pass
+                wake.clear()
 
-                latest_progress = None
-                while True:
-                    try:
-                        latest_progress = progress_queue.get_nowait()
-                    except queue.Empty:
-                        break
+                segments, latest_progress = _drain(progress_queue)
+                for seg in segments:
+                    yield _segment_event(seg)
                 if latest_progress is not None:
                     percent = latest_progress.get("percent", 0)
                     if percent != last_percent:
@@ -199,11 +243,11 @@ class WhisperServicer(transcribe_pb2_grpc.WhisperServiceServicer):
                             ),
                         )
 
-            while True:
-                try:
-                    progress_queue.get_nowait()
-                except queue.Empty:
-                    break
+            # Segments decoded right before the runner finished still go out;
+            # trailing progress is superseded by the result.
+            segments, _ = _drain(progress_queue)
+            for seg in segments:
+                yield _segment_event(seg)
 
             if "error" in error_container:
                 yield transcribe_pb2.TranscribeEvent(
@@ -0,0 +1,101 @@
+"""
+Real-time-factor benchmark for the whisper transcription paths.
+
+Usage (inside the whisper container, same env as the server):
+    python3 whisper_bench.py <audio_path> [--model medium] [--batch-size 8]
+                             [--runs 2] [--language cs] [--modes sequential,batched]
+
+Runs `whisper_rest_server.run_whisper` — the exact code path behind the gRPC
+Transcribe RPC — once per mode and run, with stream_segments on, and prints
+one row per run: mode, audio_s, wall_s, RTF, first_seg_s, segments.
+
+RTF = wall time / audio duration (lower is better, < 1 = faster than real
+time). first_seg_s is the latency until the first streamed segment. The model
+is loaded (and the router asked for the GPU) before timing starts; the first
+run of each mode includes CUDA warm-up, so use --runs 2 for steady state.
+"""
+import argparse
+import queue
+import time
+
+import whisper_rest_server as wrs
+
+
+class _TimingQueue(queue.Queue):
+    """Records when the first streamed segment arrives."""
+
+    def __init__(self):
+        super().__init__()
+        self.first_segment_at: float | None = None
+
+    def put(self, item, block=True, timeout=None):
+        if self.first_segment_at is None and "segment" in item:
+            self.first_segment_at = time.monotonic()
+        super().put(item, block, timeout)
+
+
+def bench(audio_path: str, opts: dict, mode: str, run: int) -> dict:
+    progress_queue = _TimingQueue()
+    started = time.monotonic()
+    result = wrs.run_whisper(audio_path, opts, progress_queue, f"bench-{mode}-{run}")
+    wall_s = time.monotonic() - started
+    audio_s = float(result.get("duration") or 0.0)
+    first_seg_s = (
+        progress_queue.first_segment_at - started
+        if progress_queue.first_segment_at is not None else float("nan")
+    )
+    return {
+        "mode": mode,
+        "run": run,
+        "audio_s": audio_s,
+        "wall_s": wall_s,
+        "rtf": wall_s / audio_s if audio_s > 0 else float("nan"),
+        "first_seg_s": first_seg_s,
+        "segments": len(result.get("segments") or []),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Whisper sequential vs batched RTF benchmark")
+    parser.add_argument("audio_path")
+    parser.add_argument("--model", default=wrs.DEFAULT_MODEL)
+    parser.add_argument("--batch-size", type=int, default=wrs.BATCH_SIZE)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--modes", default="sequential,batched")
+    args = parser.parse_args()
+
+    if wrs.DEVICE == "cuda":
+        wrs._router_notify_gpu()
+    try:
+        wrs.get_model(args.model)
+        rows = []
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            opts = {
+                "model": args.model,
+                "language": args.language,
+                "vad_filter": True,
+                "stream_segments": True,
+                "batched": mode == "batched",
+                "batch_size": args.batch_size,
+            }
+            for run in range(1, args.runs + 1):
+                rows.append(bench(args.audio_path, opts, mode, run))
+    finally:
+        if wrs.DEVICE == "cuda":
+            wrs._router_notify_done()
+
+    print(
+        f"\nmodel={args.model} device={wrs.DEVICE} compute={wrs.COMPUTE_TYPE} batch_size={args.batch_size}",
+        flush=True,
+    )
+    print(f"{'mode':<11} {'run':>3} {'audio_s':>8} {'wall_s':>7} {'RTF':>6} {'first_seg_s':>12} {'segments':>9}")
+    for r in rows:
+        print(
+            f"{r['mode']:<11} {r['run']:>3} {r['audio_s']:>8.1f} {r['wall_s']:>7.1f} "
+            f"{r['rtf']:>6.3f} {r['first_seg_s']:>12.2f} {r['segments']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
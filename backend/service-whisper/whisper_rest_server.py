@@ -20,11 +20,13 @@ Environment variables:
     WHISPER_COMPUTE_TYPE   – CTranslate2 compute type (default: "auto" → int8_float32 on cuda)
     WHISPER_DEFAULT_MODEL  – Model name to use (default: "medium")
     WHISPER_GPU_IDLE_S     – Seconds to keep model loaded after last transcription (default: 60)
+    WHISPER_BATCH_SIZE     – VAD chunks per forward pass in batched mode (default: 8)
     OLLAMA_URL             – Ollama base URL on same GPU (default: "http://localhost:11434")
     OLLAMA_VLM_MODEL       – VLM model name to unload before whisper (default: "qwen3-vl-tool:latest")
     HF_TOKEN               – HuggingFace token for pyannote speaker diarization (optional)
 """
 import asyncio
+import heapq
 import json
 import os
 import queue
@@ -35,6 +37,8 @@ import time
 import traceback
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -58,6 +62,7 @@ if COMPUTE_TYPE == "auto":
 
 DEFAULT_MODEL = os.environ.get("WHISPER_DEFAULT_MODEL", "medium")
 GPU_IDLE_S = int(os.environ.get("WHISPER_GPU_IDLE_S", "60"))
+BATCH_SIZE = int(os.environ.get("WHISPER_BATCH_SIZE", "8"))
 OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_VLM_MODEL = os.environ.get("OLLAMA_VLM_MODEL", "qwen3-vl-tool:latest")
 HF_TOKEN = os.environ.get("HF_TOKEN", "")
@@ -72,6 +77,7 @@ ROUTER_GRPC_PORT = int(os.environ.get("ROUTER_GRPC_PORT", "5501"))
 # Global model cache — lazy loaded, auto-unloaded after idle.
 # ---------------------------------------------------------------------------
 _model_cache: dict = {}
+_batched_cache: dict = {}  # model name → BatchedInferencePipeline (shares the cached model)
 _model_lock = threading.Lock()
 _active_transcriptions = 0
 _active_lock = threading.Lock()
@@ -84,6 +90,12 @@ _gpu_loaded = False  # True when whisper model is in GPU VRAM
 _diarization_pipeline = None
 _diarization_lock = threading.Lock()
 _diarization_available = False
+# Diarization (CPU) overlaps with ASR (GPU) of the same request. One worker:
+# the pyannote pipeline is shared, and CPU diarizations of two meetings would
+# only slow each other down.
+_diarization_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diarize")
+# After an ASR error, how long run_whisper waits for an aborted diarization to stop
+DIARIZATION_ABORT_WAIT_S = float(os.environ.get("WHISPER_DIARIZATION_ABORT_WAIT_S", "30"))
 
 
 def _load_diarization_pipeline():
@@ -211,6 +223,7 @@ def _release_gpu():
         if _model_cache:
             print(f"Unloading whisper model(s) from GPU: {list(_model_cache.keys())}", flush=True)
             _model_cache.clear()
+        _batched_cache.clear()
         # Note: diarization pipeline runs on CPU, keep it loaded
         _gpu_loaded = False
     # Force CUDA memory cleanup
@@ -257,44 +270,55 @@ def get_model(model_name: str):
         return _model_cache[model_name]
 
 
+def get_batched_pipeline(model_name: str):
+    """Batched inference wrapper around the cached WhisperModel.
+
+    BatchedInferencePipeline cuts the audio into VAD speech chunks and decodes
+    `batch_size` of them per forward pass instead of one 30s window at a time
+    — several times the throughput on long meeting recordings. Chunks are
+    decoded independently, so there is no condition_on_previous_text.
+    """
+    model = get_model(model_name)
+    with _model_lock:
+        pipeline = _batched_cache.get(model_name)
+        if pipeline is None or pipeline.model is not model:
+            from faster_whisper import BatchedInferencePipeline
+            pipeline = BatchedInferencePipeline(model=model)
+            _batched_cache[model_name] = pipeline
+        return pipeline
+
+
+class _DiarizationAborted(Exception):
+    """Raised from the pyannote step hook once the caller gave up on the job."""
+
+
 def run_diarization(
-    audio_path: str,
-    request_id: str = "",
-    progress_queue: queue.Queue | None = None,
-    segments_done: int = 0,
+    audio_path: str, request_id: str = "", abort: threading.Event | None = None,
 ) -> dict | None:
     """Run speaker diarization on audio file.
 
     Returns dict with 'turns' (list of speaker turns) and 'embeddings'
     (dict mapping speaker label → 256-dim float list), or None on failure.
+    Setting `abort` stops the pipeline at its next step/batch boundary
+    (pyannote hook) and returns None.
     """
     if not _diarization_available or _diarization_pipeline is None:
         return None
+    if abort is not None and abort.is_set():
+        print(f"[{request_id}] Diarization skipped: request already failed", flush=True)
+        return None
     if not os.path.exists(audio_path):
         print(f"[{request_id}] Diarization aborted: audio file missing at {audio_path}", flush=True)
         return None
+
+    def _hook(step_name, *args, **kwargs):
+        if abort is not None and abort.is_set():
+            raise _DiarizationAborted(step_name)
+
     try:
         print(f"[{request_id}] Running speaker diarization...", flush=True)
         start = time.time()
-        # Heartbeat thread: pyannote runs synchronously and emits no progress;
-        # without periodic SSE events, NAT/ingress can drop the connection
-        # during long diarization (5–10 min on 20-min audio).
-        stop_heartbeat = threading.Event()
-        if progress_queue is not None:
-            def _heartbeat():
-                while not stop_heartbeat.wait(5.0):
-                    elapsed = time.time() - start
-                    progress_queue.put({
-                        "percent": 99.9,
-                        "segments_done": segments_done,
-                        "elapsed_seconds": round(elapsed, 1),
-                        "last_segment_text": f"diarizing... {elapsed:.0f}s",
-                    })
-            threading.Thread(target=_heartbeat, daemon=True).start()
-        try:
-            result = _diarization_pipeline(audio_path)
-        finally:
-            stop_heartbeat.set()
+        result = _diarization_pipeline(audio_path, hook=_hook)
         # pyannote 4.x returns DiarizeOutput dataclass; 3.x returns Annotation directly
         annotation = getattr(result, "speaker_diarization", result)
         turns = []
@@ -320,6 +344,9 @@ def run_diarization(
             flush=True,
         )
         return {"turns": turns, "embeddings": embeddings}
+    except _DiarizationAborted as e:
+        print(f"[{request_id}] Diarization aborted at step {e}", flush=True)
+        return None
     except Exception as e:
         print(f"[{request_id}] Diarization failed: {e}", flush=True)
         traceback.print_exc()
@@ -327,23 +354,44 @@ def run_diarization(
 
 
 def assign_speakers_to_segments(segments: list[dict], speaker_turns: list[dict]) -> list[dict]:
-    """Merge speaker labels into whisper segments based on time overlap."""
+    """Merge speaker labels into whisper segments based on time overlap.
+
+    Sorted interval sweep instead of comparing every segment with every turn:
+    segments are visited by start time, turns enter an end-time heap once they
+    start before the segment ends and leave it once they end before the
+    segment starts. Only the turns actually overlapping a segment are scored,
+    so a 2-hour meeting is O((S + T) log T) instead of O(S·T). Ties go to the
+    earlier turn in `speaker_turns`, as before.
+    """
     if not speaker_turns:
         return segments
 
-    for seg in segments:
+    turn_order = sorted(range(len(speaker_turns)), key=lambda k: speaker_turns[k]["start"])
+    active: list[tuple[float, int]] = []  # (turn end, turn index)
+    next_turn = 0
+
+    for seg in sorted(segments, key=lambda s: s["start"]):
         seg_start = seg["start"]
         seg_end = seg["end"]
+
+        while next_turn < len(turn_order) and speaker_turns[turn_order[next_turn]]["start"] < seg_end:
+            k = turn_order[next_turn]
+            heapq.heappush(active, (speaker_turns[k]["end"], k))
+            next_turn += 1
+        # Segments come in start order — a turn over before this one starts is
+        # over for all the remaining ones too.
+        while active and active[0][0] <= seg_start:
+            heapq.heappop(active)
+
         best_speaker = None
         best_overlap = 0.0
-
-        for turn in speaker_turns:
-            overlap_start = max(seg_start, turn["start"])
-            overlap_end = min(seg_end, turn["end"])
-            overlap = max(0.0, overlap_end - overlap_start)
-            if overlap > best_overlap:
+        best_index = len(speaker_turns)
+        for turn_end, k in active:
+            overlap = min(seg_end, turn_end) - max(seg_start, speaker_turns[k]["start"])
+            if overlap > best_overlap or (overlap > 0 and overlap == best_overlap and k < best_index):
                 best_overlap = overlap
-                best_speaker = turn["speaker"]
+                best_speaker = speaker_turns[k]["speaker"]
+                best_index = k
 
         if best_speaker:
             seg["speaker"] = best_speaker
@@ -478,16 +526,18 @@ async def diagnostic():
 
 
 def run_whisper(audio_path: str, opts: dict, progress_queue: queue.Queue, request_id: str = "") -> dict:
-    """Run Whisper transcription (GPU must be acquired before calling this)."""
-    task = opts.get("task", "transcribe")
-    model_name = opts.get("model", DEFAULT_MODEL)
-    language = opts.get("language")
-    beam_size = opts.get("beam_size", 5)
-    vad_filter = opts.get("vad_filter", True)
-    word_timestamps = opts.get("word_timestamps", False)
-    initial_prompt = opts.get("initial_prompt")
-    condition_on_previous_text = opts.get("condition_on_previous_text", True)
-    no_speech_threshold = opts.get("no_speech_threshold", 0.6)
+    """Run Whisper transcription (GPU must be acquired before calling this).
+
+    Besides progress dicts, `progress_queue` receives `{"segment": {...}}`
+    items when opts["stream_segments"] is set — one per segment, as soon as
+    faster-whisper finalizes it (not in extraction mode, whose timestamps only
+    make sense after remapping). opts["batched"] switches to VAD-chunked
+    batched inference.
+
+    With diarize, pyannote starts on the CPU right away and runs alongside
+    ASR on the GPU, so a diarized meeting takes ~max(ASR, diarization)
+    instead of their sum.
+    """
     extraction_ranges = opts.get("extraction_ranges")
     do_diarize = opts.get("diarize", False)
 
@@ -507,8 +557,63 @@ def run_whisper(audio_path: str, opts: dict, progress_queue: queue.Queue, reques
                 shutil.rmtree(cleanup_dir, ignore_errors=True)
             return {"text": "", "segments": [], "error": f"ffmpeg extraction failed: {str(e)[:500]}"}
 
-    model = get_model(model_name)
-    print(f"[{request_id}] Starting transcription: task={task}, model={model_name}, lang={language or 'auto'}", flush=True)
+    # Diarization reads the original audio, so it can start before ASR.
+    diarize_future = None
+    diarize_abort = threading.Event()
+    diarize_start = time.time()
+    if do_diarize and _diarization_available:
+        diarize_future = _diarization_executor.submit(run_diarization, audio_path, request_id, diarize_abort)
+
+    try:
+        return _transcribe_and_merge(
+            transcribe_path, opts, progress_queue, request_id,
+            range_mapping, diarize_future, diarize_start,
+        )
+    finally:
+        if diarize_future is not None and not diarize_future.done():
+            # ASR failed while diarization is queued or running: stop it, and
+            # wait for it to let go of the audio before the caller deletes it
+            # (the single diarization worker is then free for the next request).
+            diarize_abort.set()
+            if not diarize_future.cancel():
+                try:
+                    diarize_future.result(timeout=DIARIZATION_ABORT_WAIT_S)
+                except FutureTimeoutError:
+                    print(f"[{request_id}] Diarization still stopping after {DIARIZATION_ABORT_WAIT_S}s", flush=True)
+                except Exception:
+                    pass
+        if cleanup_dir:
+            shutil.rmtree(cleanup_dir, ignore_errors=True)
+
+
+def _transcribe_and_merge(
+    transcribe_path: str,
+    opts: dict,
+    progress_queue: queue.Queue,
+    request_id: str,
+    range_mapping: list | None,
+    diarize_future,
+    diarize_start: float,
+) -> dict:
+    """ASR + (already running) diarization merge for run_whisper."""
+    task = opts.get("task", "transcribe")
+    model_name = opts.get("model", DEFAULT_MODEL)
+    language = opts.get("language")
+    beam_size = opts.get("beam_size", 5)
+    vad_filter = opts.get("vad_filter", True)
+    word_timestamps = opts.get("word_timestamps", False)
+    initial_prompt = opts.get("initial_prompt")
+    condition_on_previous_text = opts.get("condition_on_previous_text", True)
+    no_speech_threshold = opts.get("no_speech_threshold", 0.6)
+    batched = opts.get("batched", False)
+    batch_size = opts.get("batch_size") or BATCH_SIZE
+    stream_segments = opts.get("stream_segments", False) and range_mapping is None
+
+    print(
+        f"[{request_id}] Starting transcription: task={task}, model={model_name}, lang={language or 'auto'}, "
+        f"batched={f'yes (batch_size={batch_size})' if batched else 'no'}, stream_segments={stream_segments}",
+        flush=True,
+    )
 
     transcribe_kwargs = {
         "task": task, "beam_size": beam_size, "vad_filter": vad_filter,
@@ -520,7 +625,15 @@ def run_whisper(audio_path: str, opts: dict, progress_queue: queue.Queue, reques
     if initial_prompt:
         transcribe_kwargs["initial_prompt"] = initial_prompt
 
-    segments_iter, info = model.transcribe(transcribe_path, **transcribe_kwargs)
+    if batched:
+        # Batched mode always chunks on VAD; chunks are decoded independently.
+        transcribe_kwargs["vad_filter"] = True
+        transcribe_kwargs.pop("condition_on_previous_text")
+        segments_iter, info = get_batched_pipeline(model_name).transcribe(
+            transcribe_path, batch_size=batch_size, **transcribe_kwargs,
+        )
+    else:
+        segments_iter, info = get_model(model_name).transcribe(transcribe_path, **transcribe_kwargs)
 
     total_duration = info.duration if info.duration and info.duration > 0 else None
     print(f"Audio duration: {total_duration:.1f}s, lang: {info.language} (prob={info.language_probability:.2f})", flush=True)
@@ -533,6 +646,8 @@ def run_whisper(audio_path: str, opts: dict, progress_queue: queue.Queue, reques
     for seg in segments_iter:
         out_segments.append({"start": float(seg.start), "end": float(seg.end), "text": seg.text})
         all_text.append(seg.text)
+        if stream_segments:
+            progress_queue.put({"segment": {"i": len(out_segments) - 1, **out_segments[-1]}})
 
         now = time.time()
         if total_duration and (now - last_progress_time) >= 3:
@@ -547,14 +662,19 @@ def run_whisper(audio_path: str, opts: dict, progress_queue: queue.Queue, reques
 
     elapsed = time.time() - start_time
     progress_queue.put({"percent": 100.0, "segments_done": len(out_segments), "elapsed_seconds": round(elapsed, 1), "last_segment_text": ""})
-    print(f"[{request_id}] Transcription complete: {len(out_segments)} segments, {elapsed:.1f}s", flush=True)
+    rtf = elapsed / total_duration if total_duration else 0.0
+    print(f"[{request_id}] Transcription complete: {len(out_segments)} segments, {elapsed:.1f}s (RTF {rtf:.3f})", flush=True)
 
-    # Speaker diarization
+    # Speaker diarization (started before ASR — wait for whatever is left)
     speaker_turns = None
     speaker_embeddings = None
-    if do_diarize and _diarization_available:
-        diarize_result = run_diarization(
-            audio_path, request_id, progress_queue, len(out_segments),
+    if diarize_future is not None:
+        asr_done = time.time()
+        diarize_result = _await_diarization(diarize_future, progress_queue, len(out_segments), diarize_start)
+        print(
+            f"[{request_id}] Diarization overlap: ASR {asr_done - start_time:.1f}s, "
+            f"waited {time.time() - asr_done:.1f}s after ASR",
+            flush=True,
         )
         if diarize_result:
             speaker_turns = diarize_result["turns"]
@@ -587,12 +707,29 @@ def run_whisper(audio_path: str, opts: dict, progress_queue: queue.Queue, reques
     if speaker_embeddings:
         result["speaker_embeddings"] = speaker_embeddings
 
-    if cleanup_dir:
-        shutil.rmtree(cleanup_dir, ignore_errors=True)
-
     return result
 
 
+def _await_diarization(diarize_future, progress_queue: queue.Queue, segments_done: int, diarize_start: float) -> dict | None:
+    """Block until the background diarization finishes.
+
+    pyannote emits no progress of its own; without periodic events after ASR
+    finished, NAT/ingress can drop the connection during long diarization
+    (5–10 min on 20-min audio), so heartbeat every 5s while waiting.
+    """
+    while True:
+        try:
+            return diarize_future.result(timeout=5.0)
+        except FutureTimeoutError:
+            elapsed = time.time() - diarize_start
+            progress_queue.put({
+                "percent": 99.9,
+                "segments_done": segments_done,
+                "elapsed_seconds": round(elapsed, 1),
+                "last_segment_text": f"diarizing... {elapsed:.0f}s",
+            })
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("WHISPER_REST_PORT", "8786"))
     host = os.environ.get("WHISPER_REST_HOST", "0.0.0.0")
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from jervis.common import types_pb2 as jervis_dot_common_dot_types__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(jervis/document_extraction/extract.proto\x12\x1ajervis.document_extraction\x1a\x19jervis/common/types.proto\"\x84\x01\n\x0e\x45xtractRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x10\n\x08max_tier\x18\x05 \x01(\t\"2\n\rExtractedPage\x12\x13\n\x0bpage_number\x18\x01 \x01(\x05\x12\x0c\n\x04text\x18\x02 \x01(\t\"\xe7\x01\n\x0f\x45xtractResponse\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0e\n\x06method\x18\x02 \x01(\t\x12K\n\x08metadata\x18\x03 \x03(\x0b\x32\x39.jervis.document_extraction.ExtractResponse.MetadataEntry\x12\x38\n\x05pages\x18\x04 \x03(\x0b\x32).jervis.document_extraction.ExtractedPage\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\rHealthRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\"1\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07service\x18\x02 \x01(\t2\xe0\x01\n\x19\x44ocumentExtractionService\x12\x62\n\x07\x45xtract\x12*.jervis.document_extraction.ExtractRequest\x1a+.jervis.document_extraction.ExtractResponse\x12_\n\x06Health\x12).jervis.document_extraction.HealthRequest\x1a*.jervis.document_extraction.HealthResponseBE\n(com.jervis.contracts.document_extractionB\x17\x44ocumentExtractionProtoP\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(jervis/document_extraction/extract.proto\x12\x1ajervis.document_extraction\x1a\x19jervis/common/types.proto\"\x84\x01\n\x0e\x45xtractRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x10\n\x08max_tier\x18\x05 \x01(\t\"2\n\rExtractedPage\x12\x13\n\x0bpage_number\x18\x01 \x01(\x05\x12\x0c\n\x04text\x18\x02 \x01(\t\"\xe7\x01\n\x0f\x45xtractResponse\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0e\n\x06method\x18\x02 \x01(\t\x12K\n\x08metadata\x18\x03 \x03(\x0b\x32\x39.jervis.document_extraction.ExtractResponse.MetadataEntry\x12\x38\n\x05pages\x18\x04 \x03(\x0b\x32).jervis.document_extraction.ExtractedPage\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x8a\x01\n\x14\x45xtractStreamRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x10\n\x08max_tier\x18\x05 \x01(\t\"\x96\x01\n\x15\x45xtractStreamResponse\x12\x39\n\x04page\x18\x01 \x01(\x0b\x32).jervis.document_extraction.ExtractedPageH\x00\x12\x37\n\x04\x64one\x18\x02 \x01(\x0b\x32\'.jervis.document_extraction.ExtractDoneH\x00\x42\t\n\x07payload\"\xab\x01\n\x0b\x45xtractDone\x12\x0e\n\x06method\x18\x01 \x01(\t\x12G\n\x08metadata\x18\x02 \x03(\x0b\x32\x35.jervis.document_extraction.ExtractDone.MetadataEntry\x12\x12\n\npage_count\x18\x03 \x01(\x05\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\rHealthRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\"1\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07service\x18\x02 \x01(\t2\xd8\x02\n\x19\x44ocumentExtractionService\x12\x62\n\x07\x45xtract\x12*.jervis.document_extraction.ExtractRequest\x1a+.jervis.document_extraction.ExtractResponse\x12v\n\rExtractStream\x12\x30.jervis.document_extraction.ExtractStreamRequest\x1a\x31.jervis.document_extraction.ExtractStreamResponse0\x01\x12_\n\x06Health\x12).jervis.document_extraction.HealthRequest\x1a*.jervis.document_extraction.HealthResponseBE\n(com.jervis.contracts.document_extractionB\x17\x44ocumentExtractionProtoP\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._serialized_options = b'\n(com.jervis.contracts.document_extractionB\027DocumentExtractionProtoP\001'
   _globals['_EXTRACTRESPONSE_METADATAENTRY']._loaded_options = None
   _globals['_EXTRACTRESPONSE_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_EXTRACTDONE_METADATAENTRY']._loaded_options = None
+  _globals['_EXTRACTDONE_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_EXTRACTREQUEST']._serialized_start=100
   _globals['_EXTRACTREQUEST']._serialized_end=232
   _globals['_EXTRACTEDPAGE']._serialized_start=234
@@ -43,10 +45,18 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_EXTRACTRESPONSE']._serialized_end=518
   _globals['_EXTRACTRESPONSE_METADATAENTRY']._serialized_start=471
   _globals['_EXTRACTRESPONSE_METADATAENTRY']._serialized_end=518
-  _globals['_HEALTHREQUEST']._serialized_start=520
-  _globals['_HEALTHREQUEST']._serialized_end=579
-  _globals['_HEALTHRESPONSE']._serialized_start=581
-  _globals['_HEALTHRESPONSE']._serialized_end=630
-  _globals['_DOCUMENTEXTRACTIONSERVICE']._serialized_start=633
-  _globals['_DOCUMENTEXTRACTIONSERVICE']._serialized_end=857
+  _globals['_EXTRACTSTREAMREQUEST']._serialized_start=521
+  _globals['_EXTRACTSTREAMREQUEST']._serialized_end=659
+  _globals['_EXTRACTSTREAMRESPONSE']._serialized_start=662
+  _globals['_EXTRACTSTREAMRESPONSE']._serialized_end=812
+  _globals['_EXTRACTDONE']._serialized_start=815
+  _globals['_EXTRACTDONE']._serialized_end=986
+  _globals['_EXTRACTDONE_METADATAENTRY']._serialized_start=471
+  _globals['_EXTRACTDONE_METADATAENTRY']._serialized_end=518
+  _globals['_HEALTHREQUEST']._serialized_start=988
+  _globals['_HEALTHREQUEST']._serialized_end=1047
+  _globals['_HEALTHRESPONSE']._serialized_start=1049
+  _globals['_HEALTHRESPONSE']._serialized_end=1098
+  _globals['_DOCUMENTEXTRACTIONSERVICE']._serialized_start=1101
+  _globals['_DOCUMENTEXTRACTIONSERVICE']._serialized_end=1445
 # @@protoc_insertion_point(module_scope)
@@ -48,6 +48,45 @@ class ExtractResponse(_message.Message):
     pages: _containers.RepeatedCompositeFieldContainer[ExtractedPage]
     def __init__(self, text: _Optional[str] = ..., method: _Optional[str] = ..., metadata: _Optional[_Mapping[str, str]] = ..., pages: _Optional[_Iterable[_Union[ExtractedPage, _Mapping]]] = ...) -> None: ...
 
+class ExtractStreamRequest(_message.Message):
+    __slots__ = ("ctx", "content", "filename", "mime_type", "max_tier")
+    CTX_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    MIME_TYPE_FIELD_NUMBER: _ClassVar[int]
+    MAX_TIER_FIELD_NUMBER: _ClassVar[int]
+    ctx: _types_pb2.RequestContext
+    content: bytes
+    filename: str
+    mime_type: str
+    max_tier: str
+    def __init__(self, ctx: _Optional[_Union[_types_pb2.RequestContext, _Mapping]] = ..., content: _Optional[bytes] = ..., filename: _Optional[str] = ..., mime_type: _Optional[str] = ..., max_tier: _Optional[str] = ...) -> None: ...
+
+class ExtractStreamResponse(_message.Message):
+    __slots__ = ("page", "done")
+    PAGE_FIELD_NUMBER: _ClassVar[int]
+    DONE_FIELD_NUMBER: _ClassVar[int]
+    page: ExtractedPage
+    done: ExtractDone
+    def __init__(self, page: _Optional[_Union[ExtractedPage, _Mapping]] = ..., done: _Optional[_Union[ExtractDone, _Mapping]] = ...) -> None: ...
+
+class ExtractDone(_message.Message):
+    __slots__ = ("method", "metadata", "page_count")
+    class MetadataEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    PAGE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    metadata: _containers.ScalarMap[str, str]
+    page_count: int
+    def __init__(self, method: _Optional[str] = ..., metadata: _Optional[_Mapping[str, str]] = ..., page_count: _Optional[int] = ...) -> None: ...
+
 class HealthRequest(_message.Message):
     __slots__ = ("ctx",)
     CTX_FIELD_NUMBER: _ClassVar[int]
@@ -31,6 +31,11 @@ class DocumentExtractionServiceStub(object):
     `POST /extract` and `POST /extract-base64` FastAPI routes; the callers
     now ride a single unary RPC with the bytes inline (64 MiB cap — for
     anything larger the blob side channel is the answer).
+
+    ExtractStream is the server-streaming variant: pages (PDF pages, sheets,
+    slides, chapters) are sent as soon as the parser finishes them, so the
+    KB indexer can chunk + embed early pages while later ones still parse.
+    The last message carries method + metadata.
     """
 
     def __init__(self, channel):
@@ -44,6 +49,11 @@ class DocumentExtractionServiceStub(object):
                 request_serializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractRequest.SerializeToString,
                 response_deserializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractResponse.FromString,
                 _registered_method=True)
+        self.ExtractStream = channel.unary_stream(
+                '/jervis.document_extraction.DocumentExtractionService/ExtractStream',
+                request_serializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractStreamRequest.SerializeToString,
+                response_deserializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractStreamResponse.FromString,
+                _registered_method=True)
         self.Health = channel.unary_unary(
                 '/jervis.document_extraction.DocumentExtractionService/Health',
                 request_serializer=jervis_dot_document__extraction_dot_extract__pb2.HealthRequest.SerializeToString,
@@ -57,6 +67,11 @@ class DocumentExtractionServiceServicer(object):
     `POST /extract` and `POST /extract-base64` FastAPI routes; the callers
     now ride a single unary RPC with the bytes inline (64 MiB cap — for
     anything larger the blob side channel is the answer).
+
+    ExtractStream is the server-streaming variant: pages (PDF pages, sheets,
+    slides, chapters) are sent as soon as the parser finishes them, so the
+    KB indexer can chunk + embed early pages while later ones still parse.
+    The last message carries method + metadata.
     """
 
     def Extract(self, request, context):
@@ -65,6 +80,12 @@ class DocumentExtractionServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ExtractStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Health(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -79,6 +100,11 @@ def add_DocumentExtractionServiceServicer_to_server(servicer, server):
                     request_deserializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractRequest.FromString,
                     response_serializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractResponse.SerializeToString,
             ),
+            'ExtractStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExtractStream,
+                    request_deserializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractStreamRequest.FromString,
+                    response_serializer=jervis_dot_document__extraction_dot_extract__pb2.ExtractStreamResponse.SerializeToString,
+            ),
             'Health': grpc.unary_unary_rpc_method_handler(
                     servicer.Health,
                     request_deserializer=jervis_dot_document__extraction_dot_extract__pb2.HealthRequest.FromString,
@@ -98,6 +124,11 @@ class DocumentExtractionService(object):
     `POST /extract` and `POST /extract-base64` FastAPI routes; the callers
     now ride a single unary RPC with the bytes inline (64 MiB cap — for
     anything larger the blob side channel is the answer).
+
+    ExtractStream is the server-streaming variant: pages (PDF pages, sheets,
+    slides, chapters) are sent as soon as the parser finishes them, so the
+    KB indexer can chunk + embed early pages while later ones still parse.
+    The last message carries method + metadata.
     """
 
     @staticmethod
@@ -127,6 +158,33 @@ class DocumentExtractionService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ExtractStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/jervis.document_extraction.DocumentExtractionService/ExtractStream',
+            jervis_dot_document__extraction_dot_extract__pb2.ExtractStreamRequest.SerializeToString,
+            jervis_dot_document__extraction_dot_extract__pb2.ExtractStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Health(request,
             target,
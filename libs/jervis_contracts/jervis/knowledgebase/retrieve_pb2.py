@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from jervis.common import types_pb2 as jervis_dot_common_dot_types__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#jervis/knowledgebase/retrieve.proto\x12\x14jervis.knowledgebase\x1a\x19jervis/common/types.proto\"\xeb\x01\n\x10RetrievalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\r\n\x05query\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x10\n\x08group_id\x18\x05 \x01(\t\x12\x11\n\tas_of_iso\x18\x06 \x01(\t\x12\x16\n\x0emin_confidence\x18\x07 \x01(\x01\x12\x13\n\x0bmax_results\x18\x08 \x01(\x05\x12\x14\n\x0c\x65xpand_graph\x18\t \x01(\x08\x12\r\n\x05kinds\x18\n \x03(\t\"A\n\x0c\x45videncePack\x12\x31\n\x05items\x18\x01 \x03(\x0b\x32\".jervis.knowledgebase.EvidenceItem\"\xe2\x01\n\x0c\x45videnceItem\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\r\n\x05score\x18\x02 \x01(\x01\x12\x12\n\nsource_urn\x18\x03 \x01(\t\x12\x13\n\x0b\x63redibility\x18\x04 \x01(\t\x12\x14\n\x0c\x62ranch_scope\x18\x05 \x01(\t\x12\x42\n\x08metadata\x18\x06 \x03(\x0b\x32\x30.jervis.knowledgebase.EvidenceItem.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xbf\x02\n\x16HybridRetrievalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\r\n\x05query\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x10\n\x08group_id\x18\x05 \x01(\t\x12\x13\n\x0bmax_results\x18\x06 \x01(\x05\x12\x16\n\x0emin_confidence\x18\x07 \x01(\x01\x12\x14\n\x0c\x65xpand_graph\x18\x08 \x01(\x08\x12\x18\n\x10\x65xtract_entities\x18\t \x01(\x08\x12\x0f\n\x07use_rrf\x18\n \x01(\x08\x12\x16\n\x0emax_graph_hops\x18\x0b \x01(\x05\x12\x11\n\tmax_seeds\x18\x0c \x01(\x05\x12\x18\n\x10\x64iversity_factor\x18\r \x01(\x01\"\x8e\x01\n\x12HybridEvidencePack\x12\x37\n\x05items\x18\x01 \x03(\x0b\x32(.jervis.knowledgebase.HybridEvidenceItem\x12\x13\n\x0btotal_found\x18\x02 \x01(\x05\x12\x16\n\x0equery_entities\x18\x03 \x03(\t\x12\x12\n\nseed_nodes\x18\x04 \x03(\t\"\xb9\x03\n\x12HybridEvidenceItem\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\x16\n\x0e\x63ombined_score\x18\x02 \x01(\x01\x12\x12\n\nsource_urn\x18\x03 \x01(\t\x12\x11\n\trag_score\x18\x04 \x01(\x01\x12\x13\n\x0bgraph_score\x18\x05 \x01(\x01\x12\x14\n\x0c\x65ntity_score\x18\x06 \x01(\x01\x12\x19\n\x11\x63redibility_boost\x18\x07 \x01(\x01\x12\x0e\n\x06source\x18\x08 \x01(\t\x12\x13\n\x0b\x63redibility\x18\t \x01(\t\x12\x14\n\x0c\x62ranch_scope\x18\n \x01(\t\x12\x13\n\x0b\x62ranch_role\x18\x0b \x01(\t\x12\x16\n\x0egraph_distance\x18\x0c \x01(\x05\x12\x12\n\ngraph_refs\x18\r \x03(\t\x12\x16\n\x0ematched_entity\x18\x0e \x01(\t\x12H\n\x08metadata\x18\x0f \x03(\x0b\x32\x36.jervis.knowledgebase.HybridEvidenceItem.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xbd\x01\n\x10TraversalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x11\n\tclient_id\x18\x02 \x01(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\x12\x10\n\x08group_id\x18\x04 \x01(\t\x12\x11\n\tstart_key\x18\x05 \x01(\t\x12\x31\n\x04spec\x18\x06 \x01(\x0b\x32#.jervis.knowledgebase.TraversalSpec\"a\n\rTraversalSpec\x12\x11\n\tdirection\x18\x01 \x01(\t\x12\x11\n\tmin_depth\x18\x02 \x01(\x05\x12\x11\n\tmax_depth\x18\x03 \x01(\x05\x12\x17\n\x0f\x65\x64ge_collection\x18\x04 \x01(\t\"Y\n\x12JoernAnalyzeResult\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\t\x12\x10\n\x08warnings\x18\x03 \x01(\t\x12\x11\n\texit_code\x18\x04 \x01(\x05\"\x90\x01\n\x10JoernScanRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x11\n\tscan_type\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x16\n\x0eworkspace_path\x18\x05 \x01(\t\"i\n\x0fJoernScanResult\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x11\n\tscan_type\x18\x02 \x01(\t\x12\x0e\n\x06output\x18\x03 \x01(\t\x12\x10\n\x08warnings\x18\x04 \x01(\t\x12\x11\n\texit_code\x18\x05 \x01(\x05\"\x89\x01\n\x11ListByKindRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x11\n\tclient_id\x18\x02 \x01(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\x12\x0c\n\x04kind\x18\x04 \x01(\t\x12\x13\n\x0bmax_results\x18\x05 \x01(\x05\"7\n\tChunkList\x12*\n\x05items\x18\x01 \x03(\x0b\x32\x1b.jervis.knowledgebase.Chunk\"\xb4\x01\n\x05\x43hunk\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x12\n\nsource_urn\x18\x03 \x01(\t\x12\x0c\n\x04kind\x18\x04 \x01(\t\x12;\n\x08metadata\x18\x05 \x03(\x0b\x32).jervis.knowledgebase.Chunk.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xd5\x04\n\x18KnowledgeRetrieveService\x12V\n\x08Retrieve\x12&.jervis.knowledgebase.RetrievalRequest\x1a\".jervis.knowledgebase.EvidencePack\x12\\\n\x0eRetrieveSimple\x12&.jervis.knowledgebase.RetrievalRequest\x1a\".jervis.knowledgebase.EvidencePack\x12h\n\x0eRetrieveHybrid\x12,.jervis.knowledgebase.HybridRetrievalRequest\x1a(.jervis.knowledgebase.HybridEvidencePack\x12_\n\x0b\x41nalyzeCode\x12&.jervis.knowledgebase.TraversalRequest\x1a(.jervis.knowledgebase.JoernAnalyzeResult\x12Z\n\tJoernScan\x12&.jervis.knowledgebase.JoernScanRequest\x1a%.jervis.knowledgebase.JoernScanResult\x12\\\n\x10ListChunksByKind\x12\'.jervis.knowledgebase.ListByKindRequest\x1a\x1f.jervis.knowledgebase.ChunkListB>\n\"com.jervis.contracts.knowledgebaseB\x16KnowledgeRetrieveProtoP\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#jervis/knowledgebase/retrieve.proto\x12\x14jervis.knowledgebase\x1a\x19jervis/common/types.proto\"\xeb\x01\n\x10RetrievalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\r\n\x05query\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x10\n\x08group_id\x18\x05 \x01(\t\x12\x11\n\tas_of_iso\x18\x06 \x01(\t\x12\x16\n\x0emin_confidence\x18\x07 \x01(\x01\x12\x13\n\x0bmax_results\x18\x08 \x01(\x05\x12\x14\n\x0c\x65xpand_graph\x18\t \x01(\x08\x12\r\n\x05kinds\x18\n \x03(\t\"A\n\x0c\x45videncePack\x12\x31\n\x05items\x18\x01 \x03(\x0b\x32\".jervis.knowledgebase.EvidenceItem\"\xe2\x01\n\x0c\x45videnceItem\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\r\n\x05score\x18\x02 \x01(\x01\x12\x12\n\nsource_urn\x18\x03 \x01(\t\x12\x13\n\x0b\x63redibility\x18\x04 \x01(\t\x12\x14\n\x0c\x62ranch_scope\x18\x05 \x01(\t\x12\x42\n\x08metadata\x18\x06 \x03(\x0b\x32\x30.jervis.knowledgebase.EvidenceItem.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"^\n\x13\x42\x61tchRetrievalQuery\x12\x37\n\x07request\x18\x01 \x01(\x0b\x32&.jervis.knowledgebase.RetrievalRequest\x12\x0e\n\x06simple\x18\x02 \x01(\x08\"\x92\x01\n\x15\x42\x61tchRetrievalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12:\n\x07queries\x18\x02 \x03(\x0b\x32).jervis.knowledgebase.BatchRetrievalQuery\x12\x11\n\tbudget_ms\x18\x03 \x01(\x05\"Z\n\x11\x42\x61tchEvidencePack\x12\x31\n\x05packs\x18\x01 \x03(\x0b\x32\".jervis.knowledgebase.EvidencePack\x12\x12\n\nincomplete\x18\x02 \x03(\x05\"\xbf\x02\n\x16HybridRetrievalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\r\n\x05query\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x10\n\x08group_id\x18\x05 \x01(\t\x12\x13\n\x0bmax_results\x18\x06 \x01(\x05\x12\x16\n\x0emin_confidence\x18\x07 \x01(\x01\x12\x14\n\x0c\x65xpand_graph\x18\x08 \x01(\x08\x12\x18\n\x10\x65xtract_entities\x18\t \x01(\x08\x12\x0f\n\x07use_rrf\x18\n \x01(\x08\x12\x16\n\x0emax_graph_hops\x18\x0b \x01(\x05\x12\x11\n\tmax_seeds\x18\x0c \x01(\x05\x12\x18\n\x10\x64iversity_factor\x18\r \x01(\x01\"\x8e\x01\n\x12HybridEvidencePack\x12\x37\n\x05items\x18\x01 \x03(\x0b\x32(.jervis.knowledgebase.HybridEvidenceItem\x12\x13\n\x0btotal_found\x18\x02 \x01(\x05\x12\x16\n\x0equery_entities\x18\x03 \x03(\t\x12\x12\n\nseed_nodes\x18\x04 \x03(\t\"\xb9\x03\n\x12HybridEvidenceItem\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\x16\n\x0e\x63ombined_score\x18\x02 \x01(\x01\x12\x12\n\nsource_urn\x18\x03 \x01(\t\x12\x11\n\trag_score\x18\x04 \x01(\x01\x12\x13\n\x0bgraph_score\x18\x05 \x01(\x01\x12\x14\n\x0c\x65ntity_score\x18\x06 \x01(\x01\x12\x19\n\x11\x63redibility_boost\x18\x07 \x01(\x01\x12\x0e\n\x06source\x18\x08 \x01(\t\x12\x13\n\x0b\x63redibility\x18\t \x01(\t\x12\x14\n\x0c\x62ranch_scope\x18\n \x01(\t\x12\x13\n\x0b\x62ranch_role\x18\x0b \x01(\t\x12\x16\n\x0egraph_distance\x18\x0c \x01(\x05\x12\x12\n\ngraph_refs\x18\r \x03(\t\x12\x16\n\x0ematched_entity\x18\x0e \x01(\t\x12H\n\x08metadata\x18\x0f \x03(\x0b\x32\x36.jervis.knowledgebase.HybridEvidenceItem.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xbd\x01\n\x10TraversalRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x11\n\tclient_id\x18\x02 \x01(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\x12\x10\n\x08group_id\x18\x04 \x01(\t\x12\x11\n\tstart_key\x18\x05 \x01(\t\x12\x31\n\x04spec\x18\x06 \x01(\x0b\x32#.jervis.knowledgebase.TraversalSpec\"a\n\rTraversalSpec\x12\x11\n\tdirection\x18\x01 \x01(\t\x12\x11\n\tmin_depth\x18\x02 \x01(\x05\x12\x11\n\tmax_depth\x18\x03 \x01(\x05\x12\x17\n\x0f\x65\x64ge_collection\x18\x04 \x01(\t\"Y\n\x12JoernAnalyzeResult\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\t\x12\x10\n\x08warnings\x18\x03 \x01(\t\x12\x11\n\texit_code\x18\x04 \x01(\x05\"\x90\x01\n\x10JoernScanRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x11\n\tscan_type\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x16\n\x0eworkspace_path\x18\x05 \x01(\t\"i\n\x0fJoernScanResult\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x11\n\tscan_type\x18\x02 \x01(\t\x12\x0e\n\x06output\x18\x03 \x01(\t\x12\x10\n\x08warnings\x18\x04 \x01(\t\x12\x11\n\texit_code\x18\x05 \x01(\x05\"\x89\x01\n\x11ListByKindRequest\x12*\n\x03\x63tx\x18\x01 \x01(\x0b\x32\x1d.jervis.common.RequestContext\x12\x11\n\tclient_id\x18\x02 \x01(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\x12\x0c\n\x04kind\x18\x04 \x01(\t\x12\x13\n\x0bmax_results\x18\x05 \x01(\x05\"7\n\tChunkList\x12*\n\x05items\x18\x01 \x03(\x0b\x32\x1b.jervis.knowledgebase.Chunk\"\xb4\x01\n\x05\x43hunk\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x12\n\nsource_urn\x18\x03 \x01(\t\x12\x0c\n\x04kind\x18\x04 \x01(\t\x12;\n\x08metadata\x18\x05 \x03(\x0b\x32).jervis.knowledgebase.Chunk.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xbc\x05\n\x18KnowledgeRetrieveService\x12V\n\x08Retrieve\x12&.jervis.knowledgebase.RetrievalRequest\x1a\".jervis.knowledgebase.EvidencePack\x12\\\n\x0eRetrieveSimple\x12&.jervis.knowledgebase.RetrievalRequest\x1a\".jervis.knowledgebase.EvidencePack\x12\x65\n\rRetrieveBatch\x12+.jervis.knowledgebase.BatchRetrievalRequest\x1a\'.jervis.knowledgebase.BatchEvidencePack\x12h\n\x0eRetrieveHybrid\x12,.jervis.knowledgebase.HybridRetrievalRequest\x1a(.jervis.knowledgebase.HybridEvidencePack\x12_\n\x0b\x41nalyzeCode\x12&.jervis.knowledgebase.TraversalRequest\x1a(.jervis.knowledgebase.JoernAnalyzeResult\x12Z\n\tJoernScan\x12&.jervis.knowledgebase.JoernScanRequest\x1a%.jervis.knowledgebase.JoernScanResult\x12\\\n\x10ListChunksByKind\x12\'.jervis.knowledgebase.ListByKindRequest\x1a\x1f.jervis.knowledgebase.ChunkListB>\n\"com.jervis.contracts.knowledgebaseB\x16KnowledgeRetrieveProtoP\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -47,32 +47,38 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_EVIDENCEITEM']._serialized_end=620
   _globals['_EVIDENCEITEM_METADATAENTRY']._serialized_start=573
   _globals['_EVIDENCEITEM_METADATAENTRY']._serialized_end=620
-  _globals['_HYBRIDRETRIEVALREQUEST']._serialized_start=623
-  _globals['_HYBRIDRETRIEVALREQUEST']._serialized_end=942
-  _globals['_HYBRIDEVIDENCEPACK']._serialized_start=945
-  _globals['_HYBRIDEVIDENCEPACK']._serialized_end=1087
-  _globals['_HYBRIDEVIDENCEITEM']._serialized_start=1090
-  _globals['_HYBRIDEVIDENCEITEM']._serialized_end=1531
+  _globals['_BATCHRETRIEVALQUERY']._serialized_start=622
+  _globals['_BATCHRETRIEVALQUERY']._serialized_end=716
+  _globals['_BATCHRETRIEVALREQUEST']._serialized_start=719
+  _globals['_BATCHRETRIEVALREQUEST']._serialized_end=865
+  _globals['_BATCHEVIDENCEPACK']._serialized_start=867
+  _globals['_BATCHEVIDENCEPACK']._serialized_end=957
+  _globals['_HYBRIDRETRIEVALREQUEST']._serialized_start=960
+  _globals['_HYBRIDRETRIEVALREQUEST']._serialized_end=1279
+  _globals['_HYBRIDEVIDENCEPACK']._serialized_start=1282
+  _globals['_HYBRIDEVIDENCEPACK']._serialized_end=1424
+  _globals['_HYBRIDEVIDENCEITEM']._serialized_start=1427
+  _globals['_HYBRIDEVIDENCEITEM']._serialized_end=1868
   _globals['_HYBRIDEVIDENCEITEM_METADATAENTRY']._serialized_start=573
   _globals['_HYBRIDEVIDENCEITEM_METADATAENTRY']._serialized_end=620
-  _globals['_TRAVERSALREQUEST']._serialized_start=1534
-  _globals['_TRAVERSALREQUEST']._serialized_end=1723
-  _globals['_TRAVERSALSPEC']._serialized_start=1725
-  _globals['_TRAVERSALSPEC']._serialized_end=1822
-  _globals['_JOERNANALYZERESULT']._serialized_start=1824
-  _globals['_JOERNANALYZERESULT']._serialized_end=1913
-  _globals['_JOERNSCANREQUEST']._serialized_start=1916
-  _globals['_JOERNSCANREQUEST']._serialized_end=2060
-  _globals['_JOERNSCANRESULT']._serialized_start=2062
-  _globals['_JOERNSCANRESULT']._serialized_end=2167
-  _globals['_LISTBYKINDREQUEST']._serialized_start=2170
-  _globals['_LISTBYKINDREQUEST']._serialized_end=2307
-  _globals['_CHUNKLIST']._serialized_start=2309
-  _globals['_CHUNKLIST']._serialized_end=2364
-  _globals['_CHUNK']._serialized_start=2367
-  _globals['_CHUNK']._serialized_end=2547
+  _globals['_TRAVERSALREQUEST']._serialized_start=1871
+  _globals['_TRAVERSALREQUEST']._serialized_end=2060
+  _globals['_TRAVERSALSPEC']._serialized_start=2062
+  _globals['_TRAVERSALSPEC']._serialized_end=2159
+  _globals['_JOERNANALYZERESULT']._serialized_start=2161
+  _globals['_JOERNANALYZERESULT']._serialized_end=2250
+  _globals['_JOERNSCANREQUEST']._serialized_start=2253
+  _globals['_JOERNSCANREQUEST']._serialized_end=2397
+  _globals['_JOERNSCANRESULT']._serialized_start=2399
+  _globals['_JOERNSCANRESULT']._serialized_end=2504
+  _globals['_LISTBYKINDREQUEST']._serialized_start=2507
+  _globals['_LISTBYKINDREQUEST']._serialized_end=2644
+  _globals['_CHUNKLIST']._serialized_start=2646
+  _globals['_CHUNKLIST']._serialized_end=2701
+  _globals['_CHUNK']._serialized_start=2704
+  _globals['_CHUNK']._serialized_end=2884
   _globals['_CHUNK_METADATAENTRY']._serialized_start=573
   _globals['_CHUNK_METADATAENTRY']._serialized_end=620
-  _globals['_KNOWLEDGERETRIEVESERVICE']._serialized_start=2550
-  _globals['_KNOWLEDGERETRIEVESERVICE']._serialized_end=3147
+  _globals['_KNOWLEDGERETRIEVESERVICE']._serialized_start=2887
+  _globals['_KNOWLEDGERETRIEVESERVICE']._serialized_end=3587
 # @@protoc_insertion_point(module_scope)
@@ -60,6 +60,32 @@ class EvidenceItem(_message.Message):
     metadata: _containers.ScalarMap[str, str]
     def __init__(self, content: _Optional[str] = ..., score: _Optional[float] = ..., source_urn: _Optional[str] = ..., credibility: _Optional[str] = ..., branch_scope: _Optional[str] = ..., metadata: _Optional[_Mapping[str, str]] = ...) -> None: ...
 
+class BatchRetrievalQuery(_message.Message):
+    __slots__ = ("request", "simple")
+    REQUEST_FIELD_NUMBER: _ClassVar[int]
+    SIMPLE_FIELD_NUMBER: _ClassVar[int]
+    request: RetrievalRequest
+    simple: bool
+    def __init__(self, request: _Optional[_Union[RetrievalRequest, _Mapping]] = ..., simple: bool = ...) -> None: ...
+
+class BatchRetrievalRequest(_message.Message):
+    __slots__ = ("ctx", "queries", "budget_ms")
+    CTX_FIELD_NUMBER: _ClassVar[int]
+    QUERIES_FIELD_NUMBER: _ClassVar[int]
+    BUDGET_MS_FIELD_NUMBER: _ClassVar[int]
+    ctx: _types_pb2.RequestContext
+    queries: _containers.RepeatedCompositeFieldContainer[BatchRetrievalQuery]
+    budget_ms: int
+    def __init__(self, ctx: _Optional[_Union[_types_pb2.RequestContext, _Mapping]] = ..., queries: _Optional[_Iterable[_Union[BatchRetrievalQuery, _Mapping]]] = ..., budget_ms: _Optional[int] = ...) -> None: ...
+
+class BatchEvidencePack(_message.Message):
+    __slots__ = ("packs", "incomplete")
+    PACKS_FIELD_NUMBER: _ClassVar[int]
+    INCOMPLETE_FIELD_NUMBER: _ClassVar[int]
+    packs: _containers.RepeatedCompositeFieldContainer[EvidencePack]
+    incomplete: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, packs: _Optional[_Iterable[_Union[EvidencePack, _Mapping]]] = ..., incomplete: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class HybridRetrievalRequest(_message.Message):
     __slots__ = ("ctx", "query", "client_id", "project_id", "group_id", "max_results", "min_confidence", "expand_graph", "extract_entities", "use_rrf", "max_graph_hops", "max_seeds", "diversity_factor")
     CTX_FIELD_NUMBER: _ClassVar[int]
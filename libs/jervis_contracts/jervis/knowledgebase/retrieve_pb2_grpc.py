@@ -47,6 +47,11 @@ class KnowledgeRetrieveServiceStub(object):
                 request_serializer=jervis_dot_knowledgebase_dot_retrieve__pb2.RetrievalRequest.SerializeToString,
                 response_deserializer=jervis_dot_knowledgebase_dot_retrieve__pb2.EvidencePack.FromString,
                 _registered_method=True)
+        self.RetrieveBatch = channel.unary_unary(
+                '/jervis.knowledgebase.KnowledgeRetrieveService/RetrieveBatch',
+                request_serializer=jervis_dot_knowledgebase_dot_retrieve__pb2.BatchRetrievalRequest.SerializeToString,
+                response_deserializer=jervis_dot_knowledgebase_dot_retrieve__pb2.BatchEvidencePack.FromString,
+                _registered_method=True)
         self.RetrieveHybrid = channel.unary_unary(
                 '/jervis.knowledgebase.KnowledgeRetrieveService/RetrieveHybrid',
                 request_serializer=jervis_dot_knowledgebase_dot_retrieve__pb2.HybridRetrievalRequest.SerializeToString,
@@ -87,6 +92,12 @@ class KnowledgeRetrieveServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RetrieveBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def RetrieveHybrid(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -124,6 +135,11 @@ def add_KnowledgeRetrieveServiceServicer_to_server(servicer, server):
                     request_deserializer=jervis_dot_knowledgebase_dot_retrieve__pb2.RetrievalRequest.FromString,
                     response_serializer=jervis_dot_knowledgebase_dot_retrieve__pb2.EvidencePack.SerializeToString,
             ),
+            'RetrieveBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.RetrieveBatch,
+                    request_deserializer=jervis_dot_knowledgebase_dot_retrieve__pb2.BatchRetrievalRequest.FromString,
+                    response_serializer=jervis_dot_knowledgebase_dot_retrieve__pb2.BatchEvidencePack.SerializeToString,
+            ),
             'RetrieveHybrid': grpc.unary_unary_rpc_method_handler(
                     servicer.RetrieveHybrid,
                     request_deserializer=jervis_dot_knowledgebase_dot_retrieve__pb2.HybridRetrievalRequest.FromString,
@@ -212,6 +228,33 @@ class KnowledgeRetrieveService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def RetrieveBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/jervis.knowledgebase.KnowledgeRetrieveService/RetrieveBatch',
+            jervis_dot_knowledgebase_dot_retrieve__pb2.BatchRetrievalRequest.SerializeToString,
+            jervis_dot_knowledgebase_dot_retrieve__pb2.BatchEvidencePack.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def RetrieveHybrid(request,
             target,
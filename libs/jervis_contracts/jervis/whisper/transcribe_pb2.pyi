@@ -22,7 +22,7 @@ class TranscribeRequest(_message.Message):
     def __init__(self, ctx: _Optional[_Union[_types_pb2.RequestContext, _Mapping]] = ..., audio: _Optional[bytes] = ..., filename: _Optional[str] = ..., options: _Optional[_Union[TranscribeOptions, _Mapping]] = ..., blob_ref: _Optional[str] = ...) -> None: ...
 
 class TranscribeOptions(_message.Message):
-    __slots__ = ("task", "model", "language", "beam_size", "vad_filter", "word_timestamps", "initial_prompt", "condition_on_previous_text", "no_speech_threshold", "extraction_ranges", "diarize")
+    __slots__ = ("task", "model", "language", "beam_size", "vad_filter", "word_timestamps", "initial_prompt", "condition_on_previous_text", "no_speech_threshold", "extraction_ranges", "diarize", "stream_segments", "batched", "batch_size")
     TASK_FIELD_NUMBER: _ClassVar[int]
     MODEL_FIELD_NUMBER: _ClassVar[int]
     LANGUAGE_FIELD_NUMBER: _ClassVar[int]
@@ -34,6 +34,9 @@ class TranscribeOptions(_message.Message):
     NO_SPEECH_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
     EXTRACTION_RANGES_FIELD_NUMBER: _ClassVar[int]
     DIARIZE_FIELD_NUMBER: _ClassVar[int]
+    STREAM_SEGMENTS_FIELD_NUMBER: _ClassVar[int]
+    BATCHED_FIELD_NUMBER: _ClassVar[int]
+    BATCH_SIZE_FIELD_NUMBER: _ClassVar[int]
     task: str
     model: str
     language: str
@@ -45,7 +48,10 @@ class TranscribeOptions(_message.Message):
     no_speech_threshold: float
     extraction_ranges: _containers.RepeatedCompositeFieldContainer[ExtractionRange]
     diarize: bool
-    def __init__(self, task: _Optional[str] = ..., model: _Optional[str] = ..., language: _Optional[str] = ..., beam_size: _Optional[int] = ..., vad_filter: bool = ..., word_timestamps: bool = ..., initial_prompt: _Optional[str] = ..., condition_on_previous_text: bool = ..., no_speech_threshold: _Optional[float] = ..., extraction_ranges: _Optional[_Iterable[_Union[ExtractionRange, _Mapping]]] = ..., diarize: bool = ...) -> None: ...
+    stream_segments: bool
+    batched: bool
+    batch_size: int
+    def __init__(self, task: _Optional[str] = ..., model: _Optional[str] = ..., language: _Optional[str] = ..., beam_size: _Optional[int] = ..., vad_filter: bool = ..., word_timestamps: bool = ..., initial_prompt: _Optional[str] = ..., condition_on_previous_text: bool = ..., no_speech_threshold: _Optional[float] = ..., extraction_ranges: _Optional[_Iterable[_Union[ExtractionRange, _Mapping]]] = ..., diarize: bool = ..., stream_segments: bool = ..., batched: bool = ..., batch_size: _Optional[int] = ...) -> None: ...
 
 class ExtractionRange(_message.Message):
     __slots__ = ("start_sec", "end_sec", "segment_index")
@@ -58,14 +64,22 @@ class ExtractionRange(_message.Message):
     def __init__(self, start_sec: _Optional[float] = ..., end_sec: _Optional[float] = ..., segment_index: _Optional[int] = ...) -> None: ...
 
 class TranscribeEvent(_message.Message):
-    __slots__ = ("progress", "result", "error")
+    __slots__ = ("progress", "result", "error", "segment")
     PROGRESS_FIELD_NUMBER: _ClassVar[int]
     RESULT_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
+    SEGMENT_FIELD_NUMBER: _ClassVar[int]
     progress: ProgressEvent
     result: ResultEvent
     error: ErrorEvent
-    def __init__(self, progress: _Optional[_Union[ProgressEvent, _Mapping]] = ..., result: _Optional[_Union[ResultEvent, _Mapping]] = ..., error: _Optional[_Union[ErrorEvent, _Mapping]] = ...) -> None: ...
+    segment: SegmentEvent
+    def __init__(self, progress: _Optional[_Union[ProgressEvent, _Mapping]] = ..., result: _Optional[_Union[ResultEvent, _Mapping]] = ..., error: _Optional[_Union[ErrorEvent, _Mapping]] = ..., segment: _Optional[_Union[SegmentEvent, _Mapping]] = ...) -> None: ...
+
+class SegmentEvent(_message.Message):
+    __slots__ = ("segment",)
+    SEGMENT_FIELD_NUMBER: _ClassVar[int]
+    segment: TranscribeSegment
+    def __init__(self, segment: _Optional[_Union[TranscribeSegment, _Mapping]] = ...) -> None: ...
 
 class ProgressEvent(_message.Message):
     __slots__ = ("percent", "segments_done", "elapsed_seconds", "last_segment_text")
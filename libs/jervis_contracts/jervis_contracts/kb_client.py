@@ -332,6 +332,20 @@ async def ingest(
     return _ingest_result_to_dict(await stub.Ingest(req, timeout=timeout))
 
 
+def _evidence_to_dicts(pack) -> list[dict]:
+    return [
+        {
+            "content": it.content,
+            "score": it.score,
+            "sourceUrn": it.source_urn,
+            "credibility": it.credibility,
+            "branchScope": it.branch_scope,
+            "metadata": dict(it.metadata),
+        }
+        for it in pack.items
+    ]
+
+
 async def retrieve(
     *,
     caller: str,
@@ -369,17 +383,55 @@ async def retrieve(
     )
     method = stub.RetrieveSimple if simple else stub.Retrieve
     pack = await method(req, timeout=timeout)
-    return [
-        {
-            "content": it.content,
-            "score": it.score,
-            "sourceUrn": it.source_urn,
-            "credibility": it.credibility,
-            "branchScope": it.branch_scope,
-            "metadata": dict(it.metadata),
-        }
-        for it in pack.items
-    ]
+    return _evidence_to_dicts(pack)
+
+
+async def retrieve_batch(
+    *,
+    caller: str,
+    queries: list[dict],
+    client_id: str = "",
+    budget_s: float = 0.0,
+    timeout: float = 60.0,
+) -> tuple[list[list[dict]], list[int]]:
+    """Dial KnowledgeRetrieveService.RetrieveBatch — several queries, one call.
+
+    Each entry of `queries` takes the keyword arguments of `retrieve()`
+    (query, project_id, group_id, max_results, min_confidence,
+    expand_graph, kinds, simple). The KB embeds all query texts together
+    and searches concurrently; with `budget_s` > 0 it returns whatever
+    finished by then.
+
+    Returns:
+        (results, incomplete) — results[i] answers queries[i] in the
+        `retrieve()` dict shape; `incomplete` lists indexes that failed or
+        were cut by the budget (their result list is empty).
+    """
+    from jervis.knowledgebase import retrieve_pb2
+
+    stub = retrieve_stub()
+    req = retrieve_pb2.BatchRetrievalRequest(
+        ctx=build_request_context(caller=caller, client_id=client_id),
+        queries=[
+            retrieve_pb2.BatchRetrievalQuery(
+                request=retrieve_pb2.RetrievalRequest(
+                    query=q["query"],
+                    client_id=client_id,
+                    project_id=q.get("project_id", ""),
+                    group_id=q.get("group_id", ""),
+                    max_results=q.get("max_results", 5),
+                    min_confidence=q.get("min_confidence", 0.0),
+                    expand_graph=q.get("expand_graph", True),
+                    kinds=list(q.get("kinds") or []),
+                ),
+                simple=q.get("simple", False),
+            )
+            for q in queries
+        ],
+        budget_ms=int(budget_s * 1000),
+    )
+    resp = await stub.RetrieveBatch(req, timeout=timeout)
+    return [_evidence_to_dicts(pack) for pack in resp.packs], list(resp.incomplete)
 
 
 async def graph_search(